@@ -780,6 +780,7 @@ from . import functional
 from .functional import *
 from . import stateful
 from .stateful import *
+from . import data
 from ivy.utils.inspection import fn_array_spec, add_array_specs
 
 add_array_specs()
@@ -1490,8 +1491,8 @@ class LoggingMode:
 
 class IvyWithGlobalProps(sys.modules[__name__].__class__):
     def __setattr__(self, name, value, internal=False):
-        previous_frame = inspect.currentframe().f_back
-        filename = inspect.getframeinfo(previous_frame)[0]
+        # the file of the caller, without the source lookup of inspect.getframeinfo
+        filename = inspect.currentframe().f_back.f_code.co_filename
         internal = internal and _is_from_internal(filename)
         if not internal and name in GLOBAL_PROPS:
             raise ivy.utils.exceptions.IvyException(
@@ -0,0 +1,4 @@
+from . import dataset
+from .dataset import *
+from . import loader
+from .loader import *
@@ -0,0 +1,309 @@
+"""Datasets streaming examples from generators or memory-mapped arrays."""
+
+# global
+import itertools
+from typing import Callable, Dict, Optional, Union
+
+import numpy as np
+
+# local
+import ivy
+
+
+# Sources #
+# --------#
+
+
+class _GeneratorSource:
+    def __init__(self, generator_fn):
+        self._generator_fn = generator_fn
+
+    def examples(self, shards):
+        examples = iter(self._generator_fn())
+        for num_shards, index in shards:
+            examples = itertools.islice(examples, index, None, num_shards)
+        return examples
+
+
+class _ArraySource:
+    def __init__(self, arrays):
+        # the paths are kept rather than the arrays, so that each worker memory-maps
+        # the files itself rather than receiving a copy of their contents
+        self._arrays = arrays
+        self._loaded = None
+
+    def _load(self):
+        if self._loaded is None:
+            self._loaded = {
+                k: np.load(v, mmap_mode="r") if isinstance(v, str) else v
+                for k, v in self._arrays.items()
+            }
+            lengths = {len(v) for v in self._loaded.values()}
+            if len(lengths) > 1:
+                raise ivy.utils.exceptions.IvyException(
+                    "all arrays must have the same length, but found lengths {}".format(
+                        sorted(lengths)
+                    )
+                )
+        return self._loaded
+
+    def __getstate__(self):
+        return {"_arrays": self._arrays, "_loaded": None}
+
+    def indices(self, shards):
+        indices = range(len(next(iter(self._load().values()))))
+        for num_shards, index in shards:
+            indices = indices[index::num_shards]
+        return indices
+
+    def gather(self, idx):
+        # a single fancy index per array, rather than one read per example
+        return {k: np.asarray(v[idx]) for k, v in self._load().items()}
+
+
+# Helpers #
+# --------#
+
+
+def _stack(examples):
+    first = examples[0]
+    if isinstance(first, dict):
+        return {k: _stack([x[k] for x in examples]) for k in first}
+    if isinstance(first, (list, tuple)):
+        return type(first)(_stack([x[i] for x in examples]) for i in range(len(first)))
+    return np.stack([np.asarray(x) for x in examples])
+
+
+def _shuffle(items, buffer_size, rng):
+    buffer = []
+    for item in items:
+        if len(buffer) < buffer_size:
+            buffer.append(item)
+            continue
+        i = rng.integers(buffer_size)
+        yield buffer[i]
+        buffer[i] = item
+    rng.shuffle(buffer)
+    yield from buffer
+
+
+def _group(items, batch_size, drop_remainder):
+    while True:
+        group = list(itertools.islice(items, batch_size))
+        if not group or (drop_remainder and len(group) < batch_size):
+            return
+        yield group
+
+
+# Dataset #
+# --------#
+
+
+class Dataset:
+    def __init__(self, source, ops=()):
+        """
+        Re-iterable pipeline of transformations over a source of examples. Datasets
+        are created with :meth:`from_generator` or :meth:`from_arrays`, and each
+        transformation returns a new dataset, leaving the original unchanged.
+
+        The examples are nests of dicts, lists and tuples of numpy arrays, and
+        batching stacks the arrays at each position of the nest. The examples are
+        only produced when the dataset is iterated, which is done by the workers of
+        an :class:`ivy.data.DataLoader`.
+
+        Parameters
+        ----------
+        source
+            The source of the examples.
+        ops
+            The transformations applied to the examples, in order.
+        """
+        self._source = source
+        self._ops = tuple(ops)
+
+    @staticmethod
+    def from_generator(generator_fn: Callable):
+        """
+        Create a dataset of the examples yielded by a generator.
+
+        Parameters
+        ----------
+        generator_fn
+            Function returning a new iterator over the examples, called once for each
+            iteration over the dataset.
+
+        Returns
+        -------
+        ret
+            The dataset.
+
+        Examples
+        --------
+        >>> ds = ivy.data.Dataset.from_generator(lambda: ({"x": i} for i in range(5)))
+        >>> [b["x"].tolist() for b in ds.batch(2)]
+        [[0, 1], [2, 3], [4]]
+        """
+        return Dataset(_GeneratorSource(generator_fn))
+
+    @staticmethod
+    def from_arrays(arrays: Dict[str, Union[str, np.ndarray]]):
+        """
+        Create a dataset of the rows of arrays of the same length.
+
+        Arrays given as paths to ``.npy`` files are memory-mapped, so only the rows
+        which are read are loaded from disk. Batches of consecutive rows are read
+        with a single fancy index per array, as long as they are not preceded by a
+        ``map`` or a ``filter``.
+
+        Parameters
+        ----------
+        arrays
+            Dict of the arrays, or of the paths to the ``.npy`` files.
+
+        Returns
+        -------
+        ret
+            The dataset of the examples ``{key: arrays[key][i]}``.
+
+        Examples
+        --------
+        >>> ds = ivy.data.Dataset.from_arrays({"x": np.arange(6)})
+        >>> [b["x"].tolist() for b in ds.shard(2, 1).batch(2)]
+        [[1, 3], [5]]
+        """
+        return Dataset(_ArraySource(dict(arrays)))
+
+    def _with(self, *op):
+        return Dataset(self._source, self._ops + (op,))
+
+    def map(self, fn: Callable, /):
+        """
+        Apply a function to each example.
+
+        Parameters
+        ----------
+        fn
+            The function to apply.
+
+        Returns
+        -------
+        ret
+            The mapped dataset.
+        """
+        return self._with("map", fn)
+
+    def filter(self, predicate: Callable, /):
+        """
+        Keep only the examples for which the predicate returns ``True``.
+
+        Parameters
+        ----------
+        predicate
+            The predicate to apply.
+
+        Returns
+        -------
+        ret
+            The filtered dataset.
+        """
+        return self._with("filter", predicate)
+
+    def shuffle(self, buffer_size: int, /, *, seed: Optional[int] = None):
+        """
+        Shuffle the examples within a buffer of fixed size, which each new example
+        replaces a random example of.
+
+        Parameters
+        ----------
+        buffer_size
+            Number of examples in the buffer.
+        seed
+            Seed of the shuffle. The order is then the same on each iteration, and
+            each worker of a loader derives its own seed from it. Default is ``None``,
+            for a different order on each iteration.
+
+        Returns
+        -------
+        ret
+            The shuffled dataset.
+        """
+        return self._with("shuffle", buffer_size, seed)
+
+    def batch(self, batch_size: int, /, *, drop_remainder: bool = False):
+        """
+        Stack consecutive examples into batches.
+
+        Parameters
+        ----------
+        batch_size
+            Number of examples in each batch.
+        drop_remainder
+            Whether to drop the last batch if it has fewer examples.
+            Default is ``False``.
+
+        Returns
+        -------
+        ret
+            The batched dataset.
+        """
+        return self._with("batch", batch_size, drop_remainder)
+
+    def shard(self, num_shards: int, index: int, /):
+        """
+        Keep only every num_shards-th example of the source, starting from index.
+
+        Sharding is applied to the examples of the source, before any other
+        transformation, so that the shards of a dataset are disjoint and together
+        hold all of its examples whatever the pipeline.
+
+        Parameters
+        ----------
+        num_shards
+            Number of shards.
+        index
+            Index of the shard to keep.
+
+        Returns
+        -------
+        ret
+            The sharded dataset.
+        """
+        return self._with("shard", num_shards, index)
+
+    def _iterate(self, worker_index=0, num_workers=1):
+        shards = [op[1:] for op in self._ops if op[0] == "shard"]
+        shards.append((num_workers, worker_index))
+        ops = [op for op in self._ops if op[0] != "shard"]
+        seeds = [
+            None if op[0] != "shuffle" or op[2] is None else [op[2], worker_index, i]
+            for i, op in enumerate(ops)
+        ]
+        if isinstance(self._source, _ArraySource):
+            # leading shuffles and batches are applied to the indices of the rows
+            items = iter(self._source.indices(shards))
+            while ops and ops[0][0] == "shuffle":
+                items = _shuffle(items, ops[0][1], np.random.default_rng(seeds[0]))
+                ops, seeds = ops[1:], seeds[1:]
+            if ops and ops[0][0] == "batch":
+                items = (
+                    self._source.gather(idx)
+                    for idx in _group(items, ops[0][1], ops[0][2])
+                )
+                ops, seeds = ops[1:], seeds[1:]
+            else:
+                items = (self._source.gather(i) for i in items)
+        else:
+            items = self._source.examples(shards)
+        for op, seed in zip(ops, seeds):
+            if op[0] == "map":
+                items = map(op[1], items)
+            elif op[0] == "filter":
+                items = filter(op[1], items)
+            elif op[0] == "shuffle":
+                items = _shuffle(items, op[1], np.random.default_rng(seed))
+            else:
+                items = map(_stack, _group(items, op[1], op[2]))
+        return items
+
+    def __iter__(self):
+        return self._iterate()
@@ -0,0 +1,301 @@
+"""Loader producing batches of a dataset with prefetching worker threads or
+processes."""
+
+# global
+import queue
+import threading
+import traceback
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional, Union
+
+import dill
+import numpy as np
+
+# local
+import ivy
+from ivy.data_classes.container import Container
+
+# the offsets of the arrays within the shared memory of a batch are aligned to the
+# size of a cache line
+_ALIGNMENT = 64
+_POLL_INTERVAL = 0.1
+
+
+# Helpers #
+# --------#
+
+
+def _flatten(x, leaves):
+    # replace the arrays of a nest by their index in leaves
+    if isinstance(x, dict):
+        return {k: _flatten(v, leaves) for k, v in x.items()}
+    if isinstance(x, (list, tuple)):
+        return type(x)(_flatten(v, leaves) for v in x)
+    leaves.append(np.ascontiguousarray(x))
+    return len(leaves) - 1
+
+
+def _unflatten(structure, leaves):
+    if isinstance(structure, dict):
+        return {k: _unflatten(v, leaves) for k, v in structure.items()}
+    if isinstance(structure, (list, tuple)):
+        return type(structure)(_unflatten(v, leaves) for v in structure)
+    return leaves[structure]
+
+
+def _layout(leaves):
+    layout, nbytes = [], 0
+    for leaf in leaves:
+        nbytes = -(-nbytes // _ALIGNMENT) * _ALIGNMENT
+        layout.append((leaf.dtype.str, leaf.shape, nbytes))
+        nbytes += leaf.nbytes
+    return layout, nbytes
+
+
+def _to_ivy(x, device):
+    if isinstance(x, dict):
+        return Container({k: _to_ivy(v, device) for k, v in x.items()})
+    if isinstance(x, (list, tuple)):
+        return type(x)(_to_ivy(v, device) for v in x)
+    return ivy.asarray(x, device=device)
+
+
+# Workers #
+# --------#
+
+
+def _put(ready, msg, stop):
+    # put into the bounded queue, unless the loader stops the worker meanwhile
+    while not stop.is_set():
+        try:
+            ready.put(msg, timeout=_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _thread_worker(dataset, worker_index, num_workers, ready, stop):
+    try:
+        for batch in dataset._iterate(worker_index, num_workers):
+            if not _put(ready, ("batch", batch), stop):
+                return
+        _put(ready, ("done",), stop)
+    except Exception:
+        _put(ready, ("error", traceback.format_exc()), stop)
+
+
+def _process_worker(dataset_bytes, worker_index, num_workers, free, ready):
+    # each batch is written into one of the shared memory slots released by the
+    # loader, and only its layout is sent through the queue
+    segments = dict()
+    slot = None
+    try:
+        dataset = dill.loads(dataset_bytes)
+        for batch in dataset._iterate(worker_index, num_workers):
+            leaves = []
+            structure = _flatten(batch, leaves)
+            layout, nbytes = _layout(leaves)
+            slot = free.get()
+            if slot is None:
+                return
+            shm = segments.get(slot)
+            if shm is None or shm.size < nbytes:
+                # grow the slot, with some headroom for the following batches
+                if shm is not None:
+                    shm.close()
+                    shm.unlink()
+                shm = shared_memory.SharedMemory(
+                    create=True, size=max(int(nbytes * 1.25), _ALIGNMENT)
+                )
+                segments[slot] = shm
+            for leaf, (dtype, shape, offset) in zip(leaves, layout):
+                np.ndarray(shape, dtype, buffer=shm.buf, offset=offset)[...] = leaf
+            ready.put(("batch", slot, shm.name, structure, layout))
+        ready.put(("done",))
+    except Exception:
+        ready.put(("error", traceback.format_exc()))
+    finally:
+        # the segments are kept until the loader has copied the last batches out,
+        # and signals it with None
+        while slot is not None:
+            slot = free.get()
+        for shm in segments.values():
+            shm.close()
+            shm.unlink()
+
+
+# Loader #
+# -------#
+
+
+class DataLoader:
+    def __init__(
+        self,
+        dataset,
+        /,
+        *,
+        num_workers: int = 0,
+        worker_type: str = "process",
+        prefetch: int = 2,
+        context: Optional[str] = None,
+        device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+    ):
+        """
+        Iterable over the batches of a dataset, as containers of ivy arrays.
+
+        Each worker iterates its own shard of the dataset, holding every
+        ``num_workers``-th example of the source, and the batches are returned from
+        the workers in turn, so the order is deterministic for a given number of
+        workers. Each worker produces at most ``prefetch`` batches ahead of the
+        training loop. Worker processes write the arrays of the batches into
+        shared memory slots, which are reused once the loader has copied the arrays
+        out, so no array is pickled.
+
+        Parameters
+        ----------
+        dataset
+            The :class:`ivy.data.Dataset` to load.
+        num_workers
+            Number of workers. Default is ``0``, for loading in the calling thread.
+        worker_type
+            ``"process"`` or ``"thread"``. Threads suit pipelines which release
+            the GIL, such as those reading files. Default is ``"process"``.
+        prefetch
+            Maximum number of batches produced ahead by each worker. Default is
+            ``2``.
+        context
+            The multiprocessing context of the worker processes, either fork,
+            forkserver or spawn. The dataset is serialized with dill, so its
+            functions may be lambdas whatever the context. Default is ``None``.
+        device
+            Device on which to place the arrays of the batches. Default is ``None``.
+
+        Examples
+        --------
+        >>> ds = ivy.data.Dataset.from_arrays({"x": np.arange(8.0)}).batch(2)
+        >>> loader = ivy.data.DataLoader(ds, num_workers=2, worker_type="thread")
+        >>> [b.x.shape[0] for b in loader]
+        [2, 2, 2, 2]
+        """
+        ivy.utils.assertions.check_elem_in_list(worker_type, ["process", "thread"])
+        self._dataset = dataset
+        self._num_workers = num_workers
+        self._worker_type = worker_type
+        self._prefetch = max(prefetch, 1)
+        self._context = context
+        self._device = device
+
+    def _iter_threads(self):
+        stop = threading.Event()
+        queues = [queue.Queue(self._prefetch) for _ in range(self._num_workers)]
+        threads = [
+            threading.Thread(
+                target=_thread_worker,
+                args=(self._dataset, i, self._num_workers, queues[i], stop),
+                daemon=True,
+            )
+            for i in range(self._num_workers)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for msg in self._round_robin(queues, threads):
+                yield msg[1]
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+    def _iter_processes(self):
+        mp = ivy.multiprocessing(self._context)
+        dataset_bytes = dill.dumps(self._dataset, recurse=True)
+        # the workers share the resource tracker of the loader, which is then the only
+        # one tracking the segments, and forgets them once the loader unlinks them
+        resource_tracker.ensure_running()
+        frees = [mp.Queue() for _ in range(self._num_workers)]
+        readies = [mp.Queue() for _ in range(self._num_workers)]
+        for free in frees:
+            for slot in range(self._prefetch):
+                free.put(slot)
+        processes = [
+            mp.Process(
+                target=_process_worker,
+                args=(dataset_bytes, i, self._num_workers, frees[i], readies[i]),
+                daemon=True,
+            )
+            for i in range(self._num_workers)
+        ]
+        for process in processes:
+            process.start()
+        # the attached segment of each slot of each worker
+        attached = [dict() for _ in range(self._num_workers)]
+        try:
+            for worker, msg in self._round_robin(readies, processes, True):
+                _, slot, name, structure, layout = msg
+                shm = attached[worker].get(slot)
+                if shm is None or shm.name != name:
+                    # the worker has grown the slot, and unlinked its old segment
+                    if shm is not None:
+                        shm.close()
+                    shm = shared_memory.SharedMemory(name=name)
+                    attached[worker][slot] = shm
+                leaves = [
+                    np.ndarray(shape, dtype, buffer=shm.buf, offset=offset).copy()
+                    for dtype, shape, offset in layout
+                ]
+                frees[worker].put(slot)
+                yield _unflatten(structure, leaves)
+        finally:
+            for free in frees:
+                free.put(None)
+            for process in processes:
+                process.join(_POLL_INTERVAL * 10)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+            for shms in attached:
+                for shm in shms.values():
+                    shm.close()
+
+    @staticmethod
+    def _round_robin(queues, workers, with_worker=False):
+        active = list(range(len(queues)))
+        while active:
+            for worker in list(active):
+                while True:
+                    try:
+                        msg = queues[worker].get(timeout=_POLL_INTERVAL)
+                        break
+                    except queue.Empty:
+                        if not workers[worker].is_alive() and queues[worker].empty():
+                            raise ivy.utils.exceptions.IvyException(
+                                "data loader worker {} exited unexpectedly".format(
+                                    worker
+                                )
+                            )
+                if msg[0] == "done":
+                    active.remove(worker)
+                elif msg[0] == "error":
+                    raise ivy.utils.exceptions.IvyException(
+                        "data loader worker {} raised an exception:\n{}".format(
+                            worker, msg[1]
+                        )
+                    )
+                else:
+                    yield (worker, msg) if with_worker else msg
+
+    def __iter__(self):
+        if self._num_workers == 0:
+            batches = iter(self._dataset)
+        elif self._worker_type == "thread":
+            batches = self._iter_threads()
+        else:
+            batches = self._iter_processes()
+        try:
+            for batch in batches:
+                yield _to_ivy(batch, self._device)
+        finally:
+            # stop the workers when the iteration is interrupted
+            if hasattr(batches, "close"):
+                batches.close()
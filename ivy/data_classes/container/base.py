@@ -2,6 +2,8 @@
 
 # global
 import inspect
+import hashlib
+import weakref
 from itertools import chain
 import re
 import abc
@@ -9,6 +11,10 @@ import copy
 import termcolor
 import numpy as np
 import json
+import os
+import queue
+import threading
+import time
 
 from ivy.utils.exceptions import IvyBackendException, IvyException
 
@@ -24,12 +30,14 @@ from operator import mul
 from functools import reduce as _reduce
 from typing import Union, Tuple
 from builtins import set
+from collections import OrderedDict, UserDict
 
 # local
 import ivy
 
 
 ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+_missing = object()
 
 
 def _is_jsonable(x):
@@ -47,6 +55,153 @@ def _repr(x):
         return str(x)
 
 
+_shards_index_filename = "index.json"
+
+
+_shard_filename = re.compile(r"shard_\d+_\d{5}\.bin")
+
+
+def _write_shards(directory, leaves, max_shard_size):
+    # streams the leaves into the shard files one at a time, and writes the index
+    # last, so that a directory with an index always holds a complete checkpoint.
+    # The shards of each save are named after a new generation, so that overwriting
+    # a checkpoint never touches the shards of the index in place, and the shards
+    # which the new index does not reference are deleted once it is written
+    os.makedirs(directory, exist_ok=True)
+    index_path = os.path.join(directory, _shards_index_filename)
+    generation = 0
+    if os.path.exists(index_path):
+        with open(index_path) as index_file:
+            generation = json.load(index_file).get("generation", -1) + 1
+    index = {"generation": generation, "shards": [], "leaves": {}}
+    shard = None
+    try:
+        for kc, x in leaves:
+            if not isinstance(x, np.ndarray):
+                index["leaves"][kc] = {"value": x}
+                continue
+            x = np.require(x, requirements="C")
+            if shard is None or (
+                shard.tell() > 0 and shard.tell() + x.nbytes > max_shard_size
+            ):
+                if shard is not None:
+                    shard.close()
+                shard_name = "shard_{:d}_{:05d}.bin".format(
+                    generation, len(index["shards"])
+                )
+                index["shards"].append(shard_name)
+                shard = open(os.path.join(directory, shard_name), "wb")
+            index["leaves"][kc] = {
+                "shard": len(index["shards"]) - 1,
+                "offset": shard.tell(),
+                "dtype": x.dtype.str,
+                "shape": list(x.shape),
+            }
+            shard.write(x.tobytes() if x.ndim == 0 else x.data)
+    finally:
+        if shard is not None:
+            shard.close()
+    with open(index_path + ".tmp", "w") as index_file:
+        json.dump(index, index_file)
+    os.replace(index_path + ".tmp", index_path)
+    referenced = set(index["shards"])
+    for filename in os.listdir(directory):
+        if _shard_filename.fullmatch(filename) and filename not in referenced:
+            os.remove(os.path.join(directory, filename))
+
+
+class _ShardsWriter(threading.Thread):
+    # writes the snapshotted leaves in the background, re-raising any error on join
+    def __init__(self, directory, leaves, max_shard_size):
+        super().__init__(daemon=True)
+        self._args = (directory, leaves, max_shard_size)
+        self._exception = None
+
+    def run(self):
+        try:
+            _write_shards(*self._args)
+        except Exception as e:
+            self._exception = e
+        finally:
+            self._args = None
+
+    def join(self, timeout=None):
+        super().join(timeout)
+        if self._exception is not None:
+            raise self._exception
+
+
+_class_attr_names = dict()
+_multi_map_plans = dict()
+_multi_map_plans_limit = 1024
+
+
+def _is_attr_mirrored(cls, key):
+    # keys are mirrored into the instance __dict__, so that attribute access finds
+    # them without falling back to __getattr__, unless they would shadow a class
+    # attribute or a private attribute of the container
+    if not isinstance(key, str) or not key or key[0] == "_":
+        return False
+    attr_names = _class_attr_names.get(cls)
+    if attr_names is None:
+        attr_names = _class_attr_names[cls] = frozenset(dir(cls))
+    return key not in attr_names
+
+
+def _nest_signature(nest):
+    # the structure of the nest, with the positions of the containers marked
+    if isinstance(nest, ivy.Container):
+        return _missing
+    if isinstance(nest, (tuple, list)):
+        return type(nest), tuple(_nest_signature(item) for item in nest)
+    if isinstance(nest, (dict, UserDict)):
+        return type(nest), tuple((k, _nest_signature(v)) for k, v in nest.items())
+    return None
+
+
+def _splice_tree(idxs, offset=0):
+    # maps each index to either a nested tree, or the position of the value to splice
+    tree = dict()
+    for i, index in enumerate(idxs):
+        sub_tree = tree
+        for k in index[:-1]:
+            sub_tree = sub_tree.setdefault(k, dict())
+        sub_tree[index[-1]] = offset + i
+    return tree
+
+
+def _splice_nest(nest, tree, vals):
+    # shallow copies only the sequences and dicts along the spliced indices
+    ret = list(nest) if isinstance(nest, tuple) else copy.copy(nest)
+    for k, sub_tree in tree.items():
+        ret[k] = (
+            vals[sub_tree]
+            if isinstance(sub_tree, int)
+            else _splice_nest(nest[k], sub_tree, vals)
+        )
+    if isinstance(nest, tuple):
+        return type(nest)(*ret) if hasattr(nest, "_fields") else type(nest)(ret)
+    return ret
+
+
+def _leaf_hash(x, content):
+    hasher = hashlib.sha256()
+    x_type = type(x)
+    hasher.update(f"{x_type.__module__}.{x_type.__qualname__}".encode())
+    if ivy.is_array(x):
+        hasher.update(str(tuple(x.shape)).encode())
+        if content:
+            x = ivy.to_numpy(x)
+            hasher.update(str(x.dtype).encode())
+            hasher.update(x.tobytes())
+    elif content:
+        try:
+            hasher.update(pickle.dumps(x))
+        except Exception:
+            hasher.update(_repr(x).encode())
+    return hasher.digest()
+
+
 # noinspection PyMissingConstructor
 
 
@@ -58,6 +213,8 @@ class ContainerBase(dict, abc.ABC):
         queue_load_sizes=None,
         container_combine_method="list_join",
         queue_timeout=None,
+        queue_prefetch_size=None,
+        queue_cache_size=None,
         print_limit=10,
         key_length_limit=None,
         print_indent=4,
@@ -92,6 +249,14 @@ class ContainerBase(dict, abc.ABC):
         queue_timeout
             The timeout when waiting for containers to arrive from the queues.
             Default is global.
+        queue_prefetch_size
+            Number of queue containers to load ahead of the most recently queried
+            queue, using background threads. Default is ``None``, in which case
+            containers are only loaded from the queues when queried.
+        queue_cache_size
+            Maximum number of containers loaded from the queues to keep in memory.
+            Containers from queues preceding the most recent query are evicted first.
+            Default is ``None``, in which case all loaded containers are kept.
         print_limit
             The total array size limit when printing the container. Default is 10.
         key_length_limit
@@ -132,11 +297,24 @@ class ContainerBase(dict, abc.ABC):
             if isinstance(self._container_combine_method, str):
                 self._container_combine_method = {
                     "list_join": self.cont_list_join,
-                    "concat": lambda conts: self.concat(conts, 0),
+                    "concat": lambda conts: self._static_concat(conts, axis=0),
                 }[self._container_combine_method]
-            self._loaded_containers_from_queues = dict()
+            self._loaded_containers_from_queues = OrderedDict()
+            self._combined_containers_from_queues = dict()
             self._queue_load_sizes_cum = np.cumsum(queue_load_sizes)
             self._queue_timeout = ivy.default(queue_timeout, ivy.queue_timeout)
+            self._queue_prefetch_size = queue_prefetch_size
+            self._queue_cache_size = queue_cache_size
+            self._queue_condition = threading.Condition()
+            self._queue_last_queried = -1
+            self._queue_next_to_load = 0
+            self._queues_loading = set()
+            self._queue_stats = dict(
+                wait_time=0.0, num_waits=0, num_loaded=0, num_evicted=0
+            )
+            self._queue_prefetchers = list()
+            if ivy.exists(queue_prefetch_size) and queue_prefetch_size > 0:
+                self.cont_start_queue_prefetching()
         if dynamic_backend is not None:
             self._dynamic_backend = dynamic_backend
         else:
@@ -180,29 +358,43 @@ class ContainerBase(dict, abc.ABC):
         out=None,
         **kwargs,
     ) -> Union[Tuple[ivy.Container, ivy.Container], ivy.Container]:
-        inspect_fn = fn
-        if isinstance(fn, str):
-            inspect_fn = ivy.__dict__[fn]
-        # retrieve indices where leaves of args are also nested
-        arg_cont_idxs = ivy.nested_argwhere(
-            args, ivy.is_ivy_container, to_ignore=ivy.Container
-        )
-        # retrieve indices where leaves of kwargs are also nested
-        kwarg_cont_idxs = ivy.nested_argwhere(
-            kwargs, ivy.is_ivy_container, to_ignore=ivy.Container
-        )
+        # the positions of the containers only depend on the structure of the
+        # arguments, so they are retrieved once for each such structure and function
+        plan_key = (fn, _nest_signature(args), _nest_signature(kwargs))
+        try:
+            plan = _multi_map_plans.get(plan_key)
+        except TypeError:
+            plan_key, plan = None, None
+        if plan is None:
+            inspect_fn = ivy.__dict__[fn] if isinstance(fn, str) else fn
+            # retrieve indices where leaves of args are also nested
+            arg_cont_idxs = ivy.nested_argwhere(
+                args, ivy.is_ivy_container, to_ignore=ivy.Container
+            )
+            # retrieve indices where leaves of kwargs are also nested
+            kwarg_cont_idxs = ivy.nested_argwhere(
+                kwargs, ivy.is_ivy_container, to_ignore=ivy.Container
+            )
+            plan = (
+                arg_cont_idxs,
+                kwarg_cont_idxs,
+                _splice_tree(arg_cont_idxs),
+                _splice_tree(kwarg_cont_idxs, len(arg_cont_idxs)),
+                inspect.signature(inspect_fn).parameters.get("out") is not None,
+            )
+            if plan_key is not None:
+                if len(_multi_map_plans) >= _multi_map_plans_limit:
+                    _multi_map_plans.clear()
+                _multi_map_plans[plan_key] = plan
+        arg_cont_idxs, kwarg_cont_idxs, arg_tree, kwarg_tree, has_out = plan
 
         # retrieve all the containers in args
         arg_conts = ivy.multi_index_nest(args, arg_cont_idxs)
-        num_arg_conts = len(arg_conts)
 
         # retrieve all the containers in kwargs
         kwarg_conts = ivy.multi_index_nest(kwargs, kwarg_cont_idxs)
         # Combine the retrieved containers from args and kwargs into a single list
-        with_out = (
-            inspect.signature(inspect_fn).parameters.get("out") is not None
-            and out is not None
-        )
+        with_out = has_out and out is not None
         if with_out:
             out_conts = [out]
             num_out_conts = 1
@@ -225,16 +417,26 @@ class ContainerBase(dict, abc.ABC):
         # Get the function with the name fn_name, enabling containers to specify
         # their backends irrespective of global ivy's backend
 
+        # templates of the arguments, into which the leaves are spliced for each call
+        a = list(args)
+        kw = dict(kwargs)
+
         def map_fn(vals, _):
             if with_out:
                 out = vals[-num_out_conts:]
                 del vals[-num_out_conts:]
-            arg_vals = vals[:num_arg_conts]
-            a = ivy.copy_nest(args)
-            a = ivy.set_nest_at_indices(a, arg_cont_idxs, arg_vals)
-            kwarg_vals = vals[num_arg_conts:]
-            kw = ivy.copy_nest(kwargs)
-            kw = ivy.set_nest_at_indices(kw, kwarg_cont_idxs, kwarg_vals)
+            for k, sub_tree in arg_tree.items():
+                a[k] = (
+                    vals[sub_tree]
+                    if isinstance(sub_tree, int)
+                    else _splice_nest(args[k], sub_tree, vals)
+                )
+            for k, sub_tree in kwarg_tree.items():
+                kw[k] = (
+                    vals[sub_tree]
+                    if isinstance(sub_tree, int)
+                    else _splice_nest(kwargs[k], sub_tree, vals)
+                )
             if with_out:
                 out = out[0] if len(out) == 1 else out
                 return fn(*a, out=out, **kw)
@@ -555,6 +757,18 @@ class ContainerBase(dict, abc.ABC):
                         idxs_added += idxs_to_add_list
                 return ivy.Container(diff_dict, **config)
 
+        # skip sub-containers carrying matching structure hashes, when only
+        # structural differences are detected
+        if not detect_value_diffs and not any(
+            cont.cont_config["build_callable"] for cont in containers
+        ):
+            if ivy.Container._cont_cached_hashes_match(containers, False):
+                if mode == "diff_only":
+                    return ivy.Container(**config)
+                return ivy.Container(
+                    container0.cont_prune_empty(keep_nones=True), **config
+                )
+
         # otherwise, check that the keys are aligned between each container, and apply
         # this method recursively
         return_dict = dict()
@@ -806,7 +1020,9 @@ class ContainerBase(dict, abc.ABC):
         -------
             list of key-chains.
         """
-        if len(containers) == 1:
+        if len(containers) == 1 or ivy.Container._cont_cached_hashes_match(
+            containers, False
+        ):
             return containers[0].cont_all_key_chains()
         sets = [set(cont.cont_all_key_chains()) for cont in containers]
         return list(sets[0].intersection(*sets[1:]))
@@ -860,6 +1076,16 @@ class ContainerBase(dict, abc.ABC):
         -------
         Boolean
         """
+        if not (partial or assert_and_assign) and not any(
+            cont.cont_config["build_callable"] for cont in containers
+        ):
+            # short-circuit on sub-containers carrying matching hashes
+            if all(cont is containers[0] for cont in containers):
+                return True
+            if not same_arrays and not arrays_equal:
+                match = ivy.Container._cont_cached_hashes_match(containers, False)
+                if match or (match is False and check_types and check_shapes):
+                    return match
         if partial:
             common_key_chains = ivy.Container.cont_common_key_chains(containers)
             if not common_key_chains:
@@ -1137,6 +1363,40 @@ class ContainerBase(dict, abc.ABC):
                 return False
         return True
 
+    @staticmethod
+    def cont_unique(containers, content=True, return_inverse=False):
+        """
+        Remove duplicates from a sequence of containers, using the container hashes.
+
+        Parameters
+        ----------
+        containers
+            containers to deduplicate.
+        content
+            Whether to compare the containers by content, or only by structure.
+            Default is ``True``.
+        return_inverse
+            Whether to also return the index of the unique container which each of
+            the input containers maps to. Default is ``False``.
+
+        Returns
+        -------
+            The unique containers, in order of first occurrence, and optionally the
+            inverse indices.
+        """
+        unique_idxs = dict()
+        unique_containers = list()
+        inverse = list()
+        for cont in containers:
+            cont_hash = cont._cont_hash(content)
+            if cont_hash not in unique_idxs:
+                unique_idxs[cont_hash] = len(unique_containers)
+                unique_containers.append(cont)
+            inverse.append(unique_idxs[cont_hash])
+        if return_inverse:
+            return unique_containers, inverse
+        return unique_containers
+
     @staticmethod
     def cont_load(filepath, format="h5py"):
         if format == "json":
@@ -1145,6 +1405,8 @@ class ContainerBase(dict, abc.ABC):
             return ivy.Container.cont_from_disk_as_pickled(filepath)
         elif format == "h5py":
             return ivy.Container.cont_from_disk_as_hdf5(filepath)
+        elif format == "shards":
+            return ivy.Container.cont_from_disk_as_shards(filepath)
         else:
             raise ivy.utils.exceptions.IvyException("Unsupported format")
 
@@ -1245,6 +1507,78 @@ class ContainerBase(dict, abc.ABC):
         with open(json_filepath) as json_data_file:
             return ivy.Container(json.load(json_data_file), ivyh=ivyh)
 
+    @staticmethod
+    def cont_from_disk_as_shards(directory, key_chains=None, ivyh=None):
+        """
+        Load container object from the shards and index file in the specified
+        directory, as saved by cont_to_disk_as_shards. Only the bytes of the loaded
+        leaves are read from the shard files.
+
+        Parameters
+        ----------
+        directory
+            Directory where the container object is saved to disk.
+        key_chains
+            Key-chain or list of key-chains to load, each either a leaf or a
+            sub-container. Default is ``None``, which loads the whole container.
+        ivyh
+            Handle to ivy module to use for the calculations. Default is ``None``, which
+            results in the global ivy.
+
+        Returns
+        -------
+            Container loaded from disk
+        """
+        with open(os.path.join(directory, _shards_index_filename)) as index_file:
+            index = json.load(index_file)
+        leaves = index["leaves"]
+        if key_chains is not None:
+            key_chains = [key_chains] if isinstance(key_chains, str) else key_chains
+            key_chains = [kc.strip("/") for kc in key_chains]
+            selected = dict()
+            for key_chain in key_chains:
+                prefix = key_chain + "/"
+                matches = {
+                    kc: leaf
+                    for kc, leaf in leaves.items()
+                    if kc == key_chain or kc.startswith(prefix)
+                }
+                if not matches:
+                    raise ivy.utils.exceptions.IvyException(
+                        f"key chain {key_chain} not found in the saved container"
+                    )
+                selected.update(matches)
+            leaves = selected
+        values = dict()
+        by_shard = dict()
+        for kc, leaf in leaves.items():
+            if "value" in leaf:
+                values[kc] = leaf["value"]
+            else:
+                by_shard.setdefault(leaf["shard"], []).append((leaf["offset"], kc))
+        for shard_idx, shard_leaves in by_shard.items():
+            shard_path = os.path.join(directory, index["shards"][shard_idx])
+            with open(shard_path, "rb") as shard:
+                for offset, kc in sorted(shard_leaves):
+                    leaf = leaves[kc]
+                    shard.seek(offset)
+                    values[kc] = ivy.default(ivyh, ivy).array(
+                        np.fromfile(
+                            shard,
+                            dtype=np.dtype(leaf["dtype"]),
+                            count=_reduce(mul, leaf["shape"], 1),
+                        ).reshape(leaf["shape"])
+                    )
+        # rebuild the nesting in the saved order of the leaves
+        container_dict = dict()
+        for kc in leaves:
+            *keys, key = kc.split("/")
+            sub_dict = container_dict
+            for k in keys:
+                sub_dict = sub_dict.setdefault(k, dict())
+            sub_dict[key] = values[kc]
+        return ivy.Container(container_dict, ivyh=ivyh)
+
     @staticmethod
     def h5_file_size(h5_obj_or_filepath):
         """
@@ -1439,6 +1773,95 @@ class ContainerBase(dict, abc.ABC):
     # Private Methods #
     # ----------------#
 
+    def _cont_register_cache_parent(self, parent):
+        # let this container invalidate the caches of the parent when it is mutated
+        parents = self.__dict__.setdefault("_cont_cache_parents", list())
+        if not any(p() is parent for p in parents):
+            parents.append(weakref.ref(parent))
+
+    def _cont_invalidate_caches(self):
+        self.__dict__.pop("_cont_hashes", None)
+        self.__dict__.pop("_cont_key_chain_index", None)
+        parents = self.__dict__.pop("_cont_cache_parents", None)
+        if parents:
+            for parent in parents:
+                parent = parent()
+                if parent is not None:
+                    parent._cont_invalidate_caches()
+
+    def _cont_leaf_shapes(self):
+        # leaves updated inplace keep their identity, but may change shape
+        return tuple(
+            (key, id(value), tuple(value.shape) if ivy.is_array(value) else None)
+            for key, value in dict.items(self)
+            if not isinstance(value, ivy.Container)
+        )
+
+    def _cont_hash(self, content):
+        # content hashes are not cached, as leaf values can be updated inplace
+        # without the container being notified
+        if not content:
+            cached_hash = self._cont_cached_hash(False)
+            if cached_hash is not None:
+                return cached_hash
+        hasher = hashlib.sha256()
+        for key in sorted(self.keys()):
+            value = dict.__getitem__(self, key)
+            if isinstance(value, ivy.Container):
+                value_hash = value._cont_hash(content)
+                value._cont_register_cache_parent(self)
+            else:
+                value_hash = _leaf_hash(value, content)
+            hasher.update(str(key).encode() + b"\0" + value_hash)
+        if content:
+            return hasher.digest()
+        hashes = self.__dict__.setdefault("_cont_hashes", dict())
+        hashes["structure"] = (hasher.digest(), self._cont_leaf_shapes())
+        return hashes["structure"][0]
+
+    def _cont_cached_hash(self, content):
+        # only the structure hash is cached, and is only returned while the shapes
+        # of the leaves are the ones it was computed from
+        hashes = self.__dict__.get("_cont_hashes")
+        if content or hashes is None or "structure" not in hashes:
+            return None
+        structure_hash, leaf_shapes = hashes["structure"]
+        if leaf_shapes != self._cont_leaf_shapes():
+            return None
+        for value in dict.values(self):
+            if (
+                isinstance(value, ivy.Container)
+                and value._cont_cached_hash(False) is None
+            ):
+                return None
+        return structure_hash
+
+    def _cont_build_key_chain_index(self, index, prefix=""):
+        for key, value in self.items():
+            if not isinstance(key, str):
+                continue
+            index[prefix + key] = value
+            if isinstance(value, ivy.Container):
+                value._cont_register_cache_parent(self)
+                value._cont_build_key_chain_index(index, prefix + key + "/")
+        return index
+
+    def _cont_at_indexed_key_chain(self, key_chain):
+        index = self.__dict__.get("_cont_key_chain_index")
+        if index is None:
+            index = self._cont_build_key_chain_index(dict())
+            self.__dict__["_cont_key_chain_index"] = index
+        return index.get(key_chain.replace(".", "/"), _missing)
+
+    @staticmethod
+    def _cont_cached_hashes_match(containers, content):
+        if not all(isinstance(cont, ivy.Container) for cont in containers):
+            return None
+        hashes = [cont._cont_cached_hash(content) for cont in containers]
+        if None in hashes:
+            return None
+        return hashes.count(hashes[0]) == len(hashes)
+
     def _cont_call_static_method_with_flexible_args(
         self,
         static_method,
@@ -2017,6 +2440,8 @@ class ContainerBase(dict, abc.ABC):
             self.cont_to_disk_as_pickled(filepath)
         elif format == "h5py":
             self.cont_to_disk_as_hdf5(filepath)
+        elif format == "shards":
+            self.cont_to_disk_as_shards(filepath)
         else:
             raise ValueError("Unsupported format")
 
@@ -2124,6 +2549,50 @@ class ContainerBase(dict, abc.ABC):
         with open(json_filepath, "w+") as json_data_file:
             json.dump(self.cont_to_jsonable().cont_to_dict(), json_data_file, indent=4)
 
+    def cont_to_disk_as_shards(
+        self, directory, max_shard_size=2**30, background=False
+    ):
+        """
+        Save container object to disk, as shard files of raw array bytes together with
+        an index file, in the specified directory. The leaves are converted to numpy
+        and written one at a time, so no full copy of the container is built in
+        memory, unless writing in the background.
+
+        Parameters
+        ----------
+        directory
+            Directory for where to save the container to disk.
+        max_shard_size
+            Maximum size of each shard file in bytes, leaves larger than this are
+            written to a shard of their own. Default is 1GiB.
+        background
+            Whether to snapshot the leaves to numpy, and then write them on a
+            background thread. Default is ``False``.
+
+        Returns
+        -------
+        ret
+            The thread writing the shards if background is True, which re-raises any
+            error from the write when joined, otherwise None.
+        """
+
+        def _to_leaf(kc, x, copy):
+            if ivy.is_array(x):
+                return kc, self._cont_ivy.to_numpy(x, copy=copy)
+            if not _is_jsonable(x):
+                raise ivy.utils.exceptions.IvyException(
+                    f"leaf at key chain {kc} is neither an array nor json-able"
+                )
+            return kc, x
+
+        if background:
+            leaves = [_to_leaf(kc, x, True) for kc, x in self.cont_to_iterator()]
+            writer = _ShardsWriter(directory, leaves, max_shard_size)
+            writer.start()
+            return writer
+        leaves = (_to_leaf(kc, x, False) for kc, x in self.cont_to_iterator())
+        _write_shards(directory, leaves, max_shard_size)
+
     def cont_to_nested_list(self):
         return_list = list()
         for key, value in self.items():
@@ -2336,6 +2805,8 @@ class ContainerBase(dict, abc.ABC):
         ret
             Boolean
         """
+        if self._cont_at_indexed_key_chain(key_chain) is not _missing:
+            return True
         keys = re.split("[/.]", key_chain)
         ret = self
         for key in keys:
@@ -2599,6 +3070,9 @@ class ContainerBase(dict, abc.ABC):
         ret
             sub-container or value at specified key chain
         """
+        ret = self._cont_at_indexed_key_chain(key_chain)
+        if ret is not _missing:
+            return ret
         keys = re.split("[/.]", key_chain)
         ret = self
         for key in keys:
@@ -3211,6 +3685,37 @@ class ContainerBase(dict, abc.ABC):
     def __deepcopy__(self, memo):
         return self.cont_deep_copy()
 
+    def cont_structure_hash(self):
+        """
+        Return a hash of the key-chains of the container, and of the types and
+        shapes of its leaves.
+
+        The hash of each sub-container is cached, and recomputed once the
+        sub-container is mutated via ``__setitem__`` or ``cont_set_at_key_chain``, or
+        once one of its leaves changes shape. When containers carry their cached
+        hashes, the structural comparisons of ``cont_identical``, ``cont_diff`` and
+        ``cont_common_key_chains`` skip comparing the matching sub-containers.
+
+        Returns
+        -------
+            The structural hash, as a hexadecimal string.
+        """
+        return self._cont_hash(False).hex()
+
+    def cont_content_hash(self):
+        """
+        Return a hash of the structure of the container, and of the values of its
+        leaves.
+
+        Unlike the structural hash, the content hash is recomputed on each call, as
+        leaves can be updated inplace without the container being notified.
+
+        Returns
+        -------
+            The content hash, as a hexadecimal string.
+        """
+        return self._cont_hash(True).hex()
+
     def cont_map(
         self,
         func,
@@ -3769,6 +4274,55 @@ class ContainerBase(dict, abc.ABC):
         # show
         print(this_repr_above + sub_repr + this_repr_below)
 
+    def cont_start_queue_prefetching(self, prefetch_size=None):
+        """
+        Start background threads which load containers from the queues ahead of
+        the queries made to this container.
+
+        Parameters
+        ----------
+        prefetch_size
+            Number of queue containers to load ahead of the most recently queried
+            queue. Default is the ``queue_prefetch_size`` passed to the constructor.
+        """
+        ivy.utils.assertions.check_exists(
+            self._queues, message="container is not loaded from queues"
+        )
+        prefetch_size = ivy.default(prefetch_size, self._queue_prefetch_size)
+        ivy.utils.assertions.check_true(
+            ivy.exists(prefetch_size) and prefetch_size > 0,
+            message="prefetch_size must be a positive integer",
+        )
+        self.cont_stop_queue_prefetching()
+        self._queue_prefetch_size = prefetch_size
+        # the threads only hold a weak reference to the container, and are woken up
+        # to exit once it is garbage collected
+        container_ref = weakref.ref(self)
+        self._queue_prefetchers = [
+            threading.Thread(
+                target=ContainerBase._cont_prefetch_from_queues,
+                args=(container_ref, self._queue_condition),
+                daemon=True,
+            )
+            for _ in range(min(prefetch_size, len(self._queues)))
+        ]
+        weakref.finalize(
+            self, ContainerBase._cont_wake_prefetchers, self._queue_condition
+        )
+        for prefetcher in self._queue_prefetchers:
+            prefetcher.start()
+
+    def cont_stop_queue_prefetching(self):
+        """Stop the background threads loading containers from the queues."""
+        prefetchers = self._queue_prefetchers
+        if not prefetchers:
+            return
+        with self._queue_condition:
+            self._queue_prefetchers = list()
+            self._queue_condition.notify_all()
+        for prefetcher in prefetchers:
+            prefetcher.join()
+
     # Built-ins #
     # ----------#
 
@@ -4050,6 +4604,162 @@ class ContainerBase(dict, abc.ABC):
         else:
             super.__setattr__(self, name, value)
 
+    def _cont_load_from_queue(self, idx):
+        return self._cont_from_queue_item(
+            self._queues[idx].get(timeout=self._queue_timeout)
+        )
+
+    def _cont_from_queue_item(self, item):
+        cont = ivy.Container(item, **self._config).to_ivy()
+        # the single-queue combination is what most queries need, so it is
+        # computed at load time, which for prefetched queues is off the main thread
+        return cont, self._container_combine_method([cont])
+
+    def _cont_store_from_queue(self, idx, cont, combined_cont):
+        self._loaded_containers_from_queues[idx] = cont
+        self._combined_containers_from_queues[(idx,)] = combined_cont
+        self._queue_stats["num_loaded"] += 1
+        self._queue_condition.notify_all()
+
+    def _cont_evict_from_queue(self, idx):
+        del self._loaded_containers_from_queues[idx]
+        for idxs in list(self._combined_containers_from_queues.keys()):
+            if idx in idxs:
+                del self._combined_containers_from_queues[idxs]
+        self._queue_stats["num_evicted"] += 1
+
+    def _cont_evict_from_queues(self, queue_idxs):
+        if not ivy.exists(self._queue_cache_size):
+            return
+        loaded = self._loaded_containers_from_queues
+        # containers preceding the current query are evicted as soon as the cache
+        # is full, making room for prefetching, the others only once it overflows
+        for idx in [i for i in loaded.keys() if i < queue_idxs[0]]:
+            if len(loaded) < self._queue_cache_size:
+                break
+            self._cont_evict_from_queue(idx)
+        for idx in [i for i in loaded.keys() if i not in queue_idxs]:
+            if len(loaded) <= self._queue_cache_size:
+                break
+            self._cont_evict_from_queue(idx)
+        self._queue_condition.notify_all()
+
+    @staticmethod
+    def _cont_wake_prefetchers(condition):
+        with condition:
+            condition.notify_all()
+
+    def _cont_prefetch_is_blocked(self):
+        return (
+            self._queue_next_to_load >= len(self._queues)
+            or self._queue_next_to_load
+            > self._queue_last_queried + self._queue_prefetch_size
+            or (
+                ivy.exists(self._queue_cache_size)
+                and len(self._loaded_containers_from_queues) >= self._queue_cache_size
+            )
+        )
+
+    @staticmethod
+    def _cont_prefetch_from_queues(container_ref, condition):
+        this_thread = threading.current_thread()
+        while True:
+            with condition:
+                while True:
+                    self = container_ref()
+                    if self is None or this_thread not in self._queue_prefetchers:
+                        return
+                    if not self._cont_prefetch_is_blocked():
+                        break
+                    # the container is not kept alive while waiting
+                    del self
+                    condition.wait()
+                idx = self._queue_next_to_load
+                self._queue_next_to_load += 1
+                if (
+                    idx in self._loaded_containers_from_queues
+                    or idx in self._queues_loading
+                ):
+                    continue
+                self._queues_loading.add(idx)
+                source, timeout = self._queues[idx], self._queue_timeout
+                del self
+            try:
+                item = source.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            self = container_ref()
+            if self is None:
+                return
+            if item is None:
+                # hand the queue back, so it is loaded by the next attempt
+                with condition:
+                    self._queues_loading.discard(idx)
+                    self._queue_next_to_load = min(self._queue_next_to_load, idx)
+                    condition.notify_all()
+                del self
+                continue
+            cont, combined_cont = self._cont_from_queue_item(item)
+            with condition:
+                self._queues_loading.discard(idx)
+                self._cont_store_from_queue(idx, cont, combined_cont)
+            del self
+
+    def _cont_get_from_queue(self, idx):
+        # returns the container loaded from the queue, waiting for a prefetch thread
+        # already loading it, or else loading it on this thread, in both cases
+        # without holding the lock while blocking on the queue
+        with self._queue_condition:
+            if idx in self._loaded_containers_from_queues:
+                self._loaded_containers_from_queues.move_to_end(idx)
+                return self._loaded_containers_from_queues[idx]
+            start_time = time.perf_counter()
+            if idx in self._queues_loading:
+                self._queue_condition.wait_for(
+                    lambda: idx not in self._queues_loading,
+                    timeout=self._queue_timeout,
+                )
+            loaded = idx in self._loaded_containers_from_queues
+            if not loaded:
+                if idx in self._queues_loading:
+                    raise queue.Empty
+                self._queues_loading.add(idx)
+                if idx == self._queue_next_to_load:
+                    self._queue_next_to_load += 1
+        if not loaded:
+            try:
+                cont, combined_cont = self._cont_load_from_queue(idx)
+            except queue.Empty:
+                with self._queue_condition:
+                    self._queues_loading.discard(idx)
+                    self._queue_next_to_load = min(self._queue_next_to_load, idx)
+                    self._queue_condition.notify_all()
+                raise
+        with self._queue_condition:
+            if not loaded:
+                self._queues_loading.discard(idx)
+                self._cont_store_from_queue(idx, cont, combined_cont)
+            self._queue_stats["wait_time"] += time.perf_counter() - start_time
+            self._queue_stats["num_waits"] += 1
+            self._loaded_containers_from_queues.move_to_end(idx)
+            return self._loaded_containers_from_queues[idx]
+
+    def _cont_get_from_queues(self, queue_idxs):
+        with self._queue_condition:
+            self._queue_last_queried = max(self._queue_last_queried, queue_idxs[-1])
+            self._queue_condition.notify_all()
+            if queue_idxs in self._combined_containers_from_queues:
+                return self._combined_containers_from_queues[queue_idxs]
+        conts = [self._cont_get_from_queue(i) for i in queue_idxs]
+        with self._queue_condition:
+            combined_cont = self._combined_containers_from_queues.get(queue_idxs)
+        if combined_cont is None:
+            combined_cont = self._container_combine_method(conts)
+        with self._queue_condition:
+            self._combined_containers_from_queues[queue_idxs] = combined_cont
+            self._cont_evict_from_queues(queue_idxs)
+            return combined_cont
+
     def _get_queue_item(self, query):
         if isinstance(query, int):
             queue_queries = [query]
@@ -4066,21 +4776,18 @@ class ContainerBase(dict, abc.ABC):
                 "Invalid slice type, must be one of integer, slice "
                 "or sequences of slices."
             )
-        queue_idxs = set(
-            [np.sum(q >= self._queue_load_sizes_cum).item() for q in queue_queries]
+        queue_idxs = tuple(
+            sorted(
+                set(
+                    [
+                        np.sum(q >= self._queue_load_sizes_cum).item()
+                        for q in queue_queries
+                    ]
+                )
+            )
         )
-        conts = list()
-        for i in queue_idxs:
-            if i not in self._loaded_containers_from_queues:
-                cont = ivy.Container(
-                    self._queues[i].get(timeout=self._queue_timeout), **self._config
-                ).to_ivy()
-                self._loaded_containers_from_queues[i] = cont
-            else:
-                cont = self._loaded_containers_from_queues[i]
-            conts.append(cont)
-        combined_cont = self._container_combine_method(conts)
-        idx = list(queue_idxs)[0]
+        combined_cont = self._cont_get_from_queues(queue_idxs)
+        idx = queue_idxs[0]
         offset = 0 if idx == 0 else self._queue_load_sizes_cum[idx - 1]
         if isinstance(query, int):
             shifted_query = query - offset
@@ -4175,8 +4882,41 @@ class ContainerBase(dict, abc.ABC):
         if isinstance(query, str) and ("/" in query or "." in query):
             return self.cont_set_at_key_chain(query, val, inplace=True)
         else:
+            self._cont_invalidate_caches()
+            if _is_attr_mirrored(type(self), query):
+                self.__dict__[query] = val
             return dict.__setitem__(self, query, val)
 
+    def __delitem__(self, query):
+        self._cont_invalidate_caches()
+        if _is_attr_mirrored(type(self), query):
+            self.__dict__.pop(query, None)
+        return dict.__delitem__(self, query)
+
+    def pop(self, key, *args):
+        if key in self.keys():
+            val = dict.__getitem__(self, key)
+            del self[key]
+            return val
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        key = next(reversed(self.keys()))
+        return key, self.pop(key)
+
+    def clear(self):
+        for key in list(self.keys()):
+            del self[key]
+
+    def setdefault(self, key, default=None):
+        if key not in self.keys():
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def update(self, *args, **kwargs):
+        for key, val in dict(*args, **kwargs).items():
+            self[key] = val
+
     def __contains__(self, key):
         if isinstance(key, str) and ("/" in key or "." in key):
             return self.cont_has_key_chain(key)
@@ -4186,7 +4926,15 @@ class ContainerBase(dict, abc.ABC):
             return dict.__contains__(self, key)
 
     def __getstate__(self):
-        state_dict = copy.copy(self.__dict__)
+        # the keys mirrored as attributes are restored with the dict items, and the
+        # caches rely on weak references to the parent containers
+        state_dict = {
+            k: v
+            for k, v in self.__dict__.items()
+            if k[0] == "_"
+            and k
+            not in ("_cont_hashes", "_cont_key_chain_index", "_cont_cache_parents")
+        }
         state_dict["_local_ivy"] = (
             state_dict["_local_ivy"].current_backend_str()
             if state_dict["_local_ivy"] is not None
@@ -4298,6 +5046,18 @@ class ContainerBase(dict, abc.ABC):
         """
         return self._cont_get_dev()
 
+    @property
+    def cont_queue_stats(self):
+        """
+        Statistics of the containers loaded from the queues.
+
+        Includes the total time spent blocking on queries waiting for queues
+        (in seconds), the number of such waits, and the number of containers
+        loaded from and evicted from the queues.
+        """
+        with self._queue_condition:
+            return dict(self._queue_stats)
+
     @property
     def cont_ivy(self):
         return self._cont_ivy
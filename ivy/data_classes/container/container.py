@@ -97,6 +97,8 @@ class Container(
         queue_load_sizes=None,
         container_combine_method="list_join",
         queue_timeout=None,
+        queue_prefetch_size=None,
+        queue_cache_size=None,
         print_limit=10,
         key_length_limit=None,
         print_indent=4,
@@ -117,6 +119,8 @@ class Container(
             queue_load_sizes,
             container_combine_method,
             queue_timeout,
+            queue_prefetch_size,
+            queue_cache_size,
             print_limit,
             key_length_limit,
             print_indent,
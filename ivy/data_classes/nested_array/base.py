@@ -1,29 +1,136 @@
 # global
 import abc
+import importlib
 from typing import List, Tuple
 
 # local
 import ivy
 
 
+_elementwise_fn_names = set()
+
+
+def _is_elementwise(fn):
+    # the elementwise functions can be applied once to the packed values, the
+    # backend implementations share the names and module name of the ivy functions
+    if not _elementwise_fn_names:
+        elementwise = importlib.import_module("ivy.functional.ivy.elementwise")
+        _elementwise_fn_names.update(
+            k
+            for k, v in vars(elementwise).items()
+            if callable(v) and getattr(v, "__module__", None) == elementwise.__name__
+        )
+    return getattr(fn, "__name__", None) in _elementwise_fn_names and getattr(
+        fn, "__module__", ""
+    ).endswith(".elementwise")
+
+
+def _ragged_reduction(fn, args, kwargs):
+    # the reductions of a single nested array along its innermost nested dimension
+    # are its segment reductions, the other reductions are mapped to each row
+    name = getattr(fn, "__name__", None)
+    if name not in ("sum", "mean", "min", "max") or not getattr(
+        fn, "__module__", ""
+    ).endswith(".statistical"):
+        return None
+    if len(args) != 1 or not ivy.is_ivy_nested_array(args[0]):
+        return None
+    x, axis = args[0], kwargs.get("axis")
+    if isinstance(axis, (list, tuple)) and len(axis) == 1:
+        axis = axis[0]
+    if (
+        x.nested_rank == 0
+        or not isinstance(axis, int)
+        or axis % x.ndim != x.nested_rank
+        or kwargs.get("keepdims", False)
+        or any(
+            kwargs.get(k) is not None for k in kwargs if k not in ("axis", "keepdims")
+        )
+    ):
+        return None
+    return x.ragged_reduce(name)
+
+
 class NestedArrayBase(abc.ABC):
     """Base class for nested array objects."""
 
-    def __init__(self, data, nested_rank, inner_shape, dtype, device, internal=False):
+    def __init__(
+        self,
+        data,
+        nested_rank,
+        inner_shape,
+        dtype,
+        device,
+        internal=False,
+        flat_values=None,
+        nested_row_splits=None,
+    ):
         if not internal:
             raise RuntimeError(
                 "NestedArray is an abstract class "
                 "and should not be instantiated directly."
                 "Please use one of the factory methods instead"
             )
+        # the nested array is stored as nested lists of arrays in data, and/or as
+        # the packed flat_values with one row_splits per nested dimension, each
+        # being computed from the other only when first needed
         self._data = data
+        self._flat_values = flat_values
+        self._nested_row_splits = (
+            None if nested_row_splits is None else tuple(nested_row_splits)
+        )
         self._nested_rank = nested_rank
         self._inner_shape = inner_shape
-        self._shape = [len(self._data)] + [None] * self._nested_rank + self._inner_shape
+        num_rows = (
+            len(self._data)
+            if self._data is not None
+            else (
+                self._nested_row_splits[0].shape[0] - 1
+                if self._nested_row_splits
+                else self._flat_values.shape[0]
+            )
+        )
+        self._shape = [num_rows] + [None] * self._nested_rank + self._inner_shape
         self._dtype = dtype
         self._device = device
         self._pre_repr = "ivy.NestedArray"
 
+    @classmethod
+    def from_flat_values(cls, flat_values, nested_row_splits):
+        """
+        Create a nested array from packed values, and the row splits of each nested
+        dimension, ordered from the outermost to the innermost.
+
+        Parameters
+        ----------
+        flat_values
+            Array containing the values of all the rows, concatenated along the
+            first axis.
+        nested_row_splits
+            Sequence of 1-D integer arrays, the i-th of which partitions the rows of
+            the (i+1)-th nested dimension, or the flat values for the last one.
+
+        Returns
+        -------
+        ret
+            The nested array.
+        """
+        flat_values = ivy.array(flat_values)
+        nested_row_splits = tuple(
+            ivy.astype(ivy.array(row_splits), ivy.int64)
+            for row_splits in nested_row_splits
+        )
+        return cls(
+            None,
+            len(nested_row_splits),
+            list(flat_values.shape[1:]),
+            flat_values.dtype,
+            flat_values.device,
+            internal=True,
+            flat_values=flat_values,
+            nested_row_splits=nested_row_splits,
+        )
+
     @classmethod
     def nested_array(
         cls, data, nested_rank=None, inner_shape=None, dtype=None, device=None
@@ -46,7 +153,10 @@ class NestedArrayBase(abc.ABC):
             elif (
                 isinstance(x, (list, tuple))
                 and len(x) != 0
-                and isinstance(x[0], (list, tuple))
+                and (
+                    isinstance(x[0], (list, tuple))
+                    or (ivy.is_array(x[0]) and len(x[0].shape) > 0)
+                )
             ):
                 depth_ret = None
                 for i, item in enumerate(x):
@@ -90,11 +200,11 @@ class NestedArrayBase(abc.ABC):
                 list(inner_shape) if inner_shape is not None else default_inner_shape
             )
         elif isinstance(data, cls):
-            data = data._data
             nested_rank = nested_rank if nested_rank is not None else data.nested_rank
             inner_shape = (
-                list(inner_shape) if list(inner_shape) is not None else data.inner_shape
+                list(inner_shape) if inner_shape is not None else data.inner_shape
             )
+            data = data.data
         else:
             raise TypeError(f"Input data must be pylist or tuple, got: {type(data)}")
 
@@ -129,15 +239,45 @@ class NestedArrayBase(abc.ABC):
 
         if num_nest == 0:
             raise Exception(f"No RaggedArrays found in args or kwargs of function {fn}")
+        ret = _ragged_reduction(inspect_fn, args, kwargs)
+        if ret is not None:
+            return ret
+        if _is_elementwise(inspect_fn) and ivy.NestedArray._packable(
+            nests, list(args) + list(kwargs.values())
+        ):
+            return nests[0].__class__.from_flat_values(
+                map_fn([nest.flat_values for nest in nests]),
+                nests[0].nested_row_splits,
+            )
         ret = ivy.NestedArray.ragged_multi_map(map_fn, nests)
         return ret
 
+    @staticmethod
+    def _packable(nests, args):
+        # elementwise functions only map to the flat values if the nested arrays
+        # share their row splits, and the other arrays only broadcast to inner dims
+        nest0 = nests[0]
+        for nest in nests[1:]:
+            if nest.nested_rank != nest0.nested_rank or nest.shape[0] != nest0.shape[0]:
+                return False
+            for row_splits, row_splits0 in zip(
+                nest.nested_row_splits, nest0.nested_row_splits
+            ):
+                if row_splits is not row_splits0 and not (
+                    row_splits.shape == row_splits0.shape
+                    and ivy.array_equal(row_splits, row_splits0)
+                ):
+                    return False
+        inner_ndim = min(len(nest.inner_shape) for nest in nests)
+        return not ivy.nested_any(
+            args, lambda x: ivy.is_array(x) and len(x.shape) > inner_ndim
+        )
+
     @staticmethod
     def ragged_multi_map(fn, ragged_arrays):
         args = list()
         for ragged in ragged_arrays:
             args.append(ivy.copy_nest(ragged.data))
-        ragged_arrays[0]
         ret = ivy.nested_multi_map(lambda x, _: fn(x), args)
         # infer dtype, shape, and device from the first array in the ret data
         broadcasted_shape = ivy.NestedArray.broadcast_shapes(
@@ -209,7 +349,7 @@ class NestedArrayBase(abc.ABC):
         return z
 
     def ragged_map(self, fn):
-        arg = ivy.copy_nest(self._data)
+        arg = ivy.copy_nest(self.data)
         ivy.nested_map(lambda x: fn(x), arg, shallow=True)
         # infer dtype, shape, and device from the first array in the ret data
         arr0_id = ivy.nested_argwhere(arg, ivy.is_ivy_array, stop_after_n_found=1)[0]
@@ -220,17 +360,171 @@ class NestedArrayBase(abc.ABC):
         )
         return ragged_ret
 
+    def map_flat_values(self, fn):
+        """
+        Apply a function to the packed values of the nested array, which must keep
+        the size of their first axis.
+
+        Parameters
+        ----------
+        fn
+            The function to apply, once, to all the values of the nested array.
+
+        Returns
+        -------
+        ret
+            The nested array with the same row splits and the mapped values.
+        """
+        return self.from_flat_values(fn(self.flat_values), self.nested_row_splits)
+
+    def ragged_reduce(self, reduction="sum"):
+        """
+        Reduce each row of the innermost nested dimension, using segment reductions
+        over the packed values.
+
+        Parameters
+        ----------
+        reduction
+            The reduction to apply, one of "sum", "mean", "min" or "max".
+            Default is "sum".
+
+        Returns
+        -------
+        ret
+            The nested array with one less nested dimension, or a dense array if the
+            nested array only had one nested dimension. As for the segment reductions,
+            empty rows reduce to zero for "sum", and to the largest and lowest values
+            of the dtype for "min" and "max", while their "mean" is NaN.
+        """
+        ivy.utils.assertions.check_elem_in_list(
+            reduction, ["sum", "mean", "min", "max"]
+        )
+        flat_values = self.flat_values
+        row_splits = self.nested_row_splits[-1]
+        row_lengths = row_splits[1:] - row_splits[:-1]
+        num_rows = row_lengths.shape[0]
+        segment_ids = ivy.repeat(
+            ivy.arange(num_rows, dtype=row_splits.dtype), row_lengths
+        )
+        if reduction in ["sum", "mean"]:
+            ret = ivy.unsorted_segment_sum(flat_values, segment_ids, num_rows)
+            if reduction == "mean":
+                ret = ret / ivy.reshape(
+                    ivy.astype(row_lengths, ret.dtype),
+                    [num_rows] + [1] * len(self._inner_shape),
+                )
+        elif reduction == "min":
+            ret = ivy.unsorted_segment_min(flat_values, segment_ids, num_rows)
+        else:
+            # the maximum is the opposite of the minimum of the opposite values, or of
+            # their complement for unsigned dtypes, which can't be negated
+            if ivy.is_uint_dtype(flat_values):
+                top = ivy.iinfo(flat_values.dtype).max
+                ret = top - ivy.unsorted_segment_min(
+                    top - flat_values, segment_ids, num_rows
+                )
+            else:
+                ret = -ivy.unsorted_segment_min(-flat_values, segment_ids, num_rows)
+            lowest = (
+                ivy.finfo(flat_values.dtype).min
+                if ivy.is_float_dtype(flat_values)
+                else ivy.iinfo(flat_values.dtype).min
+            )
+            empty = ivy.reshape(
+                row_lengths == 0, [num_rows] + [1] * len(self._inner_shape)
+            )
+            ret = ivy.where(empty, ivy.full_like(ret, lowest), ret)
+        if self._nested_rank == 1:
+            return ret
+        return self.from_flat_values(ret, self.nested_row_splits[:-1])
+
     def unbind(self):
-        return tuple(ivy.copy_nest(self._data))
+        return tuple(ivy.copy_nest(self.data))
+
+    def _pack(self):
+        nested_row_lengths = [list() for _ in range(self._nested_rank)]
+        leaves = list()
+
+        def _pack_rows(x, depth):
+            nested_row_lengths[depth].append(len(x))
+            if depth == self._nested_rank - 1:
+                leaves.append(x)
+                return
+            for item in x:
+                _pack_rows(item, depth + 1)
+
+        if self._nested_rank == 0:
+            self._flat_values = ivy.array(self._data)
+            self._nested_row_splits = tuple()
+            return
+        for x in self._data:
+            _pack_rows(x, 0)
+        self._nested_row_splits = tuple(
+            ivy.concat(
+                [
+                    ivy.zeros([1], dtype=ivy.int64),
+                    ivy.cumsum(ivy.array(row_lengths, dtype=ivy.int64)),
+                ]
+            )
+            for row_lengths in nested_row_lengths
+        )
+        self._flat_values = (
+            ivy.concat(leaves, axis=0)
+            if leaves
+            else ivy.zeros([0] + self._inner_shape, dtype=self._dtype)
+        )
+
+    def _unpack(self):
+        if self._nested_rank == 0:
+            self._data = self._flat_values
+            return
+        row_splits = ivy.to_list(self._nested_row_splits[-1])
+        rows = [
+            self._flat_values[start:end]
+            for start, end in zip(row_splits[:-1], row_splits[1:])
+        ]
+        for row_splits in self._nested_row_splits[-2::-1]:
+            row_splits = ivy.to_list(row_splits)
+            rows = [
+                rows[start:end] for start, end in zip(row_splits[:-1], row_splits[1:])
+            ]
+        self._data = rows
 
     # Properties #
     # ---------- #
 
     @property
     def data(self) -> ivy.NativeArray:
-        """The native array being wrapped in self."""
+        """The nested lists of arrays, built from the packed values if needed."""
+        if self._data is None:
+            self._unpack()
         return self._data
 
+    @property
+    def flat_values(self) -> ivy.Array:
+        """The values of all the rows, concatenated along the first axis."""
+        if self._flat_values is None:
+            self._pack()
+        return self._flat_values
+
+    @property
+    def nested_row_splits(self) -> Tuple[ivy.Array]:
+        """The row splits of each nested dimension, outermost first."""
+        if self._nested_row_splits is None:
+            self._pack()
+        return self._nested_row_splits
+
+    @property
+    def row_splits(self) -> ivy.Array:
+        """The row splits of the outermost nested dimension."""
+        return self.nested_row_splits[0]
+
+    @property
+    def row_lengths(self) -> ivy.Array:
+        """The row lengths of the outermost nested dimension."""
+        row_splits = self.row_splits
+        return row_splits[1:] - row_splits[:-1]
+
     @property
     def dtype(self) -> ivy.Dtype:
         """Data type of the array elements."""
@@ -265,13 +559,13 @@ class NestedArrayBase(abc.ABC):
     # ----------#
 
     def __repr__(self):
-        rep = self._data.__repr__().replace("[ivy.array", "[")
+        rep = self.data.__repr__().replace("[ivy.array", "[")
         rep = rep.replace("ivy.array", "\n\t").replace("(", "").replace(")", "")
         ret = self._pre_repr + "(\n\t" + rep + "\n)"
         return ret
 
     def __getitem__(self, query):
-        ret = self._data[query]
+        ret = self.data[query]
         if isinstance(ret, list):
             return self.__class__.nested_array(
                 ret, self._nested_rank - 1, dtype=self._dtype, device=self._device
@@ -1,24 +1,46 @@
 # local
+import ivy
 from .base import NestedArrayBase
 
 
 class NestedArray(NestedArrayBase):
-    def __init__(self, data, nested_rank, inner_shape, dtype, device, internal=False):
+    def __init__(
+        self,
+        data,
+        nested_rank,
+        inner_shape,
+        dtype,
+        device,
+        internal=False,
+        flat_values=None,
+        nested_row_splits=None,
+    ):
         NestedArrayBase.__init__(
-            self, data, nested_rank, inner_shape, dtype, device, internal
+            self,
+            data,
+            nested_rank,
+            inner_shape,
+            dtype,
+            device,
+            internal,
+            flat_values,
+            nested_row_splits,
         )
 
     @classmethod
     def from_row_lengths(cls, values, row_lengths):
-        ivy_arrays = list()
-        for i in range(len(row_lengths)):
-            ivy_arrays.append(values[: row_lengths[i]])
-            values = values[row_lengths[i] :]
-        return cls.nested_array(ivy_arrays)
+        row_splits = ivy.concat(
+            [
+                ivy.zeros([1], dtype=ivy.int64),
+                ivy.cumsum(ivy.astype(ivy.array(row_lengths), ivy.int64)),
+            ]
+        )
+        return cls.from_row_splits(values, row_splits)
 
     @classmethod
     def from_row_splits(cls, values, row_splits):
-        row_lengths = list()
-        for i in range(1, len(row_splits)):
-            row_lengths.append(row_splits[i] - row_splits[i - 1])
-        return cls.from_row_lengths(values, row_lengths)
+        if isinstance(values, NestedArrayBase):
+            return cls.from_flat_values(
+                values.flat_values, (row_splits,) + values.nested_row_splits
+            )
+        return cls.from_flat_values(values, (row_splits,))
@@ -169,3 +169,7 @@ def grad(func: Callable, argnums: Union[int, Tuple[int]] = 0):
         return ivy.to_ivy(jax.grad(grad_fn, argnums)(ivy.to_native(x_in)))
 
     return callback_fn
+
+
+def checkpoint(func: Callable):
+    return jax.checkpoint(func)
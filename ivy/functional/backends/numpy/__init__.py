@@ -39,7 +39,9 @@ def wrap__array_ufunc__(func):
             "add": "add",
             "not_equal": "not_equal",
         }
-        if ufunc.__name__ in methods.keys():
+        # only direct calls map to ivy functions, and ufunc methods such as
+        # np.add.at are left to numpy
+        if method == "__call__" and ufunc.__name__ in methods.keys():
             return eval("ivy." + methods[ufunc.__name__] + "(*inputs, **kwargs)")
         return func(self, ufunc, method, *inputs, **kwargs)
 
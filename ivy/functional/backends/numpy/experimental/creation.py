@@ -104,12 +104,8 @@ def unsorted_segment_min(
         raise ValueError("Unsupported data type")
 
     res = np.full((num_segments,) + data.shape[1:], init_val, dtype=data.dtype)
-
-    for i in range(num_segments):
-        mask_index = segment_ids == i
-        if np.any(mask_index):
-            res[i] = np.min(data[mask_index], axis=0)
-
+    valid = segment_ids >= 0
+    np.minimum.at(res, segment_ids[valid], data[valid])
     return res
 
 
@@ -151,12 +147,10 @@ def unsorted_segment_sum(
     )
 
     res = np.zeros((num_segments,) + data.shape[1:], dtype=data.dtype)
-
-    for i in range(num_segments):
-        mask_index = segment_ids == i
-        if np.any(mask_index):
-            res[i] = np.sum(data[mask_index], axis=0)
-
+    valid = segment_ids >= 0
+    if not np.all(valid):
+        segment_ids, data = segment_ids[valid], data[valid]
+    np.add.at(res, segment_ids, data)
     return res
 
 
@@ -311,7 +311,10 @@ def scatter_nd(
     if not target_given:
         shape = list(shape) if ivy.exists(shape) else list(out.shape)
         target = np.zeros(shape, dtype=updates.dtype)
-    updates = _broadcast_to(updates, target[indices_tuple].shape)
+    # the shape of the indexed slices, without gathering them
+    updates = _broadcast_to(
+        updates, indices.shape[:-1] + target.shape[indices.shape[-1] :]
+    )
     if reduction == "sum":
         np.add.at(target, indices_tuple, updates)
     elif reduction == "replace":
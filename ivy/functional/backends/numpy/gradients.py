@@ -97,3 +97,9 @@ def stop_gradient(x, /, *, preserve_type=True, out=None):
         "has no effect on the array, as gradients are not supported in the first place."
     )
     return x
+
+
+def checkpoint(func):
+    # NumPy does not support autograd, so no activations are kept for a backward
+    # pass in the first place, and func is called as it is.
+    return func
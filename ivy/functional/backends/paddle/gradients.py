@@ -292,3 +292,16 @@ def grad(f, argnums=0):
 
 grad.f_original = None
 grad.nth = 0
+
+
+def checkpoint(func: Callable):
+    # imported lazily, as importing fleet initializes the distributed utilities
+    from paddle.distributed.fleet.utils import recompute
+
+    def checkpointed(*args):
+        # without autograd there are no activations to discard
+        if not paddle.is_grad_enabled():
+            return func(*args)
+        return recompute(func, *args)
+
+    return checkpointed
@@ -241,3 +241,7 @@ def grad(f, argnums=0):
 
 grad.f_original = None
 grad.nth = 0
+
+
+def checkpoint(func: Callable):
+    return tf.recompute_grad(func)
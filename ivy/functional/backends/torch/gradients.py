@@ -2,6 +2,7 @@
 
 # global
 import torch
+import torch.utils.checkpoint
 from typing import Optional, Callable, Sequence, Union
 
 # local
@@ -262,3 +263,13 @@ def grad(f, argnums=0):
 
 grad.f_original = None
 grad.nth = 0
+
+
+def checkpoint(func: Callable):
+    def checkpointed(*args):
+        # without autograd there are no activations to discard
+        if not torch.is_grad_enabled():
+            return func(*args)
+        return torch.utils.checkpoint.checkpoint(func, *args, use_reentrant=False)
+
+    return checkpointed
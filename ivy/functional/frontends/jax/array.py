@@ -4,10 +4,14 @@
 import ivy
 import ivy.functional.frontends.jax as jax_frontend
 from ivy.func_wrapper import with_unsupported_dtypes
+from ivy.functional.frontends.jax.func_wrapper import _native_to_ivy_array
 
 
 class Array:
+    __slots__ = ("_ivy_array", "weak_type", "__weakref__")
+
     def __init__(self, array, weak_type=False):
+        array = _native_to_ivy_array(array)
         self._ivy_array = array if isinstance(array, ivy.Array) else ivy.array(array)
         self.weak_type = weak_type
 
@@ -14,7 +14,7 @@ import ivy.functional.frontends.numpy as np_frontend
 
 
 def _from_ivy_array_to_jax_frontend_array(x, nested=False, include_derived=None):
-    if nested:
+    if nested and not isinstance(x, ivy.Array):
         return ivy.nested_map(
             _from_ivy_array_to_jax_frontend_array, x, include_derived, shallow=False
         )
@@ -26,7 +26,7 @@ def _from_ivy_array_to_jax_frontend_array(x, nested=False, include_derived=None)
 def _from_ivy_array_to_jax_frontend_array_weak_type(
     x, nested=False, include_derived=None
 ):
-    if nested:
+    if nested and not isinstance(x, ivy.Array):
         return ivy.nested_map(
             _from_ivy_array_to_jax_frontend_array_weak_type,
             x,
@@ -49,7 +49,7 @@ def _from_jax_frontend_array_to_ivy_array(x):
 
 def _native_to_ivy_array(x):
     if isinstance(x, ivy.NativeArray):
-        return ivy.array(x)
+        return ivy.Array(x)
     return x
 
 
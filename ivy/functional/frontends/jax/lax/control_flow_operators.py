@@ -1,6 +1,123 @@
 # global
 import ivy
-from ivy.functional.frontends.jax.func_wrapper import to_ivy_arrays_and_back
+from ivy.functional.frontends.jax.func_wrapper import (
+    _to_ivy_array,
+    to_ivy_arrays_and_back,
+)
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+def _check_unroll(unroll, length):
+    # as in jax, True unrolls the whole loop and False does not unroll it
+    if isinstance(unroll, bool):
+        return max(length, 1) if unroll else 1
+    if not isinstance(unroll, int) or unroll < 1:
+        raise ivy.utils.exceptions.IvyException(
+            "jax.lax: unroll must be a positive integer or a boolean."
+        )
+    return unroll
+
+
+def _scan(f, init, xs, length, reverse, unroll):
+    # each chunk of unroll steps runs back to back, and its outputs are stacked once
+    # and written into preallocated stacked outputs, where the backend updates
+    # arrays in place, or else concatenated with those of the other chunks at the end
+    xs_leaves = _tree_leaves(xs)
+    if xs_leaves:
+        if length is not None and length != xs_leaves[0].shape[0]:
+            raise ivy.utils.exceptions.IvyException(
+                "jax.lax.scan: length does not match the leading axis of xs."
+            )
+        length = xs_leaves[0].shape[0]
+    unroll = _check_unroll(unroll, length)
+    if length == 0:
+        # f is called once on zeros, as jax traces it, for the structure, shapes and
+        # dtypes of the outputs, which are stacked along an empty leading axis
+        _, y = f(
+            init,
+            _tree_unflatten(
+                xs, [ivy.zeros(x.shape[1:], dtype=x.dtype) for x in xs_leaves]
+            ),
+        )
+        outputs = [_to_ivy_output(v) for v in _tree_leaves(y)]
+        return init, _tree_unflatten(
+            y, [ivy.empty((0,) + tuple(v.shape), dtype=v.dtype) for v in outputs]
+        )
+    inplace = ivy.inplace_arrays_supported()
+    xs_iters = [iter(ivy.flip(x, axis=0) if reverse else x) for x in xs_leaves]
+
+    carry, y, stacked, chunks = init, None, None, []
+    for start in range(0, length, unroll):
+        outputs = []
+        for _ in range(min(unroll, length - start)):
+            carry, y = f(carry, _tree_unflatten(xs, [next(x) for x in xs_iters]))
+            outputs.append([_to_ivy_output(v) for v in _tree_leaves(y)])
+        if reverse:
+            outputs.reverse()
+        if not inplace:
+            chunks.append([ivy.stack(leaves) for leaves in zip(*outputs)])
+            continue
+        if stacked is None:
+            stacked = [
+                ivy.empty((length,) + tuple(v.shape), dtype=v.dtype) for v in outputs[0]
+            ]
+        stop = length - start if reverse else start + len(outputs)
+        if len(outputs) == 1:
+            for out, v in zip(stacked, outputs[0]):
+                out[stop - 1] = v
+        else:
+            for out, leaves in zip(stacked, zip(*outputs)):
+                out[stop - len(outputs) : stop] = ivy.stack(leaves)
+    if not inplace and chunks:
+        if reverse:
+            chunks.reverse()
+        stacked = [ivy.concat(leaves) for leaves in zip(*chunks)]
+    return carry, _tree_unflatten(y, stacked or [])
+
+
+def _to_ivy_output(x):
+    x = _to_ivy_array(x)
+    return x if isinstance(x, ivy.Array) else ivy.asarray(x)
+
+
+def _tree_leaves(tree):
+    # the leaves of a pytree, None being an empty subtree as in jax
+    if tree is None:
+        return []
+    if isinstance(tree, (tuple, list)):
+        return [leaf for child in tree for leaf in _tree_leaves(child)]
+    if isinstance(tree, dict):
+        return [leaf for key in sorted(tree) for leaf in _tree_leaves(tree[key])]
+    return [tree]
+
+
+def _tree_unflatten(tree, leaves):
+    # a pytree of the structure of tree, holding the leaves in the order of
+    # _tree_leaves
+    leaves = iter(leaves)
+
+    def _build(tree):
+        if tree is None:
+            return None
+        if isinstance(tree, (tuple, list)):
+            children = [_build(child) for child in tree]
+            return (
+                type(tree)(*children)
+                if hasattr(tree, "_fields")
+                else type(tree)(children)
+            )
+        if isinstance(tree, dict):
+            return {key: _build(tree[key]) for key in sorted(tree)}
+        return next(leaves)
+
+    return _build(tree)
+
+
+# --- Main --- #
+# ------------ #
 
 
 @to_ivy_arrays_and_back
@@ -18,11 +135,14 @@ def cond(pred, true_fun, false_fun, *operands, operand=None, linear=None):
 
 
 @to_ivy_arrays_and_back
-def fori_loop(lower, upper, body_fun, init_val):
+def fori_loop(lower, upper, body_fun, init_val, *, unroll=None):
     if not (callable(body_fun)):
         raise ivy.exceptions.IvyException(
             "jax.lax.fori_loop: Argument body_fun should be callable."
         )
+    if unroll is not None:
+        # the iterations of an eager loop run back to back whatever the unrolling
+        _check_unroll(unroll, upper - lower)
     val = init_val
     for i in range(lower, upper):
         val = body_fun(i, val)
@@ -31,7 +151,7 @@ def fori_loop(lower, upper, body_fun, init_val):
 
 @to_ivy_arrays_and_back
 def map(f, xs):
-    return ivy.stack([f(x) for x in xs])
+    return _scan(lambda _, x: (None, f(x)), None, xs, None, False, 1)[1]
 
 
 @to_ivy_arrays_and_back
@@ -49,15 +169,7 @@ def scan(f, init, xs, length=None, reverse=False, unroll=1):
         raise ivy.exceptions.IvyException(
             "jax.lax.scan: length must be a non-negative integer."
         )
-    if xs is None:
-        xs = [None] * length
-
-    carry = init
-    ys = []
-    for x in xs:
-        carry, y = f(carry, x)
-        ys.append(y)
-    return carry, ivy.stack(ys)
+    return _scan(f, init, xs, length, reverse, unroll)
 
 
 @to_ivy_arrays_and_back
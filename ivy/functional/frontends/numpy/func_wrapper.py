@@ -175,10 +175,8 @@ def _ivy_to_numpy(x: Any) -> Any:
 
 def _ivy_to_numpy_order_F(x: Any) -> Any:
     if isinstance(x, ivy.Array) or ivy.is_native_array(x):
-        a = np_frontend.ndarray(
-            0, order="F"
-        )  # TODO Find better initialisation workaround
-        a.ivy_array = x
+        a = np_frontend.ndarray(x, _init_overload=True)
+        a._f_contiguous = True
         return a
     else:
         return x
@@ -186,7 +184,7 @@ def _ivy_to_numpy_order_F(x: Any) -> Any:
 
 def _native_to_ivy_array(x):
     if isinstance(x, ivy.NativeArray):
-        return ivy.array(x)
+        return ivy.Array(x)
     return x
 
 
@@ -510,6 +508,8 @@ def outputs_to_frontend_arrays(fn: Callable) -> Callable:
         if not ivy.array_mode:
             return ret
         # convert all returned arrays to `ndarray` instances
+        if isinstance(ret, (ivy.Array, ivy.NativeArray)):
+            return _ivy_to_numpy_order_F(ret) if order == "F" else _ivy_to_numpy(ret)
         if order == "F":
             return ivy.nested_map(
                 _ivy_to_numpy_order_F, ret, include_derived={"tuple": True}
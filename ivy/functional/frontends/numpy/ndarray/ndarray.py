@@ -5,7 +5,10 @@ import warnings
 # local
 import ivy
 import ivy.functional.frontends.numpy as np_frontend
-from ivy.functional.frontends.numpy.func_wrapper import _to_ivy_array
+from ivy.functional.frontends.numpy.func_wrapper import (
+    _native_to_ivy_array,
+    _to_ivy_array,
+)
 
 
 # --- Classes ---#
@@ -19,8 +22,9 @@ class ndarray:
 
         # in thise case shape is actually the desired array
         if _init_overload:
+            shape = _native_to_ivy_array(shape)
             self._ivy_array = (
-                ivy.array(shape) if not isinstance(shape, ivy.Array) else shape
+                shape if isinstance(shape, ivy.Array) else ivy.array(shape)
             )
         else:
             self._ivy_array = ivy.empty(shape=shape, dtype=dtype)
@@ -77,9 +81,8 @@ class ndarray:
 
     @ivy_array.setter
     def ivy_array(self, array):
-        self._ivy_array = (
-            ivy.array(array) if not isinstance(array, ivy.Array) else array
-        )
+        array = _native_to_ivy_array(array)
+        self._ivy_array = array if isinstance(array, ivy.Array) else ivy.array(array)
 
     # Instance Methods #
     # ---------------- #
@@ -3,7 +3,13 @@ import inspect
 from math import inf
 
 # local
+import ivy
 import ivy.functional.frontends.numpy as np_frontend
+from ivy.functional.frontends.numpy.func_wrapper import (
+    _to_ivy_array,
+    from_zero_dim_arrays_to_scalar,
+    to_ivy_arrays_and_back,
+)
 
 identities = {
     "abs": None,
@@ -195,6 +201,112 @@ ufuncs = [
     "trunc",
 ]
 
+# ufuncs which are associative and commutative, so that their reductions may be
+# computed in any order and over several axes at once
+reorderable = [
+    "add",
+    "bitwise_and",
+    "bitwise_or",
+    "bitwise_xor",
+    "fmax",
+    "fmin",
+    "gcd",
+    "hypot",
+    "lcm",
+    "logaddexp",
+    "logaddexp2",
+    "logical_and",
+    "logical_or",
+    "logical_xor",
+    "maximum",
+    "minimum",
+    "multiply",
+]
+
+# backend kernels of the ufunc methods #
+# -------------------------------------#
+
+cumulative_kernels = {
+    "add": ivy.cumsum,
+    "multiply": ivy.cumprod,
+}
+reduction_kernels = {
+    "add": ivy.sum,
+    "logical_and": ivy.all,
+    "logical_or": ivy.any,
+    "maximum": ivy.max,
+    "minimum": ivy.min,
+    "multiply": ivy.prod,
+}
+scatter_reductions = {
+    "add": "sum",
+    "maximum": "max",
+    "minimum": "min",
+    "multiply": "mul",
+}
+
+
+# helpers #
+# --------#
+
+
+def _fold(fn, x, where=None, accumulate=False):
+    # left fold along the first axis, for the ufuncs which are not associative,
+    # skipping the elements outside of where, and with accumulate, returning each
+    # intermediate result stacked along the first axis
+    ret = x[0]
+    steps = [ret]
+    for i in range(1, x.shape[0]):
+        ret = (
+            fn(ret, x[i]) if where is None else ivy.where(where[i], fn(ret, x[i]), ret)
+        )
+        if accumulate:
+            steps.append(ret)
+    return ivy.stack(steps) if accumulate else ret
+
+
+def _pairwise_reduce(fn, x):
+    # combine adjacent pairs along the first axis, halving it with each kernel
+    while x.shape[0] > 1:
+        half = x.shape[0] // 2
+        paired = fn(x[: 2 * half : 2], x[1 : 2 * half : 2])
+        x = paired if x.shape[0] % 2 == 0 else ivy.concat([paired, x[-1:]])
+    return x[0]
+
+
+def _scan(fn, x):
+    # inclusive scan along the first axis, doubling the combined span with each
+    # kernel
+    shift = 1
+    while shift < x.shape[0]:
+        x = ivy.concat([x[:shift], fn(x[:-shift], x[shift:])])
+        shift *= 2
+    return x
+
+
+def _flat_positions(a, indices):
+    # the positions within the flattened array of the elements indexed by indices
+    if isinstance(indices, (list, int)):
+        indices = ivy.array(indices)
+    if len(a.shape) == 1 and ivy.is_array(indices) and ivy.is_int_dtype(indices):
+        if indices.shape[0] and ivy.min(indices) < 0:
+            return ivy.where(indices < 0, indices + a.shape[0], indices)
+        return indices
+    return ivy.reshape(ivy.arange(a.size), a.shape)[indices]
+
+
+def _occurrence_ranks(positions):
+    # the number of earlier occurrences of each position among positions
+    order = ivy.argsort(positions, stable=True)
+    sorted_positions = positions[order]
+    first = ivy.searchsorted(sorted_positions, sorted_positions)
+    return ivy.scatter_nd(
+        ivy.expand_dims(order, axis=-1),
+        ivy.arange(positions.shape[0]) - first,
+        shape=positions.shape,
+        reduction="replace",
+    )
+
 
 # Class #
 # ----- #
@@ -259,19 +371,178 @@ class ufunc:
     def __call__(self, *args, **kwargs):
         return self.func(*args, **kwargs)
 
+    def _binary(self, x1, x2):
+        return _to_ivy_array(self.func(x1, x2))
+
+    @to_ivy_arrays_and_back
+    @from_zero_dim_arrays_to_scalar
     def reduce(
-        array, axis=0, dtype=None, out=None, keepdims=False, initial=None, where=True
+        self,
+        array,
+        axis=0,
+        dtype=None,
+        out=None,
+        keepdims=False,
+        initial=None,
+        where=True,
     ):
-        pass
+        array = ivy.array(array) if not ivy.is_array(array) else array
+        if dtype is not None:
+            array = ivy.astype(array, np_frontend.to_ivy_dtype(dtype))
+        axes = tuple(range(len(array.shape))) if axis is None else axis
+        axes = (axes,) if isinstance(axes, int) else tuple(axes)
+        axes = tuple(a % len(array.shape) for a in axes)
+        if len(axes) > 1 and self.__name__ not in reorderable:
+            raise ValueError(
+                f"reduction operation '{self.__name__}' is not reorderable, so at"
+                " most one axis may be specified"
+            )
+        if where is not True and self.identity is None and initial is None:
+            raise ValueError(
+                f"reduction operation '{self.__name__}' does not have an identity,"
+                " so to use a where mask one has to specify 'initial'"
+            )
+        if self.__name__ not in reorderable:
+            # a left fold along the single axis, starting from initial
+            ret = ivy.moveaxis(array, axes[0], 0)
+            if initial is not None:
+                ret = ivy.concat([ivy.full_like(ret[:1], initial), ret])
+            mask = None
+            if where is not True:
+                mask = ivy.moveaxis(ivy.broadcast_to(where, array.shape), axes[0], 0)
+                if initial is not None:
+                    mask = ivy.concat([ivy.ones_like(mask[:1]), mask])
+            ret = _fold(self._binary, ret, mask)
+            if keepdims:
+                ret = ivy.expand_dims(ret, axis=axes[0])
+        else:
+            if where is not True:
+                fill = self.identity if self.identity is not None else initial
+                array = ivy.where(where, array, ivy.full_like(array, fill))
+            if self.__name__ in reduction_kernels:
+                ret = reduction_kernels[self.__name__](
+                    array, axis=axes, keepdims=keepdims
+                )
+            else:
+                # the slices along each axis are combined pairwise, in a logarithmic
+                # number of kernels
+                ret = array
+                for a in sorted(axes, reverse=True):
+                    ret = _pairwise_reduce(self._binary, ivy.moveaxis(ret, a, 0))
+                    if keepdims:
+                        ret = ivy.expand_dims(ret, axis=a)
+            if initial is not None:
+                ret = self._binary(initial, ret)
+        if out is not None:
+            return ivy.inplace_update(out, ret, keep_input_dtype=True)
+        return ret
 
-    def accumulate(array, axis=0, dtype=None, out=None):
-        pass
+    @to_ivy_arrays_and_back
+    def accumulate(self, array, axis=0, dtype=None, out=None):
+        array = ivy.array(array) if not ivy.is_array(array) else array
+        if dtype is not None:
+            array = ivy.astype(array, np_frontend.to_ivy_dtype(dtype))
+        if self.__name__ in cumulative_kernels:
+            ret = cumulative_kernels[self.__name__](array, axis=axis)
+        else:
+            array = ivy.moveaxis(array, axis, 0)
+            if array.shape[0] == 0:
+                ret = array
+            elif self.__name__ in reorderable:
+                ret = _scan(self._binary, array)
+            else:
+                ret = _fold(self._binary, array, accumulate=True)
+            ret = ivy.moveaxis(ret, 0, axis)
+        if out is not None:
+            return ivy.inplace_update(out, ret, keep_input_dtype=True)
+        return ret
 
-    def reduceat(array, indices, axis=0, dtype=None, out=None):
-        pass
+    @to_ivy_arrays_and_back
+    def reduceat(self, array, indices, axis=0, dtype=None, out=None):
+        array = ivy.array(array) if not ivy.is_array(array) else array
+        if dtype is not None:
+            array = ivy.astype(array, np_frontend.to_ivy_dtype(dtype))
+        indices = ivy.astype(ivy.array(indices), "int64")
+        array = ivy.moveaxis(array, axis, 0)
+        size = array.shape[0]
+        ends = ivy.concat([indices[1:], ivy.array([size], dtype="int64")])
+        # each segment holds at least its first element, and the elements after it
+        # are gathered into a single array along with the index of their segment
+        lengths = ivy.where(ends > indices, ends - indices, ivy.ones_like(indices))
+        first = ivy.gather(array, indices, axis=0)
+        if self.__name__ in scatter_reductions:
+            rest = lengths - 1
+            segments = ivy.repeat(ivy.arange(indices.shape[0], dtype="int64"), rest)
+            offsets = ivy.cumsum(rest) - rest
+            positions = ivy.arange(segments.shape[0], dtype="int64") + ivy.repeat(
+                indices - offsets + 1, rest
+            )
+            ret = ivy.scatter_nd(
+                ivy.expand_dims(segments, axis=-1),
+                ivy.gather(array, positions, axis=0),
+                reduction=scatter_reductions[self.__name__],
+                out=first,
+            )
+        else:
+            # ufuncs without a scatter kernel reduce each segment in turn
+            ret = ivy.stack(
+                [
+                    (
+                        _to_ivy_array(self.reduce(array[start : start + length]))
+                        if length > 1
+                        else first[i]
+                    )
+                    for i, (start, length) in enumerate(
+                        zip(ivy.to_list(indices), ivy.to_list(lengths))
+                    )
+                ]
+            )
+        ret = ivy.moveaxis(ret, 0, axis)
+        if out is not None:
+            return ivy.inplace_update(out, ret, keep_input_dtype=True)
+        return ret
 
-    def outer(A, B, /, **kwargs):
-        pass
+    @to_ivy_arrays_and_back
+    def outer(self, A, B, /, **kwargs):
+        A = ivy.array(A) if not ivy.is_array(A) else A
+        B = ivy.array(B) if not ivy.is_array(B) else B
+        # a single broadcast kernel, over the dimensions of A followed by those of B
+        A = ivy.reshape(A, tuple(A.shape) + (1,) * len(B.shape))
+        return _to_ivy_array(self.func(A, B, **kwargs))
 
-    def at(a, indices, b=None, /):
-        pass
+    @to_ivy_arrays_and_back
+    def at(self, a, indices, b=None, /):
+        positions = _flat_positions(a, indices)
+        if b is not None:
+            b = ivy.array(b) if not ivy.is_array(b) else b
+            b = ivy.astype(b, a.dtype, copy=False)
+            b = ivy.reshape(ivy.broadcast_to(b, positions.shape), (-1,))
+        positions = ivy.reshape(positions, (-1,))
+        flat = ivy.reshape(a, (-1,))
+        if self.__name__ in scatter_reductions and b is not None:
+            # repeated positions are combined by the scatter kernel itself
+            ret = ivy.scatter_nd(
+                ivy.expand_dims(positions, axis=-1),
+                b,
+                reduction=scatter_reductions[self.__name__],
+                out=flat,
+            )
+        else:
+            # the ufunc is applied once per round, to the positions which are not
+            # repeated within the round, in as many rounds as the most repeated
+            # position has occurrences
+            ret = flat
+            ranks = _occurrence_ranks(positions)
+            rounds = int(ivy.max(ranks)) + 1 if positions.shape[0] else 0
+            for rank in range(rounds):
+                mask = ranks == rank
+                at = positions[mask]
+                args = (ret[at],) if b is None else (ret[at], b[mask])
+                updates = ivy.astype(_to_ivy_array(self.func(*args)), a.dtype)
+                ret = ivy.scatter_nd(
+                    ivy.expand_dims(at, axis=-1),
+                    updates,
+                    reduction="replace",
+                    out=ret,
+                )
+        ivy.inplace_update(a, ivy.reshape(ret, a.shape), keep_input_dtype=True)
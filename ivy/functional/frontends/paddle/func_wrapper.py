@@ -11,20 +11,20 @@ import ivy.functional.frontends.paddle as paddle_frontend
 
 
 def _from_ivy_array_to_paddle_frontend_tensor(x, nested=False, include_derived=None):
-    if nested:
+    if nested and not isinstance(x, (ivy.Array, ivy.NativeArray)):
         return ivy.nested_map(
             _from_ivy_array_to_paddle_frontend_tensor, x, include_derived, shallow=False
         )
     elif isinstance(x, ivy.Array) or ivy.is_native_array(x):
-        a = paddle_frontend.Tensor(x)
+        a = paddle_frontend.Tensor(_to_ivy_array(x))
         return a
     return x
 
 
 def _to_ivy_array(x):
-    # if x is a native array return it as an ivy array
+    # if x is a native array return it wrapped in an ivy array, without a copy
     if isinstance(x, ivy.NativeArray):
-        return ivy.array(x)
+        return ivy.Array(x)
 
     # else if x is a frontend torch Tensor (or any frontend "Tensor" actually) return the wrapped ivy array # noqa: E501
     elif hasattr(x, "ivy_array"):
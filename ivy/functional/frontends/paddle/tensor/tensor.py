@@ -9,6 +9,8 @@ from ivy.functional.frontends.paddle.func_wrapper import _to_ivy_array
 
 
 class Tensor:
+    __slots__ = ("_ivy_array", "_dtype", "_place", "_stop_gradient", "__weakref__")
+
     def __init__(self, array, dtype=None, place="cpu", stop_gradient=True):
         self._ivy_array = (
             ivy.array(array, dtype=dtype, device=place)
@@ -53,9 +55,8 @@ class Tensor:
 
     @ivy_array.setter
     def ivy_array(self, array):
-        self._ivy_array = (
-            ivy.array(array) if not isinstance(array, ivy.Array) else array
-        )
+        array = _to_ivy_array(array)
+        self._ivy_array = array if isinstance(array, ivy.Array) else ivy.array(array)
 
     # Special Methods #
     # -------------------#
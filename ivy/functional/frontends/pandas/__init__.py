@@ -8,3 +8,5 @@ from . import dataframe
 from .dataframe import *
 from . import generic
 from .generic import *
+from . import io
+from .io import *
@@ -1,6 +1,8 @@
 from .generic import NDFrame
 import ivy
 from .series import Series
+from .groupby import DataFrameGroupBy, _factorize
+from .lazy import LazyFrame, _parse
 from ivy.functional.frontends.pandas.index import Index
 
 
@@ -16,6 +18,19 @@ class DataFrame(NDFrame):
         *args,
         **kwargs,
     ):
+        self._indexed_columns = (None, None)
+        if isinstance(data, dict):
+            # one array per column, each with its own dtype
+            self.name = None
+            self.dtype = dtype
+            self.copy = copy
+            self.orig_data = data
+            self.columns = list(data.keys()) if columns is None else columns
+            self._data = self._dict_to_columns(data, self.columns, index)
+            if index is None:
+                index = ivy.arange(len(self._data[0]) if self._data else 0)
+            self.index = index if isinstance(index, Index) else Index(index)
+            return
         super().__init__(
             data,
             index=index,
@@ -26,48 +41,94 @@ class DataFrame(NDFrame):
             *args,
             **kwargs,
         )
-        if isinstance(self.orig_data, dict):
-            # if data is a dict the underlying array needs to be extended to match the
-            # index as a 2d array
-            self.columns = list(self.orig_data.keys()) if columns is None else columns
-            array_data = list(self.orig_data.values())
-            self.array = ivy.array([array_data for _ in range(len(self.index))])
-        elif isinstance(self.orig_data, Series):
-            self.array = self.array.expand_dims()
-            self.columns = [0]
+        if isinstance(self.orig_data, Series):
+            self.columns = [0 if data.name is None else data.name]
         elif columns is None:
-            self.columns = ivy.arange(self.array.shape[1]).tolist()
+            self.columns = list(range(len(self._data)))
         else:
             self.columns = columns
 
-        assert self.array.ndim == 2, "DataFrame Data must be 2-dimensional"
+        assert len(self._data) == len(
+            self.columns
+        ), "DataFrame Data must be 2-dimensional"
+
+    @staticmethod
+    def _dict_to_columns(data, columns, index):
+        # scalars are broadcast along the index, and arrays are kept without a copy
+        values = [data.get(c, ivy.nan) for c in columns]
+        values = [v if isinstance(v, ivy.Array) else ivy.array(v) for v in values]
+        if all(v.ndim == 0 for v in values):
+            if values and index is None:
+                raise ValueError("If using all scalar values, you must pass an index")
+            length = 0 if index is None else len(index)
+        else:
+            length = max(v.shape[0] for v in values if v.ndim)
+        return [v if v.ndim else ivy.broadcast_to(v, (length,)) for v in values]
+
+    @property
+    def array(self):
+        # the columns stacked into a 2d array, their dtypes promoted to a common one
+        if not self._data:
+            return ivy.zeros((len(self.index), 0))
+        return ivy.stack(self._data, axis=1)
+
+    @array.setter
+    def array(self, value):
+        # the columns of a 2d array are stored as views of it
+        if value.ndim == 1:
+            value = ivy.expand_dims(value, axis=-1)
+        self._data = [value[:, i] for i in range(value.shape[1])]
+
+    @property
+    def _column_index(self):
+        # hash index of the column labels, rebuilt when the columns are reassigned
+        columns, index = self._indexed_columns
+        if columns is not self.columns:
+            self._indexed_columns = (self.columns, Index(self.columns))
+        return self._indexed_columns[1]
+
+    def _take_columns(self, positions, rows=slice(None)):
+        return DataFrame(
+            {self.columns[i]: self._data[i][rows] for i in positions},
+            index=self.index[rows],
+            dtype=self.dtype,
+        )
 
     def __getitem__(self, col):
-        # turn labels (strings) into numbered indexing so that self.array columns can
-        # be accessed.
+        if isinstance(col, Series):
+            col = col.array
+        if isinstance(col, ivy.Array) and ivy.is_bool_dtype(col):
+            # rows selected by a boolean mask
+            return self._take_columns(range(len(self.columns)), rows=col)
         if isinstance(col, (tuple, list)):
-            numbered_col = [self.columns.index(i) for i in col]
-            return DataFrame(
-                self.array[:, numbered_col],
-                index=self.index,
-                dtype=self.dtype,
-                columns=col,
-            )
-        col = self.columns.index(col)
+            numbered_col = self._column_index.get_indexer(col)
+            if ivy.any(numbered_col < 0):
+                raise KeyError(f"{[c for c in col if c not in self._column_index]}")
+            return self._take_columns(numbered_col.to_list())
+        # the column is returned as a view, without a copy
         return Series(
-            self.array[:, col],
+            self._data[self._column_index.get_loc(col)],
             index=self.index,
             dtype=self.dtype,
+            name=col,
         )
 
+    def __setitem__(self, col, value):
+        if isinstance(value, Series):
+            value = value.array
+        if not isinstance(value, ivy.Array):
+            value = ivy.array(value)
+        if value.ndim == 0:
+            value = ivy.broadcast_to(value, (len(self.index),))
+        if col in self._column_index:
+            self._data[self._column_index.get_loc(col)] = value
+        else:
+            self._data.append(value)
+            self.columns = self.columns + [col]
+
     def __getattr__(self, item):
-        if item in self.columns:
-            item_index = self.columns.index(item)
-            return Series(
-                self.array[:, item_index],
-                index=self.index,
-                dtype=self.dtype,
-            )
+        if item in self._column_index:
+            return self[item]
         else:
             return super().__getattr__(item)
 
@@ -78,11 +139,24 @@ class DataFrame(NDFrame):
         )
 
     def sum(self, axis=None, skipna=True, level=None, numeric_only=None, min_count=0):
-        _array = self.array
         if axis is None or axis == "index":
             axis = 0  # due to https://github.com/pandas-dev/pandas/issues/54547. TODO: remove this when fixed # noqa: E501
         elif axis == "columns":
             axis = 1
+        if axis == 0:
+            # each column is reduced on its own, in its own dtype
+            ret = [ivy.nansum(c) if skipna else ivy.sum(c) for c in self._data]
+            if min_count > 0:
+                ret = [
+                    (
+                        ivy.array(ivy.nan)
+                        if c.size - ivy.sum(ivy.isnan(c)) < min_count
+                        else r
+                    )
+                    for c, r in zip(self._data, ret)
+                ]
+            return Series(ivy.stack(ret), index=Index(self.columns))
+        _array = self.array
         if min_count > 0:
             if ivy.has_nans(_array):
                 number_values = _array.size - ivy.sum(ivy.isnan(_array))
@@ -94,20 +168,26 @@ class DataFrame(NDFrame):
             ret = ivy.nansum(_array, axis=axis)
         else:
             ret = _array.sum(axis=axis)
-        return Series(ret, index=self.columns if axis in (0, "index") else self.index)
+        return Series(ret, index=self.index)
 
     def mean(self, axis=0, skipna=True, numeric_only=None, **kwargs):
-        _array = ivy.astype(self.array, ivy.default_float_dtype())
         axis = 0 if axis == "index" else 1 if axis == "columns" else axis
+        if axis == 0:
+            ret = [
+                (ivy.nanmean if skipna else ivy.mean)(
+                    ivy.astype(c, ivy.default_float_dtype())
+                )
+                for c in self._data
+            ]
+            return Series(ivy.stack(ret), index=Index(self.columns))
+        _array = ivy.astype(self.array, ivy.default_float_dtype())
         if skipna:
             ret = ivy.nanmean(_array, axis=axis)
         else:
             ret = _array.mean(axis=axis)
         if axis is None:
             return ret  # scalar case
-        return Series(
-            ret, index=Index(self.columns) if axis in (0, "index") else self.index
-        )
+        return Series(ret, index=self.index)
 
     def get(self, key, default=None):
         if key in self.columns:
@@ -116,3 +196,39 @@ class DataFrame(NDFrame):
 
     def keys(self):
         return self.columns
+
+    def lazy(self, chunksize=2**20):
+        return LazyFrame(self, chunksize=chunksize)
+
+    def eval(self, expr, inplace=False):
+        target, code, names = _parse(expr)
+        if target is not None:
+            ret = self.lazy().eval(expr).collect()
+            if inplace:
+                self[target] = ret[target]
+                return None
+            return ret
+        # a column with an unnamed label, so that it can not clash with the others
+        result = object()
+        _, _, arrays = (
+            self.lazy()._with("assign", result, code, names)[result]._collect()
+        )
+        return Series(arrays[0], index=self.index)
+
+    def query(self, expr, inplace=False):
+        ret = self.lazy().query(expr).collect()
+        if inplace:
+            self._data, self.index = ret._data, ret.index
+            return None
+        return ret
+
+    def groupby(self, by, sort=True):
+        if isinstance(by, (list, tuple)) and len(by) != len(self.index):
+            # todo: group by several columns with a multiindex
+            raise NotImplementedError("grouping by several columns is not supported")
+        if not isinstance(by, (list, ivy.Array, Series, Index)):
+            columns = [c for c in self.columns if c != by]
+            by = self[by]
+        else:
+            columns = list(self.columns)
+        return DataFrameGroupBy(self, *_factorize(by, sort=sort), columns)
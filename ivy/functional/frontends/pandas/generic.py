@@ -4,6 +4,7 @@ import copy as py_copy
 from ivy.functional.frontends.pandas.func_wrapper import outputs_to_self_class
 import ivy.functional.frontends.pandas.series as series
 from ivy.functional.frontends.pandas.index import Index
+from ivy.functional.frontends.pandas.indexing import _LocIndexer
 
 
 class NDFrame:
@@ -12,7 +13,9 @@ class NDFrame:
         self.columns = columns
         self.dtype = dtype
         self.copy = copy
-        self.orig_data = py_copy.deepcopy(data)
+        # ivy arrays are kept without a copy, so that columns are views of a frame
+        keep = isinstance(data, ivy.Array) and not copy
+        self.orig_data = data if keep else py_copy.deepcopy(data)
 
         if ivy.is_native_array(data):
             self.array = ivy.array(data)
@@ -37,7 +40,7 @@ class NDFrame:
 
         if data_is_array_or_like:
             self.index = index
-            self.array = ivy.array(data)
+            self.array = data if keep else ivy.array(data)
 
         elif isinstance(data, dict):
             self.index = index
@@ -72,6 +75,10 @@ class NDFrame:
             ret = dict(zip(self.orig_data.keys(), ret))
         return ret
 
+    @property
+    def loc(self):
+        return _LocIndexer(self)
+
     @outputs_to_self_class
     def abs(self):
         return ivy.abs(self.array)
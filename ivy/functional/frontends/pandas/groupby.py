@@ -0,0 +1,102 @@
+import ivy
+import ivy.functional.frontends.pandas.series as series
+from ivy.functional.frontends.pandas.index import Index
+
+
+def _factorize(keys, sort=True):
+    # int code of the group of each row, into the index of the groups
+    if isinstance(keys, series.Series):
+        keys = keys.array
+    if not isinstance(keys, Index):
+        keys = Index(keys)
+    return keys.factorize(sort=sort)
+
+
+class GroupBy:
+    def __init__(self, obj, codes, groups):
+        """
+        Rows of a Series or a DataFrame grouped by the int codes of their keys.
+        Each reduction is a single segment sum over the codes, rows with a missing
+        key (code -1) being left out of every group.
+        """
+        self.obj = obj
+        self.codes = codes
+        self.groups = groups
+
+    @property
+    def ngroups(self):
+        return len(self.groups)
+
+    def _segment_sum(self, values):
+        return ivy.unsorted_segment_sum(values, self.codes, self.ngroups)
+
+    def _present(self, values):
+        if ivy.is_float_dtype(values):
+            return ~ivy.isnan(values)
+        return ivy.ones_like(values, dtype="bool")
+
+    def _segment_sums(self, values, present):
+        # missing values are summed as 0
+        if ivy.is_float_dtype(values):
+            values = ivy.where(present, values, ivy.zeros_like(values))
+        elif ivy.is_bool_dtype(values):
+            values = values.astype("int64")
+        return self._segment_sum(values)
+
+
+class SeriesGroupBy(GroupBy):
+    def _values(self):
+        return self.obj.array
+
+    def _wrap(self, array):
+        return series.Series(array, index=self.groups, name=self.obj.name)
+
+    def count(self):
+        present = self._present(self._values())
+        return self._wrap(self._segment_sum(present.astype("int64")))
+
+    def sum(self, numeric_only=False, min_count=0):
+        values = self._values()
+        present = self._present(values)
+        sums = self._segment_sums(values, present)
+        if min_count > 0:
+            counts = self._segment_sum(present.astype("int64"))
+            sums = ivy.where(counts >= min_count, sums.astype("float64"), ivy.nan)
+        return self._wrap(sums)
+
+    def mean(self, numeric_only=False):
+        values = self._values()
+        if not ivy.is_float_dtype(values):
+            values = values.astype(ivy.default_float_dtype())
+        present = self._present(values)
+        sums = self._segment_sums(values, present)
+        counts = self._segment_sum(present.astype(sums.dtype))
+        # groups without any value get nan, as 0 / 0
+        return self._wrap(sums / counts)
+
+
+class DataFrameGroupBy(GroupBy):
+    def __init__(self, obj, codes, groups, columns):
+        super().__init__(obj, codes, groups)
+        self.columns = columns
+
+    def __getitem__(self, col):
+        if isinstance(col, (list, tuple)):
+            return DataFrameGroupBy(self.obj, self.codes, self.groups, list(col))
+        return SeriesGroupBy(self.obj[col], self.codes, self.groups)
+
+    def _apply(self, name, **kwargs):
+        # each column is reduced on its own, keeping its dtype
+        return type(self.obj)(
+            {c: getattr(self[c], name)(**kwargs).array for c in self.columns},
+            index=self.groups,
+        )
+
+    def count(self):
+        return self._apply("count")
+
+    def sum(self, numeric_only=False, min_count=0):
+        return self._apply("sum", min_count=min_count)
+
+    def mean(self, numeric_only=False):
+        return self._apply("mean")
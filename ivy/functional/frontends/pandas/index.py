@@ -10,11 +10,10 @@ class Index:
         if not isinstance(data, ivy.Array):
             try:
                 self.index_array = ivy.array(data, dtype=dtype)
-            except ivy.utils.exceptions.IvyBackendException:
-                # labels as strings
+            except ivy.utils.exceptions.IvyException:
+                # labels as strings, stored as int codes into the unique labels
                 if isinstance(data, (list, tuple)):
-                    self.tokens = data
-                    self.index_array = Index._tokenize_1d(data)
+                    self.tokens, self.index_array = Index._tokenize_1d(data)
                 else:
                     # todo: handle other cases
                     raise NotImplementedError
@@ -27,30 +26,59 @@ class Index:
         self.name = name
         self.copy = copy
         self.tupleize_cols = tupleize_cols
+        self._engine_table = None
+        self._locs_table = None
+        self._sorter = None
 
     @staticmethod
     def _tokenize_1d(x: Iterable):
-        return ivy.array(list(v for v, _ in enumerate(x)))
+        # the unique labels in order of appearance, and the code of each label
+        tokens = dict()
+        codes = ivy.array([tokens.setdefault(v, len(tokens)) for v in x], dtype="int64")
+        return list(tokens), codes
+
+    @staticmethod
+    def _from_codes(codes, tokens, name=None):
+        ret = Index(codes, name=name)
+        ret.tokens = tokens
+        ret.tokens_exist = True
+        return ret
+
+    @property
+    def _engine(self):
+        # hash table from each label to the position of its first occurrence, built
+        # on the first lookup
+        if self._engine_table is None:
+            labels = self.to_list()
+            self._engine_table = dict(
+                zip(reversed(labels), range(len(labels) - 1, -1, -1))
+            )
+        return self._engine_table
 
     def __repr__(self):
-        if self.tokens_exist:
-            return f"Index({list(self.tokens)})"
-        return f"Index({self.index_array.to_list()})"
+        return f"Index({self.to_list()})"
 
     def __getitem__(self, item):
+        if isinstance(item, (list, tuple)):
+            item = ivy.array(item)
+        if isinstance(item, (slice, ivy.Array)):
+            if self.tokens_exist:
+                return Index._from_codes(
+                    self.index_array[item], self.tokens, name=self.name
+                )
+            return Index(self.index_array[item], name=self.name)
         if self.tokens_exist:
-            if isinstance(item, (list, tuple)):
-                return Index(self.tokens[item])
-            return self.tokens[item]
-        elif isinstance(item, (list, tuple)):
-            return Index(self.index_array[item])
+            return self.tokens[int(self.index_array[item])]
         return self.index_array[item]
 
+    def __contains__(self, key):
+        return key in self._engine
+
     def __len__(self):
         return len(self.index_array)
 
     def __iter__(self):
-        return iter(self.index_array.to_list())
+        return iter(self.to_list())
 
     @property
     def ndim(self):
@@ -74,14 +102,130 @@ class Index:
 
     def unique(self, level=None):
         # todo handle level with mutliindexer
-        self.index_array = ivy.unique_values(self)
-        return Index(self.index_array, dtype=self.dtype, copy=self.copy, name=self.name)
+        if self.tokens_exist:
+            return Index._from_codes(
+                ivy.unique_values(self.index_array), self.tokens, name=self.name
+            )
+        return Index(
+            ivy.unique_values(self.index_array),
+            dtype=self.dtype,
+            copy=self.copy,
+            name=self.name,
+        )
 
     def is_unique(self):
-        uniques = ivy.unique_values(self)
-        return len(uniques) == len(self.index_array)
+        return len(self._engine) == len(self.index_array)
+
+    def get_loc(self, key):
+        """
+        Get the position of a label, from a hash table of the labels. A label which
+        is repeated in the index gets a boolean mask of its positions instead.
+        """
+        loc = self._engine.get(key)
+        if loc is None:
+            raise KeyError(key)
+        if self.is_unique():
+            return loc
+        mask = self.index_array == self.index_array[loc]
+        return loc if ivy.sum(mask) == 1 else mask
+
+    def get_indexer(self, target):
+        """
+        Get the positions of the labels of target in the index, and -1 for the
+        labels which are missing. Numeric labels are searched in a sorted copy of
+        the index, all at once.
+        """
+        if not self.is_unique():
+            raise ValueError("Reindexing only valid with uniquely valued Index objects")
+        if isinstance(target, Index):
+            target = target.to_list() if target.tokens_exist else target.index_array
+        if not self.tokens_exist:
+            try:
+                target = ivy.array(target)
+            except ivy.utils.exceptions.IvyException:
+                target = None
+            if target is not None:
+                return self._search_sorted(target)
+        return ivy.array(
+            [self._engine.get(label, -1) for label in target], dtype="int64"
+        )
+
+    def get_indexer_non_unique(self, target):
+        """
+        Get the positions of the labels of target in an index which may repeat
+        them, each label giving all of its positions in order. Also returns the
+        positions in target of the labels which are missing, which get -1.
+        """
+        if self._locs_table is None:
+            self._locs_table = dict()
+            for i, label in enumerate(self.to_list()):
+                self._locs_table.setdefault(label, []).append(i)
+        if isinstance(target, ivy.Array):
+            target = target.to_list()
+        indexer, missing = [], []
+        for i, label in enumerate(target):
+            locs = self._locs_table.get(label)
+            if locs is None:
+                missing.append(i)
+                locs = [-1]
+            indexer.extend(locs)
+        return ivy.array(indexer, dtype="int64"), ivy.array(missing, dtype="int64")
+
+    def _search_sorted(self, target):
+        if self._sorter is None:
+            self._sorter = ivy.argsort(self.index_array)
+        if not self.size:
+            return ivy.full(target.shape, -1, dtype="int64")
+        ordered = self.index_array[self._sorter]
+        pos = ivy.searchsorted(ordered, target)
+        pos = ivy.minimum(pos, self.size - 1)
+        found = ordered[pos] == target
+        return ivy.where(found, self._sorter[pos], -1).astype("int64")
+
+    def factorize(self, sort=False, use_na_sentinel=True):
+        """
+        Encode the labels as int codes into their unique values, in order of
+        appearance or sorted. Missing values get the code -1.
+        """
+        values = self.index_array
+        missing = None
+        if ivy.is_float_dtype(values) and ivy.any(ivy.isnan(values)):
+            missing = ivy.isnan(values)
+            values = values[~missing]
+        uniques, first, inverse, _ = ivy.unique_all(values)
+        codes = ivy.reshape(inverse, (-1,)).astype("int64")
+        if self.tokens_exist:
+            labels = [self.tokens[c] for c in uniques.to_list()]
+            # missing labels are left out of the uniques
+            order = [i for i, v in enumerate(labels) if v is not None and v == v]
+            order.sort(key=labels.__getitem__ if sort else first.to_list().__getitem__)
+            uniques = Index([labels[i] for i in order], name=self.name)
+        elif sort:
+            order = None
+            uniques = Index(uniques, name=self.name)
+        else:
+            order = ivy.argsort(first)
+            uniques = Index(uniques[order], name=self.name)
+        if order is not None:
+            # the new code of each unique value is its position in the order
+            codes = ivy.scatter_nd(
+                ivy.expand_dims(ivy.array(order, dtype="int64"), axis=-1),
+                ivy.arange(len(order), dtype="int64"),
+                reduction="replace",
+                out=ivy.full((len(first),), -1, dtype="int64"),
+            )[codes]
+        if missing is not None:
+            codes = ivy.scatter_nd(
+                ivy.expand_dims(ivy.nonzero(~missing)[0], axis=-1),
+                codes,
+                reduction="replace",
+                out=ivy.full((len(missing),), -1, dtype="int64"),
+            )
+        return codes, uniques
 
     def to_list(self):
+        if self.tokens_exist:
+            return [self.tokens[c] for c in self.index_array.to_list()]
         return self.index_array.to_list()
 
     def to_numpy(self, dtype=None, copy=False, na_value=ivy.nan, **kwargs):
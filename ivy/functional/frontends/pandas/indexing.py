@@ -0,0 +1,58 @@
+import ivy
+import ivy.functional.frontends.pandas.series as series
+from ivy.functional.frontends.pandas.index import Index
+
+
+def _positions(index, key):
+    # positions in the index of a label, of a list of labels, of a slice of labels
+    # (both ends included) or of a boolean mask
+    if isinstance(key, slice):
+        start = 0 if key.start is None else index.get_loc(key.start)
+        stop = len(index) if key.stop is None else index.get_loc(key.stop) + 1
+        return slice(start, stop, key.step)
+    if isinstance(key, ivy.Array) and ivy.is_bool_dtype(key):
+        return key
+    if isinstance(key, (list, ivy.Array, Index)):
+        if index.is_unique():
+            indexer = index.get_indexer(key)
+            missing = ivy.nonzero(indexer < 0)[0]
+        else:
+            # a repeated label selects all of its rows
+            indexer, missing = index.get_indexer_non_unique(key)
+        if len(missing):
+            missing = set(missing.to_list())
+            missing = [k for i, k in enumerate(key) if i in missing]
+            raise KeyError(f"{missing} not in index")
+        return indexer
+    return index.get_loc(key)
+
+
+class _LocIndexer:
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __getitem__(self, key):
+        obj = self.obj
+        if isinstance(obj, series.Series):
+            rows = _positions(obj.index, key)
+            if isinstance(rows, int):
+                return obj.array[rows].item()
+            return series.Series(obj.array[rows], index=obj.index[rows], name=obj.name)
+
+        label, cols = key if isinstance(key, tuple) else (key, slice(None))
+        rows = _positions(obj.index, label)
+        cols = _positions(obj._column_index, cols)
+        if isinstance(cols, int):
+            if isinstance(rows, int):
+                return obj._data[cols][rows].item()
+            return series.Series(
+                obj._data[cols][rows], index=obj.index[rows], name=obj.columns[cols]
+            )
+        cols = ivy.arange(len(obj.columns))[cols].to_list()
+        if isinstance(rows, int):
+            return series.Series(
+                ivy.stack([obj._data[i][rows] for i in cols]),
+                index=obj._column_index[ivy.array(cols, dtype="int64")],
+                name=label,
+            )
+        return obj._take_columns(cols, rows=rows)
@@ -0,0 +1,159 @@
+from io import StringIO
+
+import numpy as np
+
+import ivy
+from ivy.functional.frontends.pandas.dataframe import DataFrame
+
+
+# characters read at once, ended at the next line
+_BLOCK_SIZE = 1 << 22
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+def _parse_column(values):
+    # the dtype of a column of strings, as inferred by pandas for numbers and bools
+    try:
+        return values.astype(np.int64)
+    except ValueError:
+        pass
+    if np.all((values == "True") | (values == "False")):
+        return values == "True"
+    try:
+        # missing values are nan
+        return np.where(np.char.strip(values) == "", "nan", values).astype(np.float64)
+    except ValueError:
+        # todo: string columns
+        raise NotImplementedError("only numeric and boolean columns can be read")
+
+
+def _parse_block(text, sep, usecols, dtypes):
+    # the columns of a block of lines, parsed in C with the dtypes of the previous
+    # blocks, and inferred again from strings when these do not fit
+    kwargs = dict(delimiter=sep, usecols=usecols, comments=None, quotechar='"')
+    if dtypes is not None:
+        struct = np.dtype(
+            [(f"f{i}", "U5" if d == bool else d) for i, d in enumerate(dtypes)]
+        )
+        try:
+            block = np.loadtxt(StringIO(text), dtype=struct, ndmin=1, **kwargs)
+        except ValueError:
+            pass
+        else:
+            return [
+                block[n] == "True" if d == bool else block[n]
+                for n, d in zip(struct.names, dtypes)
+            ]
+    block = np.loadtxt(StringIO(text), dtype=str, ndmin=2, **kwargs)
+    return [_parse_column(block[:, i]) for i in range(block.shape[1])]
+
+
+def _read_blocks(f, text, sep, usecols):
+    # the columns of each block of whole lines
+    dtypes = None
+    text += f.read(_BLOCK_SIZE)
+    while text:
+        text += f.readline()
+        if dtypes is None:
+            # the dtypes are inferred from the first lines only
+            sample = text[: text.rfind("\n", 0, 1 << 16) + 1] or text
+            dtypes = [c.dtype for c in _parse_block(sample, sep, usecols, None)]
+        columns = _parse_block(text, sep, usecols, dtypes)
+        dtypes = [np.result_type(c.dtype, d) for c, d in zip(columns, dtypes)]
+        yield columns
+        text = f.read(_BLOCK_SIZE)
+
+
+def _rechunk(blocks, chunksize, nrows):
+    # blocks of any length into chunks of chunksize rows, up to nrows rows
+    pending, length = [], 0
+    for block in blocks:
+        pending.append(block)
+        length += len(block[0])
+        while length >= min(chunksize, nrows):
+            columns = [np.concatenate(c) for c in zip(*pending)]
+            size = min(chunksize, nrows)
+            yield [c[:size] for c in columns]
+            pending, length = [[c[size:] for c in columns]], length - size
+            nrows -= size
+            if not nrows:
+                return
+    if length:
+        yield [np.concatenate(c) for c in zip(*pending)]
+
+
+def _read(f, sep, header, names, usecols, nrows, chunksize):
+    first = f.readline()
+    fields = [v.strip().strip('"') for v in first.rstrip("\r\n").split(sep) if first]
+    if names is None:
+        names = fields if header is not None else list(range(len(fields)))
+    if usecols is not None:
+        usecols = sorted(names.index(c) if c in names else c for c in usecols)
+        names = [names[i] for i in usecols]
+    # the first line holds data when there is no header
+    blocks = _read_blocks(f, "" if header is not None else first, sep, usecols)
+    return names, _rechunk(blocks, chunksize or float("inf"), nrows or float("inf"))
+
+
+def _to_frame(names, columns, dtype, start):
+    data = {}
+    for name, column in zip(names, columns):
+        column_dtype = dtype.get(name) if isinstance(dtype, dict) else dtype
+        column = ivy.array(column)
+        data[name] = column if column_dtype is None else column.astype(column_dtype)
+    return DataFrame(data, index=ivy.arange(start, start + len(columns[0])))
+
+
+def _read_chunks(filepath_or_buffer, dtype, *args):
+    if isinstance(filepath_or_buffer, str):
+        with open(filepath_or_buffer) as f:
+            yield from _read_chunks(f, dtype, *args)
+        return
+    names, chunks = _read(filepath_or_buffer, *args)
+    start = 0
+    for columns in chunks:
+        yield _to_frame(names, columns, dtype, start)
+        start += len(columns[0])
+    if not start:
+        # as in pandas, a file without rows gives one empty frame, with the columns
+        # of its header
+        yield DataFrame({name: ivy.array([]) for name in names})
+
+
+# --- Main --- #
+# ------------ #
+
+
+def read_csv(
+    filepath_or_buffer,
+    sep=",",
+    delimiter=None,
+    header="infer",
+    names=None,
+    usecols=None,
+    dtype=None,
+    nrows=None,
+    chunksize=None,
+    **kwargs,
+):
+    """
+    Read a CSV file of numeric and boolean columns into a DataFrame. The file is
+    streamed in blocks of lines, each parsed into columns in C without a Python
+    object for each row. With chunksize, an iterator over DataFrames of chunksize
+    rows is returned instead, for files which do not fit in memory.
+    """
+    if kwargs:
+        raise NotImplementedError(
+            f"read_csv does not support the arguments {sorted(kwargs)}"
+        )
+    sep = sep if delimiter is None else delimiter
+    if header == "infer":
+        header = 0 if names is None else None
+    args = (sep, header, names, usecols, nrows, chunksize)
+    if chunksize is not None:
+        return _read_chunks(filepath_or_buffer, dtype, *args)
+    # a single chunk, of all the rows
+    return next(_read_chunks(filepath_or_buffer, dtype, *args))
@@ -0,0 +1,251 @@
+import ast
+
+import ivy
+import ivy.functional.frontends.pandas.series as series
+
+
+_ALLOWED_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Compare,
+    ast.Name,
+    ast.Load,
+    ast.Constant,
+    ast.operator,
+    ast.unaryop,
+    ast.cmpop,
+)
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+class _ElementwiseLogic(ast.NodeTransformer):
+    # and, or, not and chained comparisons apply elementwise, as in pandas.eval
+    def visit_BoolOp(self, node):
+        self.generic_visit(node)
+        op = ast.BitAnd() if isinstance(node.op, ast.And) else ast.BitOr()
+        ret = node.values[0]
+        for value in node.values[1:]:
+            ret = ast.BinOp(left=ret, op=op, right=value)
+        return ret
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Not):
+            return ast.UnaryOp(op=ast.Invert(), operand=node.operand)
+        return node
+
+    def visit_Compare(self, node):
+        self.generic_visit(node)
+        operands = [node.left] + node.comparators
+        ret = None
+        for left, op, right in zip(operands, node.ops, operands[1:]):
+            pair = ast.Compare(left=left, ops=[op], comparators=[right])
+            ret = (
+                pair
+                if ret is None
+                else ast.BinOp(left=ret, op=ast.BitAnd(), right=pair)
+            )
+        return ret
+
+
+def _parse(expr):
+    # an expression over the columns, assigned to a column with "c = a + b"
+    body = ast.parse(expr.strip()).body
+    if len(body) != 1:
+        raise ValueError("only a single expression can be evaluated")
+    target = None
+    if (
+        isinstance(body[0], ast.Assign)
+        and len(body[0].targets) == 1
+        and isinstance(body[0].targets[0], ast.Name)
+    ):
+        target, node = body[0].targets[0].id, body[0].value
+    elif isinstance(body[0], ast.Expr):
+        node = body[0].value
+    else:
+        raise ValueError(f"cannot evaluate {expr!r}")
+    node = ast.fix_missing_locations(ast.Expression(_ElementwiseLogic().visit(node)))
+    for n in ast.walk(node):
+        if not isinstance(n, _ALLOWED_NODES):
+            raise ValueError(f"unsupported syntax {type(n).__name__} in {expr!r}")
+    names = {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+    return target, compile(node, "<expr>", "eval"), names
+
+
+def _count(column):
+    if ivy.is_float_dtype(column):
+        return ivy.sum(~ivy.isnan(column))
+    return ivy.array(column.shape[0])
+
+
+def _extremum(fn):
+    def _reduce(column):
+        if ivy.is_float_dtype(column):
+            column = column[~ivy.isnan(column)]
+        return fn(column) if column.shape[0] else None
+
+    return _reduce
+
+
+# reduction of a chunk of a column, and combination of the reductions of two chunks
+_PARTIALS = {
+    "sum": (lambda c: ivy.nansum(c), ivy.add),
+    "count": (_count, ivy.add),
+    "min": (_extremum(ivy.min), ivy.minimum),
+    "max": (_extremum(ivy.max), ivy.maximum),
+}
+
+
+# --- Main --- #
+# ------------ #
+
+
+class LazyFrame:
+    def __init__(self, frame, ops=(), chunksize=2**20):
+        """
+        Operations on the columns of a DataFrame, recorded rather than run. They are
+        run when the result is collected or reduced, in a single pass over the rows
+        of the frame in chunks of chunksize rows, so that the intermediate columns
+        of each chunk stay small. Only the columns which are used are read.
+        """
+        self._frame = frame
+        self._ops = tuple(ops)
+        self._chunksize = chunksize
+
+    def _with(self, *op):
+        return LazyFrame(self._frame, self._ops + (op,), self._chunksize)
+
+    def assign(self, **exprs):
+        ret = self
+        for name, expr in exprs.items():
+            ret = ret._with("assign", name, *_parse(expr)[1:])
+        return ret
+
+    def eval(self, expr):
+        target, code, names = _parse(expr)
+        if target is None:
+            raise ValueError("a lazy eval assigns to a column, as in 'c = a + b'")
+        return self._with("assign", target, code, names)
+
+    def query(self, expr):
+        return self._with("filter", *_parse(expr)[1:])
+
+    def __getitem__(self, columns):
+        if not isinstance(columns, (list, tuple)):
+            columns = [columns]
+        return self._with("select", list(columns))
+
+    def _plan(self):
+        # the columns of the result, the columns of the frame which are read, and
+        # the columns still needed after each operation
+        columns = list(self._frame.columns)
+        for op in self._ops:
+            names = set(op[1]) if op[0] == "select" else op[-1]
+            undefined = names - set(columns)
+            if undefined:
+                raise NameError(
+                    f"name {sorted(undefined, key=str)[0]!r} is not defined"
+                )
+            if op[0] == "select":
+                columns = list(op[1])
+            elif op[0] == "assign" and op[1] not in columns:
+                columns.append(op[1])
+        live, needed = set(columns), []
+        for op in reversed(self._ops):
+            needed.append(live)
+            if op[0] == "assign":
+                live = (live - {op[1]}) | op[-1]
+            elif op[0] == "filter":
+                live = live | op[-1]
+        read = [c for c in self._frame.columns if c in live]
+        return columns, read, needed[::-1]
+
+    def _chunks(self, positions=False):
+        # the columns of the result for each chunk, and the positions of its rows
+        # in the frame if asked for
+        columns, read, needed = self._plan()
+        frame = self._frame
+        data = {c: frame._data[frame._column_index.get_loc(c)] for c in read}
+        length, step = len(frame.index), self._chunksize
+        for start in range(0, max(length, 1), step):
+            # the columns of a chunk are views of the columns of the frame
+            env = {c: v[start : start + step] for c, v in data.items()}
+            size = min(step, length - start)
+            rows = ivy.arange(start, start + size, dtype="int64") if positions else None
+            for op, live in zip(self._ops, needed):
+                if op[0] == "assign":
+                    value = eval(op[2], {"__builtins__": {}}, env)
+                    if not isinstance(value, ivy.Array) or value.ndim == 0:
+                        value = ivy.broadcast_to(ivy.asarray(value), (size,))
+                    env[op[1]] = value
+                elif op[0] == "filter":
+                    mask = eval(op[1], {"__builtins__": {}}, env)
+                    # only the columns used later are filtered
+                    env = {c: v[mask] for c, v in env.items() if c in live}
+                    size = int(ivy.sum(mask))
+                    rows = None if rows is None else rows[mask]
+                env = {c: v for c, v in env.items() if c in live}
+            yield rows, [env[c] for c in columns]
+
+    def _collect(self):
+        chunks = list(self._chunks(positions=True))
+        columns = self._plan()[0]
+        positions = ivy.concat([p for p, _ in chunks])
+        arrays = [
+            ivy.concat([chunk[i] for _, chunk in chunks]) for i in range(len(columns))
+        ]
+        return positions, columns, arrays
+
+    def collect(self):
+        """Run the operations, and return the resulting DataFrame."""
+        positions, columns, arrays = self._collect()
+        return type(self._frame)(
+            dict(zip(columns, arrays)), index=self._frame.index[positions]
+        )
+
+    def _reduce(self, *reductions):
+        # the reductions of each column of the result, over all chunks
+        totals = {r: None for r in reductions}
+        for _, chunk in self._chunks():
+            for r in reductions:
+                partial, combine = _PARTIALS[r]
+                values = [partial(c) for c in chunk]
+                if totals[r] is None:
+                    totals[r] = values
+                else:
+                    totals[r] = [
+                        t if v is None else v if t is None else combine(t, v)
+                        for t, v in zip(totals[r], values)
+                    ]
+        return [
+            [ivy.array(ivy.nan) if t is None else t for t in totals[r]]
+            for r in reductions
+        ]
+
+    def _series(self, values):
+        index = self._plan()[0]
+        return series.Series(
+            ivy.stack(values) if values else ivy.array([]), index=index
+        )
+
+    def sum(self):
+        return self._series(self._reduce("sum")[0])
+
+    def count(self):
+        return self._series(self._reduce("count")[0])
+
+    def mean(self):
+        sums, counts = self._reduce("sum", "count")
+        return self._series(
+            [s.astype(ivy.default_float_dtype()) / c for s, c in zip(sums, counts)]
+        )
+
+    def min(self):
+        return self._series(self._reduce("min")[0])
+
+    def max(self):
+        return self._series(self._reduce("max")[0])
@@ -1,5 +1,6 @@
 import ivy
 from .generic import NDFrame
+from .groupby import SeriesGroupBy, _factorize
 
 
 class Series(NDFrame):
@@ -31,7 +32,7 @@ class Series(NDFrame):
         series_name = f"{self.name} " if self.name is not None else ""
         return (
             f"frontends.pandas.Series {series_name}({self.array.to_list()},"
-            f" index={self.index.array.to_list()})"
+            f" index={self.index.to_list()})"
         )
 
     def __getitem__(self, index_val):
@@ -43,7 +44,7 @@ class Series(NDFrame):
                 dtype=self.dtype,
                 copy=self.copy,
             )
-        return self.array[self.index.index(index_val)].item()
+        return self.loc[index_val]
 
     def __getattr__(self, item):
         if item in self.index:
@@ -85,3 +86,6 @@ class Series(NDFrame):
 
     def keys(self):
         return self.index
+
+    def groupby(self, by, sort=True):
+        return SeriesGroupBy(self, *_factorize(by, sort=sort))
@@ -1,14 +1,66 @@
+import copy
+import inspect
+
+import ivy
+
+
+def _as_ivy(x, dtype=None):
+    # frontend arrays, as returned by predict, hold their ivy array
+    x = getattr(x, "ivy_array", x)
+    return ivy.array(x, dtype=dtype)
+
+
 class BaseEstimator:
+    @classmethod
+    def _get_param_names(cls):
+        init = cls.__init__
+        if init is object.__init__:
+            return []
+        parameters = inspect.signature(init).parameters.values()
+        return sorted(
+            p.name
+            for p in parameters
+            if p.name != "self"
+            and p.kind != p.VAR_KEYWORD
+            and p.kind != p.VAR_POSITIONAL
+        )
+
     def get_params(self, deep=True):
-        return {}
+        out = {}
+        for key in self._get_param_names():
+            value = getattr(self, key)
+            if deep and hasattr(value, "get_params") and not isinstance(value, type):
+                out.update((key + "__" + k, v) for k, v in value.get_params().items())
+            out[key] = value
+        return out
 
     def set_params(self, **params):
+        valid_params = self.get_params(deep=True)
+        nested_params = {}
+        for key, value in params.items():
+            key, delim, sub_key = key.partition("__")
+            if key not in valid_params:
+                raise ValueError(
+                    f"Invalid parameter {key!r} for estimator {self}. Valid parameters"
+                    f" are: {self._get_param_names()!r}."
+                )
+            if delim:
+                nested_params.setdefault(key, {})[sub_key] = value
+            else:
+                setattr(self, key, value)
+                valid_params[key] = value
+        for key, sub_params in nested_params.items():
+            valid_params[key].set_params(**sub_params)
         return self
 
 
 class ClassifierMixin:
     def score(self, X, y, sample_weight=None):
-        raise NotImplementedError
+        correct = ivy.equal(_as_ivy(self.predict(X)), _as_ivy(y))
+        if sample_weight is None:
+            return float(ivy.mean(correct.astype("float64")))
+        sample_weight = _as_ivy(sample_weight, dtype="float64")
+        return float(ivy.sum(correct * sample_weight) / ivy.sum(sample_weight))
 
     def fit(self, X, y, **kwargs):
         raise NotImplementedError
@@ -24,7 +76,23 @@ class TransformerMixin:
 
 class RegressorMixin:
     def score(self, X, y, sample_weight=None):
-        raise NotImplementedError
+        # the coefficient of determination R^2 of the prediction
+        y = _as_ivy(y, dtype="float64")
+        y_pred = ivy.reshape(_as_ivy(self.predict(X), dtype="float64"), y.shape)
+        if sample_weight is None:
+            sample_weight = ivy.ones(y.shape[:1], dtype="float64")
+        weight = ivy.reshape(
+            _as_ivy(sample_weight, dtype="float64"), (-1,) + (1,) * (y.ndim - 1)
+        )
+        mean = ivy.sum(weight * y, axis=0) / ivy.sum(weight)
+        numerator = ivy.sum(weight * (y - y_pred) ** 2, axis=0)
+        denominator = ivy.sum(weight * (y - mean) ** 2, axis=0)
+        ratio = ivy.where(
+            denominator > 0,
+            numerator / ivy.where(denominator > 0, denominator, 1.0),
+            ivy.where(numerator > 0, 1.0, 0.0),
+        )
+        return float(ivy.mean(1.0 - ratio))
 
     def fit(self, X, y, **kwargs):
         raise NotImplementedError
@@ -36,3 +104,29 @@ class RegressorMixin:
 class MultiOutputMixin:
     def _more_tags(self):
         return {"multioutput": True}
+
+
+def clone(estimator, *, safe=True):
+    """
+    An unfitted copy of an estimator, built from its parameters, or of each of a
+    list, tuple or set of estimators.
+    """
+    if isinstance(estimator, (list, tuple, set, frozenset)):
+        return type(estimator)([clone(e, safe=safe) for e in estimator])
+    if not hasattr(estimator, "get_params") or isinstance(estimator, type):
+        if not safe:
+            return copy.deepcopy(estimator)
+        raise TypeError(
+            f"Cannot clone object {estimator!r} of type {type(estimator)}: it does not"
+            " implement a 'get_params' method."
+        )
+    params = estimator.get_params(deep=False)
+    return type(estimator)(**{k: clone(v, safe=False) for k, v in params.items()})
+
+
+def is_classifier(estimator):
+    return isinstance(estimator, ClassifierMixin)
+
+
+def is_regressor(estimator):
+    return isinstance(estimator, RegressorMixin)
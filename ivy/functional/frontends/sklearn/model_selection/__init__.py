@@ -1,2 +1,6 @@
 from . import _split
 from ._split import *
+from . import _validation
+from ._validation import *
+from . import _search
+from ._search import *
@@ -0,0 +1,131 @@
+from itertools import product
+
+import ivy
+from ivy.functional.frontends.numpy.func_wrapper import to_ivy_arrays_and_back
+from ivy.functional.frontends.sklearn.base import BaseEstimator, clone, is_classifier
+from ._split import check_cv
+from ._validation import _check_scoring, _evaluate_candidates
+
+
+class ParameterGrid:
+    def __init__(self, param_grid):
+        if isinstance(param_grid, dict):
+            param_grid = [param_grid]
+        self.param_grid = param_grid
+
+    def __iter__(self):
+        for grid in self.param_grid:
+            keys = sorted(grid)
+            for values in product(*(grid[key] for key in keys)):
+                yield dict(zip(keys, values))
+
+    def __len__(self):
+        total = 0
+        for grid in self.param_grid:
+            size = 1
+            for values in grid.values():
+                size *= len(values)
+            total += size
+        return total
+
+
+class GridSearchCV(BaseEstimator):
+    def __init__(
+        self,
+        estimator,
+        param_grid,
+        *,
+        scoring=None,
+        n_jobs=None,
+        refit=True,
+        cv=None,
+        return_train_score=False,
+        context=None,
+    ):
+        self.estimator = estimator
+        self.param_grid = param_grid
+        self.scoring = scoring
+        self.n_jobs = n_jobs
+        self.refit = refit
+        self.cv = cv
+        self.return_train_score = return_train_score
+        self.context = context
+
+    def fit(self, X, y=None, *, groups=None):
+        # all the candidates are evaluated on all the splits by a single pool of
+        # workers, sharing one copy of the data
+        cv = check_cv(self.cv, y, classifier=is_classifier(self.estimator))
+        candidates = list(ParameterGrid(self.param_grid))
+        estimators = [clone(self.estimator).set_params(**p) for p in candidates]
+        results = _evaluate_candidates(
+            estimators,
+            X,
+            y,
+            groups,
+            cv,
+            self.scoring,
+            self.n_jobs,
+            self.context,
+            self.return_train_score,
+            False,
+        )
+        self.n_splits_ = len(results[0])
+        self.cv_results_ = self._format_results(candidates, results)
+        self.best_index_ = int(ivy.argmin(self.cv_results_["rank_test_score"]))
+        self.best_params_ = candidates[self.best_index_]
+        self.best_score_ = float(self.cv_results_["mean_test_score"][self.best_index_])
+        if self.refit:
+            self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_)
+            self.best_estimator_.fit(X, y)
+        return self
+
+    def _format_results(self, candidates, results):
+        ret = {"params": candidates}
+        keys = ["fit_time", "score_time", "test_score"]
+        if self.return_train_score:
+            keys.append("train_score")
+        for key in keys:
+            scores = ivy.array(
+                [[result[key] for result in splits] for splits in results],
+                dtype="float64",
+            )
+            if key.endswith("_score"):
+                for s in range(scores.shape[1]):
+                    ret[f"split{s}_{key}"] = scores[:, s]
+            ret[f"mean_{key}"] = ivy.mean(scores, axis=1)
+            ret[f"std_{key}"] = ivy.std(scores, axis=1)
+        # candidates with the same mean score share the lowest of their ranks
+        means = ret["mean_test_score"]
+        ret["rank_test_score"] = (
+            ivy.sum(
+                ivy.expand_dims(means, axis=0) > ivy.expand_dims(means, axis=1),
+                axis=1,
+            )
+            + 1
+        ).astype("int32")
+        for key in sorted({key for p in candidates for key in p}):
+            ret[f"param_{key}"] = [p.get(key) for p in candidates]
+        return ret
+
+    def _check_refit(self, name):
+        if not self.refit:
+            raise AttributeError(
+                f"This GridSearchCV instance was initialized with refit=False. {name}"
+                " is available only after refitting on the best parameters."
+            )
+
+    @to_ivy_arrays_and_back
+    def predict(self, X):
+        self._check_refit("predict")
+        return self.best_estimator_.predict(X)
+
+    @to_ivy_arrays_and_back
+    def predict_proba(self, X):
+        self._check_refit("predict_proba")
+        return self.best_estimator_.predict_proba(X)
+
+    def score(self, X, y=None):
+        self._check_refit("score")
+        if self.scoring is None:
+            return self.best_estimator_.score(X, y)
+        return float(_check_scoring(self.scoring)(self.best_estimator_, X, y))
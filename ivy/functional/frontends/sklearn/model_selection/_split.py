@@ -1,6 +1,7 @@
 from abc import ABCMeta, abstractmethod
 import ivy
 from ivy.functional.frontends.numpy.func_wrapper import to_ivy_arrays_and_back
+from ivy.functional.frontends.sklearn.utils.multiclass import type_of_target
 from ivy.functional.frontends.sklearn.utils.validation import column_or_1d
 
 
@@ -74,12 +75,13 @@ class StratifiedKFold(KFold):
         )
 
     def _iter_test_indices(self, X=None, y=None, groups=None):
-        ivy.seed(self.random_state)
-        y = ivy.array(y)
-        y = column_or_1d(y)
-        _, y_idx, y_inv, _ = ivy.unique_all(y, return_index=True, return_inverse=True)
-        class_perm = ivy.unique_inverse(y_idx)
-        y_encoded = class_perm[y_inv]
+        if self.random_state is not None:
+            ivy.seed(seed_value=self.random_state)
+        y = column_or_1d(y).ivy_array
+        _, y_idx, y_inv, _ = ivy.unique_all(y)
+        # the classes are numbered in the order in which they first appear
+        _, class_perm = ivy.unique_inverse(y_idx)
+        y_encoded = class_perm[ivy.reshape(y_inv, (-1,))]
 
         n_classes = len(y_idx)
         y_order = ivy.sort(y_encoded)
@@ -91,7 +93,7 @@ class StratifiedKFold(KFold):
         )
         test_folds = ivy.empty(len(y), dtype="int64")
         for k in range(n_classes):
-            folds_for_class = ivy.arange(self.n_splits).repeat(allocation[:, k])
+            folds_for_class = ivy.repeat(ivy.arange(self.n_splits), allocation[:, k])
             if self.shuffle:
                 folds_for_class = ivy.shuffle(folds_for_class)
             test_folds[y_encoded == k] = folds_for_class
@@ -102,6 +104,40 @@ class StratifiedKFold(KFold):
         return super().split(X, y, groups)
 
 
+class _CVIterableWrapper(BaseCrossValidator):
+    def __init__(self, cv):
+        self.cv = list(cv)
+
+    def get_n_splits(self, X=None, y=None, groups=None):
+        return len(self.cv)
+
+    def split(self, X=None, y=None, groups=None):
+        for train, test in self.cv:
+            yield train, test
+
+
+def check_cv(cv=5, y=None, *, classifier=False):
+    cv = 5 if cv is None else cv
+    if isinstance(cv, int):
+        # as in sklearn, the folds of a classifier keep the proportions of the
+        # classes of a binary or multiclass target
+        if (
+            classifier
+            and y is not None
+            and type_of_target(ivy.array(y)) in ("binary", "multiclass")
+        ):
+            return StratifiedKFold(cv)
+        return KFold(cv)
+    if not hasattr(cv, "split") or isinstance(cv, str):
+        if not hasattr(cv, "__iter__") or isinstance(cv, str):
+            raise ValueError(
+                "Expected cv as an integer, cross-validation "
+                f"object (from sklearn.model_selection) or an iterable. Got {cv}."
+            )
+        return _CVIterableWrapper(cv)
+    return cv
+
+
 @to_ivy_arrays_and_back
 def train_test_split(
     *arrays,
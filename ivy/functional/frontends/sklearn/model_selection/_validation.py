@@ -0,0 +1,289 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import resource_tracker, shared_memory
+
+import dill
+import numpy as np
+
+import ivy
+from ivy.functional.frontends.numpy.func_wrapper import to_ivy_arrays_and_back
+from ivy.functional.frontends.sklearn.base import (
+    ClassifierMixin,
+    RegressorMixin,
+    clone,
+    is_classifier,
+)
+from ._split import check_cv
+
+
+# state of a worker process, set once by _init_worker: the candidate estimators,
+# the scoring, and the training data and split indices attached from shared memory
+_worker_state = dict()
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+def _accuracy(estimator, X, y):
+    return ClassifierMixin.score(estimator, X, y)
+
+
+def _r2(estimator, X, y):
+    return RegressorMixin.score(estimator, X, y)
+
+
+_SCORERS = {"accuracy": _accuracy, "r2": _r2}
+
+
+def _check_scoring(scoring):
+    if scoring is None or callable(scoring):
+        return scoring
+    if scoring not in _SCORERS:
+        raise NotImplementedError(f"scoring={scoring!r} is not supported yet")
+    return _SCORERS[scoring]
+
+
+def _score(estimator, X, y, scoring):
+    if scoring is None:
+        return float(estimator.score(X, y))
+    return float(scoring(estimator, X, y))
+
+
+def _effective_n_jobs(n_jobs):
+    # as in joblib, -1 is all the cpus, -2 all but one, and so on
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        n_jobs = (os.cpu_count() or 1) + 1 + n_jobs
+    return max(n_jobs, 1)
+
+
+def _pack_splits(cv, X, y, groups):
+    # the train and test indices of all the splits, concatenated, with the bounds of
+    # those of each split
+    indices, bounds, start = [], [], 0
+    for train, test in cv.split(X, y, groups):
+        train = np.asarray(ivy.to_numpy(train), dtype=np.int64)
+        test = np.asarray(ivy.to_numpy(test), dtype=np.int64)
+        indices += [train, test]
+        bounds.append((start, start + train.size, start + train.size + test.size))
+        start = bounds[-1][2]
+    return np.concatenate(indices), bounds
+
+
+def _split_indices(indices, bounds, split):
+    start, middle, stop = bounds[split]
+    return indices[start:middle], indices[middle:stop]
+
+
+def _fit_and_score(
+    estimator, X, y, train, test, scoring, return_train_score, return_estimator
+):
+    y_train = None if y is None else y[train]
+    y_test = None if y is None else y[test]
+    start = time.perf_counter()
+    estimator.fit(X[train], y_train)
+    fit_time = time.perf_counter() - start
+    start = time.perf_counter()
+    result = {"test_score": _score(estimator, X[test], y_test, scoring)}
+    result["score_time"] = time.perf_counter() - start
+    result["fit_time"] = fit_time
+    if return_train_score:
+        result["train_score"] = _score(estimator, X[train], y_train, scoring)
+    if return_estimator:
+        result["estimator"] = estimator
+    return result
+
+
+def _share(arrays):
+    # copy each array into a shared memory segment, which the workers attach to by
+    # name instead of receiving the array with every task
+    segments, specs = [], []
+    for array in arrays:
+        if array is None:
+            specs.append(None)
+            continue
+        shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        segments.append(shm)
+        np.ndarray(array.shape, array.dtype, buffer=shm.buf)[...] = array
+        specs.append((shm.name, array.dtype.str, array.shape))
+    return segments, specs
+
+
+def _init_worker(backend, payload, specs, bounds):
+    ivy.set_backend(backend)
+    estimators, scoring = dill.loads(payload)
+    segments, arrays = [], []
+    for spec in specs:
+        if spec is None:
+            arrays.append(None)
+            continue
+        name, dtype, shape = spec
+        shm = shared_memory.SharedMemory(name=name)
+        segments.append(shm)
+        arrays.append(np.ndarray(shape, dtype, buffer=shm.buf))
+    _worker_state.update(
+        estimators=estimators,
+        scoring=scoring,
+        segments=segments,
+        arrays=arrays,
+        bounds=bounds,
+    )
+
+
+def _worker_fit_and_score(candidate, split, return_train_score, return_estimator):
+    X, y, indices = _worker_state["arrays"]
+    train, test = _split_indices(indices, _worker_state["bounds"], split)
+    return _fit_and_score(
+        clone(_worker_state["estimators"][candidate]),
+        X,
+        y,
+        train,
+        test,
+        _worker_state["scoring"],
+        return_train_score,
+        return_estimator,
+    )
+
+
+def _evaluate_candidates(
+    estimators,
+    X,
+    y,
+    groups,
+    cv,
+    scoring,
+    n_jobs,
+    context,
+    return_train_score,
+    return_estimator,
+):
+    """
+    Fits and scores each of the estimators on every split of cv, all the
+    estimator-split pairs being fanned out to a pool of n_jobs worker processes.
+    The training data and split indices are copied once into shared memory, which
+    each worker attaches to when it starts, so that a task only carries the index
+    of its estimator and split. The results are collected as the tasks complete.
+
+    Returns a list holding, for each estimator, the list of the results of its
+    splits in the order of cv.
+    """
+    X = np.ascontiguousarray(ivy.to_numpy(X))
+    y = None if y is None else np.ascontiguousarray(ivy.to_numpy(y))
+    indices, bounds = _pack_splits(cv, X, y, groups)
+    scoring = _check_scoring(scoring)
+    tasks = [(c, s) for c in range(len(estimators)) for s in range(len(bounds))]
+    results = [[None] * len(bounds) for _ in estimators]
+    n_jobs = min(_effective_n_jobs(n_jobs), len(tasks))
+
+    if n_jobs == 1:
+        for c, s in tasks:
+            train, test = _split_indices(indices, bounds, s)
+            results[c][s] = _fit_and_score(
+                clone(estimators[c]),
+                X,
+                y,
+                train,
+                test,
+                scoring,
+                return_train_score,
+                return_estimator,
+            )
+        return results
+
+    payload = dill.dumps((estimators, scoring))
+    # the workers share the resource tracker of this process, which then forgets
+    # the segments once they are unlinked below
+    resource_tracker.ensure_running()
+    segments, specs = _share([X, y, indices])
+    executor = None
+    try:
+        executor = ProcessPoolExecutor(
+            n_jobs,
+            mp_context=ivy.multiprocessing(context),
+            initializer=_init_worker,
+            initargs=(ivy.current_backend_str(), payload, specs, bounds),
+        )
+        futures = {
+            executor.submit(
+                _worker_fit_and_score, c, s, return_train_score, return_estimator
+            ): (c, s)
+            for c, s in tasks
+        }
+        for future in as_completed(futures):
+            c, s = futures[future]
+            results[c][s] = future.result()
+    finally:
+        # the pending tasks are dropped when one of them fails
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+    return results
+
+
+# --- Main --- #
+# ------------ #
+
+
+@to_ivy_arrays_and_back
+def cross_validate(
+    estimator,
+    X,
+    y=None,
+    *,
+    groups=None,
+    scoring=None,
+    cv=None,
+    n_jobs=None,
+    return_train_score=False,
+    return_estimator=False,
+    context=None,
+):
+    cv = check_cv(cv, y, classifier=is_classifier(estimator))
+    (results,) = _evaluate_candidates(
+        [estimator],
+        X,
+        y,
+        groups,
+        cv,
+        scoring,
+        n_jobs,
+        context,
+        return_train_score,
+        return_estimator,
+    )
+    ret = {
+        key: ivy.array([result[key] for result in results], dtype="float64")
+        for key in ["fit_time", "score_time", "test_score", "train_score"]
+        if key in results[0]
+    }
+    if return_estimator:
+        ret["estimator"] = [result["estimator"] for result in results]
+    return ret
+
+
+def cross_val_score(
+    estimator,
+    X,
+    y=None,
+    *,
+    groups=None,
+    scoring=None,
+    cv=None,
+    n_jobs=None,
+    context=None,
+):
+    return cross_validate(
+        estimator,
+        X,
+        y,
+        groups=groups,
+        scoring=scoring,
+        cv=cv,
+        n_jobs=n_jobs,
+        context=context,
+    )["test_score"]
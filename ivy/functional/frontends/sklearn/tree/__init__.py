@@ -0,0 +1,2 @@
+from . import _classes
+from ._classes import *
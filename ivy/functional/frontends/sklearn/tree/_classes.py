@@ -1,9 +1,23 @@
 from abc import ABCMeta, abstractmethod
+import math
+
+import ivy
+from ivy.functional.frontends.numpy.func_wrapper import (
+    inputs_to_ivy_arrays,
+    to_ivy_arrays_and_back,
+)
 from ..base import (
     BaseEstimator,
     ClassifierMixin,
     MultiOutputMixin,
+    RegressorMixin,
 )
+from ._criterion import Entropy, Gini, MSE
+from ._tree import Tree, build_tree
+
+
+CRITERIA_CLF = {"gini": Gini, "log_loss": Entropy, "entropy": Entropy}
+CRITERIA_REG = {"squared_error": MSE}
 
 
 class BaseDecisionTree(MultiOutputMixin, BaseEstimator, metaclass=ABCMeta):
@@ -38,10 +52,10 @@ class BaseDecisionTree(MultiOutputMixin, BaseEstimator, metaclass=ABCMeta):
         self.ccp_alpha = ccp_alpha
 
     def get_depth(self):
-        raise NotImplementedError
+        return self.tree_.max_depth
 
     def get_n_leaves(self):
-        raise NotImplementedError
+        return self.tree_.n_leaves
 
     def _support_missing_values(self, X):
         raise NotImplementedError
@@ -57,19 +71,92 @@ class BaseDecisionTree(MultiOutputMixin, BaseEstimator, metaclass=ABCMeta):
         check_input=True,
         missing_values_in_feature_mask=None,
     ):
-        raise NotImplementedError
+        # todo: random splitter, max_features, best-first growth and pruning
+        if self.splitter != "best":
+            raise NotImplementedError("only the best splitter is available")
+        if self.max_features is not None or self.max_leaf_nodes is not None:
+            raise NotImplementedError(
+                "max_features and max_leaf_nodes are not supported"
+            )
+        if self.class_weight is not None or self.ccp_alpha:
+            raise NotImplementedError("class_weight and ccp_alpha are not supported")
+
+        # the samples are split in float32, as in sklearn
+        X = ivy.asarray(X).astype("float32")
+        y = ivy.asarray(y)
+        n_samples, self.n_features_in_ = X.shape
+        if y.ndim == 1:
+            y = ivy.reshape(y, (-1, 1))
+        self.n_outputs_ = y.shape[1]
+        if sample_weight is None:
+            sample_weight = ivy.ones((n_samples,), dtype="float64")
+        else:
+            sample_weight = ivy.asarray(sample_weight).astype("float64")
+
+        if isinstance(self, ClassifierMixin):
+            if self.n_outputs_ > 1:
+                raise NotImplementedError("only a single output can be classified")
+            criterion = CRITERIA_CLF[self.criterion]
+            self.classes_, y_encoded = ivy.unique_inverse(y[:, 0])
+            self.n_classes_ = self.classes_.shape[0]
+            y = ivy.one_hot(ivy.reshape(y_encoded, (-1,)), self.n_classes_)
+            n_classes = self.n_classes_
+        else:
+            criterion = CRITERIA_REG[self.criterion]
+            n_classes = 1
+
+        max_depth = float("inf") if self.max_depth is None else self.max_depth
+        min_samples_leaf = self.min_samples_leaf
+        if isinstance(min_samples_leaf, float):
+            min_samples_leaf = int(math.ceil(min_samples_leaf * n_samples))
+        min_samples_split = self.min_samples_split
+        if isinstance(min_samples_split, float):
+            min_samples_split = max(2, int(math.ceil(min_samples_split * n_samples)))
+        min_samples_split = max(min_samples_split, 2 * min_samples_leaf)
+        min_weight_leaf = self.min_weight_fraction_leaf * float(ivy.sum(sample_weight))
+
+        self.max_features_ = self.n_features_in_
+        self.tree_ = build_tree(
+            Tree(self.n_features_in_, n_classes, self.n_outputs_),
+            X,
+            criterion.sample_stats(y.astype("float64"), sample_weight),
+            criterion,
+            max_depth,
+            min_samples_split,
+            min_samples_leaf,
+            min_weight_leaf,
+            self.min_impurity_decrease,
+        )
+        return self
 
     def _validate_X_predict(self, X, check_input):
-        raise NotImplementedError
+        X = ivy.asarray(X).astype("float32")
+        if X.shape[1] != self.n_features_in_:
+            raise ValueError(
+                f"X has {X.shape[1]} features, but {type(self).__name__} is expecting"
+                f" {self.n_features_in_} features as input."
+            )
+        return X
 
+    @to_ivy_arrays_and_back
     def predict(self, X, check_input=True):
-        raise NotImplementedError
+        X = self._validate_X_predict(X, check_input)
+        proba = self.tree_.predict(X)
+        if isinstance(self, ClassifierMixin):
+            return self.classes_[ivy.argmax(proba[:, 0], axis=1)]
+        if self.n_outputs_ == 1:
+            return proba[:, 0, 0]
+        return proba[:, :, 0]
 
+    @to_ivy_arrays_and_back
     def apply(self, X, check_input=True):
-        raise NotImplementedError
+        X = self._validate_X_predict(X, check_input)
+        return self.tree_.apply(X)
 
+    @to_ivy_arrays_and_back
     def decision_path(self, X, check_input=True):
-        raise NotImplementedError
+        X = self._validate_X_predict(X, check_input)
+        return self.tree_.decision_path(X)
 
     def _prune_tree(self):
         raise NotImplementedError
@@ -79,7 +166,7 @@ class BaseDecisionTree(MultiOutputMixin, BaseEstimator, metaclass=ABCMeta):
 
     @property
     def feature_importances_(self):
-        raise NotImplementedError
+        return self.tree_.compute_feature_importances()
 
 
 class DecisionTreeClassifier(ClassifierMixin, BaseDecisionTree):
@@ -114,6 +201,7 @@ class DecisionTreeClassifier(ClassifierMixin, BaseDecisionTree):
             ccp_alpha=ccp_alpha,
         )
 
+    @inputs_to_ivy_arrays
     def fit(self, X, y, sample_weight=None, check_input=True):
         super()._fit(
             X,
@@ -123,11 +211,20 @@ class DecisionTreeClassifier(ClassifierMixin, BaseDecisionTree):
         )
         return self
 
+    def predict(self, X, check_input=True):
+        # the predict of ClassifierMixin comes first in the mro
+        return BaseDecisionTree.predict(self, X, check_input=check_input)
+
+    @to_ivy_arrays_and_back
     def predict_proba(self, X, check_input=True):
-        raise NotImplementedError
+        X = self._validate_X_predict(X, check_input)
+        proba = self.tree_.predict(X)[:, 0]
+        normalizer = ivy.sum(proba, axis=1, keepdims=True)
+        return proba / ivy.where(normalizer == 0.0, 1.0, normalizer)
 
+    @to_ivy_arrays_and_back
     def predict_log_proba(self, X):
-        raise NotImplementedError
+        return ivy.log(self.predict_proba(X))
 
     def _more_tags(self):
         allow_nan = self.splitter == "best" and self.criterion in {
@@ -136,3 +233,51 @@ class DecisionTreeClassifier(ClassifierMixin, BaseDecisionTree):
             "entropy",
         }
         return {"multilabel": True, "allow_nan": allow_nan}
+
+
+class DecisionTreeRegressor(RegressorMixin, BaseDecisionTree):
+    def __init__(
+        self,
+        *,
+        criterion="squared_error",
+        splitter="best",
+        max_depth=None,
+        min_samples_split=2,
+        min_samples_leaf=1,
+        min_weight_fraction_leaf=0.0,
+        max_features=None,
+        random_state=None,
+        max_leaf_nodes=None,
+        min_impurity_decrease=0.0,
+        ccp_alpha=0.0,
+    ):
+        super().__init__(
+            criterion=criterion,
+            splitter=splitter,
+            max_depth=max_depth,
+            min_samples_split=min_samples_split,
+            min_samples_leaf=min_samples_leaf,
+            min_weight_fraction_leaf=min_weight_fraction_leaf,
+            max_features=max_features,
+            max_leaf_nodes=max_leaf_nodes,
+            random_state=random_state,
+            min_impurity_decrease=min_impurity_decrease,
+            ccp_alpha=ccp_alpha,
+        )
+
+    @inputs_to_ivy_arrays
+    def fit(self, X, y, sample_weight=None, check_input=True):
+        super()._fit(
+            X,
+            y,
+            sample_weight=sample_weight,
+            check_input=check_input,
+        )
+        return self
+
+    def predict(self, X, check_input=True):
+        # the predict of RegressorMixin comes first in the mro
+        return BaseDecisionTree.predict(self, X, check_input=check_input)
+
+    def _more_tags(self):
+        return {"multioutput": True, "allow_nan": False}
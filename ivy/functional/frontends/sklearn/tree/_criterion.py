@@ -0,0 +1,116 @@
+import ivy
+
+
+def _sum_last(x):
+    # a sum over a short last axis, faster column by column than as a reduction
+    ret = x[..., 0]
+    for k in range(1, x.shape[-1]):
+        ret = ret + x[..., k]
+    return ret
+
+
+class Criterion:
+    """
+    Impurity of the nodes of a tree, from the sums over the samples of a node of
+    per-sample statistics. The statistics are additive, so those of the left child
+    of every candidate split are cumulative sums over the sorted samples, and those
+    of the right child the node's minus the left child's.
+    """
+
+    @staticmethod
+    def sample_stats(y, sample_weight):
+        raise NotImplementedError
+
+    @staticmethod
+    def weighted_n(stats):
+        raise NotImplementedError
+
+    @staticmethod
+    def impurity(stats):
+        raise NotImplementedError
+
+    @staticmethod
+    def node_value(stats):
+        raise NotImplementedError
+
+    @classmethod
+    def proxy_impurity_improvement(cls, left, right, w_left, w_right):
+        # the decrease of the weighted impurity of a node by a split, up to a
+        # constant of the node, cheaper to compute for every candidate
+        return -w_left * cls.impurity(left) - w_right * cls.impurity(right)
+
+
+class ClassificationCriterion(Criterion):
+    @staticmethod
+    def sample_stats(y, sample_weight):
+        # the weight of each sample in the column of its class, y being the
+        # encoded classes of a single output of shape (n_samples, n_classes)
+        return y * ivy.expand_dims(sample_weight, axis=1)
+
+    @staticmethod
+    def weighted_n(stats):
+        return _sum_last(stats)
+
+    @staticmethod
+    def node_value(stats):
+        # weighted count of each class, of shape (n_outputs, n_classes)
+        return ivy.expand_dims(stats, axis=-2)
+
+
+class Gini(ClassificationCriterion):
+    @staticmethod
+    def impurity(stats):
+        weighted_n = _sum_last(stats)
+        squared = ivy.maximum(weighted_n * weighted_n, 1e-300)
+        return 1.0 - _sum_last(stats * stats) / squared
+
+    @classmethod
+    def proxy_impurity_improvement(cls, left, right, w_left, w_right):
+        return _sum_last(left * left) / ivy.maximum(w_left, 1e-300) + _sum_last(
+            right * right
+        ) / ivy.maximum(w_right, 1e-300)
+
+
+class Entropy(ClassificationCriterion):
+    @staticmethod
+    def impurity(stats):
+        weighted_n = ivy.maximum(_sum_last(stats), 1e-300)
+        p = stats / ivy.expand_dims(weighted_n, axis=-1)
+        return -_sum_last(p * ivy.log2(ivy.where(p > 0, p, 1.0)))
+
+
+class MSE(Criterion):
+    @staticmethod
+    def sample_stats(y, sample_weight):
+        # the weight, weighted targets and weighted squared targets of each sample,
+        # y being of shape (n_samples, n_outputs)
+        w = ivy.expand_dims(sample_weight, axis=1)
+        return ivy.concat([w, w * y, w * y * y], axis=1)
+
+    @staticmethod
+    def weighted_n(stats):
+        return stats[..., 0]
+
+    @staticmethod
+    def impurity(stats):
+        n_outputs = (stats.shape[-1] - 1) // 2
+        weighted_n = ivy.maximum(stats[..., :1], 1e-300)
+        mean = stats[..., 1 : 1 + n_outputs] / weighted_n
+        variance = stats[..., 1 + n_outputs :] / weighted_n - mean * mean
+        return _sum_last(variance) / n_outputs
+
+    @classmethod
+    def proxy_impurity_improvement(cls, left, right, w_left, w_right):
+        n_outputs = (left.shape[-1] - 1) // 2
+        sum_left = left[..., 1 : 1 + n_outputs]
+        sum_right = right[..., 1 : 1 + n_outputs]
+        return _sum_last(sum_left * sum_left) / ivy.maximum(w_left, 1e-300) + _sum_last(
+            sum_right * sum_right
+        ) / ivy.maximum(w_right, 1e-300)
+
+    @staticmethod
+    def node_value(stats):
+        # mean of each output, of shape (n_outputs, 1)
+        n_outputs = (stats.shape[-1] - 1) // 2
+        mean = stats[..., 1 : 1 + n_outputs] / ivy.maximum(stats[..., :1], 1e-300)
+        return ivy.expand_dims(mean, axis=-1)
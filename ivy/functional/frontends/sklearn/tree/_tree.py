@@ -0,0 +1,360 @@
+import ivy
+
+
+TREE_LEAF = -1
+TREE_UNDEFINED = -2
+
+# values closer than this are not split between, as in sklearn
+FEATURE_THRESHOLD = 1e-7
+
+# candidate splits scored at once, over samples, features and statistics
+_SPLIT_BATCH = 1 << 23
+
+# machine epsilon of float64
+EPSILON = 2.220446049250313e-16
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+def _segment_sums(stats, segment_ids, num_segments):
+    # the sums of the columns of stats over each segment
+    return ivy.stack(
+        [
+            ivy.bincount(segment_ids, weights=stats[:, k], minlength=num_segments)
+            for k in range(stats.shape[1])
+        ],
+        axis=1,
+    )
+
+
+def _best_splits(
+    criterion,
+    orders,
+    local,
+    values,
+    stats,
+    node_stats,
+    counts,
+    min_samples_leaf,
+    min_weight_leaf,
+):
+    # the best split of every node of a level on each of a block of features, each
+    # row of orders holding the samples of the nodes to split grouped by node, as
+    # given by local, and sorted by the value of its feature within each node; a
+    # split after position i sends the samples up to i to the left
+    num_features, m = orders.shape
+    width = node_stats.shape[0]
+    positions = ivy.arange(m, dtype="int64")
+    cumulative = ivy.cumsum(stats[orders], axis=1)
+    seg_counts = ivy.bincount(local, minlength=width)
+    seg_starts = ivy.cumsum(seg_counts) - seg_counts
+    before = ivy.concat([ivy.zeros_like(cumulative[:, :1]), cumulative], axis=1)
+    left = cumulative - before[:, seg_starts[local]]
+    right = node_stats[local] - left
+
+    n_left = positions - seg_starts[local] + 1
+    n_right = counts[local] - n_left
+    node_weighted_n = criterion.weighted_n(node_stats)
+    w_left = criterion.weighted_n(left)
+    w_right = node_weighted_n[local] - w_left
+    next_values = ivy.concat([values[:, 1:], values[:, -1:]], axis=1)
+    valid = (
+        (next_values > values + FEATURE_THRESHOLD)
+        & (n_left >= min_samples_leaf)
+        & (n_right >= min_samples_leaf)
+        & (w_left >= min_weight_leaf)
+        & (w_right >= min_weight_leaf)
+    )
+
+    # candidates are compared on the proxy of the criterion, as in sklearn
+    proxy = criterion.proxy_impurity_improvement(left, right, w_left, w_right)
+    proxy = ivy.reshape(ivy.where(valid, proxy, -float("inf")), (-1,))
+    segments = ivy.reshape(
+        ivy.expand_dims(ivy.arange(num_features, dtype="int64") * width, axis=1)
+        + local,
+        (-1,),
+    )
+    best = -ivy.unsorted_segment_min(-proxy, segments, num_features * width)
+    flat_positions = ivy.arange(num_features * m, dtype="int64")
+    first = ivy.where(
+        ivy.reshape(valid, (-1,)) & (proxy == best[segments]),
+        flat_positions,
+        num_features * m,
+    )
+    position = ivy.unsorted_segment_min(first, segments, num_features * width)
+
+    # the first feature of the block with the best split of each node
+    best = ivy.reshape(best, (num_features, width))
+    feature = ivy.argmax(best, axis=0)
+    nodes = ivy.arange(width, dtype="int64")
+    position = position[feature * width + nodes]
+    found = position < num_features * m
+    position = ivy.where(found, position, 0)
+    best = ivy.where(found, ivy.max(best, axis=0), -float("inf"))
+
+    # the decrease of the weighted impurity of the node by its best split
+    best_left = ivy.reshape(left, (num_features * m, -1))[position]
+    best_right = node_stats - best_left
+    w_best_left = criterion.weighted_n(best_left)
+    improvement = (
+        node_weighted_n * criterion.impurity(node_stats)
+        - w_best_left * criterion.impurity(best_left)
+        - (node_weighted_n - w_best_left) * criterion.impurity(best_right)
+    )
+
+    # halfway between the values on either side of the split
+    flat_values = ivy.reshape(values, (-1,))
+    below = flat_values[position].astype("float64")
+    above = flat_values[ivy.minimum(position + 1, num_features * m - 1)]
+    above = above.astype("float64")
+    threshold = below / 2.0 + above / 2.0
+    threshold = ivy.where((threshold == above) | ivy.isinf(threshold), below, threshold)
+    return best, improvement, feature, threshold
+
+
+def _depth_first(children_left, children_right):
+    # the nodes in the depth-first order in which sklearn numbers them
+    left, right = children_left.to_list(), children_right.to_list()
+    order, stack = [], [0]
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        if left[node] != TREE_LEAF:
+            stack.extend([right[node], left[node]])
+    return ivy.array(order, dtype="int64")
+
+
+# --- Main --- #
+# ------------ #
+
+
+class Tree:
+    def __init__(self, n_features, n_classes, n_outputs):
+        """
+        A binary tree stored as flat arrays indexed by node, the root being node 0.
+        The children of a leaf are TREE_LEAF, and its feature and threshold
+        TREE_UNDEFINED. A sample goes left when its value of the feature of a node
+        is at most the threshold of the node.
+        """
+        self.n_features = n_features
+        self.n_classes = n_classes
+        self.n_outputs = n_outputs
+        self.max_depth = 0
+        self.node_count = 0
+
+    @property
+    def n_leaves(self):
+        return int(ivy.sum(self.children_left == TREE_LEAF))
+
+    def _paths(self, X):
+        # the node of every sample at each depth, the samples of all the nodes of a
+        # level moving down together, and those at a leaf staying there
+        n = X.shape[0]
+        flat = ivy.reshape(X, (-1,))
+        offsets = ivy.arange(n, dtype="int64") * self.n_features
+        node = ivy.zeros((n,), dtype="int64")
+        paths = [node]
+        for _ in range(self.max_depth):
+            feature = self.feature[node]
+            go_left = flat[offsets + ivy.maximum(feature, 0)] <= self.threshold[node]
+            child = ivy.where(
+                go_left, self.children_left[node], self.children_right[node]
+            )
+            node = ivy.where(feature == TREE_UNDEFINED, node, child)
+            paths.append(node)
+        return paths
+
+    def apply(self, X):
+        return self._paths(X)[-1]
+
+    def predict(self, X):
+        return self.value[self.apply(X)]
+
+    def decision_path(self, X):
+        # dense rather than sparse, of shape (n_samples, node_count)
+        n = X.shape[0]
+        rows = ivy.arange(n, dtype="int64") * self.node_count
+        indicator = ivy.zeros((n * self.node_count,), dtype="bool")
+        for node in self._paths(X):
+            indicator[rows + node] = True
+        return ivy.reshape(indicator, (n, self.node_count))
+
+    def compute_feature_importances(self, normalize=True):
+        split = self.children_left != TREE_LEAF
+        weighted = self.weighted_n_node_samples * self.impurity
+        decrease = (
+            weighted[split]
+            - weighted[self.children_left[split]]
+            - weighted[self.children_right[split]]
+        )
+        importances = ivy.bincount(
+            self.feature[split], weights=decrease, minlength=self.n_features
+        )
+        importances = importances / self.weighted_n_node_samples[0]
+        if normalize:
+            total = ivy.sum(importances)
+            if total > 0.0:
+                importances = importances / total
+        return importances
+
+
+def build_tree(
+    tree,
+    X,
+    stats,
+    criterion,
+    max_depth,
+    min_samples_split,
+    min_samples_leaf,
+    min_weight_leaf,
+    min_impurity_decrease,
+):
+    """
+    Grow a tree level by level, finding the best splits of all the nodes of a level
+    together, one feature at a time, with the impurity of every candidate threshold
+    computed at once from cumulative sums over the samples of the level. Each
+    feature is sorted once, at the root; the samples of the children of a split are
+    then kept sorted by a stable sort of those of their parent on their child.
+
+    Parameters
+    ----------
+    tree
+        The Tree to grow.
+    X
+        Training data of shape (n_samples, n_features).
+    stats
+        Statistics of each sample, of shape (n_samples, n_stats), as given by
+        criterion.sample_stats.
+    criterion
+        The Criterion of the impurity of the nodes.
+    max_depth
+        Maximum depth of the tree.
+    min_samples_split
+        Minimum number of samples of a node to be split.
+    min_samples_leaf
+        Minimum number of samples in a child of a split.
+    min_weight_leaf
+        Minimum total weight of the samples in a child of a split.
+    min_impurity_decrease
+        Minimum decrease of the weighted impurity of a split.
+    """
+    n, n_features = X.shape
+    flat = ivy.reshape(X, (-1,))
+    # the samples sorted by each feature, of shape (n_features, n_samples)
+    orders = ivy.argsort(ivy.permute_dims(X, (1, 0)), axis=1, stable=True)
+    feature_offsets = ivy.expand_dims(ivy.arange(n_features, dtype="int64"), axis=1)
+    step = max(1, _SPLIT_BATCH // (n * stats.shape[1]))
+    node_of = ivy.zeros((n,), dtype="int64")
+    rows = ivy.arange(n, dtype="int64")
+    levels = []
+    start, width, depth = 0, 1, 0
+    total_weight = None
+    while True:
+        local = node_of[rows] - start
+        node_stats = _segment_sums(stats[rows], local, width)
+        counts = ivy.bincount(local, minlength=width)
+        weighted_n = criterion.weighted_n(node_stats)
+        impurity = criterion.impurity(node_stats)
+        if total_weight is None:
+            total_weight = float(weighted_n[0])
+
+        best = ivy.full((width,), -float("inf"), dtype="float64")
+        improvement = ivy.zeros((width,), dtype="float64")
+        feature = ivy.full((width,), TREE_UNDEFINED, dtype="int64")
+        threshold = ivy.full((width,), float(TREE_UNDEFINED), dtype="float64")
+        if depth < max_depth:
+            splittable = (
+                (counts >= min_samples_split)
+                & (counts >= 2 * min_samples_leaf)
+                & (weighted_n >= 2 * min_weight_leaf)
+                & (impurity > EPSILON)
+            )
+            # the samples of a column of orders are all in the same node
+            level_orders = orders[:, splittable[node_of[orders[0]] - start]]
+            level_local = node_of[level_orders[0]] - start
+            for f in range(0, n_features if level_orders.shape[1] > 1 else 0, step):
+                block = level_orders[f : f + step]
+                (
+                    split_best,
+                    split_improvement,
+                    split_feature,
+                    split_threshold,
+                ) = _best_splits(
+                    criterion,
+                    block,
+                    level_local,
+                    flat[block * n_features + feature_offsets[f : f + step]],
+                    stats,
+                    node_stats,
+                    counts,
+                    min_samples_leaf,
+                    min_weight_leaf,
+                )
+                better = split_best > best
+                best = ivy.where(better, split_best, best)
+                improvement = ivy.where(better, split_improvement, improvement)
+                feature = ivy.where(better, split_feature + f, feature)
+                threshold = ivy.where(better, split_threshold, threshold)
+
+        split = (feature != TREE_UNDEFINED) & (
+            improvement / total_weight + EPSILON >= min_impurity_decrease
+        )
+        # the children of the k-th split of the level are the nodes 2k and 2k + 1
+        # of the next one
+        k = ivy.cumsum(split.astype("int64")) - 1
+        left = ivy.where(split, start + width + 2 * k, TREE_LEAF)
+        levels.append(
+            (
+                ivy.where(split, feature, TREE_UNDEFINED),
+                ivy.where(split, threshold, float(TREE_UNDEFINED)),
+                left,
+                ivy.where(split, left + 1, TREE_LEAF),
+                criterion.node_value(node_stats),
+                impurity,
+                counts,
+                weighted_n,
+            )
+        )
+        num_splits = int(ivy.sum(split))
+        if not num_splits:
+            break
+
+        # samples of the nodes which are split move to their children
+        moved = split[local]
+        rows, local = rows[moved], local[moved]
+        go_left = flat[rows * n_features + feature[local]] <= threshold[local]
+        node_of[rows] = start + width + 2 * k[local] + 1 - go_left.astype("int64")
+        in_level = ivy.zeros((n,), dtype="bool")
+        in_level[rows] = True
+        orders = orders[:, in_level[orders[0]]]
+        child_order = ivy.argsort(node_of[orders], axis=1, stable=True)
+        orders = ivy.reshape(orders, (-1,))[
+            ivy.reshape(child_order + feature_offsets * orders.shape[1], (-1,))
+        ]
+        orders = ivy.reshape(orders, (n_features, -1))
+        start += width
+        width = 2 * num_splits
+        depth += 1
+
+    arrays = [ivy.concat(a) for a in zip(*levels)]
+    order = _depth_first(arrays[2], arrays[3])
+    renumber = ivy.zeros_like(order)
+    renumber[order] = ivy.arange(order.shape[0], dtype="int64")
+    arrays = [a[order] for a in arrays]
+    for i in (2, 3):
+        arrays[i] = ivy.where(arrays[i] == TREE_LEAF, TREE_LEAF, renumber[arrays[i]])
+    (
+        tree.feature,
+        tree.threshold,
+        tree.children_left,
+        tree.children_right,
+        tree.value,
+        tree.impurity,
+        tree.n_node_samples,
+        tree.weighted_n_node_samples,
+    ) = arrays
+    tree.node_count = order.shape[0]
+    tree.max_depth = depth
+    return tree
@@ -21,7 +21,7 @@ def _ivy_array_to_tensorflow(x):
 
 def _native_to_ivy_array(x):
     if isinstance(x, ivy.NativeArray):
-        return ivy.array(x)
+        return ivy.Array(x)
     return x
 
 
@@ -217,6 +217,8 @@ def outputs_to_frontend_arrays(fn: Callable) -> Callable:
         ret = fn(*args, **kwargs)
 
         # convert all arrays in the return to `frontend.Tensorflow.tensor` instances
+        if isinstance(ret, (ivy.Array, ivy.NativeArray)):
+            return _ivy_array_to_tensorflow(ret)
         return ivy.nested_map(
             _ivy_array_to_tensorflow, ret, include_derived={"tuple": True}
         )
@@ -9,6 +9,7 @@ from ivy.functional.frontends.tensorflow.func_wrapper import (
     handle_tf_dtype,
     to_ivy_dtype,
 )
+from ivy.functional.frontends.tensorflow.ragged import RaggedTensor
 from ivy.functional.frontends.tensorflow.tensor import EagerTensor
 import ivy.functional.frontends.tensorflow as tf_frontend
 from ivy.functional.frontends.tensorflow import check_tensorflow_casting
@@ -251,6 +252,12 @@ def foldr(
 
 @to_ivy_arrays_and_back
 def gather(params, indices, validate_indices=None, axis=None, batch_dims=0, name=None):
+    if isinstance(params, RaggedTensor):
+        if axis not in (None, 0) or batch_dims:
+            raise ivy.utils.exceptions.IvyNotImplementedException(
+                "gather from a RaggedTensor is only supported along its rows"
+            )
+        return params._gather(indices)
     if axis is None:
         axis = batch_dims
     else:
@@ -6,6 +6,7 @@ from ivy import (
     with_supported_device_and_dtypes,
 )
 from ivy.functional.frontends.tensorflow import check_tensorflow_casting
+from ivy.functional.frontends.tensorflow.ragged import RaggedTensor
 from ivy.functional.frontends.tensorflow.func_wrapper import (
     to_ivy_arrays_and_back,
     handle_tf_dtype,
@@ -560,11 +561,15 @@ def reduce_logsumexp(input_tensor, axis=None, keepdims=False, name="reduce_logsu
 
 @to_ivy_arrays_and_back
 def reduce_max(input_tensor, axis=None, keepdims=False, name="reduce_max"):
+    if isinstance(input_tensor, RaggedTensor):
+        return input_tensor._reduce("max", axis=axis, keepdims=keepdims)
     return ivy.max(input_tensor, axis=axis, keepdims=keepdims)
 
 
 @to_ivy_arrays_and_back
 def reduce_mean(input_tensor, axis=None, keepdims=False, name="reduce_mean"):
+    if isinstance(input_tensor, RaggedTensor):
+        return input_tensor._reduce("mean", axis=axis, keepdims=keepdims)
     if ivy.exists(axis):
         axis = ivy.to_list(axis)
     return ivy.mean(input_tensor, axis=axis, keepdims=keepdims)
@@ -572,6 +577,8 @@ def reduce_mean(input_tensor, axis=None, keepdims=False, name="reduce_mean"):
 
 @to_ivy_arrays_and_back
 def reduce_min(input_tensor, axis=None, keepdims=False, name="reduce_min"):
+    if isinstance(input_tensor, RaggedTensor):
+        return input_tensor._reduce("min", axis=axis, keepdims=keepdims)
     return ivy.min(input_tensor, axis=axis, keepdims=keepdims)
 
 
@@ -589,6 +596,8 @@ def reduce_std(input_tensor, axis=None, keepdims=False, name="reduce_std"):
 
 @to_ivy_arrays_and_back
 def reduce_sum(input_tensor, axis=None, keepdims=False, name="reduce_sum"):
+    if isinstance(input_tensor, RaggedTensor):
+        return input_tensor._reduce("sum", axis=axis, keepdims=keepdims)
     input_tensor = ivy.array(input_tensor)
     return ivy.sum(input_tensor, axis=axis, keepdims=keepdims).astype(
         input_tensor.dtype
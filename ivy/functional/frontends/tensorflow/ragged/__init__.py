@@ -1 +1,2 @@
 from . import ragged
+from .ragged import RaggedTensor, map_flat_values
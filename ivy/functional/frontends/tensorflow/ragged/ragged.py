@@ -1,13 +1,56 @@
 import ivy
+from ivy.functional.frontends.tensorflow.func_wrapper import (
+    _to_ivy_array,
+    to_ivy_arrays_and_back,
+)
 
 
 # TODO: Align behavior with tensorflow, modify so that the elements of the raggedTensor
 #  object are of type EagerTensor
-# ensure that the values and row_splits are of type EagerTensor too
 # add more initializer methods
 
 
+# --- Helpers --- #
+# --------------- #
+
+
+def _nvals(values):
+    if isinstance(values, RaggedTensor):
+        return values._nrows()
+    return values.shape[0]
+
+
+def _rowids_from_splits(row_splits, nvals):
+    # the row of each value, as the number of row limits not above its index
+    positions = ivy.arange(nvals, dtype="int64")
+    return ivy.searchsorted(row_splits[1:], positions, side="right")
+
+
+def _splits_from_lengths(row_lengths):
+    zero = ivy.zeros((1,), dtype="int64")
+    return ivy.concat([zero, ivy.cumsum(row_lengths.astype("int64"))])
+
+
+def _to_ivy(x):
+    if isinstance(x, RaggedTensor):
+        return x
+    x = _to_ivy_array(x)
+    return x if isinstance(x, ivy.Array) else ivy.asarray(x)
+
+
+# --- Main --- #
+# ------------ #
+
+
 class RaggedTensor:
+    """
+    A tensor of rows of different lengths, held as the values of all the rows one
+    after another and the row_splits at which each row starts and ends. The
+    operations work on the values and row_splits directly, as segment reductions,
+    maps over the values and gathers; a list of the rows is only built when they
+    are iterated over or accessed through data.
+    """
+
     def __init__(self, values, row_partition, internal=False, data=None):
         if not internal:
             raise ivy.utils.exceptions.IvyException(
@@ -16,120 +59,341 @@ class RaggedTensor:
                 "(e.g., RaggedTensor.from_row_lengths())"
             )
         self._values = values
-        self.data = data
         self._row_partition = row_partition
+        self._data = data
 
     @classmethod
     def from_row_splits(cls, values, row_splits, name=None, validate=True):
-        # TODO : modify this, if necessary, to accept raggedTensor inputs too
-
-        if values.shape[0] != row_splits[-1] or row_splits[0] != 0:
-            if values.shape[0] != row_splits[-1]:
-                ivy.utils.exceptions.IvyException(
+        values = _to_ivy(values)
+        row_splits = _to_ivy(row_splits).astype("int64")
+        if validate:
+            if row_splits.ndim != 1 or row_splits.shape[0] == 0:
+                raise ivy.utils.exceptions.IvyException(
+                    "row_splits should be a non-empty vector"
+                )
+            if int(row_splits[0]) != 0:
+                raise ivy.utils.exceptions.IvyException(
+                    "first value of row_splits should be equal to zero."
+                )
+            if int(row_splits[-1]) != _nvals(values):
+                raise ivy.utils.exceptions.IvyException(
                     "first dimension of shape of values should be equal to the"
                     " last dimension of row_splits"
                 )
-            else:
-                ivy.utils.exceptions.IvyException(
-                    "first value of row_splits should be equal to zero."
+            if bool(ivy.any(row_splits[1:] < row_splits[:-1])):
+                raise ivy.utils.exceptions.IvyException(
+                    "row_splits should be sorted in ascending order"
                 )
-        data = [
-            values[row_splits[i] : row_splits[i + 1], :]
-            for i in range(len(row_splits) - 1)
-        ]
+        return cls(values=values, row_partition=row_splits, internal=True)
 
-        return cls(values=values, row_partition=row_splits, internal=True, data=data)
+    @classmethod
+    def from_row_lengths(cls, values, row_lengths, name=None, validate=True):
+        row_splits = _splits_from_lengths(_to_ivy(row_lengths))
+        return cls.from_row_splits(values, row_splits, validate=validate)
 
     @classmethod
-    def from_row_lengths(
-        cls,
-        values,
-        row_lengths,
-        name=None,
+    def from_value_rowids(
+        cls, values, value_rowids, nrows=None, name=None, validate=True
     ):
-        # TODO : modify this, if necessary, to accept raggedTensor inputs too
-        if sum(row_lengths) != values.shape[0]:
-            ivy.utils.exceptions.IvyException(
-                "first dimension of values should be equal to sum(row_lengths) "
+        # the values of each row are contiguous, so the row lengths are the counts of
+        # the row ids
+        value_rowids = _to_ivy(value_rowids).astype("int64")
+        if nrows is None:
+            nrows = int(value_rowids[-1]) + 1 if value_rowids.shape[0] else 0
+        if validate and bool(ivy.any(value_rowids[1:] < value_rowids[:-1])):
+            raise ivy.utils.exceptions.IvyException(
+                "value_rowids should be sorted in ascending order"
             )
-        data = []
-        z = 0
-        for length in row_lengths:
-            temp = []
-            for i in range(length):
-                temp.append(values[z, :])
-                z += 1
-
-            data.append(ivy.asarray(temp))
-
-        # data =[[values[0+i,:] for i in range(length)]
-        #   for length in row_lengths]
-        return cls(values=values, row_partition=row_lengths, internal=True, data=data)
+        row_lengths = ivy.bincount(value_rowids, minlength=int(nrows))
+        return cls.from_row_lengths(values, row_lengths, validate=validate)
 
     @classmethod
-    def from_value_rowids(
-        cls,
-        values,
-        value_rowids,
-        nrows=None,
-        name=None,
-    ):
-        if not nrows:
-            nrows = value_rowids[-1] + 1
-        data = []
-        for row in range(nrows):
-            temp = []
-            for i in range(len(values)):
-                if value_rowids[i] == row:
-                    temp.append(values[i, :])
-            data.append(ivy.asarray(temp))
-
-        # data= [[values[i,:] for i in range(len(values)) if value_rowids[i] == row]
-        #   for row in range(nrows)]
-        return cls(values=values, row_partition=value_rowids, internal=True, data=data)
+    def from_row_starts(cls, values, row_starts, name=None, validate=True):
+        values = _to_ivy(values)
+        last = ivy.full((1,), _nvals(values), dtype="int64")
+        row_splits = ivy.concat([_to_ivy(row_starts).astype("int64"), last])
+        return cls.from_row_splits(values, row_splits, validate=validate)
 
     @classmethod
-    def from_row_starts(
-        cls,
-        values,
-        row_starts,
-        name=None,
-    ):
-        # TODO since row_starts will be a tensor try appending using concat after
-        #  ensuring row_starts
-        # is a tensor
-        row_starts.append(len(values))
-        return cls.from_row_splits(values, row_starts)
+    def from_row_limits(cls, values, row_limits, name=None, validate=True):
+        zero = ivy.zeros((1,), dtype="int64")
+        row_splits = ivy.concat([zero, _to_ivy(row_limits).astype("int64")])
+        return cls.from_row_splits(values, row_splits, validate=validate)
+
+    def _nrows(self):
+        return self._row_partition.shape[0] - 1
+
+    def _value_rowids(self):
+        return _rowids_from_splits(self._row_partition, _nvals(self._values))
+
+    def _row_lengths(self):
+        return self._row_partition[1:] - self._row_partition[:-1]
+
+    def _flat_values(self):
+        values = self._values
+        while isinstance(values, RaggedTensor):
+            values = values._values
+        return values
+
+    def _gather(self, indices):
+        # the rows at indices, with the value at position p of output row r taken
+        # from position p of the row indices[r]
+        indices = _to_ivy(indices).astype("int64")
+        starts = self._row_partition[:-1][indices]
+        lengths = self._row_lengths()[indices]
+        row_splits = _splits_from_lengths(lengths)
+        rowids = _rowids_from_splits(row_splits, int(row_splits[-1]))
+        sources = (
+            starts[rowids]
+            + ivy.arange(rowids.shape[0], dtype="int64")
+            - row_splits[rowids]
+        )
+        if isinstance(self._values, RaggedTensor):
+            values = self._values._gather(sources)
+        else:
+            values = ivy.gather(self._values, sources, axis=0)
+        return RaggedTensor(values, row_splits, internal=True)
+
+    def _reduce(self, reduction, axis=None, keepdims=False):
+        """
+        Reduces over all the values, or over the values of each row with one
+        segment reduction keyed by the row ids of the values, empty rows holding
+        the identity of the reduction as in tensorflow.
+        """
+        values = self._values
+        if axis is None:
+            values = self._flat_values()
+            return getattr(ivy, reduction)(values, keepdims=keepdims)
+        if isinstance(values, RaggedTensor):
+            raise ivy.utils.exceptions.IvyNotImplementedException(
+                "reductions of a nested RaggedTensor are only supported over all its"
+                " values"
+            )
+        axis = axis % (values.ndim + 1)
+        if axis == 0:
+            raise ivy.utils.exceptions.IvyNotImplementedException(
+                "reductions of a RaggedTensor across its rows are not supported"
+            )
+        if axis > 1:
+            # an axis of the uniform inner dimensions of the values
+            ret = getattr(ivy, reduction)(values, axis=axis - 1, keepdims=keepdims)
+            return self.with_values(ret)
+        rowids = self._value_rowids()
+        nrows = self._nrows()
+        empty = ivy.reshape(self._row_lengths() == 0, (-1,) + (1,) * (values.ndim - 1))
+        if reduction in ("sum", "mean"):
+            ret = ivy.unsorted_segment_sum(values, rowids, nrows)
+            if reduction == "mean":
+                # a true division as in tensorflow, of ints of up to 16 bits into
+                # float32 and of wider ints into float64, empty rows holding nan
+                if not ivy.is_float_dtype(ret):
+                    bits = ivy.dtype_bits(values.dtype)
+                    ret = ret.astype("float32" if bits <= 16 else "float64")
+                lengths = ivy.reshape(self._row_lengths(), empty.shape)
+                ret = ivy.where(
+                    empty,
+                    ivy.full_like(ret, ivy.nan),
+                    ret / ivy.maximum(lengths, 1).astype(ret.dtype),
+                )
+        elif reduction == "min":
+            ret = ivy.unsorted_segment_min(values, rowids, nrows)
+        elif reduction == "max":
+            # scattered into the lowest value of the dtype, which empty rows hold
+            info = ivy.finfo if ivy.is_float_dtype(values) else ivy.iinfo
+            ret = ivy.full(
+                (nrows,) + tuple(values.shape[1:]),
+                info(values.dtype).min,
+                dtype=values.dtype,
+            )
+            ret = ivy.scatter_nd(
+                ivy.expand_dims(rowids, axis=-1), values, reduction="max", out=ret
+            )
+        else:
+            raise ivy.utils.exceptions.IvyNotImplementedException(
+                f"{reduction} of the rows of a RaggedTensor is not supported"
+            )
+        if keepdims:
+            ret = ivy.expand_dims(ret, axis=1)
+        return ret
+
+    @to_ivy_arrays_and_back
+    def nrows(self, out_type="int64", name=None):
+        return ivy.array(self._nrows(), dtype=out_type)
+
+    @to_ivy_arrays_and_back
+    def row_lengths(self, axis=1, name=None):
+        if axis != 1:
+            raise ivy.utils.exceptions.IvyNotImplementedException(
+                "row_lengths is only supported for axis=1"
+            )
+        return self._row_lengths()
+
+    @to_ivy_arrays_and_back
+    def row_starts(self, name=None):
+        return self._row_partition[:-1]
+
+    @to_ivy_arrays_and_back
+    def row_limits(self, name=None):
+        return self._row_partition[1:]
+
+    @to_ivy_arrays_and_back
+    def value_rowids(self, name=None):
+        return self._value_rowids()
+
+    def with_values(self, new_values):
+        new_values = _to_ivy(new_values)
+        if _nvals(new_values) != _nvals(self._values):
+            raise ivy.utils.exceptions.IvyException(
+                "new_values should have as many rows as the values"
+            )
+        return RaggedTensor(new_values, self._row_partition, internal=True)
+
+    def with_flat_values(self, new_values):
+        if isinstance(self._values, RaggedTensor):
+            return self.with_values(self._values.with_flat_values(new_values))
+        return self.with_values(new_values)
+
+    @to_ivy_arrays_and_back
+    def to_tensor(self, default_value=None, name=None, shape=None):
+        """
+        Pads the rows to the length of the longest one, writing all the values into
+        the padded tensor with a single scatter at the flat positions given by the
+        row and the position in its row of each value.
+        """
+        values = self._values
+        if isinstance(values, RaggedTensor):
+            values = values.to_tensor(default_value=default_value).ivy_array
+        nrows = self._nrows()
+        lengths = self._row_lengths()
+        width = int(ivy.max(lengths)) if nrows else 0
+        if shape is not None:
+            shape = list(shape)
+            nrows = nrows if shape[0] is None else shape[0]
+            width = width if len(shape) < 2 or shape[1] is None else shape[1]
+        rowids = self._value_rowids()
+        columns = (
+            ivy.arange(rowids.shape[0], dtype="int64") - self._row_partition[rowids]
+        )
+        keep = (columns < width) & (rowids < nrows)
+        if not bool(ivy.all(keep)):
+            rowids, columns, values = rowids[keep], columns[keep], values[keep]
+        default_value = 0 if default_value is None else default_value
+        padded = ivy.full(
+            (nrows * width,) + tuple(values.shape[1:]),
+            default_value,
+            dtype=values.dtype,
+        )
+        padded[rowids * width + columns] = values
+        return ivy.reshape(padded, (nrows, width) + tuple(values.shape[1:]))
 
     def to_list(self):
-        vals = []
-        for i in self:
-            if isinstance(i, RaggedTensor):
-                vals.append(i.to_list())
-            else:
-                vals.append(ivy.to_list(i))
-        return vals
+        # the values are converted to a list once, and split into the rows
+        if isinstance(self._values, RaggedTensor):
+            values = self._values.to_list()
+        else:
+            values = ivy.to_list(self._values)
+        splits = ivy.to_list(self._row_partition)
+        return [values[start:stop] for start, stop in zip(splits[:-1], splits[1:])]
 
     @property
+    def data(self):
+        # the list of the rows, built on first use
+        if self._data is None:
+            self._data = [self[i] for i in range(self._nrows())]
+        return self._data
+
+    def __iter__(self):
+        return iter(self.data)
+
+    @to_ivy_arrays_and_back
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            nrows = self._nrows()
+            if not -nrows <= key < nrows:
+                raise IndexError("RaggedTensor row index out of range")
+            key = key % nrows
+            if isinstance(self._values, RaggedTensor):
+                return self._gather(ivy.array([key]))._values
+            start, stop = self._row_partition[key], self._row_partition[key + 1]
+            return self._values[int(start) : int(stop)]
+        if isinstance(key, slice):
+            indices = ivy.arange(self._nrows(), dtype="int64")[key]
+            return self._gather(indices)
+        raise ivy.utils.exceptions.IvyNotImplementedException(
+            "RaggedTensor only supports indexing rows with an integer or a slice"
+        )
+
+    def _binary(self, other, fn):
+        # elementwise ops work on the flat values, with the same row partitions
+        other = other._flat_values() if isinstance(other, RaggedTensor) else other
+        return self.with_flat_values(fn(self._flat_values(), _to_ivy(other)))
+
+    def __add__(self, other):
+        return self._binary(other, ivy.add)
+
+    def __radd__(self, other):
+        return self._binary(other, lambda x, y: ivy.add(y, x))
+
+    def __sub__(self, other):
+        return self._binary(other, ivy.subtract)
+
+    def __rsub__(self, other):
+        return self._binary(other, lambda x, y: ivy.subtract(y, x))
+
+    def __mul__(self, other):
+        return self._binary(other, ivy.multiply)
+
+    def __rmul__(self, other):
+        return self._binary(other, lambda x, y: ivy.multiply(y, x))
+
+    def __truediv__(self, other):
+        return self._binary(other, ivy.divide)
+
+    def __neg__(self):
+        return self.with_flat_values(ivy.negative(self._flat_values()))
+
+    @property
+    @to_ivy_arrays_and_back
     def values(self):
         return self._values
 
     @property
+    @to_ivy_arrays_and_back
     def flat_values(self):
-        values = self.values
-        while isinstance(values, RaggedTensor):
-            values = values.values
-        return values
+        return self._flat_values()
 
     @property
+    @to_ivy_arrays_and_back
     def row_splits(self):
         return self._row_partition
 
     @property
+    @to_ivy_arrays_and_back
     def nested_row_splits(self):
-        rt_nested_splits = [self.row_splits]
-        rt_values = self.values
+        rt_nested_splits = [self._row_partition]
+        rt_values = self._values
         while isinstance(rt_values, RaggedTensor):
-            rt_nested_splits.append(rt_values.row_splits)
-            rt_values = rt_values.values
+            rt_nested_splits.append(rt_values._row_partition)
+            rt_values = rt_values._values
         return tuple(rt_nested_splits)
+
+
+def map_flat_values(op, *args, **kwargs):
+    """
+    Applies op to the flat values of the RaggedTensors in args and kwargs, all of
+    the same row partitions, and returns a RaggedTensor of those partitions holding
+    the result.
+    """
+    partitions = []
+
+    def _flat(x):
+        if isinstance(x, RaggedTensor):
+            partitions.append(x)
+            return x._flat_values()
+        return x
+
+    args = [_flat(arg) for arg in args]
+    kwargs = {key: _flat(value) for key, value in kwargs.items()}
+    if not partitions:
+        return op(*args, **kwargs)
+    return partitions[0].with_flat_values(op(*args, **kwargs))
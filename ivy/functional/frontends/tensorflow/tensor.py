@@ -4,15 +4,19 @@
 import ivy
 from ivy import with_unsupported_dtypes
 import ivy.functional.frontends.tensorflow as tf_frontend
-from ivy.functional.frontends.tensorflow.func_wrapper import _to_ivy_array
+from ivy.functional.frontends.tensorflow.func_wrapper import (
+    _native_to_ivy_array,
+    _to_ivy_array,
+)
 from ivy.functional.frontends.numpy.creation_routines.from_existing_data import array
 
 
 class EagerTensor:
+    __slots__ = ("_ivy_array", "__weakref__")
+
     def __init__(self, array):
-        self._ivy_array = (
-            ivy.array(array) if not isinstance(array, ivy.Array) else array
-        )
+        array = _native_to_ivy_array(array)
+        self._ivy_array = array if isinstance(array, ivy.Array) else ivy.array(array)
 
     def __repr__(self):
         return (
@@ -230,4 +234,4 @@ class EagerTensor:
 
 # Dummy Tensor class to help with compilation, don't add methods here
 class Tensor(EagerTensor):
-    pass
+    __slots__ = ()
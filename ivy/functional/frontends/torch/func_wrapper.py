@@ -1,5 +1,7 @@
 # global
 import functools
+import inspect
+import math
 from typing import Callable
 
 # local
@@ -15,6 +17,7 @@ numpy_compatible_args = {
     "x1": "input",
     "x2": "other",
 }
+_signatures = {}
 
 
 class AccumulateGrad:
@@ -29,64 +32,90 @@ class AccumulateGrad:
         return self.__name__ == __value
 
     def __call__(self, grads):
-        for i in range(self.__self__.ndim):
-            grads = grads.sum(-1)
-        self.__self__._grads = grads
+        # gradients are summed into .grad across backward passes, as in torch
+        grads = _to_ivy_array(grads)
+        if self.__self__._grads is not None:
+            grads = ivy.add(self.__self__._grads.ivy_array, grads)
+        self.__self__._grads = torch_frontend.Tensor(grads, _init_overload=True)
         return None
 
 
 class GradFn:
-    def __init__(self, fn, inputs) -> None:
-        self._inputs = []
-        self._fns = []
-        self.next_functions = []
-        assert len(inputs) <= 2
-        if len(inputs) == 1 and isinstance(inputs[0], torch_frontend.Tensor):
-            self._inputs.append(inputs[0].detach())
-
-            def d_fn(x):
-                return fn(x)
+    def __init__(self, fn, inputs, kwargs=None) -> None:
+        """
+        Node of the autograd tape, recording the call of fn on its inputs, and
+        computing the vector-Jacobian product of the call for each of the inputs
+        which require a gradient.
 
-            self._fns.append(to_ivy_arrays_and_back(ivy.jac(d_fn)))
-            if inputs[0].grad_fn is not None:
-                self.next_functions.append(inputs[0].grad_fn)
-            elif inputs[0].requires_grad and inputs[0].is_leaf:
+        The products are computed with the rule of fn in ``_vjp_rules``, or else by
+        differentiating the call with the autograd of the backend, so that the
+        backward pass costs about as much as the forward pass.
+        """
+        self._fn = fn
+        # the arrays of the inputs are saved, so that in-place updates of the
+        # tensors after the call do not change the gradients
+        self._args = [_to_ivy_array(x) for x in inputs]
+        self._kwargs = {k: _to_ivy_array(v) for k, v in (kwargs or {}).items()}
+        self._idxs = []
+        self.next_functions = []
+        for i, x in enumerate(inputs):
+            # only floating point tensors have gradients, as in torch
+            if not isinstance(x, torch_frontend.Tensor) or not (
+                ivy.is_float_dtype(x.dtype) or ivy.is_complex_dtype(x.dtype)
+            ):
+                continue
+            if x.grad_fn is not None:
+                self.next_functions.append(x.grad_fn)
+            elif x.requires_grad and x.is_leaf:
                 acc_grad = AccumulateGrad()
-                acc_grad.__self__ = inputs[0]
+                acc_grad.__self__ = x
                 self.next_functions.append(acc_grad)
-        elif len(inputs) == 2:
-            if isinstance(inputs[0], torch_frontend.Tensor):
-                self._inputs.append(inputs[0].detach())
-
-                def d_fn(x):
-                    return fn(x, inputs[1])
-
-                self._fns.append(to_ivy_arrays_and_back(ivy.jac(d_fn)))
-                if inputs[0].grad_fn is not None:
-                    self.next_functions.append(inputs[0].grad_fn)
-                elif inputs[0].requires_grad and inputs[0].is_leaf:
-                    acc_grad = AccumulateGrad()
-                    acc_grad.__self__ = inputs[0]
-                    self.next_functions.append(acc_grad)
-            if isinstance(inputs[1], torch_frontend.Tensor):
-                self._inputs.append(inputs[1].detach())
-
-                def d_fn(x):
-                    return fn(inputs[0], x)
-
-                self._fns.append(to_ivy_arrays_and_back(ivy.jac(d_fn)))
-                if inputs[1].grad_fn is not None:
-                    self.next_functions.append(inputs[1].grad_fn)
-                elif inputs[1].requires_grad and inputs[1].is_leaf:
-                    acc_grad = AccumulateGrad()
-                    acc_grad.__self__ = inputs[1]
-                    self.next_functions.append(acc_grad)
-        self.__name__ = fn.__name__.capitalize() + "Backward"
+            else:
+                continue
+            self._idxs.append(i)
+        self.__name__ = fn.__name__.lstrip("_").capitalize() + "Backward"
+
+    def _vjp(self, grad):
+        bound = _signature(self._fn).bind(*self._args, **self._kwargs)
+        bound.apply_defaults()
+        args = bound.arguments
+        names = list(args)
+        rules = _vjp_rules.get(self._fn.__name__)
+        if rules is None and self._fn.__name__ in _selection_ops:
+            rules = {"input": functools.partial(_selection_vjp, fn=self._fn)}
+        if rules is None or any(names[i] not in rules for i in self._idxs):
+            return self._native_vjp(grad)
+        ret = self.__self__.ivy_array
+        grads = []
+        for i in self._idxs:
+            x = self._args[i]
+            g = _unbroadcast(rules[names[i]](grad, ret, args), x.shape)
+            grads.append(g if g.dtype == x.dtype else ivy.astype(g, x.dtype))
+        return grads
+
+    def _native_vjp(self, grad):
+        if not ivy.supports_gradients:
+            raise ivy.utils.exceptions.IvyNotImplementedException(
+                "{} has no gradient rule, and the {} backend does not support"
+                " gradients".format(self.__name__, ivy.current_backend_str())
+            )
+        xs = ivy.Container({str(i): self._args[i] for i in self._idxs})
+
+        def func(xs):
+            args = list(self._args)
+            for i in self._idxs:
+                args[i] = xs[str(i)]
+            return ivy.sum(ivy.multiply(self._fn(*args, **self._kwargs), grad))
+
+        _, grads = ivy.execute_with_gradients(
+            func, xs, xs_grad_idxs=None, ret_grad_idxs=None
+        )
+        return [grads[str(i)] for i in self._idxs]
 
     def __call__(self, prev_grads):
         return [
-            jac_fn(input_tensor) * prev_grads
-            for input_tensor, jac_fn in zip(self._inputs, self._fns)
+            torch_frontend.Tensor(g, _init_overload=True)
+            for g in self._vjp(_to_ivy_array(prev_grads))
         ]
 
     def __repr__(self):
@@ -103,7 +132,7 @@ class GradFn:
 def _from_ivy_array_to_torch_frontend_tensor(
     x, nested=False, include_derived=None, requires_grad=False
 ):
-    if nested:
+    if nested and not isinstance(x, (ivy.Array, ivy.NativeArray)):
         return ivy.nested_map(
             functools.partial(
                 _from_ivy_array_to_torch_frontend_tensor, requires_grad=requires_grad
@@ -118,10 +147,84 @@ def _from_ivy_array_to_torch_frontend_tensor(
     return x
 
 
+def _matmul_vjp(grad, x, y, wrt_x):
+    # vectors are promoted to matrices as in the forward pass, and the broadcast
+    # batch dimensions are summed by _unbroadcast
+    x2 = ivy.expand_dims(x, axis=0) if x.ndim == 1 else x
+    y2 = ivy.expand_dims(y, axis=-1) if y.ndim == 1 else y
+    if y.ndim == 1:
+        grad = ivy.expand_dims(grad, axis=-1)
+    if x.ndim == 1:
+        grad = ivy.expand_dims(grad, axis=-2)
+    if wrt_x:
+        ret = ivy.matmul(grad, ivy.swapaxes(y2, -1, -2))
+        return ivy.squeeze(ret, axis=-2) if x.ndim == 1 else ret
+    ret = ivy.matmul(ivy.swapaxes(x2, -1, -2), grad)
+    return ivy.squeeze(ret, axis=-1) if y.ndim == 1 else ret
+
+
+def _reduction_vjp(grad, ret, args, mean=False):
+    x = args["input"]
+    dim = args["dim"]
+    if dim is not None and not args["keepdim"]:
+        dims = [dim] if isinstance(dim, int) else list(dim)
+        grad = ivy.expand_dims(grad, axis=sorted(d % x.ndim for d in dims))
+    if mean:
+        grad = ivy.divide(grad, math.prod(x.shape) // max(math.prod(ret.shape), 1))
+    return ivy.broadcast_to(grad, x.shape)
+
+
+def _run_backward(grad_fn, grad):
+    # order the nodes of the tape so that each one runs after all the nodes using
+    # its output, then run each one once on the sum of its incoming gradients
+    order, visited = [], set()
+    stack = [(grad_fn, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            order.append(node)
+        elif id(node) not in visited:
+            visited.add(id(node))
+            stack.append((node, True))
+            stack.extend((n, False) for n in node.next_functions)
+    grads = {id(grad_fn): _to_ivy_array(grad)}
+    for node in reversed(order):
+        grad = grads.pop(id(node), None)
+        if grad is None:
+            continue
+        if isinstance(node, AccumulateGrad):
+            node(grad)
+            continue
+        for next_fn, next_grad in zip(node.next_functions, node._vjp(grad)):
+            if id(next_fn) in grads:
+                next_grad = ivy.add(grads[id(next_fn)], next_grad)
+            grads[id(next_fn)] = next_grad
+
+
+def _selection_vjp(grad, ret, args, fn):
+    # applying the selection to the flat positions of the input gives the position
+    # each output element was read from, which the gradient is scattered back to,
+    # summing over the positions read more than once
+    x = args["input"]
+    size = math.prod(x.shape)
+    positions = ivy.reshape(ivy.arange(size, dtype=ivy.int64), x.shape)
+    positions = fn(**dict(args, input=positions))
+    grad = ivy.bincount(
+        ivy.reshape(positions, (-1,)), weights=ivy.reshape(grad, (-1,)), minlength=size
+    )
+    return ivy.reshape(grad, x.shape)
+
+
+def _signature(fn):
+    if fn not in _signatures:
+        _signatures[fn] = inspect.signature(fn)
+    return _signatures[fn]
+
+
 def _to_ivy_array(x):
-    # if x is a native array return it as an ivy array
+    # if x is a native array return it wrapped in an ivy array, without a copy
     if isinstance(x, ivy.NativeArray):
-        return ivy.array(x)
+        return ivy.Array(x)
 
     # else if x is a frontend torch Tensor (or any frontend "Tensor" actually) return the wrapped ivy array # noqa: E501
     elif hasattr(x, "ivy_array"):
@@ -131,6 +234,145 @@ def _to_ivy_array(x):
     return x
 
 
+def _unbroadcast(grad, shape):
+    # sum the gradient of a broadcast input over the dimensions it was broadcast along
+    shape = tuple(shape)
+    if tuple(grad.shape) == shape:
+        return grad
+    num_new = grad.ndim - len(shape)
+    if num_new > 0:
+        grad = ivy.sum(grad, axis=tuple(range(num_new)))
+    axes = tuple(i for i, d in enumerate(shape) if d == 1 and grad.shape[i] != 1)
+    if axes:
+        grad = ivy.sum(grad, axis=axes, keepdims=True)
+    return ivy.reshape(grad, shape)
+
+
+def _rounded_div_vjp(rule):
+    # a division rounded down or towards zero is piecewise constant, so that as in
+    # torch its gradient is zero
+    def _vjp(grad, ret, args):
+        if args.get("rounding_mode") is not None:
+            return ivy.zeros_like(grad)
+        return rule(grad, ret, args)
+
+    return _vjp
+
+
+# the vector-Jacobian products of the ops, for each of their differentiable arguments,
+# given the gradient of the output, the output, and the bound arguments of the call
+_vjp_rules = {
+    "abs": {"input": lambda g, r, a: g * ivy.sign(a["input"])},
+    "add": {
+        "input": lambda g, r, a: g,
+        "other": lambda g, r, a: g * a["alpha"],
+    },
+    "bmm": {
+        "input": lambda g, r, a: _matmul_vjp(g, a["input"], a["mat2"], True),
+        "mat2": lambda g, r, a: _matmul_vjp(g, a["input"], a["mat2"], False),
+    },
+    "clamp": {"input": lambda g, r, a: ivy.where(r == a["input"], g, 0.0)},
+    "cos": {"input": lambda g, r, a: -g * ivy.sin(a["input"])},
+    "div": {
+        "input": _rounded_div_vjp(lambda g, r, a: g / a["other"]),
+        "other": _rounded_div_vjp(lambda g, r, a: -g * r / a["other"]),
+    },
+    "exp": {"input": lambda g, r, a: g * r},
+    "flatten": {"input": lambda g, r, a: ivy.reshape(g, a["input"].shape)},
+    "linear": {
+        "input": lambda g, r, a: ivy.matmul(g, a["weight"]),
+        "weight": lambda g, r, a: ivy.matmul(
+            ivy.swapaxes(ivy.reshape(g, (-1, g.shape[-1])), 0, 1),
+            ivy.reshape(a["input"], (-1, a["input"].shape[-1])),
+        ),
+        "bias": lambda g, r, a: g,
+    },
+    "log": {"input": lambda g, r, a: g / a["input"]},
+    "log_softmax": {
+        "input": lambda g, r, a: g - ivy.exp(r) * ivy.sum(
+            g, axis=ivy.default(a["dim"], -1), keepdims=True
+        )
+    },
+    "matmul": {
+        "input": lambda g, r, a: _matmul_vjp(g, a["input"], a["other"], True),
+        "other": lambda g, r, a: _matmul_vjp(g, a["input"], a["other"], False),
+    },
+    "maximum": {
+        "input": lambda g, r, a: ivy.where(r == a["input"], g, 0.0),
+        "other": lambda g, r, a: ivy.where(r == a["input"], 0.0, g),
+    },
+    "mean": {"input": functools.partial(_reduction_vjp, mean=True)},
+    "minimum": {
+        "input": lambda g, r, a: ivy.where(r == a["input"], g, 0.0),
+        "other": lambda g, r, a: ivy.where(r == a["input"], 0.0, g),
+    },
+    "mm": {
+        "input": lambda g, r, a: _matmul_vjp(g, a["input"], a["mat2"], True),
+        "mat2": lambda g, r, a: _matmul_vjp(g, a["input"], a["mat2"], False),
+    },
+    "mul": {
+        "input": lambda g, r, a: g * a["other"],
+        "other": lambda g, r, a: g * a["input"],
+    },
+    "negative": {"input": lambda g, r, a: -g},
+    "permute": {
+        "input": lambda g, r, a: ivy.permute_dims(
+            g, axes=sorted(range(len(a["dims"])), key=list(a["dims"]).__getitem__)
+        )
+    },
+    "pow": {
+        "input": (
+            lambda g, r, a: g * a["exponent"] * ivy.pow(a["input"], a["exponent"] - 1)
+        ),
+        "exponent": lambda g, r, a: g * r * ivy.log(a["input"]),
+    },
+    "relu": {"input": lambda g, r, a: ivy.where(a["input"] > 0, g, 0.0)},
+    "reshape": {"input": lambda g, r, a: ivy.reshape(g, a["input"].shape)},
+    "rsqrt": {"input": lambda g, r, a: -0.5 * g * r**3},
+    "sigmoid": {"input": lambda g, r, a: g * r * (1 - r)},
+    "sin": {"input": lambda g, r, a: g * ivy.cos(a["input"])},
+    "softmax": {
+        "input": lambda g, r, a: r * (g - ivy.sum(g * r, axis=a["dim"], keepdims=True))
+    },
+    "sqrt": {"input": lambda g, r, a: g / (2 * r)},
+    "square": {"input": lambda g, r, a: 2 * g * a["input"]},
+    "squeeze": {"input": lambda g, r, a: ivy.reshape(g, a["input"].shape)},
+    "subtract": {
+        "input": lambda g, r, a: g,
+        "other": lambda g, r, a: -g * a["alpha"],
+    },
+    "sum": {"input": _reduction_vjp},
+    "t": {
+        "input": lambda g, r, a: ivy.permute_dims(g, axes=tuple(range(g.ndim))[::-1])
+    },
+    "tanh": {"input": lambda g, r, a: g * (1 - r**2)},
+    "transpose": {"input": lambda g, r, a: ivy.swapaxes(g, a["dim0"], a["dim1"])},
+    "true_divide": {
+        "input": lambda g, r, a: g / a["other"],
+        "other": lambda g, r, a: -g * r / a["other"],
+    },
+    "unsqueeze": {"input": lambda g, r, a: ivy.reshape(g, a["input"].shape)},
+    "where": {
+        "input": lambda g, r, a: ivy.where(a["condition"], g, 0.0),
+        "other": lambda g, r, a: ivy.where(a["condition"], 0.0, g),
+    },
+}
+_vjp_rules["divide"] = _vjp_rules["div"]
+
+# the ops which only read elements of their input, whose gradient is scattered back
+# to the positions which were read
+_selection_ops = {
+    "_index",
+    "flip",
+    "gather",
+    "index_select",
+    "narrow",
+    "roll",
+    "select",
+    "take_along_dim",
+}
+
+
 # --- Main --- #
 # ------------ #
 
@@ -248,11 +490,11 @@ def outputs_to_frontend_arrays(fn: Callable) -> Callable:
             else:
                 ret.is_leaf = False
         # set grad_fn
-        if any(
+        if isinstance(ret, torch_frontend.Tensor) and any(
             [isinstance(i, torch_frontend.Tensor) and i.requires_grad for i in args]
         ):
             # ToDo: Implement for unbind
-            grad_fn = GradFn(fn, args)
+            grad_fn = GradFn(fn, args, kwargs)
             grad_fn.__self__ = ret
             ret.grad_fn = grad_fn
 
@@ -12,16 +12,29 @@ from ivy.functional.frontends.numpy.creation_routines.from_existing_data import
 from ivy.func_wrapper import with_unsupported_dtypes
 from ivy.func_wrapper import with_supported_dtypes
 from ivy.functional.frontends.torch.func_wrapper import (
+    _run_backward,
     _to_ivy_array,
     numpy_to_torch_style_args,
+    to_ivy_arrays_and_back,
 )
 
 
 class Tensor:
+    __slots__ = (
+        "_ivy_array",
+        "_grads",
+        "_requires_grad",
+        "grad_fn",
+        "_is_leaf",
+        "__weakref__",
+    )
+
     def __init__(self, array, device=None, _init_overload=False, requires_grad=False):
         if _init_overload:
+            # native arrays are wrapped once, rather than converted by ivy.array
+            array = _to_ivy_array(array)
             self._ivy_array = (
-                ivy.array(array) if not isinstance(array, ivy.Array) else array
+                array if isinstance(array, ivy.Array) else ivy.array(array)
             )
 
         else:
@@ -105,9 +118,8 @@ class Tensor:
 
     @ivy_array.setter
     def ivy_array(self, array):
-        self._ivy_array = (
-            ivy.array(array) if not isinstance(array, ivy.Array) else array
-        )
+        array = _to_ivy_array(array)
+        self._ivy_array = array if isinstance(array, ivy.Array) else ivy.array(array)
 
     @requires_grad.setter
     def requires_grad(self, requires_grad):
@@ -1144,9 +1156,7 @@ class Tensor:
         return self.long()
 
     def __getitem__(self, query, /):
-        ivy_args = ivy.nested_map(_to_ivy_array, [self, query])
-        ret = ivy.get_item(*ivy_args)
-        return torch_frontend.Tensor(ret, _init_overload=True)
+        return _index(self, query)
 
     def __setitem__(self, key, value, /):
         key, value = ivy.nested_map(_to_ivy_array, [key, value])
@@ -1748,14 +1758,9 @@ class Tensor:
             assert self.shape == gradient.shape, "Mismatch in shape"
             self._grads = gradient
             return
-        _grad_list = self.grad_fn(
-            gradient if gradient is not None else torch_frontend.tensor(1.0)
-        )
-        for idx, next_function in enumerate(self.grad_fn.next_functions):
-            if next_function.__self__.grad_fn is not None:
-                next_function.__self__.backward(_grad_list[idx])
-            else:
-                next_function(_grad_list[idx])
+        if gradient is None:
+            gradient = ivy.ones_like(self.ivy_array)
+        _run_backward(self.grad_fn, gradient)
 
     @with_unsupported_dtypes({"2.0.1 and below": ("float16", "bfloat16")}, "torch")
     def logaddexp(self, other):
@@ -2106,3 +2111,12 @@ class Size(tuple):
     @property
     def ivy_shape(self):
         return self._ivy_shape
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+@to_ivy_arrays_and_back
+def _index(input, query):
+    return ivy.get_item(input, query)
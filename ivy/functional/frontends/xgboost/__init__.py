@@ -6,6 +6,8 @@ from . import linear
 from .linear import *
 from . import objective
 from .objective import *
+from . import tree
+from .tree import *
 from . import sklearn
 from .sklearn import *
 from . import training
@@ -1,6 +1,6 @@
 import ivy
 from ivy.func_wrapper import with_unsupported_dtypes
-from .gbm import GBLinear
+from .gbm import GBLinear, GBTree
 
 
 class DMatrix:
@@ -110,8 +110,11 @@ class Booster:
             }
         )
 
-        # create gbm(as for now only gblinear booster is available)
-        self.gbm = GBLinear(params)
+        # create gbm, gblinear unless the gbtree booster is asked for
+        if params.get("booster") == "gbtree":
+            self.gbm = GBTree(params)
+        else:
+            self.gbm = GBLinear(params)
 
     def update(self, dtrain, dlabel, iteration, fobj=None):
         """
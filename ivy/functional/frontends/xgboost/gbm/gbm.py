@@ -5,6 +5,15 @@ from ivy.functional.frontends.xgboost.objective.regression_loss import (
 from ivy.functional.frontends.xgboost.linear.updater_coordinate import (
     coordinate_updater,
 )
+from ivy.functional.frontends.xgboost.tree.updater_quantile_hist import (
+    bin_data,
+    quantile_cuts,
+    quantile_hist_updater,
+)
+
+
+# nodes visited at once by the rows of a batch in prediction, over all trees
+_PRED_BATCH = 1 << 22
 
 
 class GBLinear:
@@ -100,10 +109,115 @@ class GBLinear:
             )
 
 
+class GBTree:
+    def __init__(self, params=None):
+        # we start boosting from zero
+        self.num_boosted_rounds = 0
+
+        # trees are grown as with tree_method="hist", the only method available
+        self.updater = quantile_hist_updater
+
+        # LogisticRegression corresponds to the 'binary:logistic' objective, as above
+        self.obj = LogisticRegression()
+
+        self.base_score = self.obj.prob_to_margin(params["base_score"])
+        self.scale_pos_weight = (
+            1.0 if not params.get("scale_pos_weight") else params["scale_pos_weight"]
+        )
+        self.num_feature = params["num_feature"]
+
+        # if base margin is None, use base_score instead
+        self.base_margin = (
+            params["base_margin"] if params.get("base_margin") else self.base_score
+        )
+
+        # unset parameters take the defaults of xgboost
+        self.learning_rate = _param(params, "learning_rate", _param(params, "eta", 0.3))
+        self.max_depth = _param(params, "max_depth", 6)
+        self.max_bin = _param(params, "max_bin", 256)
+        self.reg_lambda = _param(params, "reg_lambda", 1.0)
+        self.reg_alpha = _param(params, "reg_alpha", 0.0)
+        self.min_child_weight = _param(params, "min_child_weight", 1.0)
+        self.gamma = _param(params, "gamma", 0.0)
+
+        # each tree is stored as arrays indexed by node, see quantile_hist_updater
+        self.trees = []
+        self._packed = None
+
+        # the training data with its cuts, its bins and its margin, kept up to date
+        # as trees are added so that it is never predicted again
+        self._cache = None
+
+    def boosted_rounds(self):
+        return self.num_boosted_rounds
+
+    def model_fitted(self):
+        return self.num_boosted_rounds != 0
+
+    # used to obtain raw predictions
+    def pred(self, data):
+        if self._cache is not None and data is self._cache[0]:
+            return self._cache[3]
+        if self._packed is None and self.trees:
+            self._packed = _pack_trees(self.trees)
+        return _pred_trees(data, self._packed, self.max_depth, self.base_margin)
+
+    def get_gradient(self, pred, label):
+        label = ivy.reshape(label, pred.shape)
+        return _get_gradient(self.obj, pred, label, self.scale_pos_weight)
+
+    def do_boost(self, data, gpair, iter):
+        if self._cache is None or data is not self._cache[0]:
+            cuts = quantile_cuts(data, self.max_bin)
+            self._cache = (data, cuts, bin_data(data, cuts), self.pred(data))
+        data, cuts, binned, margin = self._cache
+        tree, positions = self.updater(
+            gpair,
+            binned,
+            cuts,
+            self.learning_rate,
+            self.max_depth,
+            self.reg_lambda,
+            self.reg_alpha,
+            self.min_child_weight,
+            self.gamma,
+        )
+        self.trees.append(tree)
+        self._packed = None
+        # the training rows end in the leaves the updater put them in
+        margin = margin + ivy.expand_dims(tree[4][positions], axis=1)
+        self._cache = (data, cuts, binned, margin)
+        self.num_boosted_rounds += 1
+
+
 # --- Helpers --- #
 # --------------- #
 
 
+def _param(params, name, default):
+    value = params.get(name)
+    return default if value is None else value
+
+
+def _pack_trees(trees):
+    # all trees as one array per field, the children of the nodes of each tree
+    # offset by the first node of the tree
+    offsets, start = [], 0
+    for tree in trees:
+        offsets.append(start)
+        start += tree[0].shape[0]
+    feature, threshold, left, right, value = (
+        ivy.concat(arrays) for arrays in zip(*trees)
+    )
+    shifts = ivy.concat(
+        [ivy.full(tree[0].shape, o, dtype="int64") for tree, o in zip(trees, offsets)]
+    )
+    left = ivy.where(left >= 0, left + shifts, -1)
+    right = ivy.where(right >= 0, right + shifts, -1)
+    roots = ivy.array(offsets, dtype="int64")
+    return feature, threshold, left, right, value, roots
+
+
 def _get_gradient(obj, pred, label, scale_pos_weight):
     p = obj.pred_transform(pred)
 
@@ -124,3 +238,29 @@ def _get_gradient(obj, pred, label, scale_pos_weight):
 
 def _pred(dt, w, base):
     return ivy.matmul(dt, w[:-1]) + w[-1] + base
+
+
+def _pred_trees(data, packed, max_depth, base):
+    # every row of a batch goes down all trees at once, with a gather per level
+    n, n_features = data.shape
+    if packed is None:
+        return ivy.zeros((n, 1), dtype=data.dtype) + base
+    feature, threshold, left, right, value, roots = packed
+    num_trees = roots.shape[0]
+    flat_data = ivy.reshape(data, (-1,))
+    step = max(1, _PRED_BATCH // num_trees)
+    sums = []
+    for start in range(0, n, step):
+        size = min(step, n - start)
+        offsets = ivy.arange(start, start + size, dtype="int64") * n_features
+        offsets = ivy.reshape(
+            ivy.broadcast_to(ivy.expand_dims(offsets, axis=1), (size, num_trees)),
+            (-1,),
+        )
+        node = ivy.reshape(ivy.broadcast_to(roots, (size, num_trees)), (-1,))
+        for _ in range(max_depth):
+            f = feature[node]
+            go_left = flat_data[offsets + ivy.maximum(f, 0)] < threshold[node]
+            node = ivy.where(f < 0, node, ivy.where(go_left, left[node], right[node]))
+        sums.append(ivy.sum(ivy.reshape(value[node], (size, num_trees)), axis=1))
+    return ivy.expand_dims(ivy.concat(sums), axis=1) + base
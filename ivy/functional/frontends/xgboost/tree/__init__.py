@@ -0,0 +1,2 @@
+from . import updater_quantile_hist
+from .updater_quantile_hist import *
@@ -0,0 +1,268 @@
+import ivy
+
+
+# rows sampled to find the quantiles of each feature
+_SKETCH_SIZE = 1 << 18
+
+# bins counted at once in building histograms
+_HIST_BATCH = 1 << 22
+
+# smallest loss reduction of a split, as kRtEps in xgboost
+_RT_EPS = 1e-6
+
+
+# --- Helpers --- #
+# --------------- #
+
+
+def _threshold_l1(g, reg_alpha):
+    if not reg_alpha:
+        return g
+    return ivy.sign(g) * ivy.maximum(ivy.abs(g) - reg_alpha, 0.0)
+
+
+def _calc_gain(g, h, reg_lambda, reg_alpha):
+    g = _threshold_l1(g, reg_alpha)
+    return g * g / (h + reg_lambda)
+
+
+def _calc_weight(g, h, reg_lambda, reg_alpha):
+    return -_threshold_l1(g, reg_alpha) / (h + reg_lambda)
+
+
+def _histograms(binned, grad, hess, rows, slots, num_slots, num_bins):
+    # sums of the gradients and hessians of the rows in each bin of each feature, for
+    # the node slot of each row, of shape (2, num_slots, n_features, num_bins), with
+    # a bincount over the bins of as many features at once as fit in a batch
+    n_features = binned.shape[0]
+    size = num_slots * num_bins
+    step = max(1, _HIST_BATCH // max(rows.shape[0], 1))
+    base = slots * num_bins
+    g_rows, h_rows = grad[rows], hess[rows]
+    g, h = [], []
+    for start in range(0, n_features, step):
+        count = min(step, n_features - start)
+        offsets = ivy.expand_dims(ivy.arange(count, dtype="int64") * size, axis=1)
+        keys = ivy.reshape(
+            binned[start : start + count][:, rows] + base + offsets, (-1,)
+        )
+        g.append(
+            ivy.bincount(
+                keys, weights=ivy.tile(g_rows, (count,)), minlength=count * size
+            )
+        )
+        h.append(
+            ivy.bincount(
+                keys, weights=ivy.tile(h_rows, (count,)), minlength=count * size
+            )
+        )
+    hist = ivy.reshape(
+        ivy.stack([ivy.concat(g), ivy.concat(h)]),
+        (2, n_features, num_slots, num_bins),
+    )
+    return ivy.permute_dims(hist, (0, 2, 1, 3))
+
+
+def _best_splits(hist, g, h, reg_lambda, reg_alpha, min_child_weight, gamma):
+    # the best split of each node over the bins of all features at once, a split
+    # after bin b sending the rows in bins up to b to the left
+    num_nodes, n_features, num_bins = hist.shape[1:]
+    gl = ivy.cumsum(hist[0], axis=2)[..., :-1]
+    hl = ivy.cumsum(hist[1], axis=2)[..., :-1]
+    gr = ivy.expand_dims(g, axis=(1, 2)) - gl
+    hr = ivy.expand_dims(h, axis=(1, 2)) - hl
+    gain = _calc_gain(gl, hl, reg_lambda, reg_alpha) + _calc_gain(
+        gr, hr, reg_lambda, reg_alpha
+    )
+    gain = ivy.where(
+        (hl >= min_child_weight) & (hr >= min_child_weight), gain, -float("inf")
+    )
+    gain = ivy.reshape(gain, (num_nodes, -1))
+    best = ivy.argmax(gain, axis=1)
+    loss_chg = ivy.max(gain, axis=1) - _calc_gain(g, h, reg_lambda, reg_alpha)
+    split = loss_chg > max(gamma, _RT_EPS)
+    return best // (num_bins - 1), best % (num_bins - 1), split
+
+
+# --- Main --- #
+# ------------ #
+
+
+def quantile_cuts(data, max_bin=256):
+    """
+    Cut points of each feature, at max_bin - 1 quantiles of its values over a sample
+    of the rows. A value falls in the bin given by the number of cuts of its feature
+    which are not above it, so a value in a bin up to b is below the cut b.
+
+    Parameters
+    ----------
+    data
+        Training data of shape (n_samples, n_features).
+    max_bin
+        Maximum number of bins of a feature.
+
+    Returns
+    -------
+    ret
+        Array of shape (n_features, max_bin - 1) holding the sorted cuts of each
+        feature, repeated where a feature has few distinct values.
+    """
+    n = data.shape[0]
+    if n > _SKETCH_SIZE:
+        data = data[ivy.linspace(0, n - 1, _SKETCH_SIZE).astype("int64")]
+    values = ivy.sort(data, axis=0)
+    m = values.shape[0]
+    quantiles = ivy.linspace(0, m - 1, max_bin + 1)[1:-1]
+    return ivy.permute_dims(values[ivy.round(quantiles).astype("int64")], (1, 0))
+
+
+def bin_data(data, cuts):
+    """
+    Bins of the values of each feature, of shape (n_features, n_samples) so that the
+    bins of a feature are contiguous. They are uint8 for at most 256 bins, and int32
+    for more. Missing values fall in the last bin, and so always go right, as they do
+    in prediction where nan < cut is False.
+    """
+    dtype = "uint8" if cuts.shape[1] < 256 else "int32"
+    return ivy.stack(
+        [
+            ivy.searchsorted(cuts[f], data[:, f], side="right")
+            for f in range(cuts.shape[0])
+        ]
+    ).astype(dtype)
+
+
+def quantile_hist_updater(
+    gpair,
+    binned,
+    cuts,
+    lr,
+    max_depth,
+    reg_lambda,
+    reg_alpha,
+    min_child_weight,
+    gamma,
+):
+    """
+    Grows a tree depth-wise from the gradient histograms of the binned data. The
+    histograms of all the nodes of a level are built together, in one bincount per
+    feature over the rows of the level, and only for the child with fewer rows of
+    each split; those of its sibling are the histograms of the parent minus its own.
+    The best split of every node of the level is then found over all the features
+    and bins at once, from the cumulative sums of the histograms.
+
+    Parameters
+    ----------
+    gpair
+        Array of shape (n_samples, 2) holding gradient-hessian pairs.
+    binned
+        Bins of the training data, of shape (n_features, n_samples).
+    cuts
+        Cut points of each feature, of shape (n_features, num_bins - 1).
+    lr
+        Learning rate, by which the leaf values are scaled.
+    max_depth
+        Maximum depth of the tree.
+    reg_lambda
+        L2 regularization on the leaf values.
+    reg_alpha
+        L1 regularization on the leaf values.
+    min_child_weight
+        Minimum sum of hessians in a child of a split.
+    gamma
+        Minimum loss reduction of a split.
+
+    Returns
+    -------
+    ret
+        The tree as arrays indexed by node, the root being node 0: the feature of
+        each split (-1 at a leaf), its threshold, the left and right children and the
+        value of each leaf; and the node of each training row.
+    """
+    n_features, n = binned.shape
+    num_bins = cuts.shape[1] + 1
+    flat_binned = ivy.reshape(binned, (-1,))
+    flat_cuts = ivy.reshape(cuts, (-1,))
+    grad = gpair[:, 0].astype("float64")
+    hess = gpair[:, 1].astype("float64")
+
+    positions = ivy.zeros((n,), dtype="int64")
+    rows = ivy.arange(n, dtype="int64")
+    hist = _histograms(binned, grad, hess, rows, positions, 1, num_bins)
+    levels = []
+    start = 0
+    for depth in range(max_depth + 1):
+        width = hist.shape[1]
+        g = ivy.sum(hist[0, :, 0], axis=1)
+        h = ivy.sum(hist[1, :, 0], axis=1)
+        if depth < max_depth:
+            feature, split_bin, split = _best_splits(
+                hist, g, h, reg_lambda, reg_alpha, min_child_weight, gamma
+            )
+        else:
+            feature = split_bin = ivy.zeros((width,), dtype="int64")
+            split = ivy.zeros((width,), dtype="bool")
+        value = lr * _calc_weight(g, h, reg_lambda, reg_alpha)
+
+        # the children of the k-th split of the level are the nodes 2k and 2k + 1
+        # of the next one
+        order = ivy.cumsum(split.astype("int64")) - 1
+        left = ivy.where(split, start + width + 2 * order, -1)
+        levels.append(
+            (
+                ivy.where(split, feature, -1),
+                flat_cuts[feature * (num_bins - 1) + split_bin],
+                left,
+                ivy.where(split, left + 1, -1),
+                ivy.where(split, 0.0, value),
+            )
+        )
+        num_splits = int(ivy.sum(split))
+        if not num_splits:
+            break
+
+        # rows of the nodes which are split move to their children
+        local = positions[rows] - start
+        moved = split[local]
+        rows, local = rows[moved], local[moved]
+        go_left = (flat_binned[feature[local] * n + rows] <= split_bin[local]).astype(
+            "int64"
+        )
+        child = 2 * order[local] + 1 - go_left
+        positions[rows] = start + width + child
+        start += width
+
+        # the histograms of the smaller child of each split, by subtraction for the
+        # larger one
+        counts = ivy.reshape(
+            ivy.bincount(child, minlength=2 * num_splits), (num_splits, 2)
+        )
+        left_small = counts[:, 0] <= counts[:, 1]
+        small = ivy.reshape(ivy.stack([left_small, ~left_small], axis=1), (-1,))
+        selected = small[child]
+        small_hist = _histograms(
+            binned,
+            grad,
+            hess,
+            rows[selected],
+            child[selected] // 2,
+            num_splits,
+            num_bins,
+        )
+        large_hist = hist[:, split] - small_hist
+        left_small = ivy.reshape(left_small, (1, -1, 1, 1))
+        hist = ivy.reshape(
+            ivy.stack(
+                [
+                    ivy.where(left_small, small_hist, large_hist),
+                    ivy.where(left_small, large_hist, small_hist),
+                ],
+                axis=2,
+            ),
+            (2, 2 * num_splits, n_features, num_bins),
+        )
+
+    feature, threshold, left, right, value = (
+        ivy.concat(arrays) for arrays in zip(*levels)
+    )
+    return (feature, threshold, left, right, value.astype(gpair.dtype)), positions
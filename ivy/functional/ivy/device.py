@@ -1031,6 +1031,43 @@ def set_split_factor(
     split_factors[device] = factor
 
 
+def _split_chunk_sizes(inputs, input_axes, max_chunk_size, chunk_size, device):
+    # the sizes of the chunks along the split axis, scaled by the split factor of the
+    # device when no chunk size is given
+    if not ivy.exists(max_chunk_size) and not ivy.exists(chunk_size):
+        shape_key = "_".join([str(inp.shape) for inp in inputs])
+        if shape_key in max_chunk_sizes:
+            max_chunk_size = max_chunk_sizes[shape_key]
+        else:
+            max_chunk_size = 0
+        max_dim = max(
+            [
+                inp.shape[inp_ax] if ivy.is_array(inp) else inp.cont_shape[inp_ax]
+                for inp, inp_ax in zip(inputs, input_axes)
+            ]
+        )
+        if max_dim > max_chunk_size:
+            max_chunk_sizes[shape_key] = max_dim
+            max_chunk_size = max_dim
+    chunk_size = ivy.default(
+        chunk_size,
+        default_val=lambda: 1
+        + int(
+            round((max_chunk_size - 1) * ivy.split_factor(ivy.default_device(device)))
+        ),
+        with_callable=True,
+    )
+    dim_size = inputs[0].shape[input_axes[0]]
+    if chunk_size >= dim_size:
+        return [dim_size]
+    num_chunks = dim_size / chunk_size
+    num_chunks_floored = math.floor(num_chunks)
+    chunk_sizes = [chunk_size] * num_chunks_floored
+    if num_chunks != num_chunks_floored:
+        chunk_sizes.append(dim_size - chunk_size * num_chunks_floored)
+    return chunk_sizes
+
+
 @handle_exceptions
 def split_func_call(
     func: Callable,
@@ -1082,35 +1119,12 @@ def split_func_call(
     """
     if isinstance(input_axes, int):
         input_axes = [input_axes] * len(inputs)
-    if not ivy.exists(max_chunk_size) and not ivy.exists(chunk_size):
-        shape_key = "_".join([str(inp.shape) for inp in inputs])
-        if shape_key in max_chunk_sizes:
-            max_chunk_size = max_chunk_sizes[shape_key]
-        else:
-            max_chunk_size = 0
-        max_dim = max(
-            [inp.cont_shape[inp_ax] for inp, inp_ax in zip(inputs, input_axes)]
-        )
-        if max_dim > max_chunk_size:
-            max_chunk_sizes[shape_key] = max_dim
-            max_chunk_size = max_dim
-    chunk_size = ivy.default(
-        chunk_size,
-        default_val=lambda: 1
-        + int(
-            round((max_chunk_size - 1) * ivy.split_factor(ivy.default_device(device)))
-        ),
-        with_callable=True,
+    chunk_sizes = _split_chunk_sizes(
+        inputs, input_axes, max_chunk_size, chunk_size, device
     )
-    dim_size = inputs[0].shape[input_axes[0]]
-    if chunk_size >= dim_size:
+    if len(chunk_sizes) == 1:
         return func(*inputs)
-    num_chunks = dim_size / chunk_size
-    num_chunks_floored = math.floor(num_chunks)
-    num_chunks_ceiled = math.ceil(num_chunks)
-    chunk_sizes = [chunk_size] * num_chunks_floored
-    if num_chunks != num_chunks_floored:
-        chunk_sizes.append(dim_size - chunk_size * num_chunks_floored)
+    num_chunks_ceiled = len(chunk_sizes)
     inputs_split = [
         (
             ivy.split(
@@ -9,6 +9,7 @@ from ivy.func_wrapper import (
     handle_out_argument,
     to_native_arrays_and_back,
     handle_nestable,
+    handle_ragged,
     handle_array_like_without_promotion,
     inputs_to_ivy_arrays,
     handle_device,
@@ -24,6 +25,7 @@ from ivy.utils.exceptions import handle_exceptions
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -129,6 +131,7 @@ def abs(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -239,6 +242,7 @@ def acos(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -349,6 +353,7 @@ def acosh(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -500,6 +505,7 @@ def add(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -589,6 +595,7 @@ def asin(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -698,6 +705,7 @@ def asinh(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -783,6 +791,7 @@ def atan(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -959,6 +968,7 @@ def atan2(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -1062,6 +1072,7 @@ def atanh(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -1156,6 +1167,7 @@ def bitwise_and(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -1234,6 +1246,7 @@ def bitwise_invert(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -1285,6 +1298,7 @@ def bitwise_left_shift(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -1374,6 +1388,7 @@ def bitwise_or(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -1490,6 +1505,7 @@ def bitwise_right_shift(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -1595,6 +1611,7 @@ def bitwise_xor(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -1686,6 +1703,7 @@ def ceil(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -1773,6 +1791,7 @@ def cos(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -1893,6 +1912,7 @@ def cosh(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -2085,6 +2105,7 @@ def divide(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -2202,6 +2223,7 @@ def equal(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -2342,6 +2364,7 @@ def exp(
 
 
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -2395,6 +2418,7 @@ def imag(
 
 
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -2440,6 +2464,7 @@ def angle(
 
 
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -2482,6 +2507,7 @@ def gcd(
 
 
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -2522,6 +2548,7 @@ def exp2(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -2649,6 +2676,7 @@ def expm1(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -2740,6 +2768,7 @@ def floor(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -2939,6 +2968,7 @@ def floor_divide(
 
 
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -2986,6 +3016,7 @@ def fmin(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -3087,6 +3118,7 @@ def greater(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -3174,6 +3206,7 @@ def greater_equal(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -3261,6 +3294,7 @@ def less_equal(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -3447,6 +3481,7 @@ def multiply(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -3545,6 +3580,7 @@ def isfinite(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -3670,6 +3706,7 @@ def isinf(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -3780,6 +3817,7 @@ def isnan(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -3870,6 +3908,7 @@ def less(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -3971,6 +4010,7 @@ def log(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -4066,6 +4106,7 @@ def log10(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -4185,6 +4226,7 @@ def log1p(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -4252,6 +4294,7 @@ def log2(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -4354,6 +4397,7 @@ def logaddexp(
 
 
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -4397,6 +4441,7 @@ def logaddexp2(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -4498,6 +4543,7 @@ def logical_and(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -4596,6 +4642,7 @@ def logical_not(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -4688,6 +4735,7 @@ def logical_or(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -4787,6 +4835,7 @@ def logical_xor(
 
 
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -4849,6 +4898,7 @@ def nan_to_num(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -4936,6 +4986,7 @@ def negative(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -5119,6 +5170,7 @@ def not_equal(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -5196,6 +5248,7 @@ def positive(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -5343,6 +5396,7 @@ def _complex_to_inf(exponent):
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -5414,6 +5468,7 @@ def real(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -5544,6 +5599,7 @@ def remainder(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -5666,6 +5722,7 @@ def round(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -5776,6 +5833,7 @@ def sign(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -5871,6 +5929,7 @@ def sin(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -5995,6 +6054,7 @@ def sinh(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -6127,6 +6187,7 @@ def sqrt(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -6201,6 +6262,7 @@ def square(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -6266,6 +6328,7 @@ def subtract(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -6370,6 +6433,7 @@ def tan(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -6513,6 +6577,7 @@ def tanh(
 
 
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -6573,6 +6638,7 @@ def trapz(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -6666,6 +6732,7 @@ def trunc(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -6729,6 +6796,7 @@ def erf(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -6821,6 +6889,7 @@ def maximum(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -6913,6 +6982,7 @@ def minimum(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -6952,6 +7022,7 @@ def reciprocal(
 
 
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -7031,6 +7102,7 @@ def deg2rad(
 
 
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -7110,6 +7182,7 @@ def rad2deg(
 
 
 @handle_exceptions
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @inputs_to_ivy_arrays
@@ -7170,6 +7243,7 @@ trunc_divide.mixed_backend_wrappers = {
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -7237,6 +7311,7 @@ def isreal(
 
 
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -7281,6 +7356,7 @@ def fmod(
 
 
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_out_argument
 @to_native_arrays_and_back
@@ -587,6 +587,52 @@ def grad(func: Callable, argnums: Union[int, Sequence[int]] = 0) -> Callable:
 grad.computes_gradients = True
 
 
+@handle_exceptions
+def checkpoint(func: Callable) -> Callable:
+    """
+    Create a function that computes func without storing its intermediate
+    activations, which are instead recomputed when the gradients are computed.
+
+    This trades extra compute in the backward pass for a lower peak memory usage.
+    The positional arguments of the returned function are the arrays (or nests of
+    arrays) which gradients can flow through, any other value should be captured by
+    func. For backends without autograd, func is called unchanged.
+
+    Parameters
+    ----------
+    func
+        Function whose intermediate activations should be recomputed in the backward
+        pass.
+
+    Returns
+    -------
+    ret
+        A function returning the same values as func.
+
+    Examples
+    --------
+    >>> x = ivy.array([[4.6, 2.1, 5], [2.8, 1.3, 6.2]])
+    >>> w = ivy.array([0.5, 1.0, 2.0])
+    >>> func = lambda x, w: ivy.sum(ivy.tanh(x * w))
+    >>> y = ivy.checkpoint(func)(x, w)
+    >>> print(y)
+    ivy.array(5.6976233)
+    """
+
+    def _native_func(*args):
+        return ivy.to_native(func(*ivy.to_ivy(args, nested=True)), nested=True)
+
+    checkpointed = current_backend(None).checkpoint(_native_func)
+
+    def new_func(*args):
+        return ivy.to_ivy(checkpointed(*ivy.to_native(args, nested=True)), nested=True)
+
+    return new_func
+
+
+checkpoint.computes_gradients = True
+
+
 # Optimizer Steps #
 
 
@@ -727,7 +773,7 @@ def adam_step(
         b: ivy.array([0.216, 0.384, 0.6])
     })
     """
-    step = float(step)
+    step = float(ivy.to_scalar(step) if ivy.is_array(step) else step)
     mw = ivy.add(beta1 * mw, (1 - beta1) * dcdw)
     dcdw_sqrd = dcdw**2
     vw = ivy.add(ivy.multiply(beta2, vw), (1 - beta2) * dcdw_sqrd)
@@ -9,6 +9,7 @@ from ivy.func_wrapper import (
     to_native_arrays_and_back,
     handle_out_argument,
     handle_nestable,
+    handle_ragged,
     handle_array_like_without_promotion,
     handle_device,
     handle_backend_invalid,
@@ -36,6 +37,7 @@ def _get_promoted_type_of_operands(operands):
 
 
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -145,6 +147,7 @@ def min(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -256,6 +259,7 @@ def max(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -643,6 +647,7 @@ def std(
 
 @handle_exceptions
 @handle_backend_invalid
+@handle_ragged
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
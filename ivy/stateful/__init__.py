@@ -6,6 +6,8 @@ from . import initializers
 from .initializers import *
 from . import layers
 from .layers import *
+from . import mixed_precision
+from .mixed_precision import *
 from . import losses
 from .losses import *
 from . import module
@@ -16,3 +18,7 @@ from . import optimizers
 from .optimizers import *
 from . import sequential
 from .sequential import *
+from . import fusion
+from .fusion import *
+from . import quantization
+from .quantization import *
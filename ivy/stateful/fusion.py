@@ -0,0 +1,312 @@
+"""Inference-time fusion of the layers of a module."""
+
+# global
+import copy
+
+# local
+import ivy
+from ivy.data_classes.container import Container
+from ivy.stateful import activations
+from ivy.stateful.module import Module
+from ivy.stateful.layers import (
+    Linear,
+    Conv1D,
+    Conv2D,
+    Conv3D,
+    DepthwiseConv2D,
+    Dropout,
+    Identity,
+)
+from ivy.stateful.norms import LayerNorm, BatchNorm2D
+from ivy.stateful.sequential import Sequential
+
+
+# the layers computing op(x, w) + b, which norms and activations are fused into
+_CONV_FNS = {
+    Conv1D: "conv1d",
+    Conv2D: "conv2d",
+    Conv3D: "conv3d",
+    DepthwiseConv2D: "depthwise_conv2d",
+}
+_FUSABLE_LAYERS = (Linear, *_CONV_FNS)
+
+_ACTIVATIONS = tuple(
+    cls
+    for cls in vars(activations).values()
+    if isinstance(cls, type) and issubclass(cls, Module) and cls is not Module
+)
+
+# activations which can write their output into their input array
+_INPLACE_ACTIVATIONS = {
+    activations.ReLU: lambda act, x: ivy.relu(x, complex_mode=act._complex_mode, out=x),
+    activations.LeakyReLU: lambda act, x: ivy.leaky_relu(
+        x, alpha=act._alpha, complex_mode=act._complex_mode, out=x
+    ),
+    activations.GELU: lambda act, x: ivy.gelu(
+        x, approximate=act._approximate, complex_mode=act._complex_mode, out=x
+    ),
+    activations.Sigmoid: lambda act, x: ivy.sigmoid(
+        x, complex_mode=act._complex_mode, out=x
+    ),
+    activations.Tanh: lambda act, x: ivy.tanh(x, complex_mode=act._complex_mode, out=x),
+    activations.SiLU: lambda act, x: ivy.silu(x, out=x),
+}
+
+
+class _FusedLayer(Module):
+    def __init__(self, layer, w, b, /, *, activation=None):
+        """
+        Linear or convolutional layer with its bias addition and the following
+        activation fused into a single forward pass.
+
+        Where the backend supports inplace updates, the bias and the activation are
+        applied in place on the output of the linear or convolution operation, so
+        the layer allocates a single output array.
+
+        Parameters
+        ----------
+        layer
+            The linear or convolutional layer to fuse.
+        w
+            The weights of the fused layer.
+        b
+            The bias of the fused layer.
+        activation
+            The activation module applied to the output. Default is ``None``.
+        """
+        self._layer_name = layer.__class__.__name__
+        self._conv_fn = _CONV_FNS.get(layer.__class__)
+        if self._conv_fn is not None:
+            self._strides = layer._strides
+            self._padding = layer._padding
+            self._data_format = layer._data_format
+            self._dilations = layer._dilations
+        self._w_shape = tuple(w.shape)
+        self._b_shape = tuple(b.shape)
+        self._activation = activation
+        Module.__init__(
+            self,
+            device=layer._device,
+            v=Container(w=w, b=b),
+            dtype=layer._dtype,
+            training=False,
+        )
+
+    def _create_variables(self, device, dtype=None):
+        """Create internal variables for the layer."""
+        return {
+            "w": ivy.zeros(self._w_shape, device=device, dtype=dtype),
+            "b": ivy.zeros(self._b_shape, device=device, dtype=dtype),
+        }
+
+    def _forward(self, inputs):
+        """
+        Perform forward pass of the fused layer.
+
+        Parameters
+        ----------
+        inputs
+            Inputs to process.
+
+        Returns
+        -------
+        ret
+            The outputs following the fused layer.
+        """
+        if self._conv_fn is None:
+            x = ivy.linear(inputs, self.v.w)
+        else:
+            x = getattr(ivy, self._conv_fn)(
+                inputs,
+                self.v.w,
+                self._strides,
+                self._padding,
+                data_format=self._data_format,
+                dilations=self._dilations,
+            )
+        act = self._activation
+        if not ivy.inplace_arrays_supported():
+            x = x + self.v.b
+            return x if act is None else act._forward(x)
+        x = ivy.add(x, self.v.b, out=x)
+        if act is None:
+            return x
+        if act.__class__ in _INPLACE_ACTIVATIONS:
+            return _INPLACE_ACTIVATIONS[act.__class__](act, x)
+        return act._forward(x)
+
+    def extra_repr(self):
+        s = self._layer_name
+        if self._activation is not None:
+            s += ", activation={}".format(self._activation.__class__.__name__)
+        return s
+
+
+# Helpers #
+# --------#
+
+
+def _bind(parent, child, key_chain):
+    # wrap the call of the child to take its variables from the parent, as done
+    # when the parent is built
+    child.__dict__.pop("__call__", None)
+    child.__call__ = parent._fn_with_var_arg(
+        child.__call__, parent._extract_v, {}, key_chain
+    )
+    child.top_v = parent._top_v_fn
+    child.top_mod = parent._top_mod_fn
+    child._inference_v_src = None
+
+
+def _weight_and_bias(layer):
+    v = layer.v
+    if layer._with_bias:
+        return v.w, v.b
+    return v.w, ivy.zeros(layer._b_shape, dtype=v.w.dtype, device=ivy.dev(v.w))
+
+
+def _fold_batch_norm(layer, w, b, bn):
+    # scale and shift of the normalization, which uses the running statistics in
+    # evaluation mode
+    scale = bn.v.w / ivy.sqrt(bn.v.running_var + bn._epsilon)
+    shift = bn.v.b - bn.v.running_mean * scale
+    if isinstance(layer, Linear):
+        return w * ivy.expand_dims(scale, axis=-1), b * scale + shift
+    # the output channels are the last axis of the filters
+    b_shape = tuple(b.shape)
+    return w * scale, b * ivy.reshape(scale, b_shape) + ivy.reshape(shift, b_shape)
+
+
+def _folds_batch_norm(layer, module):
+    if not isinstance(module, BatchNorm2D) or not module._affine:
+        return False
+    channels_last = isinstance(layer, Linear) or layer._data_format[-1] == "C"
+    return channels_last == (module.data_format == "NSC")
+
+
+def _fold_layer_norm(norm, linear):
+    # the affine parameters of the norm are applied to the inputs of the linear
+    # layer, so they are folded into its weights, and the norm is left without them
+    w, b = _weight_and_bias(linear)
+    linear.v = Container(w=w * norm.v.weight, b=b + ivy.matmul(w, norm.v.bias))
+    linear._with_bias = True
+    norm._elementwise_affine = False
+    norm.v = Container()
+
+
+def _folds_layer_norm(module, next_module):
+    return (
+        isinstance(module, LayerNorm)
+        and module._elementwise_affine
+        and len(module._normalized_idxs) == 1
+        and isinstance(next_module, Linear)
+    )
+
+
+def _flatten(sequential):
+    layers = []
+    for submod in sequential:
+        submod.v = submod._bound_v()
+        if isinstance(submod, Sequential):
+            layers += _flatten(submod)
+        elif not isinstance(submod, (Dropout, Identity)):
+            layers.append(_fuse(submod))
+    return layers
+
+
+def _fuse_layers(layers):
+    fused = []
+    i = 0
+    while i < len(layers):
+        module = layers[i]
+        next_module = layers[i + 1] if i + 1 < len(layers) else None
+        if _folds_layer_norm(module, next_module):
+            _fold_layer_norm(module, next_module)
+        elif isinstance(module, _FUSABLE_LAYERS):
+            w, b = _weight_and_bias(module)
+            if _folds_batch_norm(module, next_module):
+                w, b = _fold_batch_norm(module, w, b, next_module)
+                i += 1
+                next_module = layers[i + 1] if i + 1 < len(layers) else None
+            activation = None
+            if isinstance(next_module, _ACTIVATIONS):
+                activation = next_module
+                activation.__dict__.pop("__call__", None)
+                i += 1
+            module = _FusedLayer(module, w, b, activation=activation)
+        fused.append(module)
+        i += 1
+    return fused
+
+
+def _fuse_sequential(sequential):
+    layers = _fuse_layers(_flatten(sequential))
+    sequential._submodules = layers
+    sequential._sub_mods = set(layers)
+    sequential.v = Container(
+        {
+            "submodules": {
+                f"v{str(i)}": layer.v for i, layer in enumerate(layers) if layer.v
+            }
+        }
+    )
+    if not sequential.v.submodules:
+        sequential.v = Container()
+    for i, layer in enumerate(layers):
+        _bind(sequential, layer, f"submodules/v{str(i)}")
+    return sequential
+
+
+def _fuse(module):
+    if isinstance(module, Sequential):
+        return _fuse_sequential(module)
+    for key, submod in list(module.__dict__.items()):
+        if not isinstance(submod, Module) or submod not in module._sub_mods:
+            continue
+        wrapper = submod.__dict__.get("__call__")
+        if not hasattr(wrapper, "wrapped"):
+            continue
+        key_chain = wrapper.keywords["orig_key_chain"]
+        submod.v = submod._bound_v()
+        _fuse(submod)
+        if module.v.cont_has_key_chain(key_chain):
+            module.v = module.v.cont_set_at_key_chain(key_chain, submod.v)
+    return module
+
+
+def fuse_for_inference(module):
+    """
+    Return a copy of a built module with its layers fused for inference.
+
+    The layers of each :class:`ivy.Sequential` in the module tree are rewritten:
+    nested sequentials are flattened, ``Dropout`` and ``Identity`` layers are
+    dropped, the affine parameters of a ``BatchNorm2D`` are folded into the weights
+    of the preceding ``Linear`` or ``Conv*D`` layer, the affine parameters of a
+    ``LayerNorm`` are folded into the weights of the following ``Linear`` layer, and
+    the bias addition of these layers is fused with the following activation. The
+    returned module is in evaluation and inference mode, and gives the same outputs
+    as the original module in evaluation mode, with fewer operations and
+    allocations per forward pass. The original module is left unchanged.
+
+    Parameters
+    ----------
+    module
+        The built module to fuse.
+
+    Returns
+    -------
+    ret
+        The fused module.
+
+    Examples
+    --------
+    >>> model = ivy.Sequential(
+    ...     ivy.Linear(4, 8), ivy.BatchNorm2D(8), ivy.ReLU(), ivy.Dropout(0.5)
+    ... )
+    >>> fused = ivy.fuse_for_inference(model)
+    >>> len(list(fused))
+    1
+    """
+    module = _fuse(copy.deepcopy(module))
+    module.eval()
+    return module
@@ -4,6 +4,7 @@
 import ivy
 from ivy.func_wrapper import handle_nestable
 from ivy.stateful.initializers import GlorotUniform, Zeros
+from ivy.stateful.mixed_precision import _autocast
 from ivy.stateful.module import Module
 
 # ToDo: update docstrings and typehints according to ivy\layers
@@ -114,7 +115,8 @@ class Linear(Module):
             The outputs following the linear operation and bias addition
             *[batch_shape, out]*
         """
-        return ivy.linear(x, self.v.w, bias=self.v.b if self._with_bias else None)
+        x, w, b = _autocast(x, self.v.w, self.v.b if self._with_bias else None)
+        return ivy.linear(x, w, bias=b)
 
     def extra_repr(self) -> str:
         return "in_features={}, out_features={}, with_bias={}".format(
@@ -571,14 +573,17 @@ class Conv1D(Module):
         ret
             The outputs following the conv1d layer *[batch_size,new_w,d_out]*
         """
+        inputs, w, b = _autocast(
+            inputs, self.v.w, self.v.b if self._with_bias else None
+        )
         return ivy.conv1d(
             inputs,
-            self.v.w,
+            w,
             self._strides,
             self._padding,
             data_format=self._data_format,
             dilations=self._dilations,
-        ) + (self.v.b if self._with_bias else 0)
+        ) + (b if self._with_bias else 0)
 
     def extra_repr(self):
         s = (
@@ -718,15 +723,18 @@ class Conv1DTranspose(Module):
         ret
             The outputs following the conv1d layer *[batch_size,new_w,d_out]*
         """
+        inputs, w, b = _autocast(
+            inputs, self.v.w, self.v.b if self._with_bias else None
+        )
         return ivy.conv1d_transpose(
             inputs,
-            self.v.w,
+            w,
             self._strides,
             self._padding,
             output_shape=self._output_shape,
             data_format=self._data_format,
             dilations=self._dilations,
-        ) + (self.v.b if self._with_bias else 0)
+        ) + (b if self._with_bias else 0)
 
     def extra_repr(self):
         s = (
@@ -866,14 +874,17 @@ class Conv2D(Module):
         ret
             The outputs following the conv1d layer *[batch_size,new_h,new_w,d_out]*
         """
+        inputs, w, b = _autocast(
+            inputs, self.v.w, self.v.b if self._with_bias else None
+        )
         return ivy.conv2d(
             inputs,
-            self.v.w,
+            w,
             self._strides,
             self._padding,
             data_format=self._data_format,
             dilations=self._dilations,
-        ) + (self.v.b if self._with_bias else 0)
+        ) + (b if self._with_bias else 0)
 
     def extra_repr(self):
         s = (
@@ -1015,15 +1026,18 @@ class Conv2DTranspose(Module):
         ret
             The outputs following the conv1d layer *[batch_size,new_h,new_w,d_out]*
         """
+        inputs, w, b = _autocast(
+            inputs, self.v.w, self.v.b if self._with_bias else None
+        )
         return ivy.conv2d_transpose(
             inputs,
-            self.v.w,
+            w,
             self._strides,
             self._padding,
             output_shape=self._output_shape,
             data_format=self._data_format,
             dilations=self._dilations,
-        ) + (self.v.b if self._with_bias else 0)
+        ) + (b if self._with_bias else 0)
 
     def extra_repr(self):
         s = (
@@ -1159,14 +1173,17 @@ class DepthwiseConv2D(Module):
         ret
             The outputs following the conv1d layer *[batch_size,new_h,new_w,d_out]*
         """
+        inputs, w, b = _autocast(
+            inputs, self.v.w, self.v.b if self._with_bias else None
+        )
         return ivy.depthwise_conv2d(
             inputs,
-            self.v.w,
+            w,
             self._strides,
             self._padding,
             data_format=self._data_format,
             dilations=self._dilations,
-        ) + (self.v.b if self._with_bias else 0)
+        ) + (b if self._with_bias else 0)
 
     def extra_repr(self):
         s = (
@@ -1305,14 +1322,17 @@ class Conv3D(Module):
             The outputs following the conv1d layer
             *[batch_size,new_d,new_h,new_w,d_out]*
         """
+        inputs, w, b = _autocast(
+            inputs, self.v.w, self.v.b if self._with_bias else None
+        )
         return ivy.conv3d(
             inputs,
-            self.v.w,
+            w,
             self._strides,
             self._padding,
             data_format=self._data_format,
             dilations=self._dilations,
-        ) + (self.v.b if self._with_bias else 0)
+        ) + (b if self._with_bias else 0)
 
     def extra_repr(self):
         s = (
@@ -1456,15 +1476,18 @@ class Conv3DTranspose(Module):
             The outputs following the conv1d layer
             *[batch_size,new_d,new_h,new_w,d_out]*
         """
+        inputs, w, b = _autocast(
+            inputs, self.v.w, self.v.b if self._with_bias else None
+        )
         return ivy.conv3d_transpose(
             inputs,
-            self.v.w,
+            w,
             self._strides,
             self._padding,
             output_shape=self._output_shape,
             data_format=self._data_format,
             dilations=self._dilations,
-        ) + (self.v.b if self._with_bias else 0)
+        ) + (b if self._with_bias else 0)
 
     def extra_repr(self):
         s = (
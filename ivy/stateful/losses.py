@@ -2,6 +2,7 @@
 
 # local
 import ivy
+from ivy.stateful.mixed_precision import _full_precision
 from ivy.stateful.module import Module
 
 
@@ -45,6 +46,7 @@ class LogPoissonLoss(Module):
         ret
             The binary log-likelihood loss between the given distributions.
         """
+        true, pred = _full_precision(true, pred)
         return ivy.log_poisson_loss(
             true,
             pred,
@@ -91,6 +93,7 @@ class CrossEntropyLoss(Module):
         ret
             The cross-entropy loss between the given distributions.
         """
+        true, pred = _full_precision(true, pred)
         return ivy.cross_entropy(
             true,
             pred,
@@ -152,6 +155,7 @@ class BinaryCrossEntropyLoss(Module):
         ret
             The binary cross entropy between the given distributions.
         """
+        true, pred = _full_precision(true, pred)
         return ivy.binary_cross_entropy(
             true,
             pred,
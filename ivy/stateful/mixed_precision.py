@@ -0,0 +1,335 @@
+"""Mixed-precision autocasting and loss scaling for training ivy modules."""
+
+# local
+import ivy
+from ivy.data_classes.container import Container
+
+autocast_dtype_stack = list()
+
+_HALF_DTYPES = ("float16", "bfloat16")
+
+# the backends with half precision matmul and conv kernels, which autocasting speeds
+# up, numpy only emulates half precision arithmetic, and is slower in it
+_HALF_PRECISION_BACKENDS = ("jax", "paddle", "tensorflow", "torch")
+
+
+# Autocast #
+# ---------#
+
+
+class Autocast:
+    """Autocast Context Manager."""
+
+    def __init__(self, dtype: str = "float16"):
+        self._dtype = dtype
+
+    def __enter__(self):
+        set_autocast_dtype(self._dtype)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        unset_autocast_dtype()
+        if self and (exc_type is not None):
+            raise exc_val
+        return self
+
+
+def autocast_dtype():
+    """
+    Return the dtype which the linear and convolutional layers are autocast to, or
+    ``None`` if autocasting is disabled.
+
+    Returns
+    -------
+    ret
+        The autocast dtype.
+
+    Examples
+    --------
+    >>> print(ivy.autocast_dtype())
+    None
+    >>> with ivy.Autocast("float16"):
+    ...     print(ivy.autocast_dtype())
+    float16
+    """
+    return autocast_dtype_stack[-1] if autocast_dtype_stack else None
+
+
+def set_autocast_dtype(dtype):
+    """
+    Set the dtype which the linear and convolutional layers are autocast to.
+
+    While set, the :class:`ivy.Linear` and ``ivy.Conv*`` layers cast their inputs
+    and variables to this dtype, and compute their outputs in it, on the backends with
+    half precision kernels. With the numpy backend, which only emulates half precision
+    arithmetic, the layers are left in full precision. On CPUs, ``"bfloat16"`` is
+    usually the dtype with native kernels, while ``"float16"`` convolutions may be
+    much slower than float32 ones. The variables themselves are left in their own
+    dtype, so the gradients and the optimizer state are computed in full precision.
+    The normalization layers and the losses cast their half precision inputs back to
+    float32, to keep their reductions precise.
+
+    Parameters
+    ----------
+    dtype
+        ``"float16"``, ``"bfloat16"``, or ``None`` to disable autocasting.
+
+    Examples
+    --------
+    >>> ivy.set_backend("torch")
+    >>> ivy.set_autocast_dtype("float16")
+    >>> ivy.Linear(3, 2)(ivy.ones((1, 3))).dtype
+    float16
+    >>> ivy.unset_autocast_dtype()
+    """
+    if dtype is not None:
+        # raises for the dtypes which the backend does not support
+        dtype = ivy.as_ivy_dtype(dtype)
+        if dtype not in _HALF_DTYPES:
+            raise ivy.utils.exceptions.IvyException(
+                "autocast dtype must be one of {}, but found {}".format(
+                    _HALF_DTYPES, dtype
+                )
+            )
+    autocast_dtype_stack.append(dtype)
+
+
+def unset_autocast_dtype():
+    """Reset the autocast dtype to the previously set one, if any."""
+    if autocast_dtype_stack:
+        autocast_dtype_stack.pop(-1)
+
+
+def _autocast(*xs):
+    # cast the floating point inputs of a linear or convolutional layer to the
+    # autocast dtype, the casts are differentiable so the gradients flow back to the
+    # full precision variables
+    dtype = autocast_dtype()
+    if dtype is None or ivy.current_backend_str() not in _HALF_PRECISION_BACKENDS:
+        return xs
+    return tuple(
+        (
+            ivy.astype(x, dtype)
+            if x is not None and ivy.is_float_dtype(x) and x.dtype != dtype
+            else x
+        )
+        for x in xs
+    )
+
+
+def _full_precision(*xs):
+    # cast the half precision inputs of a normalization or a loss back to float32
+    if autocast_dtype() is None:
+        return xs
+    return tuple(
+        (
+            ivy.astype(x, "float32")
+            if ivy.is_array(x) and ivy.as_ivy_dtype(x.dtype) in _HALF_DTYPES
+            else x
+        )
+        for x in xs
+    )
+
+
+# Loss Scaling #
+# -------------#
+
+
+class LossScaler:
+    def __init__(
+        self,
+        init_scale: float = 2.0**16,
+        growth_factor: float = 2.0,
+        backoff_factor: float = 0.5,
+        growth_interval: int = 2000,
+    ):
+        """
+        Dynamic loss scaler, which multiplies the loss by a scale factor before the
+        gradients are computed, so that the small gradients of half precision
+        activations do not underflow, and divides the gradients by the same factor
+        before the optimizer step.
+
+        The steps with infinite or nan gradients are skipped, and the scale is then
+        reduced by ``backoff_factor``. After ``growth_interval`` consecutive steps with
+        finite gradients, the scale is increased by ``growth_factor``.
+
+        Parameters
+        ----------
+        init_scale
+            Initial scale factor. Default is ``2.0**16``.
+        growth_factor
+            Factor by which the scale is increased. Default is ``2.0``.
+        backoff_factor
+            Factor by which the scale is reduced. Default is ``0.5``.
+        growth_interval
+            Number of consecutive steps with finite gradients after which the scale is
+            increased. Default is ``2000``.
+
+        Examples
+        --------
+        >>> model = ivy.Linear(3, 2)
+        >>> optimizer = ivy.SGD(lr=0.1)
+        >>> scaler = ivy.LossScaler()
+        >>> def loss_fn(v):
+        ...     with ivy.Autocast("float16"):
+        ...         out = model(ivy.ones((4, 3)), v=v)
+        ...     return ivy.mean(ivy.astype(out, "float32") ** 2)
+        >>> loss, grads = scaler.execute_with_gradients(loss_fn, model.v)
+        >>> model.v = scaler.step(optimizer, model.v, grads)
+        """
+        self._scale = float(init_scale)
+        self._growth_factor = growth_factor
+        self._backoff_factor = backoff_factor
+        self._growth_interval = growth_interval
+        self._growth_tracker = 0
+        self._found_inf = None
+
+    @property
+    def scale(self):
+        """The current scale factor."""
+        return self._scale
+
+    def scale_loss(self, loss):
+        """
+        Multiply the loss by the scale factor.
+
+        Parameters
+        ----------
+        loss
+            The loss to scale.
+
+        Returns
+        -------
+        ret
+            The scaled loss.
+        """
+        return loss * self._scale
+
+    def unscale(self, grads):
+        """
+        Divide the gradients of a scaled loss by the scale factor, and record
+        whether they are all finite for the next call to :meth:`step`.
+
+        Parameters
+        ----------
+        grads
+            Nest of gradients of the scaled loss.
+
+        Returns
+        -------
+        ret
+            The unscaled gradients.
+        """
+        inv_scale = 1.0 / self._scale
+        flags = []
+
+        def _unscale(g):
+            if not ivy.is_array(g):
+                return g
+            g = g * inv_scale
+            flags.append(ivy.all(ivy.isfinite(g)))
+            return g
+
+        grads = ivy.nested_map(_unscale, grads, include_derived=True, shallow=False)
+        # the flags of all the arrays are reduced to one boolean with a single sync
+        self._found_inf = bool(flags) and not bool(ivy.all(ivy.stack(flags)))
+        return grads
+
+    def execute_with_gradients(self, func, xs, /, **kwargs):
+        """
+        Call :func:`ivy.execute_with_gradients` with the loss returned by func scaled,
+        and return the loss and the unscaled gradients.
+
+        Parameters
+        ----------
+        func
+            Function returning the loss, or a tuple with the loss first.
+        xs
+            Variables for which to compute the gradients of the loss.
+        kwargs
+            Keyword arguments for :func:`ivy.execute_with_gradients`.
+
+        Returns
+        -------
+        ret
+            The return of func, and the unscaled gradients of the loss w.r.t xs.
+        """
+
+        def scaled_func(x):
+            ret = func(x)
+            if isinstance(ret, tuple):
+                return (self.scale_loss(ret[0]),) + ret[1:]
+            return self.scale_loss(ret)
+
+        ret, grads = ivy.execute_with_gradients(scaled_func, xs, **kwargs)
+        inv_scale = 1.0 / self._scale
+        if isinstance(ret, tuple):
+            ret = (ret[0] * inv_scale,) + ret[1:]
+        else:
+            ret = ret * inv_scale
+        return ret, self.unscale(grads)
+
+    def step(self, optimizer, v, grads, **kwargs):
+        """
+        Update the variables with the optimizer, unless the gradients passed to the
+        last call of :meth:`unscale` were not finite, and update the scale factor.
+
+        Parameters
+        ----------
+        optimizer
+            The stateful optimizer.
+        v
+            Nested variables to update.
+        grads
+            Nested unscaled gradients.
+        kwargs
+            Keyword arguments for the ``step`` method of the optimizer.
+
+        Returns
+        -------
+        ret
+            The updated variables, or the unchanged variables if the step is skipped.
+        """
+        if self._found_inf is None:
+            raise ivy.utils.exceptions.IvyException(
+                "the gradients must be unscaled before the optimizer step"
+            )
+        if not self._found_inf:
+            v = optimizer.step(v, grads, **kwargs)
+        self.update()
+        return v
+
+    def update(self):
+        """Update the scale factor from the gradients of the last step."""
+        if self._found_inf:
+            self._scale *= self._backoff_factor
+            self._growth_tracker = 0
+        else:
+            self._growth_tracker += 1
+            if self._growth_tracker == self._growth_interval:
+                self._scale *= self._growth_factor
+                self._growth_tracker = 0
+        self._found_inf = None
+
+    def state_dict(self):
+        """
+        Return the scale factor and the number of steps since it was last changed.
+
+        Returns
+        -------
+        ret
+            Container with the state of the scaler.
+        """
+        return Container(scale=self._scale, growth_tracker=self._growth_tracker)
+
+    def load_state_dict(self, state_dict: Container):
+        """
+        Load the state of the scaler, as returned by state_dict.
+
+        Parameters
+        ----------
+        state_dict
+            Container with the state of the scaler.
+        """
+        self._scale = float(state_dict["scale"])
+        self._growth_tracker = int(state_dict["growth_tracker"])
@@ -31,6 +31,27 @@ def _addindent(s_, numSpaces):
     return s
 
 
+def _may_hold_submodules(value):
+    # modules, and the objects which may hold modules, as opposed to the variables
+    # and other arrays of the module
+    if value is None or isinstance(value, (Container, ivy.Array)):
+        return False
+    return isinstance(value, (list, tuple, dict)) or hasattr(value, "__dict__")
+
+
+def _built_v_is_current(module):
+    # whether the variables of the built module are on its device and of the dtype
+    # which building it again would give them, so that they can be reused as they are
+    if not isinstance(module.v, Container):
+        return False
+    device = ivy.as_ivy_dev(module._device)
+    dtype = ivy.default_dtype(dtype=module._dtype)
+    return all(
+        ivy.dev(x) == device and (not ivy.is_float_dtype(x) or ivy.dtype(x) == dtype)
+        for x in module.v.cont_to_iterator_values()
+    )
+
+
 # Base #
 # -----#
 
@@ -165,6 +186,10 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         self._lazy_traced = False
         self._dynamic_backend = dynamic_backend
         self.training = training
+        self._inference = False
+        self._inference_v_src = None
+        self._inference_v = None
+        self._checkpoint_activations = False
         if build_mode != "on_init":
             return
         if hasattr(Module, "_init_var"):
@@ -270,6 +295,12 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
             obj.top_mod = self._top_mod_fn
             self._sub_mods.add(obj)
 
+            if obj.built_ and obj._store_vars and _built_v_is_current(obj):
+                # the variables of the built submodules are reused rather than
+                # created again, so a rebuild only builds the new submodules, unless
+                # their device or the default dtype changed since they were built
+                return obj.v
+
             if not obj.built_ and without_initialisation:
                 return lambda: obj._build_and_return_v(
                     *obj._args, dynamic_backend=self._dynamic_backend, **obj._kwargs
@@ -300,7 +331,7 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
             return vs
         elif not hasattr(obj, "__dict__"):
             return vs
-        for k, v in obj.__dict__.items():
+        for k, v in self._attr_items(obj):
             if v is not None and k[0:2] != "__":
                 ret = self._find_variables(
                     obj=v,
@@ -311,6 +342,18 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
                     vs[k[1:] if k[0] == "_" else k] = ret
         return vs
 
+    def _attr_items(self, obj):
+        """
+        Return the attributes of obj to search for submodules, which for the module
+        itself are only the attributes registered by __setattr__, in the order in which
+        they were first set.
+        """
+        if obj is not self or "_submodule_attrs" not in self.__dict__:
+            return obj.__dict__.items()
+        return [
+            (k, self.__dict__[k]) for k in self._submodule_attrs if k in self.__dict__
+        ]
+
     def _build_and_return_v(self, *args, **kwargs):
         self.build(*args, **kwargs)
         return self.v
@@ -410,7 +453,7 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
             return
         if not hasattr(obj, "__dict__"):
             return
-        for k, val in obj.__dict__.items():
+        for k, val in self._attr_items(obj):
             if k[0:2] == "__":
                 continue
             k = f"{key}/{k}" if key != "" else k
@@ -548,7 +591,10 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         """
         if self.track_submod_call_order():
             self._add_submod_enter()
-        ret = self._forward(*args, **kwargs)
+        if self._checkpoint_activations:
+            ret = self._forward_checkpointed(*args, **kwargs)
+        else:
+            ret = self._forward(*args, **kwargs)
         track_submod_rets = self.track_submod_rets()
         check_submod_rets = self.check_submod_rets()
         if track_submod_rets or check_submod_rets:
@@ -557,6 +603,41 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
             self._check_submod_ret()
         return ret
 
+    def _forward_checkpointed(self, *args, **kwargs):
+        """
+        Forward pass of the layer, recomputing its intermediate activations in the
+        backward pass rather than storing them.
+
+        The array arguments and the variables are passed to :func:`ivy.checkpoint`
+        as flat positional arrays, so that gradients can flow through both.
+
+        Returns
+        -------
+        ret
+            Result of the forward pass of the layer.
+        """
+        v = self.v
+        nest = [args, kwargs]
+        arg_idxs = ivy.nested_argwhere(nest, ivy.is_array)
+        arg_leaves = ivy.multi_index_nest(nest, arg_idxs)
+        v_leaves = v.cont_to_flat_list() if isinstance(v, Container) else []
+        num_args = len(arg_leaves)
+
+        def _fn(*leaves):
+            leaves = list(leaves)
+            new_nest = ivy.copy_nest(nest, to_mutable=True)
+            ivy.set_nest_at_indices(new_nest, arg_idxs, leaves[:num_args])
+            v_orig = self.v
+            if v_leaves:
+                # wrapped submodules extract their variables from self.v
+                self.v = v.cont_from_flat_list(leaves[num_args:])
+            try:
+                return self._forward(*new_nest[0], **new_nest[1])
+            finally:
+                self.v = v_orig
+
+        return ivy.checkpoint(_fn)(*arg_leaves, *v_leaves)
+
     def _call(self, *args, v=None, buffers=None, **kwargs):
         """
         Compute forward pass of the layer, treating layer instance as callable function.
@@ -601,6 +682,58 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
             return self.__call__(*args, **kwargs)
         return self._forward_with_tracking(*args, **kwargs)
 
+    def _bound_v(self):
+        """
+        Return the variables of the module in inference mode, extracted once from the
+        variables of the parent module which wrapped its call method.
+
+        Returns
+        -------
+        ret
+            The variables to use for the forward pass.
+        """
+        wrapper = self.__dict__.get("__call__")
+        if not hasattr(wrapper, "wrapped"):
+            return self.v
+        # re-extract only once the parent's variables have been replaced
+        parent_v = wrapper.func.__self__.v
+        if parent_v is not self._inference_v_src:
+            self._inference_v = wrapper.keywords["v_fn"](
+                parent_v,
+                wrapper.keywords["keychain_mappings"],
+                wrapper.keywords["orig_key_chain"],
+            )
+            self._inference_v_src = parent_v
+        return self._inference_v
+
+    def _call_in_inference(self, *args, v=None, **kwargs):
+        """
+        Compute forward pass of the layer in inference mode, without tracking the
+        submodules and without re-wrapping the variables.
+
+        Parameters
+        ----------
+        v
+            Replace `v` of current layer when forwarding. Restore
+            after the forward finished.
+
+        Returns
+        -------
+        ret
+            Result of the forward pass of the layer.
+        """
+        if not self._built:
+            return self._call(*args, v=v, **kwargs)
+        v = self._bound_v() if v is None else v
+        v_orig = self.v
+        if v is v_orig:
+            return self._forward(*args, **kwargs)
+        self.v = v
+        try:
+            return self._forward(*args, **kwargs)
+        finally:
+            self.v = v_orig
+
     # Public #
     # -------#
     def __call__(
@@ -656,6 +789,15 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
             v = v if v else self.v
             return self._module_graph(*args, v=v, **kwargs)
 
+        if (
+            self._inference
+            and not buffers
+            and not track_submod_rets
+            and not track_submod_call_order
+            and expected_submod_rets is None
+        ):
+            return self._call_in_inference(*args, v=v, **kwargs)
+
         backend = ivy.with_backend("numpy")
         self.submod_rets = ivy.Container(alphabetical_keys=False, ivyh=backend)
         self.submod_call_order = ivy.Container(alphabetical_keys=False, ivyh=backend)
@@ -669,7 +811,12 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
 
         # convert variables to native arrays so that they can be tracked
         v = ivy.to_native(v)
-        ret = self._call(*args, v=v, buffers=buffers, **kwargs)
+        if self._inference:
+            # tracking was requested, so the submodules are called as in training
+            with self.inference_mode(False):
+                ret = self._call(*args, v=v, buffers=buffers, **kwargs)
+        else:
+            ret = self._call(*args, v=v, buffers=buffers, **kwargs)
         self._unset_submod_flags()
         return ret
 
@@ -689,6 +836,57 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         os.makedirs("/".join(weights_path.split("/")[:-1]), exist_ok=True)
         self.v.cont_to_disk_as_hdf5(weights_path)
 
+    def save_checkpoint(
+        self, directory, /, *, max_shard_size=2**30, background=False
+    ):
+        """
+        Save the weights of the Module as a sharded checkpoint, streaming the
+        variables to shard files one at a time, with an index file for partial
+        loading.
+
+        Parameters
+        ----------
+        directory
+            The directory for saving the checkpoint.
+        max_shard_size
+            Maximum size of each shard file in bytes. Default is 1GiB.
+        background
+            Whether to snapshot the variables, and write them on a background thread.
+            Default is ``False``.
+
+        Returns
+        -------
+        ret
+            The thread writing the checkpoint if background is True, otherwise None.
+        """
+        return self.v.cont_to_disk_as_shards(
+            directory, max_shard_size=max_shard_size, background=background
+        )
+
+    def load_checkpoint(self, directory, /, *, key_chains=None):
+        """
+        Load the weights of the Module from a sharded checkpoint, reading only the
+        variables at the given key chains.
+
+        Parameters
+        ----------
+        directory
+            The directory of the checkpoint.
+        key_chains
+            Key-chain or list of key-chains of the variables or sub-modules to load.
+            Default is ``None``, which loads all of the variables.
+
+        Returns
+        -------
+        ret
+            The variables of the Module, updated with the loaded variables.
+        """
+        loaded = ivy.Container.cont_from_disk_as_shards(
+            directory, key_chains=key_chains
+        )
+        self.v = self.v.cont_set_at_key_chains(loaded)
+        return self.v
+
     def build(
         self,
         *args,
@@ -835,16 +1033,59 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         self._set_buffers({var_name: value})
 
     def eval(self):
-        # disables training mode for child modules
+        # disables training mode for child modules, and enables inference mode
         self.train(mode=False)
 
     def train(self, mode: bool = True):
         # enables/disables training mode
         self.training = mode
-        for module in self.v:
-            module = getattr(self, module, None)
-            if isinstance(module, ivy.Module):
-                module.train(mode=mode)
+        for module in self._sub_mods:
+            module.train(mode=mode)
+        self.inference_mode(not mode)
+
+    def inference_mode(self, mode: bool = True):
+        """
+        Enable or disable inference mode for the module and all of its submodules.
+
+        In inference mode, calling a module skips the tracking of submodule returns
+        and call order, and each submodule binds its variables from its parent module
+        once, so the forward pass runs as plain function calls. Tracking is still
+        performed when it is explicitly requested in the call. The returned object can
+        be used as a context manager, which restores the previous modes on exit.
+
+        Parameters
+        ----------
+        mode
+            Whether to enable inference mode. Default is ``True``.
+
+        Returns
+        -------
+        ret
+            Context manager restoring the previous modes on exit.
+        """
+        return _InferenceMode(self, mode)
+
+    def checkpoint_activations(self, mode: bool = True):
+        """
+        Enable or disable activation checkpointing for the module.
+
+        When enabled, the intermediate activations of the module are discarded in the
+        forward pass and recomputed in the backward pass, trading compute for a lower
+        peak memory usage when computing gradients. The flag only applies to this
+        module, so it can be set on the memory-heavy submodules of a network.
+
+        Parameters
+        ----------
+        mode
+            Whether to enable activation checkpointing. Default is ``True``.
+
+        Returns
+        -------
+        ret
+            The module itself.
+        """
+        self._checkpoint_activations = mode
+        return self
 
     def to_device(self, device):
         # moves the weights and buffers
@@ -952,9 +1193,14 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         if hasattr(self, "buffers") and name in self.buffers:
             self.buffers[name] = value
             return
+        if name[0:2] != "__" and _may_hold_submodules(value):
+            # register the attribute, so that only the registered attributes are
+            # searched for submodules when the module is built
+            self.__dict__.setdefault("_submodule_attrs", dict())[name] = None
         return super().__setattr__(name, value)
 
     def __delattr__(self, name):
+        self.__dict__.get("_submodule_attrs", {}).pop(name, None)
         if hasattr(self, "buffers"):
             if name in self.buffers:
                 del self.buffers[name]
@@ -1042,6 +1288,32 @@ class Module(ModuleHelpers, ModuleConverters, ModuleMeta):
         return loaded
 
 
+class _InferenceMode:
+    def __init__(self, module, mode):
+        self._module = module
+        self._prev_modes = []
+        stack = [module]
+        visited = set()
+        while stack:
+            mod = stack.pop()
+            if id(mod) in visited:
+                continue
+            visited.add(id(mod))
+            self._prev_modes.append((mod, mod._inference))
+            mod._inference = mode
+            stack.extend(mod._sub_mods)
+
+    def __enter__(self):
+        return self._module
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        for mod, mode in self._prev_modes:
+            mod._inference = mode
+        if self and (exc_type is not None):
+            raise exc_val
+        return self
+
+
 class _HaikuIvyModule(Module):
     def __init__(self, *args, params_hk, native_module, device, devices, **kwargs):
         self._native_module = native_module
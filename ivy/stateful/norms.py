@@ -2,6 +2,7 @@
 
 # local
 import ivy
+from ivy.stateful.mixed_precision import _full_precision
 from ivy.stateful.module import Module
 from ivy.stateful.initializers import Zeros, Ones
 
@@ -79,6 +80,7 @@ class LayerNorm(Module):
         ret
             The outputs following the layer normalization operation.
         """
+        (inputs,) = _full_precision(inputs)
         return ivy.layer_norm(
             inputs,
             self._normalized_idxs,
@@ -187,6 +189,7 @@ class BatchNorm2D(Module):
         ret
             The outputs following the batch normalization operation.
         """
+        (inputs,) = _full_precision(inputs)
         normalized, running_mean, running_var = ivy.batch_norm(
             inputs,
             self.v.running_mean,
@@ -3,10 +3,96 @@
 
 # global
 import abc
-from typing import Union, Optional, Callable
+import math
+from typing import Union, Optional, Callable, Sequence
 
 # local
 import ivy
+from ivy.functional.ivy.device import _split_chunk_sizes
+
+
+# Helpers #
+# --------#
+
+
+class _FlatLayout:
+    """Layout of the leaves of a container packed into flat buffers per dtype."""
+
+    def __init__(self, v: ivy.Container):
+        self._leaves = dict()
+        self._key_chains = dict()
+        self._segments = dict()
+        sizes = dict()
+        for kc, x in v.cont_to_iterator():
+            dtype = ivy.as_ivy_dtype(x.dtype)
+            start = sizes.get(dtype, 0)
+            sizes[dtype] = start + math.prod(x.shape)
+            self._leaves[kc] = (dtype, start, sizes[dtype], tuple(x.shape))
+            self._key_chains.setdefault(dtype, []).append(kc)
+
+    def matches(self, v: ivy.Container):
+        num_leaves = 0
+        for kc, x in v.cont_to_iterator():
+            leaf = self._leaves.get(kc)
+            if leaf is None or leaf[0] != ivy.as_ivy_dtype(x.dtype):
+                return False
+            if leaf[3] != tuple(x.shape):
+                return False
+            num_leaves += 1
+        return num_leaves == len(self._leaves)
+
+    def pack(self, cont: ivy.Container):
+        leaves = dict(cont.cont_to_iterator())
+        missing = [kc for kc in self._leaves if kc not in leaves]
+        if missing:
+            raise ivy.utils.exceptions.IvyException(
+                f"container to pack is missing the key chains {missing}"
+            )
+        # the backend functions are called directly on the native arrays, as the
+        # wrapping of the ivy functions would otherwise dominate for many leaves
+        backend = ivy.current_backend()
+        return {
+            dtype: ivy.to_ivy(
+                backend.concat(
+                    [
+                        backend.reshape(ivy.to_native(leaves[kc]), (-1,))
+                        for kc in key_chains
+                    ],
+                    axis=0,
+                )
+            )
+            for dtype, key_chains in self._key_chains.items()
+        }
+
+    def unpack(self, buffers, like: ivy.Container):
+        backend = ivy.current_backend()
+        buffers = {dtype: ivy.to_native(buffer) for dtype, buffer in buffers.items()}
+
+        def _view(x, kc):
+            dtype, start, end, shape = self._leaves[kc]
+            return ivy.Array(backend.reshape(buffers[dtype][start:end], shape))
+
+        return like.cont_map(_view)
+
+    def segments(self, dtype):
+        if dtype not in self._segments:
+            sizes = [
+                self._leaves[kc][2] - self._leaves[kc][1]
+                for kc in self._key_chains[dtype]
+            ]
+            self._segments[dtype] = (
+                ivy.repeat(ivy.arange(len(sizes), dtype=ivy.int64), sizes),
+                len(sizes),
+            )
+        return self._segments[dtype]
+
+
+def _flat_adam_step(dcdw, mw, vw, step, beta1, beta2, epsilon):
+    # updates the flat moments in-place, and returns the effective gradients
+    ivy.add(mw * beta1, dcdw * (1 - beta1), out=mw)
+    ivy.add(vw * beta2, dcdw**2 * (1 - beta2), out=vw)
+    alpha = (1 - beta2**step) ** 0.5 / (1 - beta1**step + epsilon)
+    return ivy.divide(mw * alpha, ivy.maximum(vw, 0.0) ** 0.5 + epsilon)
 
 
 # Base #
@@ -23,6 +109,7 @@ class Optimizer(abc.ABC):
         trace_on_next_step: bool = False,
         fallback_to_non_traced: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        flat: bool = False,
     ):
         """
         Construct a general Optimizer. This is an abstract class, and must be derived.
@@ -50,7 +137,22 @@ class Optimizer(abc.ABC):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        flat
+            Whether to pack the variables, gradients and optimizer state into
+            contiguous flat buffers per dtype, updated with a few fused in-place
+            operations per step. The returned variables are then views into the
+            flat buffers, and variables passed in which are not such views are
+            updated in-place with their new values. Flat mode requires both
+            ``inplace`` and ``stop_gradients``. Default is ``False``.
         """
+        if flat:
+            ivy.utils.assertions.check_true(
+                inplace and stop_gradients,
+                message=(
+                    "flat optimizers update the variables in-place and stop their"
+                    " gradients, so inplace and stop_gradients must both be True"
+                ),
+            )
         self._lr = lr
         self._inplace = inplace
         self._stop_gradients = stop_gradients
@@ -62,6 +164,12 @@ class Optimizer(abc.ABC):
         self._count = ivy.array([0], device=self._dev)
         self._traced_step_fn = None
         self._traced = False
+        self._flat = flat
+        self._flat_layout = None
+        self._flat_v = None
+        self._flat_w = None
+        self._flat_state = dict()
+        self._flat_pending_state = dict()
 
     # Private #
     # --------#
@@ -88,8 +196,116 @@ class Optimizer(abc.ABC):
         """
         raise ivy.utils.exceptions.IvyNotImplementedException
 
+    def _flat_step(self, w, dcdw, lr, state: dict, dtype):
+        """
+        Update the flat buffer w in-place, using the flat gradients dcdw of the same
+        dtype. Override this method to support flat mode.
+
+        Parameters
+        ----------
+        w
+            Flat buffer of the variables of one dtype.
+        dcdw
+            Flat gradients of the variables.
+        lr
+            Learning rate.
+        state
+            Dict of the flat optimizer state buffers for this dtype, to be updated
+            in-place.
+        dtype
+            The dtype of the flat buffers.
+        """
+        raise ivy.utils.exceptions.IvyNotImplementedException
+
     # Given #
 
+    def _flat_norms(self, x, dtype):
+        """Compute the vector norm of each variable within the flat buffer x."""
+        segment_ids, num_segments = self._flat_layout.segments(dtype)
+        return ivy.unsorted_segment_sum(x * x, segment_ids, num_segments) ** 0.5
+
+    def _flat_expand(self, x, dtype):
+        """Broadcast one value per variable to all elements of the flat buffer."""
+        return ivy.gather(x, self._flat_layout.segments(dtype)[0])
+
+    def _flat_state_container(self, name):
+        """Return the optimizer state `name` as a container of flat buffer views."""
+        if self._flat_layout is None:
+            return self._flat_pending_state.get(name)
+        buffers = {dtype: state.get(name) for dtype, state in self._flat_state.items()}
+        if not buffers or any(buffer is None for buffer in buffers.values()):
+            return None
+        return self._flat_layout.unpack(buffers, self._flat_v)
+
+    def _set_flat_state(self, **state):
+        """Pack the containers of optimizer state into the flat state buffers."""
+        state = {name: cont for name, cont in state.items() if cont is not None}
+        if self._flat_layout is None:
+            self._flat_pending_state = state
+            return
+        for name, cont in state.items():
+            for dtype, buffer in self._flat_layout.pack(cont).items():
+                self._flat_state.setdefault(dtype, dict())[name] = buffer
+
+    def _flat_step_fn(
+        self, v: ivy.Container, grads: ivy.Container, ignore_missing: bool = False
+    ):
+        """
+        Update the variables packed into the flat buffers in-place, using nested grads
+        container. The variables are only re-packed when v is not the container of
+        views returned by the previous step, in which case the leaves of v are then
+        updated in-place with their new values.
+
+        Parameters
+        ----------
+        v
+            Nested variables to update.
+        grads
+            Nested gradients to update.
+        ignore_missing
+            Not supported in flat mode.
+
+        Returns
+        -------
+        ret
+            The updated variables, as views into the flat buffers.
+        """
+        if ignore_missing:
+            raise ivy.utils.exceptions.IvyException(
+                "ignore_missing is not supported by flat optimizers"
+            )
+        repacked = v is not self._flat_v
+        if repacked:
+            if self._flat_layout is None or not self._flat_layout.matches(v):
+                self._flat_layout = _FlatLayout(v)
+                self._flat_state = dict()
+                self._set_flat_state(**self._flat_pending_state)
+                self._flat_pending_state = dict()
+            self._flat_w = {
+                dtype: ivy.stop_gradient(w)
+                for dtype, w in self._flat_layout.pack(v).items()
+            }
+            self._flat_v = self._flat_layout.unpack(self._flat_w, v)
+        lr = self._lr if isinstance(self._lr, float) else self._lr()
+        for dtype, dcdw in self._flat_layout.pack(grads).items():
+            self._flat_step(
+                self._flat_w[dtype],
+                dcdw,
+                lr,
+                self._flat_state.setdefault(dtype, dict()),
+                dtype,
+            )
+        if not ivy.inplace_arrays_supported():
+            # the buffers were replaced rather than updated, so refresh the views
+            self._flat_v = self._flat_layout.unpack(self._flat_w, self._flat_v)
+        if repacked:
+            # v is a copy of the packed values, which are written back to it
+            for (_, x), (_, new_x) in zip(
+                v.cont_to_iterator(), self._flat_v.cont_to_iterator()
+            ):
+                ivy.inplace_update(x, new_x)
+        return self._flat_v
+
     def _step_fn(
         self, v: ivy.Container, grads: ivy.Container, ignore_missing: bool = False
     ):
@@ -154,8 +370,37 @@ class Optimizer(abc.ABC):
         """
         self._count += 1
         self._initialized = True
+        if self._flat:
+            return self._flat_step_fn(v, grads, ignore_missing)
         return self._step_fn(v, grads, ignore_missing)
 
+    def state_dict(self):
+        """
+        Return the step count and the state of the optimizer, with the arrays copied.
+
+        Returns
+        -------
+        ret
+            Container with the step count and the nested optimizer state.
+        """
+        return ivy.Container(
+            {"count": ivy.copy_array(self._count), "state": self.state}
+        ).cont_deep_copy()
+
+    def load_state_dict(self, state_dict: ivy.Container):
+        """
+        Load the step count and the state of the optimizer, as returned by
+        state_dict.
+
+        Parameters
+        ----------
+        state_dict
+            Container with the step count and the nested optimizer state.
+        """
+        self._count = ivy.copy_array(state_dict["count"])
+        self._initialized = True
+        self.set_state(state_dict["state"])
+
 
 # Optimizers #
 # -----------#
@@ -168,6 +413,7 @@ class SGD(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
+        flat: bool = False,
     ):
         """
         Construct a Stochastic-Gradient-Descent (SGD) optimizer.
@@ -186,9 +432,20 @@ class SGD(Optimizer):
             Default is ``True``.
         trace_on_next_step
             Whether to trace the optimizer on the next step. Default is ``False``.
+        flat
+            Whether to pack the variables, gradients and optimizer state into
+            contiguous flat buffers per dtype, updated with a few fused in-place
+            operations per step. The returned variables are then views into the
+            flat buffers. Requires ``inplace`` and ``stop_gradients``.
+            Default is ``False``.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, trace_on_next_step=trace_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            trace_on_next_step=trace_on_next_step,
+            flat=flat,
         )
 
     # Custom Step
@@ -217,6 +474,25 @@ class SGD(Optimizer):
             stop_gradients=self._stop_gradients,
         )
 
+    def _flat_step(self, w, dcdw, lr, state: dict, dtype):
+        """
+        Update the flat buffer w in-place by gradient descent step.
+
+        Parameters
+        ----------
+        w
+            Flat buffer of the variables of one dtype.
+        dcdw
+            Flat gradients of the variables.
+        lr
+            Learning rate.
+        state
+            Dict of the flat optimizer state buffers, unused.
+        dtype
+            The dtype of the flat buffers.
+        """
+        ivy.subtract(w, dcdw * lr, out=w)
+
     def set_state(self, state: ivy.Container):
         """
         Set state of the optimizer.
@@ -241,6 +517,7 @@ class LARS(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
+        flat: bool = False,
     ):
         """
         Construct a Layer-wise Adaptive Rate Scaling (LARS) optimizer.
@@ -261,10 +538,21 @@ class LARS(Optimizer):
             Default is ``True``.
         trace_on_next_step
             Whether to trace the optimizer on the next step. Default is ``False``.
+        flat
+            Whether to pack the variables, gradients and optimizer state into
+            contiguous flat buffers per dtype, updated with a few fused in-place
+            operations per step. The returned variables are then views into the
+            flat buffers. Requires ``inplace`` and ``stop_gradients``.
+            Default is ``False``.
         """
         self._decay_lambda = decay_lambda
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, trace_on_next_step=trace_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            trace_on_next_step=trace_on_next_step,
+            flat=flat,
         )
 
     # Custom Step
@@ -294,6 +582,30 @@ class LARS(Optimizer):
             stop_gradients=self._stop_gradients,
         )
 
+    def _flat_step(self, w, dcdw, lr, state: dict, dtype):
+        """
+        Update the flat buffer w in-place by LARS step, with the learning rate scaled
+        separately for each variable.
+
+        Parameters
+        ----------
+        w
+            Flat buffer of the variables of one dtype.
+        dcdw
+            Flat gradients of the variables.
+        lr
+            Learning rate.
+        state
+            Dict of the flat optimizer state buffers, unused.
+        dtype
+            The dtype of the flat buffers.
+        """
+        w_norm = self._flat_norms(w, dtype)
+        lr = ivy.stable_divide(w_norm * lr, self._flat_norms(dcdw, dtype))
+        if self._decay_lambda > 0:
+            lr /= w_norm * self._decay_lambda
+        ivy.subtract(w, dcdw * self._flat_expand(lr, dtype), out=w)
+
     def set_state(self, state: ivy.Container):
         """
         Set state of the optimizer.
@@ -321,6 +633,7 @@ class Adam(Optimizer):
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        flat: bool = False,
     ):
         """
         Construct an ADAM optimizer.
@@ -349,6 +662,12 @@ class Adam(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        flat
+            Whether to pack the variables, gradients and optimizer state into
+            contiguous flat buffers per dtype, updated with a few fused in-place
+            operations per step. The returned variables are then views into the
+            flat buffers. Requires ``inplace`` and ``stop_gradients``.
+            Default is ``False``.
         """
         self._beta1 = beta1
         self._beta2 = beta2
@@ -359,7 +678,14 @@ class Adam(Optimizer):
         self._should_trace = False
 
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, trace_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            trace_on_next_step,
+            device=device,
+            flat=flat,
         )
 
     # Custom Step
@@ -400,6 +726,37 @@ class Adam(Optimizer):
         )
         return new_v
 
+    def _flat_step(self, w, dcdw, lr, state: dict, dtype):
+        """
+        Update the flat buffer w and the flat moments in-place by Adam update step.
+
+        Parameters
+        ----------
+        w
+            Flat buffer of the variables of one dtype.
+        dcdw
+            Flat gradients of the variables.
+        lr
+            Learning rate.
+        state
+            Dict of the flat first and second moments, "mw" and "vw".
+        dtype
+            The dtype of the flat buffers.
+        """
+        if "mw" not in state:
+            state["mw"] = ivy.copy_array(dcdw)
+            state["vw"] = dcdw**2
+        eff_grads = _flat_adam_step(
+            dcdw,
+            state["mw"],
+            state["vw"],
+            float(ivy.to_scalar(self._count)),
+            self._beta1,
+            self._beta2,
+            self._epsilon,
+        )
+        ivy.subtract(w, eff_grads * lr, out=w)
+
     def set_state(self, state: ivy.Container):
         """
         Set state of the optimizer.
@@ -409,11 +766,22 @@ class Adam(Optimizer):
         state
             Nested state to update.
         """
+        if self._flat:
+            self._set_flat_state(mw=state.mw, vw=state.vw)
+            return
         self._mw = state.mw
         self._vw = state.vw
+        self._first_pass = self._mw is None
 
     @property
     def state(self):
+        if self._flat:
+            return ivy.Container(
+                {
+                    "mw": self._flat_state_container("mw"),
+                    "vw": self._flat_state_container("vw"),
+                }
+            )
         return ivy.Container({"mw": self._mw, "vw": self._vw})
 
 
@@ -430,6 +798,7 @@ class LAMB(Optimizer):
         stop_gradients: bool = True,
         trace_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        flat: bool = False,
     ):
         """
         Construct an LAMB optimizer.
@@ -463,9 +832,22 @@ class LAMB(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        flat
+            Whether to pack the variables, gradients and optimizer state into
+            contiguous flat buffers per dtype, updated with a few fused in-place
+            operations per step. The returned variables are then views into the
+            flat buffers. Requires ``inplace`` and ``stop_gradients``.
+            Default is ``False``.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, trace_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            trace_on_next_step,
+            device=device,
+            flat=flat,
         )
         self._beta1 = beta1
         self._beta2 = beta2
@@ -516,6 +898,43 @@ class LAMB(Optimizer):
         )
         return new_v
 
+    def _flat_step(self, w, dcdw, lr, state: dict, dtype):
+        """
+        Update the flat buffer w and the flat moments in-place by LAMB update step.
+
+        Parameters
+        ----------
+        w
+            Flat buffer of the variables of one dtype.
+        dcdw
+            Flat gradients of the variables.
+        lr
+            Learning rate.
+        state
+            Dict of the flat first and second moments, "mw" and "vw".
+        dtype
+            The dtype of the flat buffers.
+        """
+        if "mw" not in state:
+            state["mw"] = ivy.copy_array(dcdw)
+            state["vw"] = dcdw**2
+        eff_grads = _flat_adam_step(
+            dcdw,
+            state["mw"],
+            state["vw"],
+            float(ivy.to_scalar(self._count)),
+            self._beta1,
+            self._beta2,
+            self._epsilon,
+        )
+        r1 = self._flat_norms(w, dtype)
+        if self._decay_lambda > 0:
+            r2 = self._flat_norms(eff_grads + self._decay_lambda * w, dtype)
+        else:
+            r2 = self._flat_norms(eff_grads, dtype)
+        r = ivy.minimum(ivy.stable_divide(r1, r2), ivy.array(self._max_trust_ratio))
+        ivy.subtract(w, eff_grads * self._flat_expand(r * lr, dtype), out=w)
+
     def set_state(self, state: ivy.Container):
         """
         Set state of the optimizer.
@@ -525,9 +944,215 @@ class LAMB(Optimizer):
         state
             Nested state to update.
         """
+        if self._flat:
+            self._set_flat_state(mw=state.mw, vw=state.vw)
+            return
         self._mw = state.mw
         self._vw = state.vw
+        self._first_pass = self._mw is None
 
     @property
     def state(self):
+        if self._flat:
+            return ivy.Container(
+                {
+                    "mw": self._flat_state_container("mw"),
+                    "vw": self._flat_state_container("vw"),
+                }
+            )
         return ivy.Container({"mw": self._mw, "vw": self._vw})
+
+
+# Gradient Accumulation #
+# ----------------------#
+
+
+class GradientAccumulator:
+    def __init__(
+        self,
+        micro_batch_size: int,
+        /,
+        *,
+        reduction: str = "mean",
+        input_axes: Union[int, Sequence[int]] = 0,
+        device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+    ):
+        """
+        Compute the gradients of a loss over a batch in micro-batches, summing them
+        into a preallocated accumulator, so that the peak memory is bounded by the size
+        of a micro-batch rather than of the batch.
+
+        Parameters
+        ----------
+        micro_batch_size
+            Number of examples in each micro-batch. The last micro-batch holds the
+            remainder of the batch.
+        reduction
+            ``"mean"`` if the loss is the mean over the examples of its inputs, in which
+            case the loss of each micro-batch is weighted by its share of the batch, or
+            ``"sum"``. Default is ``"mean"``.
+        input_axes
+            The axes along which to split each of the inputs. Default is ``0``.
+        device
+            The device of the inputs. Default is ``None``.
+
+        Examples
+        --------
+        >>> model = ivy.Linear(3, 2)
+        >>> optimizer = ivy.SGD(lr=0.1)
+        >>> accumulator = ivy.GradientAccumulator(4)
+        >>> def loss_fn(v, x):
+        ...     return ivy.mean(model(x, v=v) ** 2)
+        >>> loss, model.v = accumulator.step(
+        ...     optimizer, model.v, loss_fn, [ivy.ones((16, 3))]
+        ... )
+        """
+        ivy.utils.assertions.check_elem_in_list(reduction, ["mean", "sum"])
+        ivy.utils.assertions.check_less(0, micro_batch_size, as_array=False)
+        self._micro_batch_size = micro_batch_size
+        self._reduction = reduction
+        self._input_axes = input_axes
+        self._device = device
+        self._grads = None
+        self._leaves = None
+        self._empty = True
+
+    @staticmethod
+    def _leaves_of(grads):
+        if isinstance(grads, ivy.Container):
+            return dict(grads.cont_to_iterator())
+        return {"": grads}
+
+    def _matches(self, leaves):
+        return self._leaves is not None and all(
+            kc in self._leaves
+            and self._leaves[kc].shape == g.shape
+            and self._leaves[kc].dtype == g.dtype
+            for kc, g in leaves.items()
+        )
+
+    @property
+    def grads(self):
+        """The gradients accumulated since the last reset."""
+        return None if self._empty else self._grads
+
+    def reset(self):
+        """Start a new accumulation, keeping the accumulator for reuse."""
+        self._empty = True
+
+    def accumulate(self, grads):
+        """
+        Add gradients in-place to the accumulator, which is allocated on the first
+        call and reused as long as the gradients keep the same structure.
+
+        Parameters
+        ----------
+        grads
+            Array or container of gradients.
+
+        Returns
+        -------
+        ret
+            The accumulated gradients.
+        """
+        if grads is None:
+            return self.grads
+        leaves = self._leaves_of(grads)
+        if not self._matches(leaves):
+            self._grads = (
+                grads.cont_map(lambda g, _: ivy.zeros_like(g))
+                if isinstance(grads, ivy.Container)
+                else ivy.zeros_like(grads)
+            )
+            self._leaves = self._leaves_of(self._grads)
+            self._empty = True
+        for kc, g in leaves.items():
+            acc = self._leaves[kc]
+            if self._empty:
+                ivy.inplace_update(acc, g)
+            else:
+                ivy.add(acc, g, out=acc)
+        self._empty = False
+        return self._grads
+
+    def execute_with_gradients(self, func, xs, inputs, /, **kwargs):
+        """
+        Call func on each micro-batch of the inputs with
+        :func:`ivy.execute_with_gradients`, and accumulate the gradients.
+
+        Parameters
+        ----------
+        func
+            Function called as ``func(xs, *micro_batch)``, returning the loss of the
+            micro-batch.
+        xs
+            Variables for which to compute the gradients of the loss.
+        inputs
+            List of the arrays or containers to split into micro-batches.
+        kwargs
+            Keyword arguments for :func:`ivy.execute_with_gradients`.
+
+        Returns
+        -------
+        ret
+            The loss over the batch, and the accumulated gradients w.r.t xs, which are
+            overwritten by the next accumulation.
+        """
+        input_axes = self._input_axes
+        if isinstance(input_axes, int):
+            input_axes = [input_axes] * len(inputs)
+        chunk_sizes = _split_chunk_sizes(
+            inputs, input_axes, None, self._micro_batch_size, self._device
+        )
+        # the inputs are split into views rather than copies where the backend allows
+        inputs_split = [
+            (
+                ivy.split(
+                    inp, num_or_size_splits=chunk_sizes, axis=ax, with_remainder=True
+                )
+                if ivy.is_array(inp)
+                else inp.split(
+                    num_or_size_splits=chunk_sizes, axis=ax, with_remainder=True
+                )
+            )
+            for inp, ax in zip(inputs, input_axes)
+        ]
+        batch_size = sum(chunk_sizes)
+        self.reset()
+        loss = None
+        for size, micro_batch in zip(chunk_sizes, zip(*inputs_split)):
+            # weighting the loss rather than the gradients saves a temporary per leaf
+            weight = size / batch_size if self._reduction == "mean" else 1.0
+            micro_loss, grads = ivy.execute_with_gradients(
+                lambda v: func(v, *micro_batch) * weight, xs, **kwargs
+            )
+            loss = micro_loss if loss is None else loss + micro_loss
+            self.accumulate(grads)
+        return loss, self.grads
+
+    def step(self, optimizer, v, func, inputs, /, **kwargs):
+        """
+        Accumulate the gradients of the loss over the micro-batches of the inputs,
+        and update the variables with a single optimizer step.
+
+        Parameters
+        ----------
+        optimizer
+            The stateful optimizer.
+        v
+            Nested variables to update.
+        func
+            Function called as ``func(v, *micro_batch)``, returning the loss of the
+            micro-batch.
+        inputs
+            List of the arrays or containers to split into micro-batches.
+        kwargs
+            Keyword arguments for the ``step`` method of the optimizer.
+
+        Returns
+        -------
+        ret
+            The loss over the batch, and the updated variables.
+        """
+        loss, grads = self.execute_with_gradients(func, v, inputs)
+        return loss, optimizer.step(v, grads, **kwargs)
@@ -0,0 +1,557 @@
+"""Post-training int8 quantization of the layers of a module."""
+
+# global
+import copy
+
+# local
+import ivy
+from ivy.stateful.fusion import _bind
+from ivy.stateful.layers import Linear, Conv2D
+from ivy.stateful.module import Module
+from ivy.stateful.sequential import Sequential
+
+
+# Helpers #
+# --------#
+
+
+def _quantize_per_channel(w, axes):
+    # symmetric int8 quantization, with one scale per output channel
+    scale = ivy.maximum(ivy.max(ivy.abs(w), axis=axes), 1e-12) / 127
+    expanded_scale = ivy.expand_dims(scale, axis=axes)
+    w_q = ivy.clip(ivy.round(w / expanded_scale), -127, 127)
+    return ivy.astype(w_q, "int8"), scale
+
+
+# the helpers below operate on native arrays and call the backend functions
+# directly, as the wrapping of the ivy functions would otherwise dominate the cost
+# of the elementwise passes around the matmul or convolution
+
+
+# int8 x int8 products summed over up to this many terms are integers below 2**24,
+# which float32 represents exactly, so that the float kernels of the backend compute
+# each block of the reduction as an int32 accumulation would
+_BLOCK_DEPTH = (2**24 - 1) // (127 * 127)
+
+
+def _block_bounds(size, block):
+    return [(start, min(start + block, size)) for start in range(0, size, block)]
+
+
+def _cast_weight_blocks(w, axis, bounds, dtype):
+    # the blocks of the int8 weight along its reduction axis, cast to the dtype of
+    # the kernels once rather than on every call
+    backend = ivy.current_backend()
+    w = ivy.to_native(w)
+    index = [slice(None)] * len(w.shape)
+    blocks = []
+    for start, stop in bounds:
+        index[axis] = slice(start, stop)
+        blocks.append(backend.astype(w[tuple(index)], dtype))
+    return blocks
+
+
+def _accumulate_blocks(partials):
+    # the exact float32 partial sums of the blocks are added as int32, so that the
+    # accumulation over any depth is exact, and returned as float32 for the epilogue
+    backend = ivy.current_backend()
+    acc = None
+    for partial in partials:
+        if acc is None:
+            acc = partial
+            continue
+        if backend.dtype(acc) != "int32":
+            acc = backend.astype(acc, "int32")
+        partial = backend.astype(partial, "int32")
+        if ivy.inplace_arrays_supported():
+            acc = backend.add(acc, partial, out=acc)
+        else:
+            acc = acc + partial
+    return backend.astype(acc, "float32", copy=False)
+
+
+_int8_bounds = {}
+
+
+def _clip_to_int8(x):
+    # the bounds are arrays of the dtype of x, created once, so that the backend
+    # neither converts them on each call nor promotes x to a wider dtype
+    backend = ivy.current_backend()
+    key = (ivy.current_backend_str(), str(backend.dtype(x)))
+    if key not in _int8_bounds:
+        _int8_bounds[key] = tuple(
+            ivy.to_native(ivy.array(bound, dtype=backend.dtype(x)))
+            for bound in (-127, 127)
+        )
+    return backend.clip(x, *_int8_bounds[key])
+
+
+def _quantize_input(x, scale, acc_dtype):
+    backend = ivy.current_backend()
+    if backend.dtype(x) != "int8":
+        # int8 inputs were already requantized to the scale by the previous layer
+        x = _clip_to_int8(backend.round(x / scale))
+    return backend.astype(x, acc_dtype, copy=False)
+
+
+def _epilogue(acc, scale, bias, output_scale):
+    # rescale the accumulator and add the bias in place, then either return the
+    # float outputs or requantize them to int8 for the next quantized layer
+    backend = ivy.current_backend()
+    dtype = backend.dtype(bias)
+    if output_scale is not None:
+        scale = scale / output_scale
+        bias = bias / output_scale
+    scale = backend.astype(scale, backend.dtype(acc), copy=False)
+    bias = backend.astype(bias, backend.dtype(acc), copy=False)
+    if ivy.inplace_arrays_supported():
+        acc = backend.multiply(acc, scale, out=acc)
+        acc = backend.add(acc, bias, out=acc)
+    else:
+        acc = acc * scale + bias
+    if output_scale is None:
+        return backend.astype(acc, dtype, copy=False)
+    return backend.astype(_clip_to_int8(backend.round(acc)), "int8")
+
+
+# Quantized Layers #
+# -----------------#
+
+
+class QuantizedLinear(Module):
+    def __init__(
+        self,
+        input_channels,
+        output_channels,
+        /,
+        *,
+        input_scale,
+        output_scale=None,
+        device=None,
+        v=None,
+        dtype=None,
+    ):
+        """
+        Linear layer with int8 weights and inputs. The inputs are quantized with a
+        single scale, the weights with one scale per output channel, and the int8
+        products are accumulated exactly before being rescaled and added to the
+        bias in a single epilogue.
+
+        Parameters
+        ----------
+        input_channels
+            Number of input channels for the layer.
+        output_channels
+            Number of output channels for the layer.
+        input_scale
+            Scale of the int8 inputs, usually found by calibration.
+        output_scale
+            If given, the outputs are requantized to int8 with this scale, for a
+            following quantized layer. Float outputs are returned by default.
+        device
+            device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
+            etc. Default is cpu.
+        v
+            the variables for the layer, as a container, constructed internally by
+            default.
+        dtype
+            the desired data type of the float variables. Default is ``None``.
+        """
+        self._input_channels = input_channels
+        self._output_channels = output_channels
+        self._input_scale = input_scale
+        self._output_scale = output_scale
+        self._bounds = _block_bounds(input_channels, _BLOCK_DEPTH)
+        self._w_blocks_src = None
+        self._w_blocks = None
+        Module.__init__(self, device=device, v=v, dtype=dtype, training=False)
+
+    @classmethod
+    def from_float(cls, layer, input_scale):
+        """
+        Create a quantized layer from a float linear layer.
+
+        Parameters
+        ----------
+        layer
+            The linear layer to quantize.
+        input_scale
+            Scale of the int8 inputs.
+
+        Returns
+        -------
+        ret
+            The quantized linear layer.
+        """
+        w, w_scale = _quantize_per_channel(layer.v.w, [1])
+        b = layer.v.b if layer._with_bias else ivy.zeros_like(w_scale)
+        return cls(
+            layer._input_channels,
+            layer._output_channels,
+            input_scale=input_scale,
+            device=layer._device,
+            v=ivy.Container(w=w, w_scale=w_scale, b=b),
+            dtype=layer._dtype,
+        )
+
+    def _create_variables(self, device, dtype=None):
+        """Create internal variables for the layer."""
+        return {
+            "w": ivy.zeros(
+                (self._output_channels, self._input_channels),
+                device=device,
+                dtype="int8",
+            ),
+            "w_scale": ivy.ones((self._output_channels,), device=device, dtype=dtype),
+            "b": ivy.zeros((self._output_channels,), device=device, dtype=dtype),
+        }
+
+    def _forward(self, x):
+        """
+        Perform forward pass of the QuantizedLinear layer.
+
+        Parameters
+        ----------
+        x
+            Float or int8 inputs to process *[batch_shape, in]*.
+
+        Returns
+        -------
+        ret
+            The outputs following the quantized linear operation and bias addition
+            *[batch_shape, out]*
+        """
+        backend = ivy.current_backend()
+        if self.v.w is not self._w_blocks_src:
+            # the transposed weight blocks are cast again once the weight is replaced
+            self._w_blocks = _cast_weight_blocks(
+                ivy.permute_dims(self.v.w, (1, 0)), 0, self._bounds, "float32"
+            )
+            self._w_blocks_src = self.v.w
+        x = _quantize_input(ivy.to_native(x), self._input_scale, "float32")
+        acc = _accumulate_blocks(
+            backend.matmul(x[..., start:stop], w)
+            for (start, stop), w in zip(self._bounds, self._w_blocks)
+        )
+        v = ivy.to_native(self.v, nested=True)
+        return ivy.to_ivy(
+            _epilogue(acc, v.w_scale * self._input_scale, v.b, self._output_scale)
+        )
+
+    def extra_repr(self) -> str:
+        return "in_features={}, out_features={}, input_scale={}".format(
+            self._input_channels, self._output_channels, self._input_scale
+        )
+
+
+class QuantizedConv2D(Module):
+    def __init__(
+        self,
+        input_channels,
+        output_channels,
+        filter_shape,
+        strides,
+        padding,
+        /,
+        *,
+        input_scale,
+        output_scale=None,
+        data_format="NHWC",
+        dilations=1,
+        device=None,
+        v=None,
+        dtype=None,
+    ):
+        """
+        2D convolutional layer with int8 weights and inputs. The inputs are quantized
+        with a single scale, the weights with one scale per output channel, and the
+        int8 products are accumulated exactly before being rescaled and added to the
+        bias in a single epilogue.
+
+        Parameters
+        ----------
+        input_channels
+            Number of input channels for the layer.
+        output_channels
+            Number of output channels for the layer.
+        filter_shape
+            Shape of the convolutional filter.
+        strides
+            The stride of the sliding window for each dimension of input.
+        padding
+            SAME" or "VALID" indicating the algorithm, or
+            list indicating the per-dimension paddings.
+        input_scale
+            Scale of the int8 inputs, usually found by calibration.
+        output_scale
+            If given, the outputs are requantized to int8 with this scale, for a
+            following quantized layer. Float outputs are returned by default.
+        data_format
+            NHWC" or "NCHW". Defaults to "NHWC".
+        dilations
+            The dilation factor for each dimension of input. (Default value = 1)
+        device
+            device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
+            etc. Default is cpu.
+        v
+            the variables for the layer, as a container, constructed internally by
+            default.
+        dtype
+            the desired data type of the float variables. Default is ``None``.
+        """
+        self._input_channels = input_channels
+        self._output_channels = output_channels
+        self._filter_shape = filter_shape
+        self._strides = strides
+        self._padding = padding
+        self._w_shape = list(filter_shape) + [input_channels, output_channels]
+        self._b_shape = (
+            (1, 1, 1, output_channels)
+            if data_format == "NHWC"
+            else (1, output_channels, 1, 1)
+        )
+        self._data_format = data_format
+        self._dilations = dilations
+        self._input_scale = input_scale
+        self._output_scale = output_scale
+        # blocks of input channels, of at least one channel whatever the depth of the
+        # filter, which is accumulated in float64 beyond the exact float32 depth
+        filter_size = self._w_shape[0] * self._w_shape[1]
+        self._acc_dtype = "float32" if filter_size <= _BLOCK_DEPTH else "float64"
+        self._bounds = _block_bounds(
+            input_channels, max(_BLOCK_DEPTH // filter_size, 1)
+        )
+        self._w_blocks_src = None
+        self._w_blocks = None
+        Module.__init__(self, device=device, v=v, dtype=dtype, training=False)
+
+    @classmethod
+    def from_float(cls, layer, input_scale):
+        """
+        Create a quantized layer from a float 2D convolutional layer.
+
+        Parameters
+        ----------
+        layer
+            The convolutional layer to quantize.
+        input_scale
+            Scale of the int8 inputs.
+
+        Returns
+        -------
+        ret
+            The quantized convolutional layer.
+        """
+        w, w_scale = _quantize_per_channel(layer.v.w, [0, 1, 2])
+        b = (
+            ivy.reshape(layer.v.b, (-1,))
+            if layer._with_bias
+            else ivy.zeros_like(w_scale)
+        )
+        return cls(
+            layer._input_channels,
+            layer._output_channels,
+            layer._filter_shape,
+            layer._strides,
+            layer._padding,
+            input_scale=input_scale,
+            data_format=layer._data_format,
+            dilations=layer._dilations,
+            device=layer._device,
+            v=ivy.Container(w=w, w_scale=w_scale, b=b),
+            dtype=layer._dtype,
+        )
+
+    def _create_variables(self, device, dtype=None):
+        """Create internal variables for the layer."""
+        return {
+            "w": ivy.zeros(self._w_shape, device=device, dtype="int8"),
+            "w_scale": ivy.ones((self._output_channels,), device=device, dtype=dtype),
+            "b": ivy.zeros((self._output_channels,), device=device, dtype=dtype),
+        }
+
+    def _forward(self, inputs):
+        """
+        Perform forward pass of the QuantizedConv2D layer.
+
+        Parameters
+        ----------
+        inputs
+            Float or int8 inputs to process *[batch_size,h,w,d_in]*.
+
+        Returns
+        -------
+        ret
+            The outputs following the quantized conv2d layer
+            *[batch_size,new_h,new_w,d_out]*
+        """
+        backend = ivy.current_backend()
+        if self.v.w is not self._w_blocks_src:
+            # the weight blocks are cast again once the weight is replaced
+            self._w_blocks = _cast_weight_blocks(
+                self.v.w, 2, self._bounds, self._acc_dtype
+            )
+            self._w_blocks_src = self.v.w
+        x = _quantize_input(ivy.to_native(inputs), self._input_scale, self._acc_dtype)
+        channel_axis = -1 if self._data_format == "NHWC" else 1
+        index = [slice(None)] * len(x.shape)
+        partials = []
+        for (start, stop), w in zip(self._bounds, self._w_blocks):
+            index[channel_axis] = slice(start, stop)
+            partials.append(
+                backend.conv2d(
+                    x[tuple(index)] if len(self._bounds) > 1 else x,
+                    w,
+                    self._strides,
+                    self._padding,
+                    data_format=self._data_format,
+                    dilations=self._dilations,
+                )
+            )
+        acc = (
+            _accumulate_blocks(partials)
+            if self._acc_dtype == "float32"
+            else sum(partials[1:], partials[0])
+        )
+        v = ivy.to_native(self.v, nested=True)
+        return ivy.to_ivy(
+            _epilogue(
+                acc,
+                backend.reshape(v.w_scale * self._input_scale, self._b_shape),
+                backend.reshape(v.b, self._b_shape),
+                self._output_scale,
+            )
+        )
+
+    def extra_repr(self):
+        s = (
+            "{_input_channels}, {_output_channels}, filter_shape={_filter_shape},"
+            " strides={_strides}, padding={_padding}, input_scale={_input_scale}"
+        )
+        if self._data_format != "NHWC":
+            s += ", data_format={_data_format}"
+        return s.format(**self.__dict__)
+
+
+_QUANTIZED_LAYERS = {Linear: QuantizedLinear, Conv2D: QuantizedConv2D}
+
+
+# Quantization Pass #
+# ------------------#
+
+
+def _calibrate(module, calibration_data):
+    # record the largest absolute input of each quantizable layer
+    layers = []
+    stack = [module]
+    while stack:
+        mod = stack.pop()
+        if mod.__class__ in _QUANTIZED_LAYERS:
+            layers.append(mod)
+        else:
+            stack.extend(mod._sub_mods)
+    max_abs = {id(layer): 0.0 for layer in layers}
+
+    def _observed(layer):
+        forward = layer._forward
+
+        def _forward(x, *args, **kwargs):
+            max_abs[id(layer)] = max(
+                max_abs[id(layer)], float(ivy.to_scalar(ivy.max(ivy.abs(x))))
+            )
+            return forward(x, *args, **kwargs)
+
+        return _forward
+
+    for layer in layers:
+        layer._forward = _observed(layer)
+    try:
+        for batch in calibration_data:
+            module(*batch) if isinstance(batch, (list, tuple)) else module(batch)
+    finally:
+        for layer in layers:
+            del layer._forward
+    return {key: val / 127 if val > 0 else 1.0 for key, val in max_abs.items()}
+
+
+def _replace(parent, old, new):
+    for key, val in parent.__dict__.items():
+        if val is old:
+            parent.__dict__[key] = new
+        elif isinstance(val, list):
+            parent.__dict__[key] = [new if v is old else v for v in val]
+    parent._sub_mods.discard(old)
+    parent._sub_mods.add(new)
+
+
+def _quantize_layers(module, input_scales):
+    for submod in list(module._sub_mods):
+        wrapper = submod.__dict__.get("__call__")
+        if not hasattr(wrapper, "wrapped"):
+            continue
+        key_chain = wrapper.keywords["orig_key_chain"]
+        submod.v = submod._bound_v()
+        if id(submod) in input_scales:
+            new = _QUANTIZED_LAYERS[submod.__class__].from_float(
+                submod, input_scales[id(submod)]
+            )
+            _replace(module, submod, new)
+            _bind(module, new, key_chain)
+        else:
+            new = _quantize_layers(submod, input_scales)
+        module.v = module.v.cont_set_at_key_chain(key_chain, new.v)
+    if isinstance(module, Sequential):
+        # consecutive quantized layers pass int8 outputs to each other
+        layers = module._submodules
+        for prev, layer in zip(layers[:-1], layers[1:]):
+            if isinstance(prev, (QuantizedLinear, QuantizedConv2D)) and isinstance(
+                layer, (QuantizedLinear, QuantizedConv2D)
+            ):
+                prev._output_scale = layer._input_scale
+    return module
+
+
+def quantize_module(module, calibration_data):
+    """
+    Return a copy of a built module with its ``Linear`` and ``Conv2D`` layers
+    quantized to int8 for inference.
+
+    The weights are quantized symmetrically with one scale per output channel. The
+    scale of the inputs of each layer is calibrated from the largest absolute input
+    seen when running the module on the calibration batches. Consecutive quantized
+    layers in a :class:`ivy.Sequential` pass int8 outputs to each other, requantized
+    in the epilogue of the first layer. The returned module is in evaluation and
+    inference mode, and the original module is left unchanged.
+
+    Parameters
+    ----------
+    module
+        The built module to quantize.
+    calibration_data
+        Iterable of input batches, each an array or a tuple of positional arguments
+        of the module.
+
+    Returns
+    -------
+    ret
+        The quantized module.
+
+    Examples
+    --------
+    >>> model = ivy.Sequential(ivy.Linear(4, 8), ivy.ReLU(), ivy.Linear(8, 2))
+    >>> batches = [ivy.random_normal(shape=(16, 4)) for _ in range(4)]
+    >>> quantized = ivy.quantize_module(model, batches)
+    >>> quantized.v.submodules.v0.w.dtype
+    int8
+    """
+    module = copy.deepcopy(module)
+    module.eval()
+    input_scales = _calibrate(module, calibration_data)
+    if id(module) in input_scales:
+        module = _QUANTIZED_LAYERS[module.__class__].from_float(
+            module, input_scales[id(module)]
+        )
+    else:
+        module = _quantize_layers(module, input_scales)
+    module.eval()
+    return module
@@ -1,7 +1,10 @@
 # global
+import numpy as np
 from hypothesis import strategies as st
 
 # local
+import ivy
+import ivy.functional.frontends.jax as jax_frontend
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_frontend_test
 
@@ -136,6 +139,8 @@ def test_jax_map(
     ),
     length=st.integers(min_value=-10, max_value=10),
     init=st.integers(min_value=-10, max_value=10),
+    reverse=st.booleans(),
+    unroll=st.integers(min_value=1, max_value=4),
     test_with_out=st.just(False),
 )
 def test_jax_scan(
@@ -143,6 +148,8 @@ def test_jax_scan(
     dtype_and_x,
     length,
     init,
+    reverse,
+    unroll,
     test_flags,
     on_device,
     fn_tree,
@@ -167,9 +174,49 @@ def test_jax_scan(
         init=init,
         xs=x[0],
         length=length,
+        reverse=reverse,
+        unroll=unroll,
     )
 
 
+def test_jax_scan_pytrees(backend_fw):
+    ivy.set_backend(backend_fw)
+    xs = np.arange(12, dtype=np.float32).reshape(6, 2)
+
+    def _step(carry, x):
+        return carry + x["a"], (x["a"] * 2, {"b": x["b"] + carry[0]})
+
+    for reverse in [False, True]:
+        for unroll in [1, 4, True]:
+            carry, (doubled, nested) = jax_frontend.lax.scan(
+                _step,
+                np.zeros(2, dtype=np.float32),
+                {"a": xs, "b": xs[:, 0]},
+                reverse=reverse,
+                unroll=unroll,
+            )
+            assert np.allclose(ivy.to_numpy(carry.ivy_array), xs.sum(axis=0))
+            assert np.allclose(ivy.to_numpy(doubled.ivy_array), xs * 2)
+            # the carry seen at step i is the sum of the rows scanned before it
+            before = np.cumsum(xs[::-1] if reverse else xs, axis=0)[:-1, 0]
+            before = np.concatenate([[0.0], before])
+            expected = xs[:, 0] + (before[::-1] if reverse else before)
+            assert np.allclose(ivy.to_numpy(nested["b"].ivy_array), expected)
+
+    carry, ys = jax_frontend.lax.scan(lambda c, _: (c + 1, None), 0, None, length=5)
+    assert int(carry) == 5 and ys is None
+
+    # an empty scan stacks its outputs along an empty leading axis
+    carry, ys = jax_frontend.lax.scan(
+        lambda c, x: (c + x, (x, x[:1] * c)), 0.0, np.zeros((0, 3), dtype=np.float32)
+    )
+    assert float(carry) == 0.0
+    assert ys[0].shape == (0, 3) and ys[1].shape == (0, 1)
+    ys = jax_frontend.lax.map(lambda x: x * 2, np.zeros((0,), dtype=np.float32))
+    assert ys.shape == (0,) and ys.dtype == "float32"
+    ivy.previous_backend()
+
+
 @handle_frontend_test(
     fn_tree="jax.lax.switch",
     dtype_and_x=helpers.dtype_and_values(
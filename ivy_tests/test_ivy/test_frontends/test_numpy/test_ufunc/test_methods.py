@@ -1,8 +1,10 @@
 # global
 from hypothesis import assume, strategies as st, given
 import numpy as np
+import pytest
 
 # local
+import ivy
 import ivy.functional.frontends.numpy as np_frontend
 from ivy.functional.frontends.numpy.ufunc import (
     ufuncs,
@@ -19,7 +21,49 @@ def generate_ufunc(draw, ufuncs=ufuncs):
     return draw(st.sampled_from(ufuncs))
 
 
-# identity
+def _to_numpy(x):
+    return ivy.to_numpy(x.ivy_array) if hasattr(x, "ivy_array") else np.asarray(x)
+
+
+# --- Main --- #
+# ------------ #
+
+
+# accumulate
+@pytest.mark.parametrize("ufunc_name", ["add", "maximum", "logaddexp", "subtract"])
+def test_numpy_accumulate(ufunc_name, backend_fw):
+    ivy.set_backend(backend_fw)
+    x = np.random.default_rng(0).uniform(-5, 5, (3, 6, 4))
+    for axis in [0, 1, -1]:
+        ret = getattr(np_frontend, ufunc_name).accumulate(x, axis=axis)
+        expected = getattr(np, ufunc_name).accumulate(x, axis=axis)
+        assert np.allclose(_to_numpy(ret), expected)
+    ret = getattr(np_frontend, ufunc_name).accumulate(np.zeros((0, 2)))
+    assert _to_numpy(ret).shape == (0, 2)
+    ivy.previous_backend()
+
+
+# at
+@pytest.mark.parametrize("ufunc_name", ["add", "maximum", "multiply", "subtract"])
+def test_numpy_at(ufunc_name, backend_fw):
+    ivy.set_backend(backend_fw)
+    # repeated indices are applied once per occurrence
+    x = np.arange(1.0, 7.0)
+    indices = [0, 1, 1, 5, 1, -1]
+    frontend_x = np_frontend.array(x)
+    getattr(np_frontend, ufunc_name).at(frontend_x, indices, [2.0, 3, 4, 1, 2, 1.5])
+    getattr(np, ufunc_name).at(x, indices, [2.0, 3, 4, 1, 2, 1.5])
+    assert np.allclose(_to_numpy(frontend_x), x)
+
+    x = np.arange(12.0).reshape(3, 4)
+    frontend_x = np_frontend.array(x)
+    indices = (np.array([0, 0, 2]), slice(1, 3))
+    getattr(np_frontend, ufunc_name).at(frontend_x, indices, 3.0)
+    getattr(np, ufunc_name).at(x, indices, 3.0)
+    assert np.allclose(_to_numpy(frontend_x), x)
+    ivy.previous_backend()
+
+
 @given(
     ufunc_name=generate_ufunc(),
 )
@@ -69,3 +113,59 @@ def test_numpy_nout(
     frontend_ufunc = getattr(np_frontend, ufunc_name)
     np_ufunc = getattr(np, ufunc_name)
     assert frontend_ufunc.nout == np_ufunc.nout
+
+
+# outer
+def test_numpy_outer(backend_fw):
+    ivy.set_backend(backend_fw)
+    a, b = np.arange(3.0), np.arange(8.0).reshape(2, 4)
+    for ufunc_name in ["multiply", "subtract", "maximum"]:
+        ret = getattr(np_frontend, ufunc_name).outer(a, b)
+        expected = getattr(np, ufunc_name).outer(a, b)
+        assert np.allclose(_to_numpy(ret), expected)
+    ivy.previous_backend()
+
+
+# reduce
+@pytest.mark.parametrize("ufunc_name", ["add", "maximum", "logaddexp", "subtract"])
+def test_numpy_reduce(ufunc_name, backend_fw):
+    ivy.set_backend(backend_fw)
+    x = np.random.default_rng(0).uniform(-5, 5, (3, 5, 4))
+    frontend_ufunc = getattr(np_frontend, ufunc_name)
+    np_ufunc = getattr(np, ufunc_name)
+    for axis in [0, 1, 2]:
+        for keepdims in [False, True]:
+            ret = frontend_ufunc.reduce(x, axis=axis, keepdims=keepdims)
+            expected = np_ufunc.reduce(x, axis=axis, keepdims=keepdims)
+            assert np.allclose(_to_numpy(ret), expected)
+    ret = frontend_ufunc.reduce(x, axis=2, where=x > 0, initial=-10.0)
+    expected = np_ufunc.reduce(x, axis=2, where=x > 0, initial=-10.0)
+    assert np.allclose(_to_numpy(ret), expected)
+    out = np_frontend.zeros((3, 5))
+    ret = frontend_ufunc.reduce(x, axis=2, out=out)
+    expected = np_ufunc.reduce(x, axis=2)
+    assert np.allclose(_to_numpy(ret), expected)
+    assert np.allclose(_to_numpy(out), expected)
+    if ufunc_name == "subtract":
+        with pytest.raises(ValueError):
+            frontend_ufunc.reduce(x, axis=None)
+    else:
+        ret = frontend_ufunc.reduce(x, axis=(0, 2))
+        assert np.allclose(_to_numpy(ret), np_ufunc.reduce(x, axis=(0, 2)))
+    ivy.previous_backend()
+
+
+# reduceat
+@pytest.mark.parametrize("ufunc_name", ["add", "maximum", "subtract"])
+def test_numpy_reduceat(ufunc_name, backend_fw):
+    ivy.set_backend(backend_fw)
+    x = np.random.default_rng(0).uniform(-5, 5, (10, 3))
+    # decreasing and repeated indices select a single element
+    for indices in [[0, 4, 1, 5, 7], [0, 3, 3, 8], [9]]:
+        ret = getattr(np_frontend, ufunc_name).reduceat(x, indices)
+        expected = getattr(np, ufunc_name).reduceat(x, indices)
+        assert np.allclose(_to_numpy(ret), expected)
+    ret = getattr(np_frontend, ufunc_name).reduceat(x, [0, 2], axis=1)
+    expected = getattr(np, ufunc_name).reduceat(x, [0, 2], axis=1)
+    assert np.allclose(_to_numpy(ret), expected)
+    ivy.previous_backend()
@@ -4,13 +4,68 @@ import pytest
 import numpy as np
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
+from ivy.functional.frontends.pandas import DataFrame
 from ivy_tests.test_ivy.helpers import handle_frontend_method
 
 
 CLASS_TREE = "ivy.functional.frontends.pandas.DataFrame"
 
 
+def test_pandas_dataframe_columns(backend_fw):
+    ivy.set_backend(backend_fw)
+    x = DataFrame({"a": ivy.array([1, 2, 3]), "b": ivy.array([0.5, 1.5, 2.5])})
+    assert [c.dtype for c in x._data] == [ivy.int32, ivy.float32]
+    # columns are views of the frame
+    assert x["a"].array is x._data[0]
+    y = DataFrame(ivy.arange(6).reshape((3, 2)), columns=["p", "q"])
+    assert y["q"].array.to_list() == [1, 3, 5]
+    x["c"] = 7
+    assert x.columns == ["a", "b", "c"]
+    assert x[x["a"].array > 1]["c"].array.to_list() == [7, 7]
+    assert x.sum().array.to_list() == [6.0, 4.5, 21.0]
+    ivy.previous_backend()
+
+
+def test_pandas_dataframe_groupby(backend_fw):
+    ivy.set_backend(backend_fw)
+    x = DataFrame({"k": [2, 1, 2, 3], "v": [1.0, 2.0, np.nan, 4.0], "w": [1, 2, 3, 4]})
+    assert x[["w", "k"]].array.to_list() == [[1, 2], [2, 1], [3, 2], [4, 3]]
+    assert x.loc[[0, 2], "w"].array.to_list() == [1, 3]
+    grouped = x.groupby("k")
+    ret = grouped.sum()
+    assert ret.columns == ["v", "w"]
+    assert ret.index.to_list() == [1, 2, 3]
+    assert ret.array.to_list() == [[2.0, 2.0], [1.0, 4.0], [4.0, 4.0]]
+    assert grouped.count().array.to_list() == [[1, 1], [1, 2], [1, 1]]
+    assert grouped.mean()["w"].array.to_list() == [2.0, 2.0, 4.0]
+    assert grouped["v"].mean().array.to_list() == [2.0, 1.0, 4.0]
+    ivy.previous_backend()
+
+
+def test_pandas_dataframe_lazy(backend_fw):
+    ivy.set_backend(backend_fw)
+    x = DataFrame({"a": [1, 2, 3, 4, 5], "b": [0.5, np.nan, 2.5, 3.5, 4.5]})
+    assert x.eval("a * 2 + b").array.to_list()[2] == 8.5
+    assert x.eval("c = a * 10")["c"].array.to_list() == [10, 20, 30, 40, 50]
+    assert x.query("a > 1 and not b > 4").index.to_list() == [1, 2, 3]
+    chain = x.lazy(chunksize=2).assign(c="a * b").query("2 <= a <= 4")[["a", "c"]]
+    assert chain.collect().index.to_list() == [1, 2, 3]
+    assert chain.sum().array.to_list() == [9.0, 21.5]
+    assert chain.count().array.to_list() == [3, 2]
+    assert chain.mean().array.to_list() == [3.0, 10.75]
+    assert chain.max().array.to_list() == [4.0, 14.0]
+    with pytest.raises(NameError):
+        x.lazy().query("d > 1").collect()
+    with pytest.raises(ValueError):
+        x.eval("a.__class__")
+    assert x.query("a > 3", inplace=True) is None
+    assert x.index.to_list() == [3, 4]
+    assert x["b"].array.to_list() == [3.5, 4.5]
+    ivy.previous_backend()
+
+
 @pytest.mark.skip("Testing pipeline not yet implemented")
 @handle_frontend_method(
     class_tree=CLASS_TREE,
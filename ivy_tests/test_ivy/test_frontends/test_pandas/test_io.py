@@ -0,0 +1,37 @@
+# global
+import io
+import pytest
+
+# local
+import ivy
+import ivy.functional.frontends.pandas as pd_frontend
+
+
+def test_pandas_read_csv(backend_fw, monkeypatch):
+    ivy.set_backend(backend_fw)
+    # blocks of a few lines, so that a column changes dtype across them
+    monkeypatch.setattr(pd_frontend.io, "_BLOCK_SIZE", 16)
+    rows = [f"{i % 3},{i},{i / 2 if i != 5 else ''},{i % 2 == 0}" for i in range(10)]
+    text = "\n".join(["k,a,b,f"] + rows + ["3,10.5,1.0,True"]) + "\n"
+    x = pd_frontend.read_csv(io.StringIO(text))
+    assert x.columns == ["k", "a", "b", "f"]
+    assert [c.dtype for c in x._data] == [ivy.int64, ivy.float64, ivy.float64, ivy.bool]
+    assert x["a"].array.to_list()[-2:] == [9.0, 10.5]
+    assert ivy.isnan(x["b"].array[5])
+    chunks = list(
+        pd_frontend.read_csv(io.StringIO(text), chunksize=4, usecols=["b", "k"])
+    )
+    assert [len(c.index) for c in chunks] == [4, 4, 3]
+    assert chunks[2].index.to_list() == [8, 9, 10]
+    assert chunks[0].columns == ["k", "b"]
+    x = pd_frontend.read_csv(io.StringIO("1;2\n3;4\n"), sep=";", names=["p", "q"])
+    assert x["q"].array.to_list() == [2, 4]
+    assert pd_frontend.read_csv(io.StringIO(text), nrows=3).index.to_list() == [0, 1, 2]
+    # a header without rows
+    x = pd_frontend.read_csv(io.StringIO("k,a\n"))
+    assert x.columns == ["k", "a"] and len(x.index) == 0
+    assert len(list(pd_frontend.read_csv(io.StringIO("k,a\n"), chunksize=2))) == 1
+    assert pd_frontend.read_csv(io.StringIO("")).columns == []
+    with pytest.raises(NotImplementedError):
+        pd_frontend.read_csv(io.StringIO(text), index_col=0)
+    ivy.previous_backend()
@@ -4,7 +4,9 @@ import numpy as np
 import pytest
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
+from ivy.functional.frontends.pandas import Series
 from ivy_tests.test_ivy.helpers import handle_frontend_method
 
 
@@ -84,6 +86,42 @@ def test_pandas_series_add(
     )
 
 
+def test_pandas_series_groupby(backend_fw):
+    ivy.set_backend(backend_fw)
+    x = Series([1.0, 2.0, np.nan, 4.0, 5.0], index=["a", "b", "c", "d", "e"])
+    grouped = x.groupby(["y", "x", "y", np.nan, "x"])
+    assert grouped.sum().index.to_list() == ["x", "y"]
+    assert grouped.sum().array.to_list() == [7.0, 1.0]
+    assert grouped.count().array.to_list() == [2, 1]
+    assert grouped.mean().array.to_list() == [3.5, 1.0]
+    grouped = x.groupby([3, 1, 3, 2, 1], sort=False)
+    assert grouped.sum().index.to_list() == [3, 1, 2]
+    assert grouped.mean().array.to_list() == [1.0, 3.5, 4.0]
+    ivy.previous_backend()
+
+
+def test_pandas_series_loc(backend_fw):
+    ivy.set_backend(backend_fw)
+    x = Series([1, 2, 3, 4], index=["a", "b", "a", "c"])
+    assert x["b"] == 2
+    assert x.loc["c"] == 4
+    assert x["a"].array.to_list() == [1, 3]
+    assert x.loc["b":"c"].array.to_list() == [2, 3, 4]
+    assert "c" in x.index and "d" not in x.index
+    with pytest.raises(KeyError):
+        x.loc["d"]
+    assert x.loc[["b", "c"]].array.to_list() == [2, 4]
+    assert x.loc[["c", "a"]].index.to_list() == ["c", "a", "a"]
+    assert x.loc[["c", "a"]].array.to_list() == [4, 1, 3]
+    assert x.index.get_indexer_non_unique(["a", "d"])[1].to_list() == [1]
+    with pytest.raises(KeyError):
+        x.loc[["a", "d"]]
+    x = Series([10, 20, 30], index=[7, 3, 5])
+    assert x.loc[[5, 7]].array.to_list() == [30, 10]
+    assert x.index.get_indexer([3, 4, 7]).to_list() == [1, -1, 0]
+    ivy.previous_backend()
+
+
 @pytest.mark.xfail(reason="testing pipeline fixes")
 @handle_frontend_method(
     class_tree=CLASS_TREE,
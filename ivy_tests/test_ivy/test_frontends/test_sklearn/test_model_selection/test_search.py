@@ -0,0 +1,37 @@
+import numpy as np
+
+import ivy
+from ivy.functional.frontends.sklearn.model_selection import (
+    GridSearchCV,
+    ParameterGrid,
+    cross_val_score,
+)
+from ivy.functional.frontends.sklearn.tree import DecisionTreeClassifier
+
+
+def test_sklearn_parameter_grid():
+    grid = ParameterGrid([{"b": [1, 2], "a": ["x"]}, {"c": [None]}])
+    assert len(grid) == 3
+    assert list(grid) == [{"a": "x", "b": 1}, {"a": "x", "b": 2}, {"c": None}]
+
+
+def test_sklearn_grid_search_cv(backend_fw):
+    ivy.set_backend(backend_fw)
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(150, 3)).astype(np.float32)
+    y = (x[:, 0] * x[:, 1] > 0).astype(np.int64)
+    grid = {"max_depth": [1, 3], "criterion": ["gini", "entropy"]}
+    search = GridSearchCV(DecisionTreeClassifier(), grid, cv=3, n_jobs=2).fit(x, y)
+
+    results = search.cv_results_
+    assert [p["max_depth"] for p in results["params"]] == [1, 3, 1, 3]
+    for i, params in enumerate(results["params"]):
+        scores = cross_val_score(DecisionTreeClassifier(**params), x, y, cv=3)
+        assert np.isclose(float(results["mean_test_score"][i]), np.mean(scores))
+    assert search.best_params_["max_depth"] == 3
+    assert int(results["rank_test_score"][search.best_index_]) == 1
+    assert search.best_estimator_.get_depth() == 3
+    assert np.array_equal(
+        np.asarray(search.predict(x)), np.asarray(search.best_estimator_.predict(x))
+    )
+    ivy.previous_backend()
@@ -0,0 +1,70 @@
+import numpy as np
+
+import ivy
+from ivy.functional.frontends.sklearn.model_selection import (
+    KFold,
+    StratifiedKFold,
+    check_cv,
+    cross_val_score,
+    cross_validate,
+)
+from ivy.functional.frontends.sklearn.tree import (
+    DecisionTreeClassifier,
+    DecisionTreeRegressor,
+)
+
+
+def _data():
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(120, 3)).astype(np.float32)
+    y = (x[:, 0] + x[:, 1] > 0).astype(np.int64)
+    return x, y
+
+
+def test_sklearn_cross_val_score(backend_fw):
+    ivy.set_backend(backend_fw)
+    x, y = _data()
+    clf = DecisionTreeClassifier(max_depth=2)
+    serial = np.asarray(cross_val_score(clf, x, y, cv=3))
+    # the folds evaluated by worker processes score as those evaluated in process
+    parallel = np.asarray(cross_val_score(clf, x, y, cv=3, n_jobs=2))
+    assert np.array_equal(serial, parallel)
+
+    # the folds of a classifier are stratified, as in sklearn
+    assert isinstance(check_cv(3, y, classifier=True), StratifiedKFold)
+    assert type(check_cv(3, y)) is KFold
+    assert type(check_cv(3, x[:, 0], classifier=True)) is KFold
+    expected = []
+    for train, test in StratifiedKFold(3).split(x, y):
+        train, test = ivy.to_numpy(train), ivy.to_numpy(test)
+        fitted = DecisionTreeClassifier(max_depth=2).fit(x[train], y[train])
+        expected.append(np.mean(np.asarray(fitted.predict(x[test])) == y[test]))
+    assert np.allclose(serial, expected)
+    ivy.previous_backend()
+
+
+def test_sklearn_cross_validate(backend_fw):
+    ivy.set_backend(backend_fw)
+    x, _ = _data()
+    splits = [(np.arange(60, 120), np.arange(60)), (np.arange(60), np.arange(60, 120))]
+    ret = cross_validate(
+        DecisionTreeRegressor(max_depth=3),
+        x,
+        2 * x[:, 0],
+        cv=splits,
+        scoring="r2",
+        n_jobs=2,
+        return_train_score=True,
+        return_estimator=True,
+    )
+    assert set(ret) == {
+        "fit_time",
+        "score_time",
+        "test_score",
+        "train_score",
+        "estimator",
+    }
+    assert np.asarray(ret["test_score"]).shape == (2,)
+    assert np.all(np.asarray(ret["train_score"]) > 0.9)
+    assert [estimator.get_depth() for estimator in ret["estimator"]] == [3, 3]
+    ivy.previous_backend()
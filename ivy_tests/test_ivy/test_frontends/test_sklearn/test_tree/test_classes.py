@@ -0,0 +1,51 @@
+import numpy as np
+
+import ivy
+from ivy.functional.frontends.sklearn.tree import (
+    DecisionTreeClassifier,
+    DecisionTreeRegressor,
+)
+
+
+def test_sklearn_decision_tree_classifier(backend_fw):
+    ivy.set_backend(backend_fw)
+    x = np.array([[0.0, 5.0], [1.0, 4.0], [2.0, 3.0], [3.0, 2.0], [4.0, 1.0]])
+    y = np.array([0, 0, 1, 1, 2])
+    clf = DecisionTreeClassifier().fit(x, y)
+    tree = clf.tree_
+    # nodes are numbered depth-first, as in sklearn
+    assert tree.node_count == 5 and clf.get_depth() == 2 and clf.get_n_leaves() == 3
+    assert ivy.to_numpy(tree.children_left).tolist() == [1, -1, 3, -1, -1]
+    assert ivy.to_numpy(tree.children_right).tolist() == [2, -1, 4, -1, -1]
+    # thresholds are halfway between the values on either side of a split
+    assert ivy.to_numpy(tree.threshold).tolist() == [1.5, -2.0, 3.5, -2.0, -2.0]
+    assert np.array_equal(np.asarray(clf.predict(x)), y)
+    assert np.array_equal(np.asarray(clf.apply(x)), [1, 1, 3, 3, 4])
+    assert np.allclose(np.asarray(clf.predict_proba([[2.5, 0.0]])), [[0, 1, 0]])
+    path = np.asarray(clf.decision_path(x[:1]))
+    assert path.tolist() == [[True, True, False, False, False]]
+
+    shallow = DecisionTreeClassifier(max_depth=1, criterion="entropy").fit(x, y)
+    assert shallow.tree_.node_count == 3
+    assert np.allclose(np.asarray(shallow.predict_proba(x[4:])), [[0, 2 / 3, 1 / 3]])
+    ivy.previous_backend()
+
+
+def test_sklearn_decision_tree_regressor(backend_fw):
+    ivy.set_backend(backend_fw)
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(200, 3)).astype(np.float32)
+    y = np.where(x[:, 1] > 0.2, 3.0, -1.0) + 0.1 * x[:, 0]
+    reg = DecisionTreeRegressor(max_depth=1).fit(x, y)
+    assert int(reg.tree_.feature[0]) == 1
+    right = x[:, 1] > float(reg.tree_.threshold[0])
+    assert np.allclose(np.asarray(reg.predict(x))[right], y[right].mean())
+    importances = ivy.to_numpy(reg.feature_importances_)
+    assert np.allclose(importances, [0.0, 1.0, 0.0])
+
+    # leaves hold at least min_samples_leaf samples
+    reg = DecisionTreeRegressor(min_samples_leaf=20).fit(x, y)
+    leaves = ivy.to_numpy(reg.tree_.children_left) == -1
+    assert ivy.to_numpy(reg.tree_.n_node_samples)[leaves].min() >= 20
+    assert np.mean((np.asarray(reg.predict(x)) - y) ** 2) < 0.01
+    ivy.previous_backend()
@@ -0,0 +1,114 @@
+# global
+import numpy as np
+import pytest
+
+# local
+import ivy
+import ivy.functional.frontends.tensorflow as tf_frontend
+
+
+def _rows():
+    return [[0.0, 1.0, 2.0], [], [3.0, 4.0, 5.0, 6.0], [7.0, 8.0, 9.0]]
+
+
+def _ragged():
+    values = np.arange(10, dtype=np.float32)
+    return tf_frontend.ragged.RaggedTensor.from_row_splits(values, [0, 3, 3, 7, 10])
+
+
+def test_tensorflow_ragged_factories(backend_fw):
+    ivy.set_backend(backend_fw)
+    RaggedTensor = tf_frontend.ragged.RaggedTensor
+    values = np.arange(10, dtype=np.float32)
+    ragged = [
+        _ragged(),
+        RaggedTensor.from_row_lengths(values, [3, 0, 4, 3]),
+        RaggedTensor.from_value_rowids(values, [0, 0, 0, 2, 2, 2, 2, 3, 3, 3], nrows=4),
+        RaggedTensor.from_row_starts(values, [0, 3, 3, 7]),
+        RaggedTensor.from_row_limits(values, [3, 3, 7, 10]),
+    ]
+    for rt in ragged:
+        assert rt.to_list() == _rows()
+        assert ivy.to_numpy(rt.row_splits.ivy_array).tolist() == [0, 3, 3, 7, 10]
+        assert ivy.to_numpy(rt.row_lengths().ivy_array).tolist() == [3, 0, 4, 3]
+        assert int(rt.nrows().ivy_array) == 4
+    with pytest.raises(Exception):
+        RaggedTensor.from_row_splits(values, [0, 3, 11])
+    ivy.previous_backend()
+
+
+def test_tensorflow_ragged_reductions(backend_fw):
+    ivy.set_backend(backend_fw)
+    rt = _ragged()
+    rows = _rows()
+    for name, fn, empty in [
+        ("reduce_sum", np.sum, 0.0),
+        ("reduce_mean", np.mean, np.nan),
+        ("reduce_min", np.min, np.finfo(np.float32).max),
+        ("reduce_max", np.max, np.finfo(np.float32).min),
+    ]:
+        ret = getattr(tf_frontend.math, name)(rt, axis=1)
+        expected = [fn(row) if row else empty for row in rows]
+        assert np.allclose(ivy.to_numpy(ret.ivy_array), expected, equal_nan=True)
+    assert float(tf_frontend.math.reduce_sum(rt).ivy_array) == 45.0
+    assert tf_frontend.math.reduce_sum(rt, axis=1, keepdims=True).shape == (4, 1)
+
+    # int rows take the lowest value of their dtype as their empty maximum, and
+    # their mean is a float
+    for dtype in [np.int32, np.uint8]:
+        rt = tf_frontend.ragged.RaggedTensor.from_row_lengths(
+            np.array([0, 5, 3, 200, 7], dtype=dtype), [2, 0, 3]
+        )
+        ret = tf_frontend.math.reduce_max(rt, axis=1).ivy_array
+        assert ret.dtype == np.dtype(dtype).name
+        assert ivy.to_numpy(ret).tolist() == [5, np.iinfo(dtype).min, 200]
+        ret = tf_frontend.math.reduce_mean(rt, axis=1).ivy_array
+        assert ivy.is_float_dtype(ret)
+        assert np.allclose(ivy.to_numpy(ret), [2.5, np.nan, 70.0], equal_nan=True)
+
+    # reducing an inner dimension keeps the rows ragged
+    values = np.arange(12, dtype=np.int32).reshape(6, 2)
+    inner = tf_frontend.ragged.RaggedTensor.from_row_lengths(values, [2, 0, 4])
+    assert tf_frontend.math.reduce_sum(inner, axis=2).to_list() == [
+        [1, 5],
+        [],
+        [9, 13, 17, 21],
+    ]
+    ivy.previous_backend()
+
+
+def test_tensorflow_ragged_to_tensor(backend_fw):
+    ivy.set_backend(backend_fw)
+    rt = _ragged()
+    expected = np.zeros((4, 4), dtype=np.float32)
+    for i, row in enumerate(_rows()):
+        expected[i, : len(row)] = row
+    assert np.array_equal(ivy.to_numpy(rt.to_tensor().ivy_array), expected)
+    ret = rt.to_tensor(default_value=-1, shape=[3, 2])
+    assert np.array_equal(
+        ivy.to_numpy(ret.ivy_array), [[0.0, 1.0], [-1.0, -1.0], [3.0, 4.0]]
+    )
+    nested = tf_frontend.ragged.RaggedTensor.from_row_splits(rt, [0, 1, 4])
+    assert nested.to_tensor().shape == (2, 3, 4)
+    ivy.previous_backend()
+
+
+def test_tensorflow_ragged_gather_and_map_flat_values(backend_fw):
+    ivy.set_backend(backend_fw)
+    rt = _ragged()
+    rows = _rows()
+    assert tf_frontend.gather(rt, [3, 1, 0]).to_list() == [rows[3], rows[1], rows[0]]
+    assert rt[1:3].to_list() == rows[1:3]
+    assert ivy.to_numpy(rt[-1].ivy_array).tolist() == rows[-1]
+    nested = tf_frontend.ragged.RaggedTensor.from_row_splits(rt, [0, 1, 4])
+    assert tf_frontend.gather(nested, [1, 0]).to_list() == [rows[1:], rows[:1]]
+
+    squared = tf_frontend.ragged.map_flat_values(tf_frontend.math.square, rt)
+    assert squared.to_list() == [[v**2 for v in row] for row in rows]
+    assert (rt * 2 + 1).to_list() == [[v * 2 + 1 for v in row] for row in rows]
+    negated = [
+        [[-v for v in row] for row in rows[:1]],
+        [[-v for v in row] for row in rows[1:]],
+    ]
+    assert (-nested).to_list() == negated
+    ivy.previous_backend()
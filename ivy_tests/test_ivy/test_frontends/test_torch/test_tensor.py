@@ -7551,6 +7551,46 @@ def test_torch_tensor_grad_fn(backend_fw):
     ivy.previous_backend()
 
 
+def test_torch_tensor_grad_fn_vjp(backend_fw):
+    ivy.set_backend(backend_fw)
+    x_np = np.array([[1.0, -2.0, 3.0], [0.5, 4.0, -1.0]], dtype=np.float32)
+    w_np = np.array([0.5, -1.0, 2.0], dtype=np.float32)
+    x = Tensor(x_np, requires_grad=True)
+    w = Tensor(w_np, requires_grad=True)
+    # w is broadcast over the rows, y is used twice, and the rows are indexed with a
+    # repeated index
+    y = (x * w).relu()
+    z = (y + y * y)[[0, 0, 1]].sum()
+    z.backward()
+    y_np = np.maximum(x_np * w_np, 0)
+    rows = np.array([2.0, 1.0], dtype=np.float32)[:, None]
+    dy = rows * (1 + 2 * y_np) * (x_np * w_np > 0)
+    assert np.allclose(ivy.to_numpy(x.grad.ivy_array), dy * w_np, rtol=1e-5)
+    assert np.allclose(ivy.to_numpy(w.grad.ivy_array), (dy * x_np).sum(0), rtol=1e-5)
+    ivy.utils.assertions.check_equal(
+        z.grad_fn.next_functions[0], "IndexBackward", as_array=False
+    )
+
+    # gradients accumulate in .grad across backward passes
+    (x * 2.0).sum().backward()
+    assert np.allclose(ivy.to_numpy(x.grad.ivy_array), dy * w_np + 2.0, rtol=1e-5)
+
+    # a rounded division has no gradient, unlike a true division
+    for rounding_mode in [None, "floor", "trunc"]:
+        a = Tensor(x_np, requires_grad=True)
+        b = Tensor(w_np, requires_grad=True)
+        a.div(b, rounding_mode=rounding_mode).sum().backward()
+        expected = 1 / w_np if rounding_mode is None else 0.0
+        assert np.allclose(
+            ivy.to_numpy(a.grad.ivy_array), expected * np.ones_like(x_np)
+        )
+        expected = -(x_np / w_np**2).sum(0) if rounding_mode is None else 0.0
+        assert np.allclose(
+            ivy.to_numpy(b.grad.ivy_array), expected * np.ones_like(w_np), rtol=1e-5
+        )
+    ivy.previous_backend()
+
+
 # greater
 @handle_frontend_method(
     class_tree=CLASS_TREE,
@@ -13313,6 +13353,21 @@ def test_torch_tensor_where(
     )
 
 
+def test_torch_tensor_wraps_native(backend_fw):
+    ivy.set_backend(backend_fw)
+    x = ivy.native_array([1.0, 2.0, 3.0])
+    # the native array is wrapped in an ivy array, without a copy
+    t = Tensor(x, _init_overload=True)
+    assert t.ivy_array.data is x
+    t.ivy_array = x
+    assert t.ivy_array.data is x
+    y = t.add(x)
+    assert isinstance(y, Tensor)
+    assert not hasattr(y, "__dict__")
+    assert np.allclose(ivy.to_numpy(y.ivy_array), [2.0, 4.0, 6.0])
+    ivy.previous_backend()
+
+
 # xlogy
 @handle_frontend_method(
     class_tree=CLASS_TREE,
@@ -0,0 +1,48 @@
+import numpy as np
+
+import ivy
+from ivy.functional.frontends.xgboost.core import Booster
+from ivy.functional.frontends.xgboost.tree import bin_data, quantile_cuts
+
+
+def test_xgboost_gbtree(backend_fw):
+    ivy.set_backend(backend_fw)
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(2000, 4)).astype(np.float32)
+    y = ((x[:, 0] > 0.3) ^ (x[:, 1] > -0.5)).astype(np.float32)
+    data, label = ivy.array(x), ivy.array(y[:, None])
+
+    cuts = quantile_cuts(data, max_bin=16)
+    binned = bin_data(data, cuts)
+    assert cuts.shape == (4, 15) and binned.shape == (4, 2000)
+    assert binned.dtype == ivy.uint8 and int(ivy.max(binned)) == 15
+    # a value in a bin up to b is below the cut b
+    b = ivy.to_numpy(binned[0])
+    assert np.all(x[b <= 7, 0] < ivy.to_numpy(cuts[0, 7]))
+    assert np.all(x[b > 7, 0] >= ivy.to_numpy(cuts[0, 7]))
+    # more than 256 bins do not wrap around
+    binned = bin_data(data, quantile_cuts(data, max_bin=1024))
+    assert binned.dtype == ivy.int32 and int(ivy.max(binned)) == 1023
+
+    params = {
+        "booster": "gbtree",
+        "base_score": None,
+        "scale_pos_weight": None,
+        "max_depth": 3,
+    }
+    bst = Booster(params, cache=[data, label])
+    for i in range(10):
+        bst.update(data, label, i)
+    assert bst.gbm.boosted_rounds() == 10
+    # an xor of two thresholds is learnt by trees, and not by a linear model
+    accuracy = ivy.mean((bst.predict(data) == label).astype("float32"))
+    assert float(accuracy) > 0.97
+
+    # the margins kept for the training rows are those of the array-encoded trees
+    margin = bst.gbm.pred(data)
+    assert ivy.allclose(margin, bst.gbm.pred(ivy.array(x)), rtol=1e-5, atol=1e-5)
+    feature, threshold, left, right, value = bst.gbm.trees[0]
+    leaves = ivy.to_numpy(feature) < 0
+    assert np.all(ivy.to_numpy(left)[leaves] == -1)
+    assert np.all(ivy.to_numpy(right)[~leaves] == ivy.to_numpy(left)[~leaves] + 1)
+    ivy.previous_backend()
@@ -1,6 +1,11 @@
 # global
+import gc
 import os
+import shutil
 import queue
+import threading
+import time
+import weakref
 import pytest
 import random
 import numpy as np
@@ -1191,6 +1196,93 @@ def test_container_from_queues(on_device):
     del container
 
 
+def test_container_from_queues_with_prefetching(on_device):
+    queue_load_sizes = [1, 2, 1, 1]
+    queues = [queue.Queue() for _ in queue_load_sizes]
+
+    container = Container(
+        queues=queues,
+        queue_load_sizes=queue_load_sizes,
+        queue_timeout=0.25,
+        queue_prefetch_size=2,
+        queue_cache_size=2,
+    )
+
+    # nothing has arrived yet
+    queue_was_empty = False
+    try:
+        container[0]
+    except queue.Empty:
+        queue_was_empty = True
+    assert queue_was_empty
+
+    for i, (q, load_size) in enumerate(zip(queues, queue_load_sizes)):
+        q.put(
+            {"a": [ivy.array([1.0, 2.0, 3.0], device=on_device) * (i + 1)] * load_size}
+        )
+
+    assert np.allclose(ivy.to_numpy(container[0].a), np.array([1.0, 2.0, 3.0]))
+    assert np.allclose(ivy.to_numpy(container[1].a), np.array([2.0, 4.0, 6.0]))
+    assert np.allclose(ivy.to_numpy(container[2].a), np.array([2.0, 4.0, 6.0]))
+    assert np.allclose(ivy.to_numpy(container[3].a), np.array([3.0, 6.0, 9.0]))
+    assert np.allclose(ivy.to_numpy(container[4].a), np.array([4.0, 8.0, 12.0]))
+
+    queue_stats = container.cont_queue_stats
+    assert queue_stats["num_loaded"] == 4
+    assert queue_stats["num_evicted"] >= 2
+    assert queue_stats["num_waits"] <= 4
+    assert len(container._loaded_containers_from_queues) <= 2
+
+    container.cont_stop_queue_prefetching()
+    assert not container._queue_prefetchers
+
+
+def test_container_from_queues_prefetching_without_lock(on_device):
+    queues = [queue.Queue() for _ in range(3)]
+    container = Container(
+        queues=queues,
+        queue_load_sizes=[1, 1, 1],
+        queue_timeout=5.0,
+        queue_prefetch_size=1,
+    )
+
+    # the query blocks on the third queue while the first one is prefetched
+    query = threading.Thread(target=lambda: container[2])
+    query.start()
+    queues[0].put({"a": [ivy.array([1.0], device=on_device)]})
+    start_time = time.perf_counter()
+    while 0 not in container._loaded_containers_from_queues:
+        assert time.perf_counter() - start_time < 2.0
+        time.sleep(0.01)
+    assert query.is_alive()
+    queues[2].put({"a": [ivy.array([3.0], device=on_device)]})
+    query.join()
+    assert 2 in container._loaded_containers_from_queues
+    container.cont_stop_queue_prefetching()
+
+
+def test_container_from_queues_prefetching_is_collected(on_device):
+    container = Container(
+        queues=[queue.Queue() for _ in range(4)],
+        queue_load_sizes=[1, 1, 1, 1],
+        queue_timeout=0.1,
+        queue_prefetch_size=2,
+    )
+    prefetchers = list(container._queue_prefetchers)
+    container_ref = weakref.ref(container)
+    del container
+    gc.collect()
+    # a prefetch thread only holds the container between two waits on its queue
+    start_time = time.perf_counter()
+    while container_ref() is not None:
+        assert time.perf_counter() - start_time < 2.0
+        time.sleep(0.01)
+        gc.collect()
+    for prefetcher in prefetchers:
+        prefetcher.join(timeout=2.0)
+        assert not prefetcher.is_alive()
+
+
 def test_container_from_tuple(on_device):
     tuple_in = (
         ivy.array([1], device=on_device),
@@ -1205,6 +1297,76 @@ def test_container_from_tuple(on_device):
     assert np.allclose(ivy.to_numpy(container.it_1.it_1), np.array([3]))
 
 
+def test_container_hashes(on_device):
+    container0 = Container(
+        {
+            "a": ivy.array([1], device=on_device),
+            "b": {
+                "c": ivy.array([2], device=on_device),
+                "d": ivy.array([3], device=on_device),
+            },
+        }
+    )
+    container1 = container0.cont_deep_copy()
+    container2 = container0.cont_deep_copy()
+    container2["b/d"] = ivy.array([4], device=on_device)
+    container3 = container0.cont_deep_copy()
+    container3["b/d"] = ivy.array([3, 4], device=on_device)
+
+    # content
+    assert container0.cont_content_hash() == container1.cont_content_hash()
+    assert container0.cont_content_hash() != container2.cont_content_hash()
+    assert ivy.Container.cont_identical(
+        [container0, container1], same_arrays=False, arrays_equal=True
+    )
+    assert not ivy.Container.cont_identical(
+        [container0, container2], same_arrays=False, arrays_equal=True
+    )
+
+    # structure
+    assert container0.cont_structure_hash() == container2.cont_structure_hash()
+    assert container0.cont_structure_hash() != container3.cont_structure_hash()
+    assert ivy.Container.cont_identical_structure([container0, container2])
+    assert not ivy.Container.cont_identical_structure([container0, container3])
+
+    # mutation invalidates the cached hashes of all ancestors
+    container2.b.d = ivy.array([3], device=on_device)
+    assert container0.cont_content_hash() == container2.cont_content_hash()
+    assert not ivy.Container.cont_diff(container0, container2, mode="diff_only")
+    del container2["a"]
+    assert container0.cont_structure_hash() != container2.cont_structure_hash()
+    assert not ivy.Container.cont_identical_structure([container0, container2])
+
+    # deduplication
+    unique, inverse = ivy.Container.cont_unique(
+        [container0, container1, container3, container0], return_inverse=True
+    )
+    assert len(unique) == 2
+    assert inverse == [0, 0, 1, 0]
+
+
+def test_container_hashes_with_inplace_updates(on_device):
+    container0 = Container(
+        {"a": ivy.array([1.0], device=on_device), "b": {"c": ivy.array([2.0])}}
+    )
+    container1 = container0.cont_deep_copy()
+    container0.cont_content_hash()
+    container1.cont_content_hash()
+    container0.cont_structure_hash()
+    container1.cont_structure_hash()
+
+    # leaves updated inplace are compared by value, and not through stale hashes
+    ivy.inplace_update(container0.a, ivy.array([5.0], device=on_device))
+    assert not ivy.Container.cont_identical([container0, container1], same_arrays=False)
+    assert ivy.Container.cont_diff(container0, container1, mode="diff_only")
+    assert container0.cont_content_hash() != container1.cont_content_hash()
+
+    # as are leaves whose data is replaced with data of another shape
+    container0.b.c.data = ivy.native_array([2.0, 3.0], device=on_device)
+    assert container0.cont_structure_hash() != container1.cont_structure_hash()
+    assert not ivy.Container.cont_identical_structure([container0, container1])
+
+
 def test_container_has_key(on_device):
     dict_in = {
         "a": ivy.array([1], device=on_device),
@@ -1506,6 +1668,35 @@ def test_container_inplace(on_device):
             assert og_ids == op_ids  # value ids
 
 
+def test_container_key_chain_index(on_device):
+    container = Container(
+        {
+            "a": ivy.array([1], device=on_device),
+            "b": {"c": {"d": ivy.array([2], device=on_device)}},
+        }
+    )
+
+    # keys are found as plain attributes, without shadowing methods
+    assert "a" in vars(container)
+    container["cont_map"] = ivy.array([3], device=on_device)
+    assert "cont_map" not in vars(container)
+    assert callable(container.cont_map)
+
+    # the indexed key-chains are invalidated on mutation of any sub-container
+    assert np.allclose(ivy.to_numpy(container["b/c/d"]), np.array([2]))
+    container.b.c.d = ivy.array([4], device=on_device)
+    assert np.allclose(ivy.to_numpy(container["b.c.d"]), np.array([4]))
+    assert np.allclose(ivy.to_numpy(container.b.c.d), np.array([4]))
+    del container.b["c"]
+    assert "b/c/d" not in container
+    assert container.cont_at_key_chain("b/c/d", ignore_key_errors=True) is None
+    container.b.update({"e": ivy.array([5], device=on_device)})
+    assert np.allclose(ivy.to_numpy(container["b/e"]), np.array([5]))
+    assert np.allclose(ivy.to_numpy(container.b.pop("e")), np.array([5]))
+    assert "e" not in vars(container.b)
+    assert "b/e" not in container
+
+
 @pytest.mark.parametrize("include_empty", [True, False])
 def test_container_key_chains_containing(include_empty, on_device):
     a_val = Container() if include_empty else ivy.array([1], device=on_device)
@@ -1811,6 +2002,37 @@ def test_container_multi_map(on_device):
     assert np.allclose(ivy.to_numpy(container_mapped["d"].f), 3)
 
 
+def test_container_multi_map_in_function(on_device):
+    container0 = Container(
+        {
+            "a": ivy.array([1.0], device=on_device),
+            "b": {"c": ivy.array([2.0], device=on_device)},
+        }
+    )
+    container1 = container0 * 2
+    arr = ivy.array([5.0], device=on_device)
+
+    # repeated calls with the same argument structure reuse the cached plan
+    for _ in range(2):
+        ret = Container.cont_multi_map_in_function(
+            "concat", [container0, arr, container1], axis=0
+        )
+        assert np.allclose(ivy.to_numpy(ret.a), np.array([1.0, 5.0, 2.0]))
+        assert np.allclose(ivy.to_numpy(ret.b.c), np.array([2.0, 5.0, 4.0]))
+
+    # containers at a different position of the same function
+    ret = Container.cont_multi_map_in_function("concat", (arr, container0), axis=0)
+    assert np.allclose(ivy.to_numpy(ret.a), np.array([5.0, 1.0]))
+    assert np.allclose(ivy.to_numpy(ret.b.c), np.array([5.0, 2.0]))
+
+    # containers passed as keyword arguments
+    ret = Container.cont_multi_map_in_function(
+        "clip", container1, x_min=container0, x_max=3.0
+    )
+    assert np.allclose(ivy.to_numpy(ret.a), np.array([2.0]))
+    assert np.allclose(ivy.to_numpy(ret.b.c), np.array([3.0]))
+
+
 def test_container_num_arrays(on_device):
     dict_in = {
         "a": ivy.array([[0.0, 1.0, 2.0, 3.0]], device=on_device),
@@ -3024,6 +3246,71 @@ def test_container_to_and_from_disk_as_pickled(on_device):
     os.remove(save_filepath)
 
 
+def test_container_to_and_from_disk_as_shards(on_device):
+    save_dirpath = "container_on_disk_as_shards"
+    dict_in = {
+        "a": ivy.array([[1.0, 2.0], [3.0, 4.0]], device=on_device),
+        "b": {
+            "c": ivy.array(5, dtype="int32", device=on_device),
+            "d": ivy.array([True, False], device=on_device),
+            "e": "string",
+        },
+        "f": ivy.zeros((64,), device=on_device),
+    }
+    container = Container(dict_in)
+
+    # saving, with a and f in shards of their own, and c and d sharing one
+    container.cont_to_disk_as_shards(save_dirpath, max_shard_size=8)
+    assert os.path.exists(os.path.join(save_dirpath, "index.json"))
+    assert len([f for f in os.listdir(save_dirpath) if f.endswith(".bin")]) == 3
+
+    # loading
+    loaded_container = Container.cont_from_disk_as_shards(save_dirpath)
+    assert loaded_container.cont_all_key_chains() == container.cont_all_key_chains()
+    for kc, value in container.cont_to_iterator():
+        loaded_value = loaded_container[kc]
+        if kc == "b/e":
+            assert loaded_value == value
+            continue
+        assert loaded_value.shape == value.shape
+        assert loaded_value.dtype == value.dtype
+        assert np.array_equal(ivy.to_numpy(loaded_value), ivy.to_numpy(value))
+
+    # partial loading
+    loaded_container = Container.cont_from_disk_as_shards(
+        save_dirpath, key_chains=["b/c", "a"]
+    )
+    assert loaded_container.cont_all_key_chains() == ["a", "b/c"]
+    assert np.array_equal(ivy.to_numpy(loaded_container.b.c), 5)
+    loaded_container = Container.cont_from_disk_as_shards(save_dirpath, key_chains="b")
+    assert loaded_container.cont_all_key_chains() == ["b/c", "b/d", "b/e"]
+
+    # saving in the background
+    writer = container.cont_to_disk_as_shards(save_dirpath, background=True)
+    writer.join()
+    loaded_container = Container.cont_load(save_dirpath, format="shards")
+    assert np.array_equal(ivy.to_numpy(loaded_container.a), ivy.to_numpy(container.a))
+
+    # overwriting leaves only the shards of the new index, and a failed overwrite
+    # leaves the previous checkpoint loadable
+    assert len([f for f in os.listdir(save_dirpath) if f.endswith(".bin")]) == 1
+    container.cont_to_disk_as_shards(save_dirpath, max_shard_size=8)
+    assert len([f for f in os.listdir(save_dirpath) if f.endswith(".bin")]) == 3
+
+    def _failing_leaves():
+        yield "a", np.ones((2, 2))
+        raise IOError("disk full")
+
+    with pytest.raises(IOError):
+        ivy.data_classes.container.base._write_shards(
+            save_dirpath, _failing_leaves(), 8
+        )
+    loaded_container = Container.cont_from_disk_as_shards(save_dirpath)
+    assert np.array_equal(ivy.to_numpy(loaded_container.f), ivy.to_numpy(container.f))
+
+    shutil.rmtree(save_dirpath)
+
+
 def test_container_to_dict(on_device):
     container0 = Container(
         {
@@ -0,0 +1,82 @@
+# global
+import numpy as np
+import pytest
+
+# local
+import ivy
+
+
+def _values(loader, key="x"):
+    return [v for batch in loader for v in ivy.to_numpy(batch[key]).tolist()]
+
+
+# Tests #
+# ------#
+
+
+def test_dataset_pipeline(backend_fw):
+    ivy.set_backend(backend_fw)
+    ds = (
+        ivy.data.Dataset.from_generator(lambda: ({"x": i} for i in range(20)))
+        .filter(lambda e: e["x"] % 2 == 0)
+        .map(lambda e: {"x": e["x"] * 10})
+        .batch(3)
+    )
+    assert [b["x"].tolist() for b in ds] == [
+        [0, 20, 40],
+        [60, 80, 100],
+        [120, 140, 160],
+        [180],
+    ]
+    assert [b["x"].tolist() for b in ds] == [b["x"].tolist() for b in ds]
+
+    # the shards hold every example exactly once, whatever the pipeline
+    sharded = [e for i in range(3) for b in ds.shard(3, i) for e in b["x"].tolist()]
+    assert sorted(sharded) == list(range(0, 200, 20))
+    assert [b["x"].tolist() for b in ds.shard(3, 1)] == [[40, 100, 160]]
+    ivy.previous_backend()
+
+
+def test_dataset_shuffle(backend_fw):
+    ivy.set_backend(backend_fw)
+    ds = ivy.data.Dataset.from_arrays({"x": np.arange(50)}).shuffle(8, seed=0)
+    first = [int(e["x"]) for e in ds]
+    assert first == [int(e["x"]) for e in ds]
+    assert sorted(first) == list(range(50))
+    assert first != list(range(50))
+    ivy.previous_backend()
+
+
+def test_dataset_from_npy(backend_fw, tmp_path):
+    ivy.set_backend(backend_fw)
+    path = str(tmp_path / "x.npy")
+    np.save(path, np.arange(24.0).reshape(12, 2))
+    ds = ivy.data.Dataset.from_arrays({"x": path, "y": np.arange(12)}).batch(5)
+    batches = list(ds)
+    assert [b["x"].shape for b in batches] == [(5, 2), (5, 2), (2, 2)]
+    assert np.array_equal(batches[1]["y"], np.arange(5, 10))
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        list(ivy.data.Dataset.from_arrays({"x": path, "y": np.arange(3)}))
+    ivy.previous_backend()
+
+
+@pytest.mark.parametrize("num_workers", [0, 1, 3])
+@pytest.mark.parametrize("worker_type", ["thread", "process"])
+def test_data_loader(num_workers, worker_type, backend_fw):
+    ivy.set_backend(backend_fw)
+    ds = ivy.data.Dataset.from_arrays({"x": np.arange(30.0)}).batch(4)
+    loader = ivy.data.DataLoader(ds, num_workers=num_workers, worker_type=worker_type)
+    values = _values(loader)
+    assert sorted(values) == list(range(30))
+    # the order is deterministic for a given number of workers
+    assert values == _values(loader)
+    assert isinstance(next(iter(loader)), ivy.Container)
+
+    failing = ds.map(lambda b: b["missing"])
+    loader = ivy.data.DataLoader(
+        failing, num_workers=num_workers, worker_type=worker_type
+    )
+    exception = KeyError if num_workers == 0 else ivy.utils.exceptions.IvyException
+    with pytest.raises(exception):
+        list(loader)
+    ivy.previous_backend()
@@ -0,0 +1,109 @@
+# global
+import numpy as np
+
+# local
+import ivy
+
+
+def _rows():
+    return [[1.0, 2.0, 3.0], [], [4.0, 5.0]]
+
+
+def _nested(rows):
+    return ivy.NestedArray.nested_array(
+        [ivy.array(row, dtype="float32") for row in rows]
+    )
+
+
+def _to_lists(nested):
+    return [ivy.to_numpy(row).tolist() for row in nested.data]
+
+
+# Tests #
+# ------#
+
+
+def test_nested_array_packing(backend_fw):
+    ivy.set_backend(backend_fw)
+    rows = _rows()
+    nested = _nested(rows)
+    assert ivy.to_numpy(nested.flat_values).tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert ivy.to_numpy(nested.row_splits).tolist() == [0, 3, 3, 5]
+
+    # the nested lists are rebuilt from the packed values without loss
+    for packed in [
+        ivy.NestedArray.from_flat_values(nested.flat_values, nested.nested_row_splits),
+        ivy.NestedArray.from_row_lengths(nested.flat_values, [3, 0, 2]),
+    ]:
+        assert packed.shape == [3, None]
+        assert _to_lists(packed) == rows
+
+    # as are those of several nested dimensions, and of inner dimensions
+    values = np.arange(12, dtype=np.float32).reshape(6, 2)
+    inner = ivy.NestedArray.from_row_lengths(values, [2, 0, 4])
+    outer = ivy.NestedArray.from_row_splits(inner, [0, 1, 3])
+    assert outer.shape == [2, None, None, 2]
+    assert [len(row) for row in outer.data] == [1, 2]
+    assert ivy.to_numpy(outer.data[1][1]).tolist() == values[2:].tolist()
+    repacked = ivy.NestedArray.nested_array(outer.data, nested_rank=2)
+    assert np.array_equal(ivy.to_numpy(repacked.flat_values), values)
+    assert [ivy.to_numpy(s).tolist() for s in repacked.nested_row_splits] == [
+        [0, 1, 3],
+        [0, 2, 2, 6],
+    ]
+    ivy.previous_backend()
+
+
+def test_nested_array_elementwise(backend_fw):
+    ivy.set_backend(backend_fw)
+    rows = _rows()
+    nested = _nested(rows)
+
+    # elementwise functions run once on the packed values
+    ret = ivy.exp(nested)
+    assert ret._data is None
+    assert ivy.to_numpy(ret.row_splits).tolist() == [0, 3, 3, 5]
+    assert np.allclose(ivy.to_numpy(ret.flat_values), np.exp([1.0, 2.0, 3.0, 4.0, 5.0]))
+    assert _to_lists(ivy.multiply(ivy.add(nested, nested), 2.0)) == [
+        [v * 4 for v in row] for row in rows
+    ]
+
+    # nested arrays with other row splits are mapped row by row
+    other = _nested([[1.0], [], [2.0]])
+    assert _to_lists(ivy.add(nested, other)) == [[2.0, 3.0, 4.0], [], [6.0, 7.0]]
+    ivy.previous_backend()
+
+
+def test_nested_array_ragged_reduce(backend_fw):
+    ivy.set_backend(backend_fw)
+    nested = _nested(_rows())
+    lowest, highest = np.finfo(np.float32).min, np.finfo(np.float32).max
+
+    # empty rows reduce as the segment reductions do
+    for reduction, expected in [
+        ("sum", [6.0, 0.0, 9.0]),
+        ("mean", [2.0, np.nan, 4.5]),
+        ("min", [1.0, highest, 4.0]),
+        ("max", [3.0, lowest, 5.0]),
+    ]:
+        for ret in [
+            nested.ragged_reduce(reduction),
+            getattr(ivy, reduction)(nested, axis=1),
+            getattr(ivy, reduction)(nested, axis=-1),
+        ]:
+            assert np.allclose(ivy.to_numpy(ret), expected, equal_nan=True)
+
+    # the lowest value of the dtype is the maximum of empty unsigned rows
+    unsigned = ivy.NestedArray.from_row_lengths(
+        ivy.array([1, 7, 3, 4, 0], dtype="uint8"), [3, 0, 2]
+    )
+    assert ivy.to_numpy(unsigned.ragged_reduce("max")).tolist() == [7, 0, 4]
+
+    # reducing the innermost of several nested dimensions keeps the others
+    values = np.arange(6, dtype=np.float32)
+    inner = ivy.NestedArray.from_row_lengths(values, [2, 0, 4])
+    outer = ivy.NestedArray.from_row_splits(inner, [0, 1, 3])
+    ret = ivy.sum(outer, axis=2)
+    assert ivy.to_numpy(ret.flat_values).tolist() == [1.0, 0.0, 14.0]
+    assert ivy.to_numpy(ret.row_splits).tolist() == [0, 1, 3]
+    ivy.previous_backend()
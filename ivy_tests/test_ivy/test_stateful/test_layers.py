@@ -4,6 +4,7 @@
 import numpy as np
 from hypothesis import assume
 from hypothesis import strategies as st
+import pytest
 
 # local
 import ivy
@@ -11,6 +12,7 @@ import ivy_tests.test_ivy.helpers as helpers
 from ivy.data_classes.container import Container
 from ivy.functional.ivy.gradients import _variable
 from ivy.functional.ivy.layers import _deconv_length
+from ivy.stateful.mixed_precision import _HALF_PRECISION_BACKENDS
 from ivy_tests.test_ivy.helpers import handle_method
 from ivy_tests.test_ivy.helpers.assertions import assert_same_type_and_shape
 from ivy_tests.test_ivy.test_functional.test_experimental.test_nn import (
@@ -1552,6 +1554,89 @@ def test_multi_head_attention_layer(
     assert_same_type_and_shape([ret_np_flat, ret_np_from_gt_flat])
 
 
+# autocast
+@pytest.mark.parametrize("model", ["linear", "conv"])
+def test_autocast(model):
+    if model == "linear":
+        module = ivy.Sequential(
+            ivy.Linear(8, 16), ivy.ReLU(), ivy.LayerNorm([16]), ivy.Linear(16, 4)
+        )
+        x = ivy.random_uniform(shape=(4, 8))
+    else:
+        module = ivy.Sequential(
+            ivy.Conv2D(3, 8, [3, 3], 1, "SAME"),
+            ivy.ReLU(),
+            ivy.BatchNorm2D(8),
+            ivy.Conv2D(8, 4, [1, 1], 1, "SAME"),
+        )
+        x = ivy.random_uniform(shape=(2, 6, 6, 3))
+    ref = module(x)
+    with ivy.Autocast("float16"):
+        assert ivy.autocast_dtype() == "float16"
+        ret = module(x)
+    assert ivy.autocast_dtype() is None
+
+    # the linear and conv layers run in float16 on the backends with half precision
+    # kernels, the norms in float32, and the variables are left in full precision
+    half = ivy.current_backend_str() in _HALF_PRECISION_BACKENDS
+    assert ret.dtype == ("float16" if half else "float32")
+    assert all(w.dtype == "float32" for w in module.v.cont_to_flat_list())
+    assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(ref), atol=1e-2, rtol=1e-2)
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        ivy.set_autocast_dtype("float32")
+
+
+# quantize_module
+@pytest.mark.parametrize("model", ["linear", "NHWC", "NCHW"])
+def test_quantize_module(model):
+    if model == "linear":
+        module = ivy.Sequential(
+            ivy.Linear(16, 32), ivy.ReLU(), ivy.Linear(32, 32), ivy.Linear(32, 4)
+        )
+        x = ivy.random_normal(shape=(8, 16))
+        quantized_types = (ivy.QuantizedLinear,)
+    else:
+        module = ivy.Sequential(
+            ivy.Conv2D(3, 8, [3, 3], 1, "SAME", data_format=model),
+            ivy.ReLU(),
+            ivy.Conv2D(8, 8, [1, 1], 1, "SAME", data_format=model, with_bias=False),
+            ivy.Conv2D(8, 4, [3, 3], 1, "SAME", data_format=model),
+        )
+        x = ivy.random_normal(shape=(4, 8, 8, 3) if model == "NHWC" else (4, 3, 8, 8))
+        quantized_types = (ivy.QuantizedConv2D,)
+    module.eval()
+    ret = ivy.to_numpy(module(x))
+
+    quantized = ivy.quantize_module(module, [ivy.random_normal(shape=x.shape), x])
+    layers = list(quantized)
+    assert isinstance(layers[0], quantized_types)
+    assert quantized.v.submodules.v0.w.dtype == "int8"
+    # consecutive quantized layers are chained through int8 outputs
+    assert layers[2]._output_scale == layers[3]._input_scale
+    assert layers[0]._output_scale is None
+    assert np.abs(ivy.to_numpy(quantized(x)) - ret).max() < 0.05 * np.abs(ret).max()
+    # the original module is left unchanged
+    assert np.allclose(ivy.to_numpy(module(x)), ret)
+
+
+# QuantizedLinear
+def test_quantized_linear_blocks():
+    # a depth beyond the exact range of float32 is accumulated in blocks, exactly
+    rng = np.random.default_rng(0)
+    w = rng.integers(-127, 128, size=(4, 3000)).astype(np.int8)
+    x = ivy.array(rng.integers(-127, 128, size=(2, 3000)).astype(np.float32))
+    v = ivy.Container(w=ivy.array(w), w_scale=ivy.ones((4,)), b=ivy.zeros((4,)))
+    layer = ivy.QuantizedLinear(3000, 4, input_scale=1.0, v=v)
+    assert len(layer._bounds) == 3
+    expected = (ivy.to_numpy(x).astype(np.int64) @ w.T.astype(np.int64)).astype(
+        np.float32
+    )
+    assert np.array_equal(ivy.to_numpy(layer(x)), expected)
+    # the weight blocks are cast again once the weight is replaced
+    layer.v.w = ivy.array(-w)
+    assert np.array_equal(ivy.to_numpy(layer(x)), -expected)
+
+
 # # Sequential #
 @handle_method(
     method_tree="Sequential.__call__",
@@ -2,6 +2,7 @@
 
 # global
 import os
+import shutil
 from hypothesis import given, strategies as st
 import numpy as np
 
@@ -324,6 +325,118 @@ def test_module_height(batch_shape, input_channels, output_channels, on_device):
     assert module._dl1._l1.mod_height() == 0
 
 
+# module inference mode
+@given(
+    batch_shape=helpers.get_shape(
+        min_num_dims=2, max_num_dims=2, min_dim_size=1, max_dim_size=2
+    ),
+    input_channels=st.integers(min_value=2, max_value=5),
+    output_channels=st.integers(min_value=2, max_value=5),
+)
+def test_module_inference_mode(batch_shape, input_channels, output_channels, on_device):
+    x = ivy.astype(
+        ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
+        "float32",
+    )
+    module = WithNestedModules(input_channels, output_channels, device=on_device)
+    ret = module(x)
+    new_v = module.v.cont_map(lambda v, kc: v * 2)
+    new_ret = module(x, v=new_v)
+
+    with module.inference_mode():
+        assert module._inference
+        assert module._dl0._l0._inference
+        assert np.allclose(ivy.to_numpy(module(x)), ivy.to_numpy(ret))
+        # variables passed to the top module reach the submodules
+        assert np.allclose(ivy.to_numpy(module(x, v=new_v)), ivy.to_numpy(new_ret))
+        assert np.allclose(ivy.to_numpy(module(x)), ivy.to_numpy(ret))
+        # tracking still runs when explicitly requested
+        module(x, track_submod_call_order=True)
+        assert module.submod_call_order
+    assert not module._inference
+    assert not module._dl0._l0._inference
+
+    module.eval()
+    assert module._dl1._l1._inference
+    module.v = new_v
+    assert np.allclose(ivy.to_numpy(module(x)), ivy.to_numpy(new_ret))
+    module.train()
+    assert not module._dl1._l1._inference
+
+
+# module activation checkpointing
+@given(
+    batch_shape=helpers.get_shape(
+        min_num_dims=2, max_num_dims=2, min_dim_size=1, max_dim_size=2
+    ),
+    input_channels=st.integers(min_value=2, max_value=5),
+    output_channels=st.integers(min_value=2, max_value=5),
+)
+def test_module_checkpoint_activations(
+    batch_shape, input_channels, output_channels, on_device
+):
+    x = ivy.astype(
+        ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
+        "float32",
+    )
+    module = WithNestedModules(input_channels, output_channels, device=on_device)
+    new_v = module.v.cont_map(lambda v, kc: v * 2)
+    ret = module(x)
+    new_ret = module(x, v=new_v)
+
+    assert module._dl0.checkpoint_activations() is module._dl0
+    module._dl1._l1.checkpoint_activations()
+    assert np.allclose(ivy.to_numpy(module(x)), ivy.to_numpy(ret))
+    # variables passed to the top module reach the checkpointed submodules
+    assert np.allclose(ivy.to_numpy(module(x, v=new_v)), ivy.to_numpy(new_ret))
+
+    if ivy.current_backend_str() == "numpy":
+        # NumPy does not support gradients
+        return
+
+    def loss_fn(v_):
+        return ivy.mean(module(x, v=v_))
+
+    _, grads = ivy.execute_with_gradients(loss_fn, module.v)
+    module._dl0.checkpoint_activations(False)
+    module._dl1._l1.checkpoint_activations(False)
+    _, ref_grads = ivy.execute_with_gradients(loss_fn, module.v)
+    for kc, grad in grads.cont_to_iterator():
+        assert np.allclose(ivy.to_numpy(grad), ivy.to_numpy(ref_grads[kc]))
+
+
+# module rebuild
+def test_module_rebuild(on_device):
+    module = WithNestedModules(2, 3, device=on_device)
+    # only the attributes which may hold submodules are registered, in order
+    attrs = list(module._submodule_attrs)
+    assert attrs.index("_dl0") < attrs.index("_dl1")
+    assert "v" not in attrs
+    v = module.v
+
+    # replacing a submodule and rebuilding only creates the variables of the new
+    # submodule, and reuses those of the others
+    module._dl1 = DoubleLinear(64, 64, device=on_device)
+    module.build()
+    assert module.v.dl0.l0.w is v.dl0.l0.w
+    assert module.v.dl0.l1.b is v.dl0.l1.b
+    assert module.v.dl1.l0.w is not v.dl1.l0.w
+    assert module.v.dl1.l1.w.shape == v.dl1.l1.w.shape
+    assert module._dl1 in module._sub_mods
+    assert module(ivy.ones((1, 2), device=on_device)).shape == (1, 64)
+
+    # the submodules are built again once the default dtype has changed
+    ivy.set_default_float_dtype("float64")
+    module.build()
+    ivy.unset_default_float_dtype()
+    assert module.v.dl0.l0.w is not v.dl0.l0.w
+    assert all(x.dtype == "float64" for x in module.v.cont_to_iterator_values())
+
+    # deleted attributes are no longer searched for submodules
+    del module._dl1
+    assert "_dl1" not in module._submodule_attrs
+
+
 @given(
     batch_shape=helpers.get_shape(
         min_num_dims=2, max_num_dims=2, min_dim_size=1, max_dim_size=2
@@ -373,6 +486,42 @@ def test_module_save_and_load_as_pickled(
     os.remove(save_filepath)
 
 
+@given(
+    batch_shape=helpers.get_shape(
+        min_num_dims=2, max_num_dims=2, min_dim_size=1, max_dim_size=2
+    ),
+    input_channels=st.integers(min_value=2, max_value=5),
+    output_channels=st.integers(min_value=2, max_value=5),
+)
+def test_module_save_and_load_checkpoint(
+    batch_shape, input_channels, output_channels, on_device
+):
+    save_dirpath = "module_checkpoint"
+    x = ivy.astype(
+        ivy.linspace(ivy.zeros(batch_shape), ivy.ones(batch_shape), input_channels),
+        "float32",
+    )
+    module = TrainableModule(input_channels, output_channels, device=on_device)
+    module.save_checkpoint(save_dirpath, max_shard_size=64)
+    assert os.path.exists(os.path.join(save_dirpath, "index.json"))
+
+    # partial loading only replaces the variables at the given key chains
+    loaded_module = TrainableModule(input_channels, output_channels, device=on_device)
+    linear1_w = loaded_module.v.linear1.w
+    loaded_module.load_checkpoint(save_dirpath, key_chains="linear0")
+    assert np.allclose(
+        ivy.to_numpy(loaded_module.v.linear0.w), ivy.to_numpy(module.v.linear0.w)
+    )
+    assert loaded_module.v.linear1.w is linear1_w
+
+    # loading in full, after writing in the background
+    module.save_checkpoint(save_dirpath, background=True).join()
+    loaded_module.load_checkpoint(save_dirpath)
+    assert np.allclose(ivy.to_numpy(loaded_module(x)), ivy.to_numpy(module(x)))
+
+    shutil.rmtree(save_dirpath)
+
+
 @given(dummy=st.booleans())
 def test_module_to_device(dummy, on_device):
     model = TrainableModule(5, 5)
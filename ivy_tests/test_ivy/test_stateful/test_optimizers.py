@@ -2,8 +2,11 @@
 
 # global
 from hypothesis import strategies as st
+import numpy as np
+import pytest
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_method
 from ivy_tests.test_ivy.test_functional.test_core.test_gradients import (
@@ -75,6 +78,152 @@ def test_adam_optimizer(
     )
 
 
+# flat
+@pytest.mark.parametrize(
+    ("optimizer", "kwargs"),
+    [
+        ("SGD", {}),
+        ("LARS", {"decay_lambda": 0.1}),
+        ("Adam", {}),
+        ("LAMB", {"decay_lambda": 0.1}),
+    ],
+)
+def test_flat_optimizer(optimizer, kwargs, on_device):
+    v = ivy.Container(
+        a=ivy.array([[0.5, -1.0], [2.0, 1.5]], device=on_device),
+        b={
+            "c": ivy.array([1.0, -2.0, 3.0], device=on_device),
+            "d": ivy.array([4.0, 5.0], dtype="float64", device=on_device),
+        },
+    )
+    grads = [v * 0.1, v * -0.2, v * 0.3]
+    optimizer_cls = getattr(ivy, optimizer)
+    ref, flat = optimizer_cls(lr=0.1, **kwargs), optimizer_cls(
+        lr=0.1, flat=True, **kwargs
+    )
+    ref_v, flat_v = v.cont_deep_copy(), v.cont_deep_copy()
+    for g in grads[:2]:
+        ref_v = ref.step(ref_v, g)
+        flat_v = flat.step(flat_v, g)
+
+    # the state round-trips into a new flat optimizer
+    loaded = optimizer_cls(lr=0.1, flat=True, **kwargs)
+    loaded.load_state_dict(flat.state_dict())
+    loaded_v = flat_v.cont_deep_copy()
+    ref_v = ref.step(ref_v, grads[2])
+    flat_v = flat.step(flat_v, grads[2])
+    loaded_v = loaded.step(loaded_v, grads[2])
+
+    assert flat_v.b.d.dtype == "float64"
+    for new_v in [flat_v, loaded_v]:
+        assert ivy.Container.cont_identical_structure([ref_v, new_v])
+        for (_, x), (_, y) in zip(ref_v.cont_to_iterator(), new_v.cont_to_iterator()):
+            assert x.shape == y.shape
+            assert np.allclose(ivy.to_numpy(x), ivy.to_numpy(y), rtol=1e-5, atol=1e-6)
+
+
+def test_flat_optimizer_inplace(on_device):
+    v = ivy.Container(
+        a=ivy.array([0.5, -1.0], device=on_device),
+        b={"c": ivy.array([1.0, -2.0, 3.0], device=on_device)},
+    )
+    optimizer = ivy.SGD(lr=0.1, flat=True)
+
+    # variables which are not the views returned by the previous step are updated
+    # in-place, as are the returned views when passed back
+    for step in range(1, 3):
+        new_v = optimizer.step(v, v.cont_map(lambda x, _: ivy.ones_like(x)))
+        for (_, x), (_, y) in zip(v.cont_to_iterator(), new_v.cont_to_iterator()):
+            assert np.allclose(ivy.to_numpy(x), ivy.to_numpy(y))
+        assert np.allclose(ivy.to_numpy(v.a), np.array([0.5, -1.0]) - 0.1 * step)
+
+    # the flags conflicting with flat mode are rejected
+    for kwargs in [{"inplace": False}, {"stop_gradients": False}]:
+        with pytest.raises(ivy.utils.exceptions.IvyException):
+            ivy.Adam(lr=0.1, flat=True, **kwargs)
+
+
+# loss scaler
+def test_loss_scaler(on_device):
+    v = ivy.Container(
+        a=ivy.array([0.5, -1.0], device=on_device),
+        b={"c": ivy.array([1.0, 2.0, 3.0], device=on_device)},
+    )
+    scaler = ivy.LossScaler(init_scale=8.0, growth_interval=2)
+    optimizer = ivy.SGD(lr=0.1)
+
+    # finite gradients are unscaled and applied, and the scale grows after two steps
+    grads = scaler.unscale(v * 8.0)
+    assert np.allclose(ivy.to_numpy(grads.b.c), [1.0, 2.0, 3.0])
+    new_v = scaler.step(optimizer, v.cont_deep_copy(), grads)
+    assert np.allclose(ivy.to_numpy(new_v.a), [0.45, -0.9])
+    assert scaler.scale == 8.0
+    scaler.step(optimizer, new_v, scaler.unscale(v * 8.0))
+    assert scaler.scale == 16.0
+
+    # a step with non-finite gradients is skipped, and the scale backs off
+    grads = v.cont_set_at_key_chain("a", ivy.array([np.inf, 1.0], device=on_device))
+    skipped_v = scaler.step(optimizer, new_v, scaler.unscale(grads))
+    assert skipped_v is new_v
+    assert scaler.scale == 8.0
+
+    # the loss returned by execute_with_gradients is unscaled
+    loss, _ = scaler.execute_with_gradients(lambda x: ivy.sum(x.a), v)
+    assert np.allclose(ivy.to_numpy(loss), -0.5)
+
+    loaded = ivy.LossScaler()
+    loaded.load_state_dict(scaler.state_dict())
+    assert loaded.scale == 8.0
+
+
+# gradient accumulator
+def test_gradient_accumulator(on_device, backend_fw):
+    ivy.set_backend(backend_fw)
+    v = ivy.Container(
+        w=ivy.array([0.5, -1.0], device=on_device),
+        b=ivy.array([0.25], device=on_device),
+    )
+    accumulator = ivy.GradientAccumulator(3)
+
+    # the gradients are summed into the same preallocated arrays on each accumulation
+    accumulator.accumulate(v)
+    acc = accumulator.accumulate(v * 2.0)
+    buffer = acc.w
+    assert np.allclose(ivy.to_numpy(acc.w), [1.5, -3.0])
+    accumulator.reset()
+    assert accumulator.grads is None
+    acc = accumulator.accumulate(v)
+    assert acc.w is buffer
+    assert np.allclose(ivy.to_numpy(acc.w), [0.5, -1.0])
+
+    # the micro-batch size must be given
+    with pytest.raises(TypeError):
+        ivy.GradientAccumulator()
+
+    if backend_fw == "numpy":
+        # NumPy does not support gradients
+        ivy.previous_backend()
+        return
+
+    # the losses of the micro-batches are weighted by their share of the batch
+    x = ivy.random_uniform(shape=(8, 2), device=on_device)
+    y = ivy.random_uniform(shape=(8, 1), device=on_device)
+
+    def loss_fn(v, x, y):
+        pred = ivy.matmul(x, ivy.expand_dims(v.w, axis=-1)) + v.b
+        return ivy.mean((pred - y) ** 2)
+
+    loss, grads = accumulator.execute_with_gradients(loss_fn, v, [x, y])
+    full_loss, full_grads = ivy.execute_with_gradients(lambda v: loss_fn(v, x, y), v)
+    assert np.allclose(ivy.to_numpy(loss), ivy.to_numpy(full_loss))
+    assert np.allclose(ivy.to_numpy(grads.w), ivy.to_numpy(full_grads.w))
+    assert np.allclose(ivy.to_numpy(grads.b), ivy.to_numpy(full_grads.b))
+    _, new_v = accumulator.step(ivy.SGD(lr=0.1), v, loss_fn, [x, y])
+    expected = ivy.to_numpy(v.w - full_grads.w * 0.1)
+    assert np.allclose(ivy.to_numpy(new_v.w), expected)
+    ivy.previous_backend()
+
+
 # lamb
 @handle_method(
     method_tree="LAMB._step",
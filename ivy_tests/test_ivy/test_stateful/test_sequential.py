@@ -4,6 +4,8 @@
 import itertools
 
 from hypothesis import strategies as st
+import numpy as np
+import pytest
 
 # local
 import ivy
@@ -25,6 +27,16 @@ class TrainableModule(ivy.Module):
 # --------------- #
 
 
+def _batch_norm(num_features, data_format="NSC"):
+    # batch norm with non-trivial running statistics and affine parameters
+    bn = ivy.BatchNorm2D(num_features, data_format=data_format)
+    bn.v.running_mean = ivy.random_normal(shape=(num_features,))
+    bn.v.running_var = ivy.random_uniform(low=0.5, high=2.0, shape=(num_features,))
+    bn.v.w = ivy.random_normal(shape=(num_features,))
+    bn.v.b = ivy.random_normal(shape=(num_features,))
+    return bn
+
+
 def _copy_weights(v1, v2):
     # copy weights from layer1 to layer2
     v2.w = ivy.copy_array(v1.w)
@@ -84,7 +96,7 @@ def test_sequential_construction_and_value(
 
     input_array = ivy.array(input_array, dtype="float32", device=on_device)
 
-    if "numpy" not in backend_fw.__name__:
+    if backend_fw != "numpy":
         _train(module, input_array)
 
 
@@ -111,7 +123,45 @@ def test_sequential_same_as_class(input_array, dims, backend_fw):
 
     input_array = ivy.array(input_array, dtype="float32")
 
-    if "numpy" not in backend_fw.__name__:
+    if backend_fw != "numpy":
         sequential_loss = _train(m_sequential, input_array)
         class_loss = _train(m_class, input_array)
         assert sequential_loss == class_loss
+
+
+@pytest.mark.parametrize("model", ["mlp", "conv"])
+def test_fuse_for_inference(model):
+    if model == "mlp":
+        norm = ivy.LayerNorm(16)
+        norm.v.weight = ivy.random_normal(shape=(16,))
+        norm.v.bias = ivy.random_normal(shape=(16,))
+        module = ivy.Sequential(
+            ivy.Linear(8, 16, with_bias=False),
+            _batch_norm(16),
+            ivy.ReLU(),
+            ivy.Dropout(0.5),
+            ivy.Sequential(norm, ivy.Linear(16, 8), ivy.GELU(), ivy.Identity()),
+            ivy.Linear(8, 3),
+        )
+        x = ivy.random_normal(shape=(4, 8))
+        num_fused = 4
+    else:
+        module = ivy.Sequential(
+            ivy.Conv2D(3, 8, [3, 3], 1, "SAME", data_format="NCHW"),
+            _batch_norm(8, "NCS"),
+            ivy.ReLU(),
+            ivy.Conv2D(8, 4, [3, 3], 1, "SAME", data_format="NCHW"),
+            _batch_norm(4, "NCS"),
+        )
+        x = ivy.random_normal(shape=(2, 3, 8, 8))
+        num_fused = 2
+    module.eval()
+    ret = ivy.to_numpy(module(x))
+
+    fused = ivy.fuse_for_inference(module)
+    assert len(list(fused)) == num_fused
+    assert not any(isinstance(m, (ivy.BatchNorm2D, ivy.Dropout)) for m in fused)
+    assert np.allclose(ivy.to_numpy(fused(x)), ret, atol=1e-5)
+    # the original module is left unchanged
+    assert len(list(module)) == (6 if model == "mlp" else 5)
+    assert np.allclose(ivy.to_numpy(module(x)), ret)
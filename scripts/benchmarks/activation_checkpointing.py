@@ -0,0 +1,84 @@
+"""
+Benchmark the peak memory of a training step with and without activation
+checkpointing, for a deep MLP and a conv stack.
+
+Each measurement runs in a fresh process, and the peak is the growth of the maximum
+resident set size over the gradient computation, after the model has been built.
+
+Usage: python scripts/benchmarks/activation_checkpointing.py [backend] [depth]
+"""
+
+import multiprocessing
+import resource
+import sys
+
+import ivy
+
+
+def _mlp(depth, width=1024):
+    return ivy.Sequential(
+        *[
+            ivy.Sequential(
+                ivy.Linear(width, width), ivy.GELU(), ivy.Linear(width, width)
+            )
+            for _ in range(depth)
+        ]
+    ), ivy.random_uniform(shape=(256, width))
+
+
+def _conv_stack(depth, channels=32):
+    return ivy.Sequential(
+        *[
+            ivy.Sequential(
+                ivy.Conv2D(channels, channels, [3, 3], 1, "SAME"),
+                ivy.ReLU(),
+                ivy.Conv2D(channels, channels, [3, 3], 1, "SAME"),
+            )
+            for _ in range(depth)
+        ]
+    ), ivy.random_uniform(shape=(8, 32, 32, channels))
+
+
+def _peak_mb():
+    # ru_maxrss is reported in kilobytes on linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _measure(backend, model_fn, depth, checkpoint, queue):
+    ivy.set_backend(backend)
+    module, x = model_fn(depth)
+    for block in module:
+        block.checkpoint_activations(checkpoint)
+
+    def loss_fn(v):
+        return ivy.mean(module(x, v=v))
+
+    baseline = _peak_mb()
+    ivy.execute_with_gradients(loss_fn, module.v)
+    queue.put(_peak_mb() - baseline)
+
+
+def _peak_growth(backend, model_fn, depth, checkpoint):
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(
+        target=_measure, args=(backend, model_fn, depth, checkpoint, queue)
+    )
+    process.start()
+    ret = queue.get()
+    process.join()
+    return ret
+
+
+def main(backend="torch", depth=16):
+    for name, model_fn in [("mlp", _mlp), ("conv", _conv_stack)]:
+        stored = _peak_growth(backend, model_fn, depth, False)
+        recomputed = _peak_growth(backend, model_fn, depth, True)
+        print(
+            f"{backend} {name} x{depth}: {stored:.0f}MB -> {recomputed:.0f}MB peak"
+            " during the gradient step"
+        )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:3]])
@@ -0,0 +1,116 @@
+"""
+Benchmark the input pipeline of a training loop, with the batches loaded in the loop
+itself and by prefetching worker threads and processes.
+
+Each example is decoded after a simulated read latency, as for files on disk or a
+network store. The training step is the forward pass of an MLP, and the input-bound
+fraction is the part of the epoch spent waiting for the next batch. The transfer of
+large batches from worker processes through shared memory is also compared with
+sending them pickled through a queue.
+
+Usage: python scripts/benchmarks/data_loader.py [backend] [num_workers]
+"""
+
+import multiprocessing
+import sys
+import time
+
+import numpy as np
+
+import ivy
+
+_NUM_EXAMPLES = 2048
+_BATCH_SIZE = 64
+_READ_LATENCY = 0.0005
+
+
+def _read(i):
+    time.sleep(_READ_LATENCY)
+    rng = np.random.default_rng(i)
+    image = rng.integers(0, 256, (32, 32, 3), dtype=np.uint8)
+    return {"image": (image.astype(np.float32) / 255.0).reshape(-1), "label": i % 10}
+
+
+def _dataset():
+    return (
+        ivy.data.Dataset.from_generator(lambda: range(_NUM_EXAMPLES))
+        .map(_read)
+        .batch(_BATCH_SIZE)
+    )
+
+
+def _epoch(model, loader):
+    waiting = 0.0
+    start = time.perf_counter()
+    batches = iter(loader)
+    while True:
+        wait_start = time.perf_counter()
+        batch = next(batches, None)
+        waiting += time.perf_counter() - wait_start
+        if batch is None:
+            break
+        model(batch.image)
+    return time.perf_counter() - start, waiting
+
+
+def _pickled_worker(batches, queue):
+    for batch in batches:
+        queue.put(batch)
+    queue.put(None)
+
+
+def _transfer(num_batches, shape):
+    arrays = {"x": np.random.uniform(size=(num_batches * shape[0], *shape[1:]))}
+    dataset = ivy.data.Dataset.from_arrays(arrays).batch(shape[0])
+    start = time.perf_counter()
+    for _ in ivy.data.DataLoader(dataset, num_workers=1):
+        pass
+    shared = time.perf_counter() - start
+
+    queue = multiprocessing.Queue(2)
+    process = multiprocessing.Process(
+        target=_pickled_worker, args=(iter(dataset), queue)
+    )
+    start = time.perf_counter()
+    process.start()
+    while queue.get() is not None:
+        pass
+    pickled = time.perf_counter() - start
+    process.join()
+    return shared, pickled
+
+
+def main(backend="numpy", num_workers=4):
+    ivy.set_backend(backend)
+    model = ivy.Sequential(
+        ivy.Linear(32 * 32 * 3, 512), ivy.ReLU(), ivy.Linear(512, 10)
+    )
+    for name, loader in [
+        ("in-loop", ivy.data.DataLoader(_dataset())),
+        (
+            f"{num_workers} threads",
+            ivy.data.DataLoader(
+                _dataset(), num_workers=num_workers, worker_type="thread"
+            ),
+        ),
+        (
+            f"{num_workers} processes",
+            ivy.data.DataLoader(_dataset(), num_workers=num_workers),
+        ),
+    ]:
+        total, waiting = _epoch(model, loader)
+        print(
+            f"{backend} {name}: {_NUM_EXAMPLES / total:.0f} examples/s,"
+            f" {100 * waiting / total:.0f}% of the epoch waiting for input"
+        )
+
+    shared, pickled = _transfer(32, (32, 128, 128, 3))
+    size_mb = 32 * 32 * 128 * 128 * 3 * 8 / 2**20
+    print(
+        f"{backend} transfer of {size_mb:.0f}MB in 32 batches: shared memory"
+        f" {size_mb / shared:.0f}MB/s, pickled {size_mb / pickled:.0f}MB/s"
+    )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:3]])
@@ -0,0 +1,50 @@
+"""
+Benchmark the optimizer steps with and without packing into flat buffers.
+
+Usage: python scripts/benchmarks/flat_optimizers.py [backend] [num_tensors]
+"""
+
+import sys
+import timeit
+
+import ivy
+
+
+def _variables(num_tensors):
+    # a mixture of weight matrices and bias vectors, as found in deep models
+    return ivy.Container(
+        {
+            f"layer{i}": {
+                "w": ivy.random_uniform(shape=(16, 16)),
+                "b": ivy.random_uniform(shape=(16,)),
+            }
+            for i in range(num_tensors // 2)
+        }
+    )
+
+
+def main(backend="numpy", num_tensors=2000, number=3):
+    ivy.set_backend(backend)
+    v = _variables(num_tensors)
+    grads = v.cont_map(lambda x, kc: x * 1e-2)
+    for optimizer_cls in [ivy.SGD, ivy.LARS, ivy.Adam, ivy.LAMB]:
+        times = list()
+        for flat in [False, True]:
+            optimizer = optimizer_cls(lr=1e-3, flat=flat)
+            new_v = optimizer.step(v.cont_deep_copy(), grads)
+
+            def _step():
+                nonlocal new_v
+                new_v = optimizer.step(new_v, grads)
+
+            times.append(timeit.timeit(_step, number=number) / number)
+        print(
+            f"{backend} {optimizer_cls.__name__} ({num_tensors} tensors):"
+            f" {times[0] * 1e3:.1f}ms -> {times[1] * 1e3:.1f}ms per step"
+            f" ({times[0] / times[1]:.1f}x)"
+        )
+    ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:3]])
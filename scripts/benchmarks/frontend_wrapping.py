@@ -0,0 +1,121 @@
+"""
+Benchmark the per-op overhead of the frontend array wrappers, for an elementwise op
+on small arrays in the torch, numpy, jax, tensorflow and paddle frontends.
+
+Each op is called with frontend arrays and with native arrays as inputs. The report
+gives the mean time of an op, the number of ``ivy.Array`` and frontend wrappers
+constructed by each op and of the conversions by ``ivy.array`` among them, the peak
+of the memory traced by ``tracemalloc`` while it runs, and the size held by the
+returned wrapper itself.
+
+Usage: python scripts/benchmarks/frontend_wrapping.py [backend] [number]
+"""
+
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import ivy
+
+
+def _frontends():
+    import ivy.functional.frontends.jax as jax_frontend
+    import ivy.functional.frontends.numpy as np_frontend
+    import ivy.functional.frontends.paddle as paddle_frontend
+    import ivy.functional.frontends.tensorflow as tf_frontend
+    import ivy.functional.frontends.torch as torch_frontend
+
+    return [
+        ("torch", torch_frontend.Tensor, torch_frontend.tensor, torch_frontend.add),
+        ("numpy", np_frontend.ndarray, np_frontend.array, np_frontend.add),
+        ("jax", jax_frontend.Array, jax_frontend.numpy.array, jax_frontend.numpy.add),
+        (
+            "tensorflow",
+            tf_frontend.EagerTensor,
+            tf_frontend.constant,
+            tf_frontend.math.add,
+        ),
+        (
+            "paddle",
+            paddle_frontend.Tensor,
+            paddle_frontend.to_tensor,
+            paddle_frontend.add,
+        ),
+    ]
+
+
+def _count_inits(classes):
+    # wrap the constructors, and ivy.array, to count the wrappers built by an op
+    counts = dict.fromkeys(classes + ["ivy.array"], 0)
+    originals = {cls: cls.__init__ for cls in classes}
+    array = ivy.array
+
+    def counting_array(*args, **kwargs):
+        counts["ivy.array"] += 1
+        return array(*args, **kwargs)
+
+    def counting(cls):
+        def __init__(self, *args, **kwargs):
+            counts[cls] += 1
+            originals[cls](self, *args, **kwargs)
+
+        return __init__
+
+    for cls in classes:
+        cls.__init__ = counting(cls)
+    ivy.array = counting_array
+
+    def restore():
+        for cls, init in originals.items():
+            cls.__init__ = init
+        ivy.array = array
+
+    return counts, restore
+
+
+def _held_bytes(x):
+    # the wrapper, and its attribute dict if it has one
+    return sys.getsizeof(x) + sys.getsizeof(getattr(x, "__dict__", None) or ())
+
+
+def _measure(op, x, y, number):
+    op(x, y)
+    start = time.perf_counter()
+    for _ in range(number):
+        op(x, y)
+    per_op = (time.perf_counter() - start) / number
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    ret = op(x, y)
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    return per_op, peak, ret
+
+
+def main(backend="numpy", number=200):
+    ivy.set_backend(backend)
+    native = ivy.to_native(ivy.random_uniform(shape=(8, 8)))
+    for name, cls, array_fn, op in _frontends():
+        for inputs in ["frontend", "native"]:
+            x = array_fn(native) if inputs == "frontend" else native
+            per_op, peak, ret = _measure(op, x, x, number)
+            counts, restore = _count_inits([ivy.Array, cls])
+            try:
+                op(x, x)
+            finally:
+                restore()
+            print(
+                f"{backend} {name} add on {inputs} arrays:"
+                f" {per_op * 1e6:.0f}us/op,"
+                f" {counts[ivy.Array]} ivy.Array ({counts['ivy.array']} by ivy.array)"
+                f" and {counts[cls]} {cls.__name__} constructed,"
+                f" {peak / 1024:.1f}KB traced peak,"
+                f" {_held_bytes(ret)}B held by the wrapper"
+            )
+    print(f"{backend} native array: {np.asarray(native).nbytes}B of data")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:3]])
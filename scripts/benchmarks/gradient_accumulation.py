@@ -0,0 +1,76 @@
+"""
+Benchmark a training step of an MLP over a large batch, computed at once and in
+micro-batches with a gradient accumulator.
+
+Each measurement runs in a fresh process, and reports the mean time of a step and
+the growth of the maximum resident set size over the steps, after the model has been
+built. With the numpy backend, which computes no gradients, the step is a forward
+pass.
+
+Usage: python scripts/benchmarks/gradient_accumulation.py [backend] [batch_size]
+    [micro_batch_size]
+"""
+
+import multiprocessing
+import resource
+import sys
+import time
+
+import ivy
+
+
+def _peak_mb():
+    # ru_maxrss is reported in kilobytes on linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _measure(backend, batch_size, micro_batch_size, number, queue, width=1024):
+    ivy.set_backend(backend)
+    model = ivy.Sequential(
+        *[ivy.Sequential(ivy.Linear(width, width), ivy.GELU()) for _ in range(4)],
+        ivy.Linear(width, 1),
+    )
+    optimizer = ivy.SGD(lr=1e-3)
+    accumulator = ivy.GradientAccumulator(micro_batch_size)
+    x = ivy.random_uniform(shape=(batch_size, width))
+    y = ivy.random_uniform(shape=(batch_size, 1))
+
+    def loss_fn(v, x, y):
+        return ivy.mean((model(x, v=v) - y) ** 2)
+
+    baseline = _peak_mb()
+    start = time.perf_counter()
+    for _ in range(number):
+        if micro_batch_size is None:
+            loss, grads = ivy.execute_with_gradients(
+                lambda v: loss_fn(v, x, y), model.v
+            )
+        else:
+            loss, grads = accumulator.execute_with_gradients(loss_fn, model.v, [x, y])
+        if grads is not None:
+            model.v = optimizer.step(model.v, grads)
+    queue.put(((time.perf_counter() - start) / number, _peak_mb() - baseline))
+
+
+def _run(*args):
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(target=_measure, args=(*args, queue))
+    process.start()
+    ret = queue.get()
+    process.join()
+    return ret
+
+
+def main(backend="numpy", batch_size=8192, micro_batch_size=512, number=3):
+    full_time, full_mb = _run(backend, batch_size, None, number)
+    micro_time, micro_mb = _run(backend, batch_size, micro_batch_size, number)
+    print(
+        f"{backend} batch {batch_size}: {full_time * 1e3:.0f}ms, {full_mb:.0f}MB peak"
+        f" growth at once -> {micro_time * 1e3:.0f}ms, {micro_mb:.0f}MB in"
+        f" micro-batches of {micro_batch_size}"
+    )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:4]])
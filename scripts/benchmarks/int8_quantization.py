@@ -0,0 +1,62 @@
+"""
+Benchmark the accuracy, speed and weight size of int8 quantized modules against the
+float modules they are quantized from.
+
+Usage: python scripts/benchmarks/int8_quantization.py [backend] [depth]
+"""
+
+import sys
+import timeit
+
+import numpy as np
+
+import ivy
+
+
+def _mlp(depth, width=1024):
+    layers = []
+    for _ in range(depth):
+        layers += [ivy.Linear(width, width), ivy.ReLU()]
+    return ivy.Sequential(*layers, ivy.Linear(width, 10)), (256, width)
+
+
+def _conv_stack(depth, channels=32):
+    layers = []
+    for _ in range(depth):
+        layers += [ivy.Conv2D(channels, channels, [3, 3], 1, "SAME"), ivy.ReLU()]
+    return ivy.Sequential(*layers), (8, 32, 32, channels)
+
+
+def _weight_bytes(module):
+    return sum(
+        int(np.prod(x.shape)) * ivy.dtype_bits(x.dtype) // 8
+        for _, x in module.v.cont_to_iterator()
+    )
+
+
+def main(backend="numpy", depth=4, number=10):
+    ivy.set_backend(backend)
+    for name, model_fn in [("mlp", _mlp), ("conv", _conv_stack)]:
+        module, shape = model_fn(depth)
+        module.eval()
+        calibration = [ivy.random_normal(shape=shape) for _ in range(4)]
+        quantized = ivy.quantize_module(module, calibration)
+        x = ivy.random_normal(shape=shape)
+        ret, quantized_ret = ivy.to_numpy(module(x)), ivy.to_numpy(quantized(x))
+        error = np.abs(quantized_ret - ret).max() / np.abs(ret).max()
+        float_time = timeit.timeit(lambda: module(x), number=number) / number
+        int8_time = timeit.timeit(lambda: quantized(x), number=number) / number
+        print(
+            f"{backend} {name} x{depth}: max error {error * 100:.2f}% of the output"
+            f" range, {_weight_bytes(module) / 2**20:.1f}MB ->"
+            f" {_weight_bytes(quantized) / 2**20:.1f}MB weights,"
+            f" {float_time * 1e3:.1f}ms -> {int8_time * 1e3:.1f}ms"
+        )
+        if name == "mlp":
+            agreement = np.mean(ret.argmax(-1) == quantized_ret.argmax(-1))
+            print(f"{backend} {name} x{depth}: top-1 agreement {agreement * 100:.1f}%")
+    ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:3]])
@@ -0,0 +1,66 @@
+"""
+Benchmark lax.scan of the jax frontend on a long scan.
+
+The outputs of each chunk of unroll steps are stacked once and written into
+preallocated stacked outputs, so a step's output is released once its chunk is
+written. This is compared, in time and in peak memory traced by tracemalloc, with
+keeping the output of every step in a list and stacking the whole list at the end.
+
+Usage: python scripts/benchmarks/jax_lax_scan.py [backend] [num_steps] [size]
+"""
+
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import ivy
+
+
+def _list_scan(f, init, xs):
+    # every output kept until the end, then copied into the stack
+    carry, ys = init, []
+    for x in xs:
+        carry, y = f(carry, x)
+        ys.append(y)
+    return carry, ivy.stack(ys)
+
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def _step(carry, x):
+    carry = ivy.tanh(carry + x)
+    return carry, carry * 2.0
+
+
+def main(backend="numpy", num_steps=10_000, size=4096):
+    ivy.set_backend(backend)
+    from ivy.functional.frontends.jax import lax
+
+    rng = np.random.default_rng(0)
+    xs = ivy.array(rng.normal(size=(num_steps, size)).astype(np.float32))
+    init = ivy.zeros((size,), dtype="float32")
+    stacked_mb = num_steps * size * 4 / 2**20
+
+    listed, listed_peak = _measure(lambda: _list_scan(_step, init, xs))
+    for unroll in [1, 16]:
+        elapsed, peak = _measure(lambda: lax.scan(_step, init, xs, unroll=unroll))
+        print(
+            f"{backend} scan of {num_steps} steps, {stacked_mb:.0f}MB of stacked"
+            f" outputs, unroll={unroll}: {elapsed:.2f}s and {peak:.0f}MB peak"
+            f" preallocated, {listed:.2f}s and {listed_peak:.0f}MB peak with a list"
+            " stacked at the end"
+        )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:4]])
@@ -0,0 +1,88 @@
+"""
+Benchmark a training step of a deep MLP and a conv stack in full precision and
+under float16 or bfloat16 autocast with dynamic loss scaling.
+
+Each measurement runs in a fresh process, and reports the mean time of a step and
+the growth of the maximum resident set size over the steps, after the model has been
+built. With the numpy backend, which computes no gradients, the step is a forward
+pass, and autocasting leaves the layers in full precision, as numpy only emulates
+half precision arithmetic.
+
+Usage: python scripts/benchmarks/mixed_precision.py [backend] [depth] [number] [dtype]
+"""
+
+import multiprocessing
+import resource
+import sys
+import time
+
+import ivy
+
+
+def _mlp(depth, width=1024):
+    return ivy.Sequential(
+        *[
+            ivy.Sequential(ivy.Linear(width, width), ivy.GELU(), ivy.LayerNorm([width]))
+            for _ in range(depth)
+        ]
+    ), ivy.random_uniform(shape=(256, width))
+
+
+def _conv_stack(depth, channels=32):
+    return ivy.Sequential(
+        *[
+            ivy.Sequential(
+                ivy.Conv2D(channels, channels, [3, 3], 1, "SAME"), ivy.ReLU()
+            )
+            for _ in range(depth)
+        ]
+    ), ivy.random_uniform(shape=(8, 32, 32, channels))
+
+
+def _peak_mb():
+    # ru_maxrss is reported in kilobytes on linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _measure(backend, model_fn, depth, number, dtype, queue):
+    ivy.set_backend(backend)
+    module, x = model_fn(depth)
+    scaler = ivy.LossScaler()
+
+    def loss_fn(v):
+        with ivy.Autocast(dtype):
+            out = module(x, v=v)
+        return ivy.mean(ivy.astype(out, "float32") ** 2)
+
+    baseline = _peak_mb()
+    start = time.perf_counter()
+    for _ in range(number):
+        scaler.execute_with_gradients(loss_fn, module.v)
+    queue.put(((time.perf_counter() - start) / number, _peak_mb() - baseline))
+
+
+def _run(backend, model_fn, depth, number, dtype):
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(
+        target=_measure, args=(backend, model_fn, depth, number, dtype, queue)
+    )
+    process.start()
+    ret = queue.get()
+    process.join()
+    return ret
+
+
+def main(backend="numpy", depth=8, number=5, dtype="float16"):
+    for name, model_fn in [("mlp", _mlp), ("conv", _conv_stack)]:
+        full_time, full_mb = _run(backend, model_fn, depth, number, None)
+        half_time, half_mb = _run(backend, model_fn, depth, number, dtype)
+        print(
+            f"{backend} {name} x{depth} {dtype}: {full_time * 1e3:.1f}ms -> "
+            f"{half_time * 1e3:.1f}ms per step, {full_mb:.0f}MB -> {half_mb:.0f}MB"
+            " peak growth"
+        )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:4]], *sys.argv[4:5])
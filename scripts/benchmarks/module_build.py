@@ -0,0 +1,35 @@
+"""
+Benchmark building a model of many small submodules, and rebuilding it after one of
+its blocks has been replaced.
+
+Usage: python scripts/benchmarks/module_build.py [backend] [num_submodules]
+"""
+
+import sys
+import time
+
+import ivy
+
+
+def _block(width):
+    return ivy.Sequential(*[ivy.Linear(width, width) for _ in range(9)], ivy.ReLU())
+
+
+def main(backend="numpy", num_submodules=2000, width=8):
+    ivy.set_backend(backend)
+    start = time.perf_counter()
+    model = ivy.Sequential(*[_block(width) for _ in range(num_submodules // 10)])
+    build_time = time.perf_counter() - start
+
+    model._submodules[0] = _block(width)
+    start = time.perf_counter()
+    model.build()
+    rebuild_time = time.perf_counter() - start
+    print(
+        f"{backend} {num_submodules} submodules: build {build_time:.2f}s, rebuild"
+        f" after replacing a block {rebuild_time:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:3]])
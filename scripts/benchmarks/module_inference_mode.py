@@ -0,0 +1,51 @@
+"""
+Benchmark the per-layer call overhead of ivy.Module with and without inference mode.
+
+Usage: python scripts/benchmarks/module_inference_mode.py [backend] [num_layers]
+"""
+
+import sys
+import timeit
+
+import ivy
+
+
+class _Passthrough(ivy.Module):
+    # holds a variable, but does no maths, so only the call overhead is measured
+    def __init__(self, channels):
+        self._channels = channels
+        ivy.Module.__init__(self)
+
+    def _create_variables(self, device=None, dtype=None):
+        return {"w": ivy.zeros((self._channels,), device=device, dtype=dtype)}
+
+    def _forward(self, x):
+        return x
+
+
+def _time_per_layer(module, x, num_layers, number):
+    return timeit.timeit(lambda: module(x), number=number) / (number * num_layers)
+
+
+def main(backend="numpy", num_layers=16, number=100):
+    ivy.set_backend(backend)
+    x = ivy.random_uniform(shape=(8, 32))
+    for name, layer_fn in [
+        ("passthrough", lambda: _Passthrough(32)),
+        ("linear", lambda: ivy.Linear(32, 32)),
+    ]:
+        module = ivy.Sequential(*[layer_fn() for _ in range(num_layers)])
+        module(x)
+        tracked = _time_per_layer(module, x, num_layers, number)
+        with module.inference_mode():
+            module(x)
+            inference = _time_per_layer(module, x, num_layers, number)
+        print(
+            f"{backend} {name}: {tracked * 1e6:.1f}us -> {inference * 1e6:.1f}us per"
+            f" layer ({tracked / inference:.1f}x)"
+        )
+    ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:3]])
@@ -0,0 +1,81 @@
+"""
+Benchmark the reduce, accumulate, reduceat, outer and at methods of the numpy
+frontend ufuncs against those of numpy itself, on inputs of 10M elements.
+
+Each method is computed by a constant number of backend kernels, except for the
+ufuncs without a dedicated kernel, which combine slices in a logarithmic number of
+kernels. Each timing is the best of several runs, and the results are checked
+against numpy.
+
+Usage: python scripts/benchmarks/numpy_ufunc_methods.py [backend] [size] [number]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _best(fn, number):
+    times = []
+    for _ in range(number):
+        start = time.perf_counter()
+        ret = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), ret
+
+
+def _at(ufunc, indices, values):
+    # at updates its first argument in place, which is returned to be checked
+    def run(module):
+        target = np.zeros(1000)
+        getattr(module, ufunc).at(target, indices, values)
+        return target
+
+    return run
+
+
+def _cases(size):
+    rng = np.random.default_rng(0)
+    x = rng.uniform(size=size)
+    segments = np.sort(rng.choice(size, size // 100, replace=False))
+    segments[0] = 0
+    bins = rng.integers(0, 1000, size)
+    side = int(size**0.5)
+    a, b = x[:side], x[side : 2 * side]
+    return [
+        ("add.reduce", lambda m: m.add.reduce(x)),
+        ("maximum.reduce", lambda m: m.maximum.reduce(x)),
+        ("logaddexp.reduce", lambda m: m.logaddexp.reduce(x)),
+        ("add.accumulate", lambda m: m.add.accumulate(x)),
+        ("maximum.accumulate", lambda m: m.maximum.accumulate(x)),
+        ("add.reduceat, 100 per segment", lambda m: m.add.reduceat(x, segments)),
+        (
+            "maximum.reduceat, 100 per segment",
+            lambda m: m.maximum.reduceat(x, segments),
+        ),
+        (f"multiply.outer, {side}x{side}", lambda m: m.multiply.outer(a, b)),
+        ("add.at, 1000 bins", _at("add", bins, x)),
+        ("maximum.at, 1000 bins", _at("maximum", bins, x)),
+    ]
+
+
+def main(backend="numpy", size=10_000_000, number=3):
+    ivy.set_backend(backend)
+    import ivy.functional.frontends.numpy as np_frontend
+
+    for name, run in _cases(size):
+        numpy_time, expected = _best(lambda: run(np), number)
+        frontend_time, ret = _best(lambda: run(np_frontend), number)
+        ret = ivy.to_numpy(ret.ivy_array) if hasattr(ret, "ivy_array") else ret
+        assert np.allclose(ret, expected), name
+        print(
+            f"{backend} {name}: numpy {numpy_time * 1e3:.1f}ms, frontend"
+            f" {frontend_time * 1e3:.1f}ms ({frontend_time / numpy_time:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:4]])
@@ -0,0 +1,109 @@
+"""
+Benchmark the columnar DataFrame of the pandas frontend.
+
+Selecting a column, which is a view of the frame, is compared with copying it out of
+a 2-D array. A chain of column arithmetic, a filter and a sum is run eagerly over
+whole columns and lazily in a single pass over chunks of rows. Reading a CSV file
+with ``read_csv`` is compared with parsing it into Python rows with the ``csv``
+module, in time and in peak traced memory.
+
+Usage: python scripts/benchmarks/pandas_columnar.py [backend] [num_rows]
+"""
+
+import csv
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+import ivy
+
+
+def _time(fn, number=3):
+    fn()
+    start = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return (time.perf_counter() - start) / number
+
+
+def _traced(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def _eager(df):
+    a, b = df["a"].array, df["b"].array
+    c = a * b + a
+    mask = (c > 0) & (b < 1)
+    return ivy.sum(a[mask]), ivy.sum(c[mask])
+
+
+def _rows(path):
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        next(reader)
+        rows = [[float(v) for v in row] for row in reader]
+    return np.array(rows)
+
+
+def main(backend="numpy", num_rows=2_000_000):
+    ivy.set_backend(backend)
+    import ivy.functional.frontends.pandas as pd
+
+    rng = np.random.default_rng(0)
+    data = {name: ivy.array(rng.normal(size=num_rows)) for name in "abcdefgh"}
+    df = pd.DataFrame(data)
+    view = _time(lambda: df["c"], 100)
+    stacked = df.array
+    copied = _time(lambda: pd.Series(stacked[:, 2], copy=True), 10)
+    print(
+        f"{backend} column of {num_rows} rows x 8: view {view * 1e6:.0f}us,"
+        f" copy out of a 2-D array {copied * 1e3:.1f}ms"
+    )
+
+    chain = df.lazy().assign(c="a * b + a").query("c > 0 and b < 1")[["a", "c"]]
+    for name, fn in [("eager", lambda: _eager(df)), ("lazy in one pass", chain.sum)]:
+        per_call = _time(fn)
+        peak = _traced(fn)[1]
+        print(
+            f"{backend} arithmetic, filter and sum over {num_rows} rows, {name}:"
+            f" {per_call * 1e3:.0f}ms, {peak:.0f}MB traced peak"
+        )
+
+    path = os.path.join(tempfile.mkdtemp(), "frame.csv")
+    with open(path, "w") as f:
+        f.write("k,a,b\n")
+        np.savetxt(
+            f,
+            np.c_[rng.integers(0, 1000, num_rows), rng.normal(size=(num_rows, 2))],
+            fmt=["%d", "%.6f", "%.6f"],
+            delimiter=",",
+        )
+    size_mb = os.path.getsize(path) / 2**20
+    for name, fn in [
+        ("read_csv", lambda: pd.read_csv(path)),
+        (
+            "read_csv by 100k rows",
+            lambda: [0 for _ in pd.read_csv(path, chunksize=10**5)],
+        ),
+        ("csv rows", lambda: _rows(path)),
+    ]:
+        elapsed, peak = _time(fn, 1), _traced(fn)[1]
+        print(
+            f"{backend} {name} of {size_mb:.0f}MB: {num_rows / elapsed / 1e6:.2f}M"
+            f" rows/s, {peak:.0f}MB traced peak"
+        )
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:3]])
@@ -0,0 +1,95 @@
+"""
+Benchmark label lookups and groupby reductions of the pandas frontend.
+
+Single label lookups through the hash table of an ``Index`` are compared with a scan
+of the list of labels, and bulk lookups of many labels with ``get_indexer`` are
+compared with one ``get_loc`` per label. ``groupby(...).sum/mean/count`` over
+millions of rows, as a segment sum over the codes of the keys, is compared with a
+reduction over a mask of the rows of each group.
+
+Usage: python scripts/benchmarks/pandas_groupby.py [backend] [num_rows] [num_groups]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _time(fn, number=1):
+    fn()
+    start = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return (time.perf_counter() - start) / number
+
+
+def _lookups(pd, num_labels):
+    labels = [f"label_{i}" for i in range(num_labels)]
+    index = pd.Index(labels)
+    targets = [
+        labels[i] for i in np.random.default_rng(0).integers(num_labels, size=1000)
+    ]
+    scan = _time(lambda: [labels.index(t) for t in targets[:100]]) / 100
+    hashed = _time(lambda: [index.get_loc(t) for t in targets]) / 1000
+    print(
+        f"lookup of a label among {num_labels}: list scan {scan * 1e6:.1f}us,"
+        f" hash table {hashed * 1e6:.2f}us"
+    )
+
+    numbers = pd.Index(ivy.arange(num_labels) * 7)
+    targets = ivy.array(np.random.default_rng(1).integers(num_labels * 7, size=10**5))
+    looped = _time(
+        lambda: [numbers._engine.get(t, -1) for t in targets[: 10**4].to_list()]
+    )
+    bulk = _time(lambda: numbers.get_indexer(targets))
+    print(
+        f"lookup of 100000 int labels among {num_labels}: one by one"
+        f" {looped * 10 * 1e3:.0f}ms, get_indexer {bulk * 1e3:.0f}ms"
+    )
+
+
+def _masked_groupby(keys, values):
+    # one pass over the rows for each group
+    groups = np.unique(keys)
+    sums = np.stack([np.nansum(values[keys == g], axis=0) for g in groups])
+    counts = np.stack([(~np.isnan(values[keys == g])).sum(axis=0) for g in groups])
+    return sums, counts, sums / counts
+
+
+def main(backend="numpy", num_rows=2_000_000, num_groups=1000):
+    ivy.set_backend(backend)
+    import ivy.functional.frontends.pandas as pd
+
+    _lookups(pd, 100_000)
+
+    rng = np.random.default_rng(0)
+    keys = rng.integers(num_groups, size=num_rows)
+    values = rng.normal(size=(num_rows, 3))
+    values[rng.random(num_rows) < 0.01, 0] = np.nan
+    df = pd.DataFrame(
+        ivy.array(np.concatenate([keys[:, None], values], axis=1)),
+        columns=["key", "a", "b", "c"],
+    )
+    grouped = df.groupby("key")
+    factorize = _time(lambda: df.groupby("key"))
+    total = 0.0
+    for name in ["sum", "mean", "count"]:
+        per_call = _time(getattr(grouped, name))
+        total += per_call
+        print(
+            f"{backend} groupby {name} of {num_rows} rows into {num_groups} groups:"
+            f" {per_call * 1e3:.0f}ms ({num_rows / per_call / 1e6:.1f}M rows/s)"
+        )
+    masked = _time(lambda: _masked_groupby(keys, values))
+    print(
+        f"{backend} factorizing the keys {factorize * 1e3:.0f}ms, sum+mean+count"
+        f" {(factorize + total) * 1e3:.0f}ms, against {masked * 1e3:.0f}ms with a"
+        " mask per group"
+    )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:4]])
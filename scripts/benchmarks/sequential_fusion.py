@@ -0,0 +1,55 @@
+"""
+Benchmark the forward pass of Sequential models before and after fusing their layers
+for inference.
+
+Usage: python scripts/benchmarks/sequential_fusion.py [backend] [depth]
+"""
+
+import sys
+import timeit
+
+import ivy
+
+
+def _conv_block(channels):
+    return [
+        ivy.Conv2D(channels, channels, [3, 3], 1, "SAME"),
+        ivy.BatchNorm2D(channels),
+        ivy.ReLU(),
+    ]
+
+
+def _mlp_block(width):
+    return [
+        ivy.Linear(width, width),
+        ivy.BatchNorm2D(width),
+        ivy.GELU(),
+        ivy.Dropout(0.1),
+    ]
+
+
+def main(backend="numpy", depth=8, number=20):
+    ivy.set_backend(backend)
+    for name, block_fn, x in [
+        ("conv", _conv_block, ivy.random_uniform(shape=(8, 32, 32, 32))),
+        ("mlp", _mlp_block, ivy.random_uniform(shape=(256, 512))),
+    ]:
+        channels = x.shape[-1]
+        module = ivy.Sequential(
+            *[layer for _ in range(depth) for layer in block_fn(channels)]
+        )
+        module.eval()
+        fused = ivy.fuse_for_inference(module)
+        module(x), fused(x)
+        unfused_time = timeit.timeit(lambda: module(x), number=number) / number
+        fused_time = timeit.timeit(lambda: fused(x), number=number) / number
+        print(
+            f"{backend} {name} x{depth}: {len(list(module))} -> {len(list(fused))}"
+            f" layers, {unfused_time * 1e3:.1f}ms -> {fused_time * 1e3:.1f}ms"
+            f" ({unfused_time / fused_time:.2f}x)"
+        )
+    ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:3]])
@@ -0,0 +1,98 @@
+"""
+Benchmark the cross-validation executor of the sklearn frontend model_selection.
+
+A grid search fans all its candidate-split pairs out to a pool of worker processes,
+the training data being copied once into shared memory which the workers attach to,
+so that a task only carries the indices of its candidate and split. This is
+compared with the same pool receiving the pickled training data and split indices
+with every task, and with evaluating the tasks one after another in this process.
+
+Usage: python scripts/benchmarks/sklearn_cross_validation.py [backend] [num_samples]
+    [num_workers]
+"""
+
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+import ivy
+
+
+class NearestCentroid:
+    # a cheap estimator, so that the time goes to moving the data around
+    def __init__(self, shrink=0.0):
+        self.shrink = shrink
+
+    def get_params(self, deep=True):
+        return {"shrink": self.shrink}
+
+    def set_params(self, **params):
+        self.shrink = params.get("shrink", self.shrink)
+        return self
+
+    def fit(self, X, y):
+        X, y = ivy.array(X), ivy.array(y)
+        self.centroids_ = ivy.stack(
+            [ivy.mean(X[y == k], axis=0) * (1 - self.shrink) for k in range(2)]
+        )
+        return self
+
+    def score(self, X, y):
+        X, y = ivy.array(X), ivy.array(y)
+        distances = ivy.stack(
+            [ivy.sum((X - c) ** 2, axis=1) for c in self.centroids_], axis=1
+        )
+        return float(ivy.mean((ivy.argmin(distances, axis=1) == y).astype("float32")))
+
+
+def _pickled_task(estimator, X, y, train, test):
+    ivy.set_backend("numpy")
+    return estimator.fit(X[train], y[train]).score(X[test], y[test])
+
+
+def _pickled_search(estimators, X, y, splits, num_workers):
+    with ProcessPoolExecutor(num_workers) as executor:
+        futures = [
+            executor.submit(_pickled_task, estimator, X, y, train, test)
+            for estimator in estimators
+            for train, test in splits
+        ]
+        return [future.result() for future in as_completed(futures)]
+
+
+def main(backend="numpy", num_samples=1_000_000, num_workers=4):
+    ivy.set_backend(backend)
+    from ivy.functional.frontends.sklearn.model_selection import GridSearchCV, KFold
+
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(num_samples, 20)).astype(np.float32)
+    y = (x[:, 0] + x[:, 1] > 0).astype(np.int64)
+    grid = {"shrink": [0.0, 0.1, 0.2, 0.3]}
+    cv = KFold(5)
+
+    timings = {}
+    for n_jobs in [1, num_workers]:
+        search = GridSearchCV(NearestCentroid(), grid, cv=cv, n_jobs=n_jobs)
+        start = time.perf_counter()
+        search.fit(x, y)
+        timings[n_jobs] = time.perf_counter() - start
+
+    splits = [
+        (ivy.to_numpy(train), ivy.to_numpy(test)) for train, test in cv.split(x, y)
+    ]
+    estimators = [NearestCentroid(shrink) for shrink in grid["shrink"]]
+    start = time.perf_counter()
+    _pickled_search(estimators, x, y, splits, num_workers)
+    pickled = time.perf_counter() - start
+    print(
+        f"{backend} grid search of 4 candidates x 5 folds on {num_samples} samples"
+        f" x 20 ({x.nbytes / 2**20:.0f}MB): {timings[num_workers]:.2f}s with"
+        f" {num_workers} workers and shared memory, {pickled:.2f}s with the data"
+        f" pickled per task, {timings[1]:.2f}s in process"
+    )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:4]])
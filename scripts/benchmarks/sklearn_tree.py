@@ -0,0 +1,95 @@
+"""
+Benchmark fitting and prediction of the DecisionTreeClassifier of the sklearn frontend.
+
+Fitting, with each feature sorted once and the splits of all the nodes of a level
+searched together, is compared with sorting the samples of every node again, one node at
+a time, with the same ivy ops. Prediction with the tree stored as flat arrays, all the
+samples moving down a level at each step, is compared with walking the tree for each
+sample.
+
+Usage: python scripts/benchmarks/sklearn_tree.py [backend] [num_samples] [max_depth]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _time(fn):
+    start = time.perf_counter()
+    ret = fn()
+    return time.perf_counter() - start, ret
+
+
+def _gini_proxy(counts):
+    return ivy.sum(counts * counts, axis=-1) / ivy.sum(counts, axis=-1)
+
+
+def _fit_per_node(x, onehot, max_depth, depth=0):
+    # every node sorts its own samples, for all features at once
+    n = x.shape[0]
+    counts = ivy.sum(onehot, axis=0)
+    if depth >= max_depth or n < 2 or int(ivy.max(counts)) == n:
+        return 1
+    order = ivy.argsort(x, axis=0, stable=True)
+    values = ivy.reshape(x, (-1,))[order * x.shape[1] + ivy.arange(x.shape[1])]
+    left = ivy.cumsum(onehot[order], axis=0)[:-1]
+    score = _gini_proxy(left) + _gini_proxy(counts - left)
+    score = ivy.where(values[1:] > values[:-1] + 1e-7, score, -float("inf"))
+    best = int(ivy.argmax(ivy.reshape(score, (-1,))))
+    i, f = divmod(best, x.shape[1])
+    if float(score[i, f]) == -float("inf"):
+        return 1
+    goes_left = x[:, f] <= values[i, f] / 2 + values[i + 1, f] / 2
+    return (
+        1
+        + _fit_per_node(x[goes_left], onehot[goes_left], max_depth, depth + 1)
+        + _fit_per_node(x[~goes_left], onehot[~goes_left], max_depth, depth + 1)
+    )
+
+
+def _walk(x, tree):
+    left, right = tree.children_left.to_list(), tree.children_right.to_list()
+    feature, threshold = tree.feature.to_list(), tree.threshold.to_list()
+    leaves = []
+    for row in x.tolist():
+        node = 0
+        while left[node] != -1:
+            go_left = row[feature[node]] <= threshold[node]
+            node = left[node] if go_left else right[node]
+        leaves.append(node)
+    return leaves
+
+
+def main(backend="numpy", num_samples=200_000, max_depth=10):
+    ivy.set_backend(backend)
+    from ivy.functional.frontends.sklearn.tree import DecisionTreeClassifier
+
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(num_samples, 10)).astype(np.float32)
+    y = (x[:, 0] * x[:, 1] + np.sin(2 * x[:, 2]) + 0.3 * x[:, 3] > 0).astype(np.int64)
+
+    elapsed, clf = _time(lambda: DecisionTreeClassifier(max_depth=max_depth).fit(x, y))
+    per_node, node_count = _time(
+        lambda: _fit_per_node(ivy.array(x), ivy.array(np.eye(2)[y]), max_depth)
+    )
+    print(
+        f"{backend} fit of {num_samples} samples x 10 to depth {max_depth}"
+        f" ({clf.tree_.node_count} nodes): {elapsed:.2f}s level by level, sorted"
+        f" once, {per_node:.2f}s node by node ({node_count} nodes)"
+    )
+
+    data = ivy.array(x)
+    gathered, _ = _time(lambda: clf.apply(data))
+    walked, _ = _time(lambda: _walk(x[:20_000], clf.tree_))
+    print(
+        f"{backend} apply to {num_samples} samples: {gathered * 1e3:.0f}ms with"
+        f" gathers, {walked * num_samples / 20_000 * 1e3:.0f}ms walking each sample"
+    )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:4]])
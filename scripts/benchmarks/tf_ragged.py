@@ -0,0 +1,65 @@
+"""
+Benchmark RaggedTensor ops of the tensorflow frontend on many short rows.
+
+A RaggedTensor holds its flat values and row_splits, so that a row reduction is one
+segment reduction over the values, to_tensor is one scatter of the values into the
+padded tensor, and a gather of rows is one gather of the values. This is compared
+with the former layout of a list of row tensors, where each op runs once per row.
+
+Usage: python scripts/benchmarks/tf_ragged.py [backend] [num_rows] [max_length]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _row_list_ops(rows, indices, width):
+    # one call per row, as with a list of the row tensors
+    sums = ivy.stack([ivy.sum(row) for row in rows])
+    padded = ivy.stack(
+        [ivy.concat([row, ivy.zeros((width - row.shape[0],))]) for row in rows]
+    )
+    gathered = [rows[i] for i in indices]
+    return sums, padded, gathered
+
+
+def _ragged_ops(tf, rt, indices):
+    sums = tf.math.reduce_sum(rt, axis=1)
+    padded = rt.to_tensor()
+    gathered = tf.gather(rt, indices)
+    return sums, padded, gathered
+
+
+def _time(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main(backend="numpy", num_rows=10_000, max_length=32):
+    ivy.set_backend(backend)
+    import ivy.functional.frontends.tensorflow as tf
+
+    rng = np.random.default_rng(0)
+    lengths = rng.integers(0, max_length + 1, size=num_rows)
+    values = rng.normal(size=int(lengths.sum())).astype(np.float32)
+    indices = rng.permutation(num_rows)
+    splits = np.concatenate([[0], np.cumsum(lengths)])
+    rows = [ivy.array(values[s:e]) for s, e in zip(splits[:-1], splits[1:])]
+    rt = tf.ragged.RaggedTensor.from_row_lengths(values, lengths)
+
+    listed = _time(lambda: _row_list_ops(rows, indices, int(lengths.max())))
+    ragged = _time(lambda: _ragged_ops(tf, rt, indices))
+    print(
+        f"{backend} reduce_sum, to_tensor and gather of {num_rows} rows of up to"
+        f" {max_length} values: {ragged:.3f}s on values and row_splits,"
+        f" {listed:.3f}s on a list of rows"
+    )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:4]])
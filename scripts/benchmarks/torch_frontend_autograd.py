@@ -0,0 +1,57 @@
+"""
+Benchmark the forward and backward passes of an MLP written with the torch frontend.
+
+The backward pass runs the vector-Jacobian products recorded on the autograd tape.
+The number of elements of the largest Jacobian of a layer w.r.t its weight is also
+reported, which is what building each op's full Jacobian would have to materialize.
+
+Usage: python scripts/benchmarks/torch_frontend_autograd.py [backend] [width] [number]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import ivy
+
+
+def main(backend="numpy", width=512, number=5, batch_size=256, depth=4):
+    ivy.set_backend(backend)
+    import ivy.functional.frontends.torch as torch
+
+    rng = np.random.default_rng(0)
+    x = torch.tensor(rng.standard_normal((batch_size, width)).astype(np.float32))
+    weights = [
+        torch.tensor(
+            rng.standard_normal((width, width)).astype(np.float32) / width**0.5,
+            requires_grad=True,
+        )
+        for _ in range(depth)
+    ]
+
+    def forward():
+        out = x
+        for w in weights:
+            out = torch.nn.functional.linear(out, w).tanh()
+        return (out * out).mean()
+
+    forward_time = backward_time = 0.0
+    for _ in range(number):
+        start = time.perf_counter()
+        loss = forward()
+        forward_time += time.perf_counter() - start
+        start = time.perf_counter()
+        loss.backward()
+        backward_time += time.perf_counter() - start
+    jacobian_size = batch_size * width * width * width
+    print(
+        f"{backend} {depth} layers of width {width}, batch {batch_size}: forward"
+        f" {forward_time / number * 1e3:.1f}ms, backward"
+        f" {backward_time / number * 1e3:.1f}ms, full Jacobian of a layer w.r.t its"
+        f" weight {jacobian_size:.1e} elements"
+    )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:4]])
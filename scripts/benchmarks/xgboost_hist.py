@@ -0,0 +1,139 @@
+"""
+Benchmark the hist gbtree booster of the xgboost frontend.
+
+Boosting rounds of depth-wise trees grown from gradient histograms of the binned data
+are timed on millions of rows, next to rounds of the gblinear booster. The histograms
+of the children of a split, built for the smaller child and taken from the parent for
+its sibling, are compared with building both, and the search of the best split of a
+node over the bins of all features at once is compared with the exact greedy search
+over the sorted values of each feature. Prediction with array-encoded trees is
+compared with walking the nodes of every tree for each row.
+
+Usage: python scripts/benchmarks/xgboost_hist.py [backend] [num_rows] [num_rounds]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _time(fn, number=1):
+    start = time.perf_counter()
+    for _ in range(number):
+        ret = fn()
+    return (time.perf_counter() - start) / number, ret
+
+
+def _exact_root_split(x, grad, hess, reg_lambda=1.0):
+    # the exact greedy search: every feature sorted, every value a candidate
+    g, h = grad.sum(), hess.sum()
+    best = -np.inf
+    for f in range(x.shape[1]):
+        order = np.argsort(x[:, f], kind="stable")
+        gl, hl = np.cumsum(grad[order])[:-1], np.cumsum(hess[order])[:-1]
+        gain = gl**2 / (hl + reg_lambda) + (g - gl) ** 2 / (h - hl + reg_lambda)
+        best = max(best, gain.max() - g**2 / (h + reg_lambda))
+    return best
+
+
+def _walk(x, trees):
+    # one row and one node at a time
+    margins = []
+    for row in x:
+        total = 0.0
+        for feature, threshold, left, right, value in trees:
+            node = 0
+            while feature[node] >= 0:
+                go_left = row[feature[node]] < threshold[node]
+                node = left[node] if go_left else right[node]
+            total += value[node]
+        margins.append(total)
+    return np.array(margins)
+
+
+def main(backend="numpy", num_rows=1_000_000, num_rounds=10):
+    ivy.set_backend(backend)
+    from ivy.functional.frontends.xgboost.core import Booster
+    from ivy.functional.frontends.xgboost.tree import updater_quantile_hist as hist
+
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(num_rows, 28)).astype(np.float32)
+    y = (x[:, 0] * x[:, 1] + np.sin(3 * x[:, 2]) + x[:, 3] > 0).astype(np.float32)
+    data, label = ivy.array(x), ivy.array(y[:, None])
+
+    elapsed, cuts = _time(lambda: hist.quantile_cuts(data))
+    binning, binned = _time(lambda: hist.bin_data(data, cuts))
+    print(
+        f"{backend} quantile cuts of {num_rows} rows x 28: {elapsed * 1e3:.0f}ms,"
+        f" binning into uint8 {binning * 1e3:.0f}ms"
+    )
+
+    for booster in ["gbtree", "gblinear"]:
+        params = {
+            "booster": booster,
+            "base_score": None,
+            "scale_pos_weight": None,
+            "base_margin": None,
+            "learning_rate": 0.3,
+            "reg_lambda": 1.0,
+            "reg_alpha": 0.0,
+        }
+        bst = Booster(params, cache=[data, label])
+        start = time.perf_counter()
+        for i in range(num_rounds):
+            bst.update(data, label, i)
+        per_round = (time.perf_counter() - start) / num_rounds
+        accuracy = float(ivy.mean((bst.predict(data) == label).astype("float32")))
+        print(
+            f"{backend} {booster} on {num_rows} rows: {per_round:.2f}s per round,"
+            f" training accuracy {accuracy:.3f} after {num_rounds} rounds"
+        )
+        if booster == "gbtree":
+            gbm = bst.gbm
+
+    # the histograms of the two children of the root split
+    p = ivy.sigmoid(ivy.zeros((num_rows,)))
+    grad, hess = (p - label[:, 0]).astype("float64"), p * (1 - p)
+    rows = ivy.arange(num_rows, dtype="int64")
+    root = hist._histograms(binned, grad, hess, rows, rows * 0, 1, 256)
+    goes_left = binned[0] <= 200
+    child = 1 - goes_left.astype("int64")
+    both, _ = _time(lambda: hist._histograms(binned, grad, hess, rows, child, 2, 256))
+    small_rows = rows[~goes_left]
+    small, _ = _time(
+        lambda: root
+        - hist._histograms(binned, grad, hess, small_rows, small_rows * 0, 1, 256)
+    )
+    print(
+        f"{backend} histograms of the children of a split of {num_rows} rows:"
+        f" {both * 1e3:.0f}ms for both, {small * 1e3:.0f}ms for the smaller"
+        f" {small_rows.shape[0] / num_rows:.0%} and a subtraction"
+    )
+
+    g, h = ivy.sum(root[0, :, 0], axis=1), ivy.sum(root[1, :, 0], axis=1)
+    binned_search, _ = _time(lambda: hist._best_splits(root, g, h, 1.0, 0.0, 1.0, 0.0))
+    exact, _ = _time(
+        lambda: _exact_root_split(x, ivy.to_numpy(grad), ivy.to_numpy(hess))
+    )
+    print(
+        f"{backend} best root split over 28 features: {binned_search * 1e3:.1f}ms"
+        f" over 255 bins each, {exact * 1e3:.0f}ms exact over sorted values"
+    )
+
+    batch = data[:100_000]
+    trees = [tuple(ivy.to_numpy(a).tolist() for a in tree) for tree in gbm.trees]
+    gbm._cache = None
+    arrays, _ = _time(lambda: gbm.pred(batch))
+    walked, _ = _time(lambda: _walk(x[:1000], trees))
+    print(
+        f"{backend} prediction with {len(trees)} trees: array-encoded"
+        f" {batch.shape[0] / arrays / 1e6:.2f}M rows/s, walking each row"
+        f" {1000 / walked / 1e6:.3f}M rows/s"
+    )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:4]])